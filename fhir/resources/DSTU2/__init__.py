@@ -9,7 +9,8 @@ __fhir_version__ = "1.0.2"
 
 
 def construct_fhir_element(
-    element_type: str, data: Union[Dict[str, Any], str, bytes, Path]
+    element_type: str,
+    data: Union[Dict[str, Any], str, bytes, bytearray, memoryview, Path],
 ) -> FHIRAbstractModel:
     """ """
     try:
@@ -18,7 +19,7 @@ def construct_fhir_element(
         raise LookupError(
             f"'{element_type}' is not valid FHIRModel (element type) name!"
         )
-    if isinstance(data, (str, bytes)):
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
         return klass.parse_raw(data, content_type="application/json")
     elif isinstance(data, Path):
         return klass.parse_file(data)
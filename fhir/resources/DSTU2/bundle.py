@@ -9,6 +9,9 @@ from typing import List as ListType
 
 from pydantic.v1 import Field
 
+from fhir.resources.core.bundle import BundleEntryReader
+from fhir.resources.core.utils.jsonstream import DEFAULT_CHUNK_SIZE
+
 from . import fhirtypes
 from .backboneelement import BackboneElement
 from .resource import Resource
@@ -60,6 +63,30 @@ class Bundle(Resource):
         ),
     )
 
+    @classmethod
+    def iter_entries(
+        cls,
+        source,
+        *,
+        entry_filter=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Incrementally reads (large) Bundle JSON document, yielding
+        ``BundleEntry`` one at a time, without loading whole document in memory.
+        Bundle envelope (``type``, ``total``, ``link`` etc.) is validated before
+        the first entry is yielded and available as ``bundle`` attribute of the
+        returned reader.
+
+        :param source: file path, (binary or text) file object or bytes.
+        :param entry_filter: collection of ``resourceType`` names or callable
+            (receives ``resourceType`` of entry's resource), other entries are
+            skipped without being constructed.
+        :param chunk_size: read size in bytes.
+        """
+        return BundleEntryReader(
+            cls, source, entry_filter=entry_filter, chunk_size=chunk_size
+        )
+
 
 class BundleEntry(BackboneElement):
     """Entry in the bundle - will have a resource, or information.
@@ -23,7 +23,7 @@ from pydantic.v1.validators import (
 )
 
 from .fhirabstractmodel import FHIRAbstractModel
-from .fhirtypesvalidators import run_validator_for_fhir_type
+from .fhirtypesvalidators import dispatch_fhir_model_validator
 
 if TYPE_CHECKING:
     from pydantic.v1.types import CallableGenerator
@@ -470,24 +470,15 @@ class AbstractBaseType(dict):
     def validate(cls, v, values, config, field):
         """ """
         if isinstance(v, (bytes, str)):
-            input_data = load_str_bytes(v)
-            resource_type = input_data.get("resourceType", None)
-        elif isinstance(v, FHIRAbstractModel):
+            # decoded only once
+            v = load_str_bytes(v)
+
+        if isinstance(v, FHIRAbstractModel):
             resource_type = v.resource_type
         else:
             resource_type = v.get("resourceType", None)
 
-        if resource_type is None or resource_type == cls.__resource_type__:
-            from . import fhirtypesvalidators
-
-            v = getattr(
-                fhirtypesvalidators, cls.__resource_type__.lower() + "_validator"
-            )(v)
-            return v
-
-        type_class = get_fhir_type_class(resource_type)
-        v = run_validator_for_fhir_type(type_class, v, values, config, field)
-        return v
+        return dispatch_fhir_model_validator(resource_type or cls.__resource_type__, v)
 
 
 class Canonical(Uri):
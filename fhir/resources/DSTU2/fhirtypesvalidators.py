@@ -336,6 +336,13 @@ MODEL_CLASSES = {
     "TestScriptSetupActionOperationRequestHeader": (None, ".testscript"),
 }
 
+# resourceType -> (model class, model validator)
+DISPATCH_TABLE: typing.Dict[
+    str, typing.Tuple[typing.Type[FHIRAbstractModel], typing.Callable]
+] = {}
+# type class -> compiled (generic) validators
+GENERIC_VALIDATORS: typing.Dict[type, typing.List[typing.Callable]] = {}
+
 
 def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
     """"""
@@ -352,12 +359,49 @@ def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
 def run_validator_for_fhir_type(model_type_cls, v, values, config, field):
     """ """
     cls = get_fhir_model_class(model_type_cls.__resource_type__)
-    for validator in model_type_cls.__get_validators__():
-        func = make_generic_validator(validator)
+    try:
+        validators = GENERIC_VALIDATORS[model_type_cls]
+    except KeyError:
+        validators = GENERIC_VALIDATORS[model_type_cls] = [
+            make_generic_validator(validator)
+            for validator in model_type_cls.__get_validators__()
+        ]
+    for func in validators:
         v = func(cls, v, values, config, field)
     return v
 
 
+def get_fhir_model_dispatch(
+    resource_type: str,
+) -> typing.Tuple[typing.Type[FHIRAbstractModel], typing.Callable]:
+    """Returns (model class, model validator) of the resource type (element type)
+    from the precomputed dispatch table."""
+    try:
+        return DISPATCH_TABLE[resource_type]
+    except KeyError:
+        pass
+    try:
+        model_class = get_fhir_model_class(resource_type)
+    except KeyError:
+        raise LookupError(
+            f"'{__package__}.fhirtypes.{resource_type}Type' doesnt found."
+        )
+    validator = globals()[resource_type.lower() + "_validator"]
+    DISPATCH_TABLE[resource_type] = (model_class, validator)
+    return model_class, validator
+
+
+def dispatch_fhir_model_validator(
+    resource_type: str, v: Union[dict, FHIRAbstractModel]
+) -> FHIRAbstractModel:
+    """Single pass polymorphic validation (i.e ``Bundle.entry.resource``,
+    ``contained``), already decoded value is validated directly."""
+    model_class, validator = get_fhir_model_dispatch(resource_type)
+    if v.__class__ is dict:
+        return model_class.parse_obj(v)
+    return validator(v)
+
+
 def fhir_model_validator(
     model_name: str, v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
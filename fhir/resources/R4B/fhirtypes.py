@@ -3,21 +3,14 @@ import datetime
 import decimal
 import re
 from email.utils import formataddr, parseaddr
-from typing import TYPE_CHECKING, Any, Dict, Optional, Pattern, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Type, Union
 from uuid import UUID
 
-from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
-
 from pydantic.v1 import AnyUrl
 from pydantic.v1.errors import ConfigError, DateError, DateTimeError, TimeError
 from pydantic.v1.main import load_str_bytes
 from pydantic.v1.networks import validate_email
-from pydantic.v1.types import (
-    ConstrainedBytes,
-    ConstrainedDecimal,
-    ConstrainedInt,
-    ConstrainedStr,
-)
+from pydantic.v1.types import ConstrainedBytes, ConstrainedInt, ConstrainedStr
 from pydantic.v1.validators import (
     bool_validator,
     parse_date,
@@ -25,12 +18,25 @@ from pydantic.v1.validators import (
     parse_time,
 )
 
-from .fhirtypesvalidators import run_validator_for_fhir_type
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.core.lazy import LazyResource
+from fhir.resources.core.primitives import (
+    PRIMITIVE_CACHE,
+    FastConstrainedDecimal,
+    FastConstrainedStr,
+    cached_validator,
+    fast_date,
+    fast_datetime,
+    fast_time,
+    is_relative_url,
+)
+
+from .fhirtypesvalidators import MODEL_CLASSES, dispatch_fhir_model_validator
 
 if TYPE_CHECKING:
-    from pydantic.v1.types import CallableGenerator
-    from pydantic.v1.fields import ModelField
     from pydantic.v1 import BaseConfig
+    from pydantic.v1.fields import ModelField
+    from pydantic.v1.types import CallableGenerator
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
@@ -102,7 +108,7 @@ else:
             return value is True and "true" or "false"
 
 
-class String(ConstrainedStr, Primitive):
+class String(FastConstrainedStr, Primitive):
     """A sequence of Unicode characters
     Note that strings SHALL NOT exceed 1MB (1024*1024 characters) in size.
     Strings SHOULD not contain Unicode character points below 32, except for
@@ -132,6 +138,7 @@ class String(ConstrainedStr, Primitive):
         """
         if isinstance(allow, bool):
             cls.allow_empty_str = allow
+            PRIMITIVE_CACHE.clear()
 
     @classmethod
     def validate(cls, value: Union[str]) -> Union[str]:
@@ -164,7 +171,7 @@ class Base64Binary(ConstrainedBytes, Primitive):
         return value.decode()
 
 
-class Code(ConstrainedStr, Primitive):
+class Code(FastConstrainedStr, Primitive):
     """Indicates that the value is taken from a set of controlled
     strings defined elsewhere (see Using codes for further discussion).
     Technically, a code is restricted to a string which has at least one
@@ -183,7 +190,7 @@ class Code(ConstrainedStr, Primitive):
         return value
 
 
-class Id(ConstrainedStr, Primitive):
+class Id(FastConstrainedStr, Primitive):
     """Any combination of upper- or lower-case ASCII letters
     ('A'..'Z', and 'a'..'z', numerals ('0'..'9'), '-' and '.',
     with a length limit of 64 characters.
@@ -234,6 +241,7 @@ class Id(ConstrainedStr, Primitive):
 
         if regex is not None:
             cls.regex = regex
+        PRIMITIVE_CACHE.clear()
 
     @classmethod
     def to_string(cls, value):
@@ -244,7 +252,7 @@ class Id(ConstrainedStr, Primitive):
         return value
 
 
-class Decimal(ConstrainedDecimal, Primitive):
+class Decimal(FastConstrainedDecimal, Primitive):
     """Rational numbers that have a decimal representation.
     See below about the precision of the number"""
 
@@ -300,7 +308,7 @@ class PositiveInt(ConstrainedInt, Primitive):
         return str(value)
 
 
-class Uri(ConstrainedStr, Primitive):
+class Uri(FastConstrainedStr, Primitive):
     """A Uniform Resource Identifier Reference (RFC 3986 ).
     Note: URIs are case sensitive.
     For UUID (urn:uuid:53fefa32-fcbb-4ff8-8a92-55ee120877b7)
@@ -323,7 +331,7 @@ class Uri(ConstrainedStr, Primitive):
         return value
 
 
-class Oid(ConstrainedStr, Primitive):
+class Oid(FastConstrainedStr, Primitive):
     """An OID represented as a URI (RFC 3001 ); e.g. urn:oid:1.2.3.4.5"""
 
     __visit_name__ = "oid"
@@ -384,6 +392,7 @@ class Url(AnyUrl, Primitive):
     __visit_name__ = "url"
 
     @classmethod
+    @cached_validator
     def validate(  # type: ignore
         cls, value: str, field: "ModelField", config: "BaseConfig"
     ) -> Union["AnyUrl", str]:
@@ -405,22 +414,13 @@ class Url(AnyUrl, Primitive):
         elif value in FHIR_PRIMITIVES:
             # Extensions may contain a valueUrl for a primitive FHIR type
             return value
+        elif is_relative_url(value):
+            # we are allowing relative path (which never has scheme,
+            # so it is not valid absolute url anyway)
+            # @ToDo: required resource type validation?
+            return value
 
-        try:
-            return AnyUrl.validate(value, field, config)
-        except Exception:
-            # we are allowing relative path
-            if not value.startswith("/"):
-                matched = cls.path_regex.match("/" + value)
-            else:
-                matched = cls.path_regex.match(value)
-            if matched is not None:
-                if re.match(
-                    r"^[A-Za-z0-9\-.#]+$", matched.groupdict().get("resourceType", "")
-                ):
-                    # @ToDo: required resource type validation?
-                    return value
-            raise
+        return AnyUrl.validate(value, field, config)
 
     @classmethod
     def to_string(cls, value):
@@ -431,7 +431,7 @@ class Url(AnyUrl, Primitive):
         return value
 
 
-class Markdown(ConstrainedStr, Primitive):
+class Markdown(FastConstrainedStr, Primitive):
     """A FHIR string (see above) that may contain markdown syntax for optional processing
     by a markdown presentation engine, in the GFM extension of CommonMark format (see below)
     """
@@ -448,7 +448,7 @@ class Markdown(ConstrainedStr, Primitive):
         return value
 
 
-class Xhtml(ConstrainedStr, Primitive):  # type: ignore
+class Xhtml(FastConstrainedStr, Primitive):  # type: ignore
     __visit_name__ = "xhtml"
 
     @classmethod
@@ -478,6 +478,7 @@ class Date(datetime.date, Primitive):
         yield cls.validate
 
     @classmethod
+    @cached_validator
     def validate(
         cls, value: Union[datetime.date, str, bytes, int, float]
     ) -> Union[datetime.date, str]:
@@ -491,11 +492,16 @@ class Date(datetime.date, Primitive):
         if not match:
             if not cls.regex.match(value):
                 raise DateError()
-        elif not match.groupdict().get("day"):
-            if match.groupdict().get("month") and int(match.groupdict()["month"]) > 12:
+        elif not match.group("day"):
+            month = match.group("month")
+            if month and int(month) > 12:
                 raise DateError()
             # we keep original
             return value
+        else:
+            date = fast_date(value)
+            if date is not None:
+                return date
         return parse_date(value)
 
     @classmethod
@@ -532,6 +538,7 @@ class DateTime(datetime.datetime, Primitive):
         yield cls.validate
 
     @classmethod
+    @cached_validator
     def validate(
         cls, value: Union[datetime.date, datetime.datetime, str, bytes, int, float]
     ) -> Union[datetime.datetime, datetime.date, str]:
@@ -542,16 +549,20 @@ class DateTime(datetime.datetime, Primitive):
         if not isinstance(value, str):
             # default handler
             return parse_datetime(value)
+        if len(value) > 10:
+            result = fast_datetime(value)
+            if result is not None:
+                return result
         match = FHIR_DATE_PARTS.match(value)
         if match:
-            if (
-                match.groupdict().get("year")
-                and match.groupdict().get("month")
-                and match.groupdict().get("day")
-            ):
+            month = match.group("month")
+            if month and match.group("day"):
+                date = fast_date(value)
+                if date is not None:
+                    return date
                 return parse_date(value)
-            elif match.groupdict().get("year") and match.groupdict().get("month"):
-                if int(match.groupdict()["month"]) > 12:
+            elif month:
+                if int(month) > 12:
                     raise DateError()
             # we don't want to loose actual information, so keep as string
             return value
@@ -595,9 +606,13 @@ class Instant(datetime.datetime, Primitive):
         yield cls.validate
 
     @classmethod
+    @cached_validator
     def validate(cls, value):
         """ """
         if isinstance(value, str):
+            result = fast_datetime(value, require_timezone=True)
+            if result is not None:
+                return result
             if not cls.regex.match(value):
                 raise DateTimeError()
         return parse_datetime(value)
@@ -627,9 +642,13 @@ class Time(datetime.time, Primitive):
         yield cls.validate
 
     @classmethod
+    @cached_validator
     def validate(cls, value):
         """ """
         if isinstance(value, str):
+            result = fast_time(value)
+            if result is not None:
+                return result
             if not cls.regex.match(value):
                 raise TimeError()
 
@@ -648,7 +667,9 @@ def get_fhir_type_class(model_name):
     try:
         return globals()[model_name + "Type"]
     except KeyError:
-        raise LookupError(f"'{__name__}.{model_name}Type' doesnt found.")
+        if model_name not in MODEL_CLASSES:
+            raise LookupError(f"'{__name__}.{model_name}Type' doesnt found.")
+    return make_fhir_type_class(model_name)
 
 
 class AbstractType(dict):
@@ -701,25 +722,19 @@ class AbstractBaseType(dict):
     @classmethod
     def validate(cls, v, values, config, field):
         """ """
+        if isinstance(v, LazyResource):
+            # validation is deferred, see ``parse_raw(..., lazy=True)``
+            return v
         if isinstance(v, (bytes, str)):
-            input_data = load_str_bytes(v)
-            resource_type = input_data.get("resourceType", None)
-        elif isinstance(v, FHIRAbstractModel):
+            # decoded only once
+            v = load_str_bytes(v)
+
+        if isinstance(v, FHIRAbstractModel):
             resource_type = v.resource_type
         else:
             resource_type = v.get("resourceType", None)
 
-        if resource_type is None or resource_type == cls.__resource_type__:
-            from . import fhirtypesvalidators
-
-            v = getattr(
-                fhirtypesvalidators, cls.__resource_type__.lower() + "_validator"
-            )(v)
-            return v
-
-        type_class = get_fhir_type_class(resource_type)
-        v = run_validator_for_fhir_type(type_class, v, values, config, field)
-        return v
+        return dispatch_fhir_model_validator(resource_type or cls.__resource_type__, v)
 
     @classmethod
     def is_primitive(cls) -> bool:
@@ -744,2737 +759,31 @@ class ResourceType(AbstractBaseType):
     __resource_type__ = "Resource"
 
 
-class AccountType(AbstractType):
-    __resource_type__ = "Account"
-
-
-class AccountCoverageType(AbstractType):
-    __resource_type__ = "AccountCoverage"
-
-
-class AccountGuarantorType(AbstractType):
-    __resource_type__ = "AccountGuarantor"
-
-
-class ActivityDefinitionType(AbstractType):
-    __resource_type__ = "ActivityDefinition"
-
-
-class ActivityDefinitionDynamicValueType(AbstractType):
-    __resource_type__ = "ActivityDefinitionDynamicValue"
-
-
-class ActivityDefinitionParticipantType(AbstractType):
-    __resource_type__ = "ActivityDefinitionParticipant"
-
-
-class AddressType(AbstractType):
-    __resource_type__ = "Address"
-
-
-class AdministrableProductDefinitionType(AbstractType):
-    __resource_type__ = "AdministrableProductDefinition"
-
-
-class AdministrableProductDefinitionPropertyType(AbstractType):
-    __resource_type__ = "AdministrableProductDefinitionProperty"
-
-
-class AdministrableProductDefinitionRouteOfAdministrationType(AbstractType):
-    __resource_type__ = "AdministrableProductDefinitionRouteOfAdministration"
-
-
-class AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesType(
-    AbstractType
-):
-    __resource_type__ = (
-        "AdministrableProductDefinitionRouteOfAdministrationTargetSpecies"
-    )
-
-
-class AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawalPeriodType(
-    AbstractType
-):
-    __resource_type__ = "AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawalPeriod"  # noqa: B950
-
-
-class AdverseEventType(AbstractType):
-    __resource_type__ = "AdverseEvent"
-
-
-class AdverseEventSuspectEntityType(AbstractType):
-    __resource_type__ = "AdverseEventSuspectEntity"
-
-
-class AdverseEventSuspectEntityCausalityType(AbstractType):
-    __resource_type__ = "AdverseEventSuspectEntityCausality"
-
-
-class AgeType(AbstractType):
-    __resource_type__ = "Age"
-
-
-class AllergyIntoleranceType(AbstractType):
-    __resource_type__ = "AllergyIntolerance"
-
-
-class AllergyIntoleranceReactionType(AbstractType):
-    __resource_type__ = "AllergyIntoleranceReaction"
-
-
-class AnnotationType(AbstractType):
-    __resource_type__ = "Annotation"
-
-
-class AppointmentType(AbstractType):
-    __resource_type__ = "Appointment"
-
-
-class AppointmentParticipantType(AbstractType):
-    __resource_type__ = "AppointmentParticipant"
-
-
-class AppointmentResponseType(AbstractType):
-    __resource_type__ = "AppointmentResponse"
-
-
-class AttachmentType(AbstractType):
-    __resource_type__ = "Attachment"
-
-
-class AuditEventType(AbstractType):
-    __resource_type__ = "AuditEvent"
-
-
-class AuditEventAgentType(AbstractType):
-    __resource_type__ = "AuditEventAgent"
-
-
-class AuditEventAgentNetworkType(AbstractType):
-    __resource_type__ = "AuditEventAgentNetwork"
-
-
-class AuditEventEntityType(AbstractType):
-    __resource_type__ = "AuditEventEntity"
-
-
-class AuditEventEntityDetailType(AbstractType):
-    __resource_type__ = "AuditEventEntityDetail"
-
-
-class AuditEventSourceType(AbstractType):
-    __resource_type__ = "AuditEventSource"
-
-
-class BackboneElementType(AbstractType):
-    __resource_type__ = "BackboneElement"
-
-
-class BasicType(AbstractType):
-    __resource_type__ = "Basic"
-
-
-class BinaryType(AbstractType):
-    __resource_type__ = "Binary"
-
-
-class BiologicallyDerivedProductType(AbstractType):
-    __resource_type__ = "BiologicallyDerivedProduct"
-
-
-class BiologicallyDerivedProductCollectionType(AbstractType):
-    __resource_type__ = "BiologicallyDerivedProductCollection"
-
-
-class BiologicallyDerivedProductManipulationType(AbstractType):
-    __resource_type__ = "BiologicallyDerivedProductManipulation"
-
-
-class BiologicallyDerivedProductProcessingType(AbstractType):
-    __resource_type__ = "BiologicallyDerivedProductProcessing"
-
-
-class BiologicallyDerivedProductStorageType(AbstractType):
-    __resource_type__ = "BiologicallyDerivedProductStorage"
-
-
-class BodyStructureType(AbstractType):
-    __resource_type__ = "BodyStructure"
-
-
-class BundleType(AbstractType):
-    __resource_type__ = "Bundle"
-
-
-class BundleEntryType(AbstractType):
-    __resource_type__ = "BundleEntry"
-
-
-class BundleEntryRequestType(AbstractType):
-    __resource_type__ = "BundleEntryRequest"
-
-
-class BundleEntryResponseType(AbstractType):
-    __resource_type__ = "BundleEntryResponse"
-
-
-class BundleEntrySearchType(AbstractType):
-    __resource_type__ = "BundleEntrySearch"
-
-
-class BundleLinkType(AbstractType):
-    __resource_type__ = "BundleLink"
-
-
-class CapabilityStatementType(AbstractType):
-    __resource_type__ = "CapabilityStatement"
-
-
-class CapabilityStatementDocumentType(AbstractType):
-    __resource_type__ = "CapabilityStatementDocument"
-
-
-class CapabilityStatementImplementationType(AbstractType):
-    __resource_type__ = "CapabilityStatementImplementation"
-
-
-class CapabilityStatementMessagingType(AbstractType):
-    __resource_type__ = "CapabilityStatementMessaging"
-
-
-class CapabilityStatementMessagingEndpointType(AbstractType):
-    __resource_type__ = "CapabilityStatementMessagingEndpoint"
-
-
-class CapabilityStatementMessagingSupportedMessageType(AbstractType):
-    __resource_type__ = "CapabilityStatementMessagingSupportedMessage"
-
-
-class CapabilityStatementRestType(AbstractType):
-    __resource_type__ = "CapabilityStatementRest"
-
-
-class CapabilityStatementRestInteractionType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestInteraction"
-
-
-class CapabilityStatementRestResourceType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestResource"
-
-
-class CapabilityStatementRestResourceInteractionType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestResourceInteraction"
-
-
-class CapabilityStatementRestResourceOperationType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestResourceOperation"
-
-
-class CapabilityStatementRestResourceSearchParamType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestResourceSearchParam"
-
-
-class CapabilityStatementRestSecurityType(AbstractType):
-    __resource_type__ = "CapabilityStatementRestSecurity"
-
-
-class CapabilityStatementSoftwareType(AbstractType):
-    __resource_type__ = "CapabilityStatementSoftware"
-
-
-class CarePlanType(AbstractType):
-    __resource_type__ = "CarePlan"
-
-
-class CarePlanActivityType(AbstractType):
-    __resource_type__ = "CarePlanActivity"
-
-
-class CarePlanActivityDetailType(AbstractType):
-    __resource_type__ = "CarePlanActivityDetail"
-
-
-class CareTeamType(AbstractType):
-    __resource_type__ = "CareTeam"
-
-
-class CareTeamParticipantType(AbstractType):
-    __resource_type__ = "CareTeamParticipant"
-
-
-class CatalogEntryType(AbstractType):
-    __resource_type__ = "CatalogEntry"
-
-
-class CatalogEntryRelatedEntryType(AbstractType):
-    __resource_type__ = "CatalogEntryRelatedEntry"
-
-
-class ChargeItemType(AbstractType):
-    __resource_type__ = "ChargeItem"
-
-
-class ChargeItemDefinitionType(AbstractType):
-    __resource_type__ = "ChargeItemDefinition"
-
-
-class ChargeItemDefinitionApplicabilityType(AbstractType):
-    __resource_type__ = "ChargeItemDefinitionApplicability"
-
-
-class ChargeItemDefinitionPropertyGroupType(AbstractType):
-    __resource_type__ = "ChargeItemDefinitionPropertyGroup"
-
-
-class ChargeItemDefinitionPropertyGroupPriceComponentType(AbstractType):
-    __resource_type__ = "ChargeItemDefinitionPropertyGroupPriceComponent"
-
-
-class ChargeItemPerformerType(AbstractType):
-    __resource_type__ = "ChargeItemPerformer"
-
-
-class CitationType(AbstractType):
-    __resource_type__ = "Citation"
-
-
-class CitationCitedArtifactType(AbstractType):
-    __resource_type__ = "CitationCitedArtifact"
-
-
-class CitationCitedArtifactAbstractType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactAbstract"
-
-
-class CitationCitedArtifactClassificationType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactClassification"
-
-
-class CitationCitedArtifactClassificationWhoClassifiedType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactClassificationWhoClassified"
-
-
-class CitationCitedArtifactContributorshipType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactContributorship"
-
-
-class CitationCitedArtifactContributorshipEntryType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactContributorshipEntry"
-
-
-class CitationCitedArtifactContributorshipEntryAffiliationInfoType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactContributorshipEntryAffiliationInfo"
-
-
-class CitationCitedArtifactContributorshipEntryContributionInstanceType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactContributorshipEntryContributionInstance"
-
-
-class CitationCitedArtifactContributorshipSummaryType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactContributorshipSummary"
-
-
-class CitationCitedArtifactPartType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactPart"
-
-
-class CitationCitedArtifactPublicationFormType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactPublicationForm"
-
-
-class CitationCitedArtifactPublicationFormPeriodicReleaseType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactPublicationFormPeriodicRelease"
-
-
-class CitationCitedArtifactPublicationFormPeriodicReleaseDateOfPublicationType(
-    AbstractType
-):
-    __resource_type__ = (
-        "CitationCitedArtifactPublicationFormPeriodicReleaseDateOfPublication"
+def make_fhir_type_class(model_name: str) -> Type[AbstractType]:
+    """``<Model>Type`` class (i.e. ``PatientType``), created only once."""
+    name = model_name + "Type"
+    klass = type(
+        name, (AbstractType,), {"__resource_type__": model_name, "__module__": __name__}
     )
+    # concurrent first access gets the same class
+    return globals().setdefault(name, klass)
 
 
-class CitationCitedArtifactPublicationFormPublishedInType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactPublicationFormPublishedIn"
-
-
-class CitationCitedArtifactRelatesToType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactRelatesTo"
-
-
-class CitationCitedArtifactStatusDateType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactStatusDate"
-
-
-class CitationCitedArtifactTitleType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactTitle"
-
-
-class CitationCitedArtifactVersionType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactVersion"
-
-
-class CitationCitedArtifactWebLocationType(AbstractType):
-    __resource_type__ = "CitationCitedArtifactWebLocation"
-
-
-class CitationClassificationType(AbstractType):
-    __resource_type__ = "CitationClassification"
-
-
-class CitationRelatesToType(AbstractType):
-    __resource_type__ = "CitationRelatesTo"
-
-
-class CitationStatusDateType(AbstractType):
-    __resource_type__ = "CitationStatusDate"
-
-
-class CitationSummaryType(AbstractType):
-    __resource_type__ = "CitationSummary"
-
-
-class ClaimType(AbstractType):
-    __resource_type__ = "Claim"
-
-
-class ClaimAccidentType(AbstractType):
-    __resource_type__ = "ClaimAccident"
-
-
-class ClaimCareTeamType(AbstractType):
-    __resource_type__ = "ClaimCareTeam"
-
-
-class ClaimDiagnosisType(AbstractType):
-    __resource_type__ = "ClaimDiagnosis"
-
-
-class ClaimInsuranceType(AbstractType):
-    __resource_type__ = "ClaimInsurance"
-
-
-class ClaimItemType(AbstractType):
-    __resource_type__ = "ClaimItem"
-
-
-class ClaimItemDetailType(AbstractType):
-    __resource_type__ = "ClaimItemDetail"
-
-
-class ClaimItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ClaimItemDetailSubDetail"
-
-
-class ClaimPayeeType(AbstractType):
-    __resource_type__ = "ClaimPayee"
-
-
-class ClaimProcedureType(AbstractType):
-    __resource_type__ = "ClaimProcedure"
-
-
-class ClaimRelatedType(AbstractType):
-    __resource_type__ = "ClaimRelated"
-
-
-class ClaimResponseType(AbstractType):
-    __resource_type__ = "ClaimResponse"
-
-
-class ClaimResponseAddItemType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItem"
-
-
-class ClaimResponseAddItemDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItemDetail"
-
-
-class ClaimResponseAddItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseAddItemDetailSubDetail"
-
-
-class ClaimResponseErrorType(AbstractType):
-    __resource_type__ = "ClaimResponseError"
-
-
-class ClaimResponseInsuranceType(AbstractType):
-    __resource_type__ = "ClaimResponseInsurance"
-
-
-class ClaimResponseItemType(AbstractType):
-    __resource_type__ = "ClaimResponseItem"
-
-
-class ClaimResponseItemAdjudicationType(AbstractType):
-    __resource_type__ = "ClaimResponseItemAdjudication"
-
-
-class ClaimResponseItemDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetail"
-
-
-class ClaimResponseItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ClaimResponseItemDetailSubDetail"
-
-
-class ClaimResponsePaymentType(AbstractType):
-    __resource_type__ = "ClaimResponsePayment"
-
-
-class ClaimResponseProcessNoteType(AbstractType):
-    __resource_type__ = "ClaimResponseProcessNote"
-
-
-class ClaimResponseTotalType(AbstractType):
-    __resource_type__ = "ClaimResponseTotal"
-
-
-class ClaimSupportingInfoType(AbstractType):
-    __resource_type__ = "ClaimSupportingInfo"
-
-
-class ClinicalImpressionType(AbstractType):
-    __resource_type__ = "ClinicalImpression"
+def __getattr__(name: str) -> Any:
+    """``<Model>Type`` classes (i.e. ``PatientType``) are created on first access
+    (from ``MODEL_CLASSES`` names of ``fhirtypesvalidators``), not at import time."""
+    if name.endswith("Type") and name[:-4] in MODEL_CLASSES:
+        return make_fhir_type_class(name[:-4])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-class ClinicalImpressionFindingType(AbstractType):
-    __resource_type__ = "ClinicalImpressionFinding"
-
-
-class ClinicalImpressionInvestigationType(AbstractType):
-    __resource_type__ = "ClinicalImpressionInvestigation"
-
-
-class ClinicalUseDefinitionType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinition"
-
-
-class ClinicalUseDefinitionContraindicationType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionContraindication"
-
-
-class ClinicalUseDefinitionContraindicationOtherTherapyType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionContraindicationOtherTherapy"
-
-
-class ClinicalUseDefinitionIndicationType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionIndication"
-
-
-class ClinicalUseDefinitionInteractionType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionInteraction"
-
-
-class ClinicalUseDefinitionInteractionInteractantType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionInteractionInteractant"
-
-
-class ClinicalUseDefinitionUndesirableEffectType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionUndesirableEffect"
-
-
-class ClinicalUseDefinitionWarningType(AbstractType):
-    __resource_type__ = "ClinicalUseDefinitionWarning"
-
-
-class CodeSystemType(AbstractType):
-    __resource_type__ = "CodeSystem"
-
-
-class CodeSystemConceptType(AbstractType):
-    __resource_type__ = "CodeSystemConcept"
-
-
-class CodeSystemConceptDesignationType(AbstractType):
-    __resource_type__ = "CodeSystemConceptDesignation"
-
-
-class CodeSystemConceptPropertyType(AbstractType):
-    __resource_type__ = "CodeSystemConceptProperty"
-
-
-class CodeSystemFilterType(AbstractType):
-    __resource_type__ = "CodeSystemFilter"
-
-
-class CodeSystemPropertyType(AbstractType):
-    __resource_type__ = "CodeSystemProperty"
-
-
-class CodeableConceptType(AbstractType):
-    __resource_type__ = "CodeableConcept"
-
-
-class CodeableReferenceType(AbstractType):
-    __resource_type__ = "CodeableReference"
-
-
-class CodingType(AbstractType):
-    __resource_type__ = "Coding"
-
-
-class CommunicationType(AbstractType):
-    __resource_type__ = "Communication"
-
-
-class CommunicationPayloadType(AbstractType):
-    __resource_type__ = "CommunicationPayload"
-
-
-class CommunicationRequestType(AbstractType):
-    __resource_type__ = "CommunicationRequest"
-
-
-class CommunicationRequestPayloadType(AbstractType):
-    __resource_type__ = "CommunicationRequestPayload"
-
-
-class CompartmentDefinitionType(AbstractType):
-    __resource_type__ = "CompartmentDefinition"
-
-
-class CompartmentDefinitionResourceType(AbstractType):
-    __resource_type__ = "CompartmentDefinitionResource"
-
-
-class CompositionType(AbstractType):
-    __resource_type__ = "Composition"
-
-
-class CompositionAttesterType(AbstractType):
-    __resource_type__ = "CompositionAttester"
-
-
-class CompositionEventType(AbstractType):
-    __resource_type__ = "CompositionEvent"
-
-
-class CompositionRelatesToType(AbstractType):
-    __resource_type__ = "CompositionRelatesTo"
-
-
-class CompositionSectionType(AbstractType):
-    __resource_type__ = "CompositionSection"
-
-
-class ConceptMapType(AbstractType):
-    __resource_type__ = "ConceptMap"
-
-
-class ConceptMapGroupType(AbstractType):
-    __resource_type__ = "ConceptMapGroup"
-
-
-class ConceptMapGroupElementType(AbstractType):
-    __resource_type__ = "ConceptMapGroupElement"
-
-
-class ConceptMapGroupElementTargetType(AbstractType):
-    __resource_type__ = "ConceptMapGroupElementTarget"
-
-
-class ConceptMapGroupElementTargetDependsOnType(AbstractType):
-    __resource_type__ = "ConceptMapGroupElementTargetDependsOn"
-
-
-class ConceptMapGroupUnmappedType(AbstractType):
-    __resource_type__ = "ConceptMapGroupUnmapped"
-
-
-class ConditionType(AbstractType):
-    __resource_type__ = "Condition"
-
-
-class ConditionEvidenceType(AbstractType):
-    __resource_type__ = "ConditionEvidence"
-
-
-class ConditionStageType(AbstractType):
-    __resource_type__ = "ConditionStage"
-
-
-class ConsentType(AbstractType):
-    __resource_type__ = "Consent"
-
-
-class ConsentPolicyType(AbstractType):
-    __resource_type__ = "ConsentPolicy"
-
-
-class ConsentProvisionType(AbstractType):
-    __resource_type__ = "ConsentProvision"
-
-
-class ConsentProvisionActorType(AbstractType):
-    __resource_type__ = "ConsentProvisionActor"
-
-
-class ConsentProvisionDataType(AbstractType):
-    __resource_type__ = "ConsentProvisionData"
-
-
-class ConsentVerificationType(AbstractType):
-    __resource_type__ = "ConsentVerification"
-
-
-class ContactDetailType(AbstractType):
-    __resource_type__ = "ContactDetail"
-
-
-class ContactPointType(AbstractType):
-    __resource_type__ = "ContactPoint"
-
-
-class ContractType(AbstractType):
-    __resource_type__ = "Contract"
-
-
-class ContractContentDefinitionType(AbstractType):
-    __resource_type__ = "ContractContentDefinition"
-
-
-class ContractFriendlyType(AbstractType):
-    __resource_type__ = "ContractFriendly"
-
-
-class ContractLegalType(AbstractType):
-    __resource_type__ = "ContractLegal"
-
-
-class ContractRuleType(AbstractType):
-    __resource_type__ = "ContractRule"
-
-
-class ContractSignerType(AbstractType):
-    __resource_type__ = "ContractSigner"
-
-
-class ContractTermType(AbstractType):
-    __resource_type__ = "ContractTerm"
-
-
-class ContractTermActionType(AbstractType):
-    __resource_type__ = "ContractTermAction"
-
-
-class ContractTermActionSubjectType(AbstractType):
-    __resource_type__ = "ContractTermActionSubject"
-
-
-class ContractTermAssetType(AbstractType):
-    __resource_type__ = "ContractTermAsset"
-
-
-class ContractTermAssetContextType(AbstractType):
-    __resource_type__ = "ContractTermAssetContext"
-
-
-class ContractTermAssetValuedItemType(AbstractType):
-    __resource_type__ = "ContractTermAssetValuedItem"
-
-
-class ContractTermOfferType(AbstractType):
-    __resource_type__ = "ContractTermOffer"
-
-
-class ContractTermOfferAnswerType(AbstractType):
-    __resource_type__ = "ContractTermOfferAnswer"
-
-
-class ContractTermOfferPartyType(AbstractType):
-    __resource_type__ = "ContractTermOfferParty"
-
-
-class ContractTermSecurityLabelType(AbstractType):
-    __resource_type__ = "ContractTermSecurityLabel"
-
-
-class ContributorType(AbstractType):
-    __resource_type__ = "Contributor"
-
-
-class CountType(AbstractType):
-    __resource_type__ = "Count"
-
-
-class CoverageType(AbstractType):
-    __resource_type__ = "Coverage"
-
-
-class CoverageClassType(AbstractType):
-    __resource_type__ = "CoverageClass"
-
-
-class CoverageCostToBeneficiaryType(AbstractType):
-    __resource_type__ = "CoverageCostToBeneficiary"
-
-
-class CoverageCostToBeneficiaryExceptionType(AbstractType):
-    __resource_type__ = "CoverageCostToBeneficiaryException"
-
-
-class CoverageEligibilityRequestType(AbstractType):
-    __resource_type__ = "CoverageEligibilityRequest"
-
-
-class CoverageEligibilityRequestInsuranceType(AbstractType):
-    __resource_type__ = "CoverageEligibilityRequestInsurance"
-
-
-class CoverageEligibilityRequestItemType(AbstractType):
-    __resource_type__ = "CoverageEligibilityRequestItem"
-
-
-class CoverageEligibilityRequestItemDiagnosisType(AbstractType):
-    __resource_type__ = "CoverageEligibilityRequestItemDiagnosis"
-
-
-class CoverageEligibilityRequestSupportingInfoType(AbstractType):
-    __resource_type__ = "CoverageEligibilityRequestSupportingInfo"
-
-
-class CoverageEligibilityResponseType(AbstractType):
-    __resource_type__ = "CoverageEligibilityResponse"
-
-
-class CoverageEligibilityResponseErrorType(AbstractType):
-    __resource_type__ = "CoverageEligibilityResponseError"
-
-
-class CoverageEligibilityResponseInsuranceType(AbstractType):
-    __resource_type__ = "CoverageEligibilityResponseInsurance"
-
-
-class CoverageEligibilityResponseInsuranceItemType(AbstractType):
-    __resource_type__ = "CoverageEligibilityResponseInsuranceItem"
-
-
-class CoverageEligibilityResponseInsuranceItemBenefitType(AbstractType):
-    __resource_type__ = "CoverageEligibilityResponseInsuranceItemBenefit"
-
-
-class DataRequirementType(AbstractType):
-    __resource_type__ = "DataRequirement"
-
-
-class DataRequirementCodeFilterType(AbstractType):
-    __resource_type__ = "DataRequirementCodeFilter"
-
-
-class DataRequirementDateFilterType(AbstractType):
-    __resource_type__ = "DataRequirementDateFilter"
-
-
-class DataRequirementSortType(AbstractType):
-    __resource_type__ = "DataRequirementSort"
-
-
-class DetectedIssueType(AbstractType):
-    __resource_type__ = "DetectedIssue"
-
-
-class DetectedIssueEvidenceType(AbstractType):
-    __resource_type__ = "DetectedIssueEvidence"
-
-
-class DetectedIssueMitigationType(AbstractType):
-    __resource_type__ = "DetectedIssueMitigation"
-
-
-class DeviceType(AbstractType):
-    __resource_type__ = "Device"
-
-
-class DeviceDefinitionType(AbstractType):
-    __resource_type__ = "DeviceDefinition"
-
-
-class DeviceDefinitionCapabilityType(AbstractType):
-    __resource_type__ = "DeviceDefinitionCapability"
-
-
-class DeviceDefinitionDeviceNameType(AbstractType):
-    __resource_type__ = "DeviceDefinitionDeviceName"
-
-
-class DeviceDefinitionMaterialType(AbstractType):
-    __resource_type__ = "DeviceDefinitionMaterial"
-
-
-class DeviceDefinitionPropertyType(AbstractType):
-    __resource_type__ = "DeviceDefinitionProperty"
-
-
-class DeviceDefinitionSpecializationType(AbstractType):
-    __resource_type__ = "DeviceDefinitionSpecialization"
-
-
-class DeviceDefinitionUdiDeviceIdentifierType(AbstractType):
-    __resource_type__ = "DeviceDefinitionUdiDeviceIdentifier"
-
-
-class DeviceDeviceNameType(AbstractType):
-    __resource_type__ = "DeviceDeviceName"
-
-
-class DeviceMetricType(AbstractType):
-    __resource_type__ = "DeviceMetric"
-
-
-class DeviceMetricCalibrationType(AbstractType):
-    __resource_type__ = "DeviceMetricCalibration"
-
-
-class DevicePropertyType(AbstractType):
-    __resource_type__ = "DeviceProperty"
-
-
-class DeviceRequestType(AbstractType):
-    __resource_type__ = "DeviceRequest"
-
-
-class DeviceRequestParameterType(AbstractType):
-    __resource_type__ = "DeviceRequestParameter"
-
-
-class DeviceSpecializationType(AbstractType):
-    __resource_type__ = "DeviceSpecialization"
-
-
-class DeviceUdiCarrierType(AbstractType):
-    __resource_type__ = "DeviceUdiCarrier"
-
-
-class DeviceUseStatementType(AbstractType):
-    __resource_type__ = "DeviceUseStatement"
-
-
-class DeviceVersionType(AbstractType):
-    __resource_type__ = "DeviceVersion"
-
-
-class DiagnosticReportType(AbstractType):
-    __resource_type__ = "DiagnosticReport"
-
-
-class DiagnosticReportMediaType(AbstractType):
-    __resource_type__ = "DiagnosticReportMedia"
-
-
-class DistanceType(AbstractType):
-    __resource_type__ = "Distance"
-
-
-class DocumentManifestType(AbstractType):
-    __resource_type__ = "DocumentManifest"
-
-
-class DocumentManifestRelatedType(AbstractType):
-    __resource_type__ = "DocumentManifestRelated"
-
-
-class DocumentReferenceType(AbstractType):
-    __resource_type__ = "DocumentReference"
-
-
-class DocumentReferenceContentType(AbstractType):
-    __resource_type__ = "DocumentReferenceContent"
-
-
-class DocumentReferenceContextType(AbstractType):
-    __resource_type__ = "DocumentReferenceContext"
-
-
-class DocumentReferenceRelatesToType(AbstractType):
-    __resource_type__ = "DocumentReferenceRelatesTo"
-
-
-class DomainResourceType(AbstractType):
-    __resource_type__ = "DomainResource"
-
-
-class DosageType(AbstractType):
-    __resource_type__ = "Dosage"
-
-
-class DosageDoseAndRateType(AbstractType):
-    __resource_type__ = "DosageDoseAndRate"
-
-
-class DurationType(AbstractType):
-    __resource_type__ = "Duration"
-
-
-class ElementDefinitionType(AbstractType):
-    __resource_type__ = "ElementDefinition"
-
-
-class ElementDefinitionBaseType(AbstractType):
-    __resource_type__ = "ElementDefinitionBase"
-
-
-class ElementDefinitionBindingType(AbstractType):
-    __resource_type__ = "ElementDefinitionBinding"
-
-
-class ElementDefinitionConstraintType(AbstractType):
-    __resource_type__ = "ElementDefinitionConstraint"
-
-
-class ElementDefinitionExampleType(AbstractType):
-    __resource_type__ = "ElementDefinitionExample"
-
-
-class ElementDefinitionMappingType(AbstractType):
-    __resource_type__ = "ElementDefinitionMapping"
-
-
-class ElementDefinitionSlicingType(AbstractType):
-    __resource_type__ = "ElementDefinitionSlicing"
-
-
-class ElementDefinitionSlicingDiscriminatorType(AbstractType):
-    __resource_type__ = "ElementDefinitionSlicingDiscriminator"
-
-
-class ElementDefinitionTypeType(AbstractType):
-    __resource_type__ = "ElementDefinitionType"
-
-
-class EncounterType(AbstractType):
-    __resource_type__ = "Encounter"
-
-
-class EncounterClassHistoryType(AbstractType):
-    __resource_type__ = "EncounterClassHistory"
-
-
-class EncounterDiagnosisType(AbstractType):
-    __resource_type__ = "EncounterDiagnosis"
-
-
-class EncounterHospitalizationType(AbstractType):
-    __resource_type__ = "EncounterHospitalization"
-
-
-class EncounterLocationType(AbstractType):
-    __resource_type__ = "EncounterLocation"
-
-
-class EncounterParticipantType(AbstractType):
-    __resource_type__ = "EncounterParticipant"
-
-
-class EncounterStatusHistoryType(AbstractType):
-    __resource_type__ = "EncounterStatusHistory"
-
-
-class EndpointType(AbstractType):
-    __resource_type__ = "Endpoint"
-
-
-class EnrollmentRequestType(AbstractType):
-    __resource_type__ = "EnrollmentRequest"
-
-
-class EnrollmentResponseType(AbstractType):
-    __resource_type__ = "EnrollmentResponse"
-
-
-class EpisodeOfCareType(AbstractType):
-    __resource_type__ = "EpisodeOfCare"
-
-
-class EpisodeOfCareDiagnosisType(AbstractType):
-    __resource_type__ = "EpisodeOfCareDiagnosis"
-
-
-class EpisodeOfCareStatusHistoryType(AbstractType):
-    __resource_type__ = "EpisodeOfCareStatusHistory"
-
-
-class EventDefinitionType(AbstractType):
-    __resource_type__ = "EventDefinition"
-
-
-class EvidenceType(AbstractType):
-    __resource_type__ = "Evidence"
-
-
-class EvidenceCertaintyType(AbstractType):
-    __resource_type__ = "EvidenceCertainty"
-
-
-class EvidenceReportType(AbstractType):
-    __resource_type__ = "EvidenceReport"
-
-
-class EvidenceReportRelatesToType(AbstractType):
-    __resource_type__ = "EvidenceReportRelatesTo"
-
-
-class EvidenceReportSectionType(AbstractType):
-    __resource_type__ = "EvidenceReportSection"
-
-
-class EvidenceReportSubjectType(AbstractType):
-    __resource_type__ = "EvidenceReportSubject"
-
-
-class EvidenceReportSubjectCharacteristicType(AbstractType):
-    __resource_type__ = "EvidenceReportSubjectCharacteristic"
-
-
-class EvidenceStatisticType(AbstractType):
-    __resource_type__ = "EvidenceStatistic"
-
-
-class EvidenceStatisticAttributeEstimateType(AbstractType):
-    __resource_type__ = "EvidenceStatisticAttributeEstimate"
-
-
-class EvidenceStatisticModelCharacteristicType(AbstractType):
-    __resource_type__ = "EvidenceStatisticModelCharacteristic"
-
-
-class EvidenceStatisticModelCharacteristicVariableType(AbstractType):
-    __resource_type__ = "EvidenceStatisticModelCharacteristicVariable"
-
-
-class EvidenceStatisticSampleSizeType(AbstractType):
-    __resource_type__ = "EvidenceStatisticSampleSize"
-
-
-class EvidenceVariableType(AbstractType):
-    __resource_type__ = "EvidenceVariable"
-
-
-class EvidenceVariableCategoryType(AbstractType):
-    __resource_type__ = "EvidenceVariableCategory"
-
-
-class EvidenceVariableCharacteristicType(AbstractType):
-    __resource_type__ = "EvidenceVariableCharacteristic"
-
-
-class EvidenceVariableCharacteristicTimeFromStartType(AbstractType):
-    __resource_type__ = "EvidenceVariableCharacteristicTimeFromStart"
-
-
-class EvidenceVariableDefinitionType(AbstractType):
-    __resource_type__ = "EvidenceVariableDefinition"
-
-
-class ExampleScenarioType(AbstractType):
-    __resource_type__ = "ExampleScenario"
-
-
-class ExampleScenarioActorType(AbstractType):
-    __resource_type__ = "ExampleScenarioActor"
-
-
-class ExampleScenarioInstanceType(AbstractType):
-    __resource_type__ = "ExampleScenarioInstance"
-
-
-class ExampleScenarioInstanceContainedInstanceType(AbstractType):
-    __resource_type__ = "ExampleScenarioInstanceContainedInstance"
-
-
-class ExampleScenarioInstanceVersionType(AbstractType):
-    __resource_type__ = "ExampleScenarioInstanceVersion"
-
-
-class ExampleScenarioProcessType(AbstractType):
-    __resource_type__ = "ExampleScenarioProcess"
-
-
-class ExampleScenarioProcessStepType(AbstractType):
-    __resource_type__ = "ExampleScenarioProcessStep"
-
-
-class ExampleScenarioProcessStepAlternativeType(AbstractType):
-    __resource_type__ = "ExampleScenarioProcessStepAlternative"
-
-
-class ExampleScenarioProcessStepOperationType(AbstractType):
-    __resource_type__ = "ExampleScenarioProcessStepOperation"
-
-
-class ExplanationOfBenefitType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefit"
-
-
-class ExplanationOfBenefitAccidentType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitAccident"
-
-
-class ExplanationOfBenefitAddItemType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitAddItem"
-
-
-class ExplanationOfBenefitAddItemDetailType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitAddItemDetail"
-
-
-class ExplanationOfBenefitAddItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitAddItemDetailSubDetail"
-
-
-class ExplanationOfBenefitBenefitBalanceType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitBenefitBalance"
-
-
-class ExplanationOfBenefitBenefitBalanceFinancialType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitBenefitBalanceFinancial"
-
-
-class ExplanationOfBenefitCareTeamType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitCareTeam"
-
-
-class ExplanationOfBenefitDiagnosisType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitDiagnosis"
-
-
-class ExplanationOfBenefitInsuranceType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitInsurance"
-
-
-class ExplanationOfBenefitItemType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitItem"
-
-
-class ExplanationOfBenefitItemAdjudicationType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitItemAdjudication"
-
-
-class ExplanationOfBenefitItemDetailType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitItemDetail"
-
-
-class ExplanationOfBenefitItemDetailSubDetailType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitItemDetailSubDetail"
-
-
-class ExplanationOfBenefitPayeeType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitPayee"
-
-
-class ExplanationOfBenefitPaymentType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitPayment"
-
-
-class ExplanationOfBenefitProcedureType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitProcedure"
-
-
-class ExplanationOfBenefitProcessNoteType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitProcessNote"
-
-
-class ExplanationOfBenefitRelatedType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitRelated"
-
-
-class ExplanationOfBenefitSupportingInfoType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitSupportingInfo"
-
-
-class ExplanationOfBenefitTotalType(AbstractType):
-    __resource_type__ = "ExplanationOfBenefitTotal"
-
-
-class ExpressionType(AbstractType):
-    __resource_type__ = "Expression"
-
-
-class ExtensionType(AbstractType):
-    __resource_type__ = "Extension"
-
-
-class FamilyMemberHistoryType(AbstractType):
-    __resource_type__ = "FamilyMemberHistory"
-
-
-class FamilyMemberHistoryConditionType(AbstractType):
-    __resource_type__ = "FamilyMemberHistoryCondition"
-
-
-class FlagType(AbstractType):
-    __resource_type__ = "Flag"
-
-
-class GoalType(AbstractType):
-    __resource_type__ = "Goal"
-
-
-class GoalTargetType(AbstractType):
-    __resource_type__ = "GoalTarget"
-
-
-class GraphDefinitionType(AbstractType):
-    __resource_type__ = "GraphDefinition"
-
-
-class GraphDefinitionLinkType(AbstractType):
-    __resource_type__ = "GraphDefinitionLink"
-
-
-class GraphDefinitionLinkTargetType(AbstractType):
-    __resource_type__ = "GraphDefinitionLinkTarget"
-
-
-class GraphDefinitionLinkTargetCompartmentType(AbstractType):
-    __resource_type__ = "GraphDefinitionLinkTargetCompartment"
-
-
-class GroupType(AbstractType):
-    __resource_type__ = "Group"
-
-
-class GroupCharacteristicType(AbstractType):
-    __resource_type__ = "GroupCharacteristic"
-
-
-class GroupMemberType(AbstractType):
-    __resource_type__ = "GroupMember"
-
-
-class GuidanceResponseType(AbstractType):
-    __resource_type__ = "GuidanceResponse"
-
-
-class HealthcareServiceType(AbstractType):
-    __resource_type__ = "HealthcareService"
-
-
-class HealthcareServiceAvailableTimeType(AbstractType):
-    __resource_type__ = "HealthcareServiceAvailableTime"
-
-
-class HealthcareServiceEligibilityType(AbstractType):
-    __resource_type__ = "HealthcareServiceEligibility"
-
-
-class HealthcareServiceNotAvailableType(AbstractType):
-    __resource_type__ = "HealthcareServiceNotAvailable"
-
-
-class HumanNameType(AbstractType):
-    __resource_type__ = "HumanName"
-
-
-class IdentifierType(AbstractType):
-    __resource_type__ = "Identifier"
-
-
-class ImagingStudyType(AbstractType):
-    __resource_type__ = "ImagingStudy"
-
-
-class ImagingStudySeriesType(AbstractType):
-    __resource_type__ = "ImagingStudySeries"
-
-
-class ImagingStudySeriesInstanceType(AbstractType):
-    __resource_type__ = "ImagingStudySeriesInstance"
-
-
-class ImagingStudySeriesPerformerType(AbstractType):
-    __resource_type__ = "ImagingStudySeriesPerformer"
-
-
-class ImmunizationType(AbstractType):
-    __resource_type__ = "Immunization"
-
-
-class ImmunizationEducationType(AbstractType):
-    __resource_type__ = "ImmunizationEducation"
-
-
-class ImmunizationEvaluationType(AbstractType):
-    __resource_type__ = "ImmunizationEvaluation"
-
-
-class ImmunizationPerformerType(AbstractType):
-    __resource_type__ = "ImmunizationPerformer"
-
-
-class ImmunizationProtocolAppliedType(AbstractType):
-    __resource_type__ = "ImmunizationProtocolApplied"
-
-
-class ImmunizationReactionType(AbstractType):
-    __resource_type__ = "ImmunizationReaction"
-
-
-class ImmunizationRecommendationType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendation"
-
-
-class ImmunizationRecommendationRecommendationType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendationRecommendation"
-
-
-class ImmunizationRecommendationRecommendationDateCriterionType(AbstractType):
-    __resource_type__ = "ImmunizationRecommendationRecommendationDateCriterion"
-
-
-class ImplementationGuideType(AbstractType):
-    __resource_type__ = "ImplementationGuide"
-
-
-class ImplementationGuideDefinitionType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinition"
-
-
-class ImplementationGuideDefinitionGroupingType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinitionGrouping"
-
-
-class ImplementationGuideDefinitionPageType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinitionPage"
-
-
-class ImplementationGuideDefinitionParameterType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinitionParameter"
-
-
-class ImplementationGuideDefinitionResourceType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinitionResource"
-
-
-class ImplementationGuideDefinitionTemplateType(AbstractType):
-    __resource_type__ = "ImplementationGuideDefinitionTemplate"
-
-
-class ImplementationGuideDependsOnType(AbstractType):
-    __resource_type__ = "ImplementationGuideDependsOn"
-
-
-class ImplementationGuideGlobalType(AbstractType):
-    __resource_type__ = "ImplementationGuideGlobal"
-
-
-class ImplementationGuideManifestType(AbstractType):
-    __resource_type__ = "ImplementationGuideManifest"
-
-
-class ImplementationGuideManifestPageType(AbstractType):
-    __resource_type__ = "ImplementationGuideManifestPage"
-
-
-class ImplementationGuideManifestResourceType(AbstractType):
-    __resource_type__ = "ImplementationGuideManifestResource"
-
-
-class IngredientType(AbstractType):
-    __resource_type__ = "Ingredient"
-
-
-class IngredientManufacturerType(AbstractType):
-    __resource_type__ = "IngredientManufacturer"
-
-
-class IngredientSubstanceType(AbstractType):
-    __resource_type__ = "IngredientSubstance"
-
-
-class IngredientSubstanceStrengthType(AbstractType):
-    __resource_type__ = "IngredientSubstanceStrength"
-
-
-class IngredientSubstanceStrengthReferenceStrengthType(AbstractType):
-    __resource_type__ = "IngredientSubstanceStrengthReferenceStrength"
-
-
-class InsurancePlanType(AbstractType):
-    __resource_type__ = "InsurancePlan"
-
-
-class InsurancePlanContactType(AbstractType):
-    __resource_type__ = "InsurancePlanContact"
-
-
-class InsurancePlanCoverageType(AbstractType):
-    __resource_type__ = "InsurancePlanCoverage"
-
-
-class InsurancePlanCoverageBenefitType(AbstractType):
-    __resource_type__ = "InsurancePlanCoverageBenefit"
-
-
-class InsurancePlanCoverageBenefitLimitType(AbstractType):
-    __resource_type__ = "InsurancePlanCoverageBenefitLimit"
-
-
-class InsurancePlanPlanType(AbstractType):
-    __resource_type__ = "InsurancePlanPlan"
-
-
-class InsurancePlanPlanGeneralCostType(AbstractType):
-    __resource_type__ = "InsurancePlanPlanGeneralCost"
-
-
-class InsurancePlanPlanSpecificCostType(AbstractType):
-    __resource_type__ = "InsurancePlanPlanSpecificCost"
-
-
-class InsurancePlanPlanSpecificCostBenefitType(AbstractType):
-    __resource_type__ = "InsurancePlanPlanSpecificCostBenefit"
-
-
-class InsurancePlanPlanSpecificCostBenefitCostType(AbstractType):
-    __resource_type__ = "InsurancePlanPlanSpecificCostBenefitCost"
-
-
-class InvoiceType(AbstractType):
-    __resource_type__ = "Invoice"
-
-
-class InvoiceLineItemType(AbstractType):
-    __resource_type__ = "InvoiceLineItem"
-
-
-class InvoiceLineItemPriceComponentType(AbstractType):
-    __resource_type__ = "InvoiceLineItemPriceComponent"
-
-
-class InvoiceParticipantType(AbstractType):
-    __resource_type__ = "InvoiceParticipant"
-
-
-class LibraryType(AbstractType):
-    __resource_type__ = "Library"
-
-
-class LinkageType(AbstractType):
-    __resource_type__ = "Linkage"
-
-
-class LinkageItemType(AbstractType):
-    __resource_type__ = "LinkageItem"
-
-
-class ListType(AbstractType):
-    __resource_type__ = "List"
-
-
-class ListEntryType(AbstractType):
-    __resource_type__ = "ListEntry"
-
-
-class LocationType(AbstractType):
-    __resource_type__ = "Location"
-
-
-class LocationHoursOfOperationType(AbstractType):
-    __resource_type__ = "LocationHoursOfOperation"
-
-
-class LocationPositionType(AbstractType):
-    __resource_type__ = "LocationPosition"
-
-
-class ManufacturedItemDefinitionType(AbstractType):
-    __resource_type__ = "ManufacturedItemDefinition"
-
-
-class ManufacturedItemDefinitionPropertyType(AbstractType):
-    __resource_type__ = "ManufacturedItemDefinitionProperty"
-
-
-class MarketingStatusType(AbstractType):
-    __resource_type__ = "MarketingStatus"
-
-
-class MeasureType(AbstractType):
-    __resource_type__ = "Measure"
-
-
-class MeasureGroupType(AbstractType):
-    __resource_type__ = "MeasureGroup"
-
-
-class MeasureGroupPopulationType(AbstractType):
-    __resource_type__ = "MeasureGroupPopulation"
-
-
-class MeasureGroupStratifierType(AbstractType):
-    __resource_type__ = "MeasureGroupStratifier"
-
-
-class MeasureGroupStratifierComponentType(AbstractType):
-    __resource_type__ = "MeasureGroupStratifierComponent"
-
-
-class MeasureReportType(AbstractType):
-    __resource_type__ = "MeasureReport"
-
-
-class MeasureReportGroupType(AbstractType):
-    __resource_type__ = "MeasureReportGroup"
-
-
-class MeasureReportGroupPopulationType(AbstractType):
-    __resource_type__ = "MeasureReportGroupPopulation"
-
-
-class MeasureReportGroupStratifierType(AbstractType):
-    __resource_type__ = "MeasureReportGroupStratifier"
-
-
-class MeasureReportGroupStratifierStratumType(AbstractType):
-    __resource_type__ = "MeasureReportGroupStratifierStratum"
-
-
-class MeasureReportGroupStratifierStratumComponentType(AbstractType):
-    __resource_type__ = "MeasureReportGroupStratifierStratumComponent"
-
-
-class MeasureReportGroupStratifierStratumPopulationType(AbstractType):
-    __resource_type__ = "MeasureReportGroupStratifierStratumPopulation"
-
-
-class MeasureSupplementalDataType(AbstractType):
-    __resource_type__ = "MeasureSupplementalData"
-
-
-class MediaType(AbstractType):
-    __resource_type__ = "Media"
-
-
-class MedicationType(AbstractType):
-    __resource_type__ = "Medication"
-
-
-class MedicationAdministrationType(AbstractType):
-    __resource_type__ = "MedicationAdministration"
-
-
-class MedicationAdministrationDosageType(AbstractType):
-    __resource_type__ = "MedicationAdministrationDosage"
-
-
-class MedicationAdministrationPerformerType(AbstractType):
-    __resource_type__ = "MedicationAdministrationPerformer"
-
-
-class MedicationBatchType(AbstractType):
-    __resource_type__ = "MedicationBatch"
-
-
-class MedicationDispenseType(AbstractType):
-    __resource_type__ = "MedicationDispense"
-
-
-class MedicationDispensePerformerType(AbstractType):
-    __resource_type__ = "MedicationDispensePerformer"
-
-
-class MedicationDispenseSubstitutionType(AbstractType):
-    __resource_type__ = "MedicationDispenseSubstitution"
-
-
-class MedicationIngredientType(AbstractType):
-    __resource_type__ = "MedicationIngredient"
-
-
-class MedicationKnowledgeType(AbstractType):
-    __resource_type__ = "MedicationKnowledge"
-
-
-class MedicationKnowledgeAdministrationGuidelinesType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeAdministrationGuidelines"
-
-
-class MedicationKnowledgeAdministrationGuidelinesDosageType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeAdministrationGuidelinesDosage"
-
-
-class MedicationKnowledgeAdministrationGuidelinesPatientCharacteristicsType(
-    AbstractType
-):
-    __resource_type__ = (
-        "MedicationKnowledgeAdministrationGuidelinesPatientCharacteristics"
-    )
-
-
-class MedicationKnowledgeCostType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeCost"
-
-
-class MedicationKnowledgeDrugCharacteristicType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeDrugCharacteristic"
-
-
-class MedicationKnowledgeIngredientType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeIngredient"
-
-
-class MedicationKnowledgeKineticsType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeKinetics"
-
-
-class MedicationKnowledgeMedicineClassificationType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeMedicineClassification"
-
-
-class MedicationKnowledgeMonitoringProgramType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeMonitoringProgram"
-
-
-class MedicationKnowledgeMonographType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeMonograph"
-
-
-class MedicationKnowledgePackagingType(AbstractType):
-    __resource_type__ = "MedicationKnowledgePackaging"
-
-
-class MedicationKnowledgeRegulatoryType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeRegulatory"
-
-
-class MedicationKnowledgeRegulatoryMaxDispenseType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeRegulatoryMaxDispense"
-
-
-class MedicationKnowledgeRegulatoryScheduleType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeRegulatorySchedule"
-
-
-class MedicationKnowledgeRegulatorySubstitutionType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeRegulatorySubstitution"
-
-
-class MedicationKnowledgeRelatedMedicationKnowledgeType(AbstractType):
-    __resource_type__ = "MedicationKnowledgeRelatedMedicationKnowledge"
-
-
-class MedicationRequestType(AbstractType):
-    __resource_type__ = "MedicationRequest"
-
-
-class MedicationRequestDispenseRequestType(AbstractType):
-    __resource_type__ = "MedicationRequestDispenseRequest"
-
-
-class MedicationRequestDispenseRequestInitialFillType(AbstractType):
-    __resource_type__ = "MedicationRequestDispenseRequestInitialFill"
-
-
-class MedicationRequestSubstitutionType(AbstractType):
-    __resource_type__ = "MedicationRequestSubstitution"
-
-
-class MedicationStatementType(AbstractType):
-    __resource_type__ = "MedicationStatement"
-
-
-class MedicinalProductDefinitionType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinition"
-
-
-class MedicinalProductDefinitionCharacteristicType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionCharacteristic"
-
-
-class MedicinalProductDefinitionContactType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionContact"
-
-
-class MedicinalProductDefinitionCrossReferenceType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionCrossReference"
-
-
-class MedicinalProductDefinitionNameType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionName"
-
-
-class MedicinalProductDefinitionNameCountryLanguageType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionNameCountryLanguage"
-
-
-class MedicinalProductDefinitionNameNamePartType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionNameNamePart"
-
-
-class MedicinalProductDefinitionOperationType(AbstractType):
-    __resource_type__ = "MedicinalProductDefinitionOperation"
-
-
-class MessageDefinitionType(AbstractType):
-    __resource_type__ = "MessageDefinition"
-
-
-class MessageDefinitionAllowedResponseType(AbstractType):
-    __resource_type__ = "MessageDefinitionAllowedResponse"
-
-
-class MessageDefinitionFocusType(AbstractType):
-    __resource_type__ = "MessageDefinitionFocus"
-
-
-class MessageHeaderType(AbstractType):
-    __resource_type__ = "MessageHeader"
-
-
-class MessageHeaderDestinationType(AbstractType):
-    __resource_type__ = "MessageHeaderDestination"
-
-
-class MessageHeaderResponseType(AbstractType):
-    __resource_type__ = "MessageHeaderResponse"
-
-
-class MessageHeaderSourceType(AbstractType):
-    __resource_type__ = "MessageHeaderSource"
-
-
-class MetaType(AbstractType):
-    __resource_type__ = "Meta"
-
-
-class MolecularSequenceType(AbstractType):
-    __resource_type__ = "MolecularSequence"
-
-
-class MolecularSequenceQualityType(AbstractType):
-    __resource_type__ = "MolecularSequenceQuality"
-
-
-class MolecularSequenceQualityRocType(AbstractType):
-    __resource_type__ = "MolecularSequenceQualityRoc"
-
-
-class MolecularSequenceReferenceSeqType(AbstractType):
-    __resource_type__ = "MolecularSequenceReferenceSeq"
-
-
-class MolecularSequenceRepositoryType(AbstractType):
-    __resource_type__ = "MolecularSequenceRepository"
-
-
-class MolecularSequenceStructureVariantType(AbstractType):
-    __resource_type__ = "MolecularSequenceStructureVariant"
-
-
-class MolecularSequenceStructureVariantInnerType(AbstractType):
-    __resource_type__ = "MolecularSequenceStructureVariantInner"
-
-
-class MolecularSequenceStructureVariantOuterType(AbstractType):
-    __resource_type__ = "MolecularSequenceStructureVariantOuter"
-
-
-class MolecularSequenceVariantType(AbstractType):
-    __resource_type__ = "MolecularSequenceVariant"
-
-
-class MoneyType(AbstractType):
-    __resource_type__ = "Money"
-
-
-class NamingSystemType(AbstractType):
-    __resource_type__ = "NamingSystem"
-
-
-class NamingSystemUniqueIdType(AbstractType):
-    __resource_type__ = "NamingSystemUniqueId"
-
-
-class NarrativeType(AbstractType):
-    __resource_type__ = "Narrative"
-
-
-class NutritionOrderType(AbstractType):
-    __resource_type__ = "NutritionOrder"
-
-
-class NutritionOrderEnteralFormulaType(AbstractType):
-    __resource_type__ = "NutritionOrderEnteralFormula"
-
-
-class NutritionOrderEnteralFormulaAdministrationType(AbstractType):
-    __resource_type__ = "NutritionOrderEnteralFormulaAdministration"
-
-
-class NutritionOrderOralDietType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDiet"
-
-
-class NutritionOrderOralDietNutrientType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDietNutrient"
-
-
-class NutritionOrderOralDietTextureType(AbstractType):
-    __resource_type__ = "NutritionOrderOralDietTexture"
-
-
-class NutritionOrderSupplementType(AbstractType):
-    __resource_type__ = "NutritionOrderSupplement"
-
-
-class NutritionProductType(AbstractType):
-    __resource_type__ = "NutritionProduct"
-
-
-class NutritionProductIngredientType(AbstractType):
-    __resource_type__ = "NutritionProductIngredient"
-
-
-class NutritionProductInstanceType(AbstractType):
-    __resource_type__ = "NutritionProductInstance"
-
-
-class NutritionProductNutrientType(AbstractType):
-    __resource_type__ = "NutritionProductNutrient"
-
-
-class NutritionProductProductCharacteristicType(AbstractType):
-    __resource_type__ = "NutritionProductProductCharacteristic"
-
-
-class ObservationType(AbstractType):
-    __resource_type__ = "Observation"
-
-
-class ObservationComponentType(AbstractType):
-    __resource_type__ = "ObservationComponent"
-
-
-class ObservationDefinitionType(AbstractType):
-    __resource_type__ = "ObservationDefinition"
-
-
-class ObservationDefinitionQualifiedIntervalType(AbstractType):
-    __resource_type__ = "ObservationDefinitionQualifiedInterval"
-
-
-class ObservationDefinitionQuantitativeDetailsType(AbstractType):
-    __resource_type__ = "ObservationDefinitionQuantitativeDetails"
-
-
-class ObservationReferenceRangeType(AbstractType):
-    __resource_type__ = "ObservationReferenceRange"
-
-
-class OperationDefinitionType(AbstractType):
-    __resource_type__ = "OperationDefinition"
-
-
-class OperationDefinitionOverloadType(AbstractType):
-    __resource_type__ = "OperationDefinitionOverload"
-
-
-class OperationDefinitionParameterType(AbstractType):
-    __resource_type__ = "OperationDefinitionParameter"
-
-
-class OperationDefinitionParameterBindingType(AbstractType):
-    __resource_type__ = "OperationDefinitionParameterBinding"
-
-
-class OperationDefinitionParameterReferencedFromType(AbstractType):
-    __resource_type__ = "OperationDefinitionParameterReferencedFrom"
-
-
-class OperationOutcomeType(AbstractType):
-    __resource_type__ = "OperationOutcome"
-
-
-class OperationOutcomeIssueType(AbstractType):
-    __resource_type__ = "OperationOutcomeIssue"
-
-
-class OrganizationType(AbstractType):
-    __resource_type__ = "Organization"
-
-
-class OrganizationAffiliationType(AbstractType):
-    __resource_type__ = "OrganizationAffiliation"
-
-
-class OrganizationContactType(AbstractType):
-    __resource_type__ = "OrganizationContact"
-
-
-class PackagedProductDefinitionType(AbstractType):
-    __resource_type__ = "PackagedProductDefinition"
-
-
-class PackagedProductDefinitionLegalStatusOfSupplyType(AbstractType):
-    __resource_type__ = "PackagedProductDefinitionLegalStatusOfSupply"
-
-
-class PackagedProductDefinitionPackageType(AbstractType):
-    __resource_type__ = "PackagedProductDefinitionPackage"
-
-
-class PackagedProductDefinitionPackageContainedItemType(AbstractType):
-    __resource_type__ = "PackagedProductDefinitionPackageContainedItem"
-
-
-class PackagedProductDefinitionPackagePropertyType(AbstractType):
-    __resource_type__ = "PackagedProductDefinitionPackageProperty"
-
-
-class PackagedProductDefinitionPackageShelfLifeStorageType(AbstractType):
-    __resource_type__ = "PackagedProductDefinitionPackageShelfLifeStorage"
-
-
-class ParameterDefinitionType(AbstractType):
-    __resource_type__ = "ParameterDefinition"
-
-
-class ParametersType(AbstractType):
-    __resource_type__ = "Parameters"
-
-
-class ParametersParameterType(AbstractType):
-    __resource_type__ = "ParametersParameter"
-
-
-class PatientType(AbstractType):
-    __resource_type__ = "Patient"
-
-
-class PatientCommunicationType(AbstractType):
-    __resource_type__ = "PatientCommunication"
-
-
-class PatientContactType(AbstractType):
-    __resource_type__ = "PatientContact"
-
-
-class PatientLinkType(AbstractType):
-    __resource_type__ = "PatientLink"
-
-
-class PaymentNoticeType(AbstractType):
-    __resource_type__ = "PaymentNotice"
-
-
-class PaymentReconciliationType(AbstractType):
-    __resource_type__ = "PaymentReconciliation"
-
-
-class PaymentReconciliationDetailType(AbstractType):
-    __resource_type__ = "PaymentReconciliationDetail"
-
-
-class PaymentReconciliationProcessNoteType(AbstractType):
-    __resource_type__ = "PaymentReconciliationProcessNote"
-
-
-class PeriodType(AbstractType):
-    __resource_type__ = "Period"
-
-
-class PersonType(AbstractType):
-    __resource_type__ = "Person"
-
-
-class PersonLinkType(AbstractType):
-    __resource_type__ = "PersonLink"
-
-
-class PlanDefinitionType(AbstractType):
-    __resource_type__ = "PlanDefinition"
-
-
-class PlanDefinitionActionType(AbstractType):
-    __resource_type__ = "PlanDefinitionAction"
-
-
-class PlanDefinitionActionConditionType(AbstractType):
-    __resource_type__ = "PlanDefinitionActionCondition"
-
-
-class PlanDefinitionActionDynamicValueType(AbstractType):
-    __resource_type__ = "PlanDefinitionActionDynamicValue"
-
-
-class PlanDefinitionActionParticipantType(AbstractType):
-    __resource_type__ = "PlanDefinitionActionParticipant"
-
-
-class PlanDefinitionActionRelatedActionType(AbstractType):
-    __resource_type__ = "PlanDefinitionActionRelatedAction"
-
-
-class PlanDefinitionGoalType(AbstractType):
-    __resource_type__ = "PlanDefinitionGoal"
-
-
-class PlanDefinitionGoalTargetType(AbstractType):
-    __resource_type__ = "PlanDefinitionGoalTarget"
-
-
-class PopulationType(AbstractType):
-    __resource_type__ = "Population"
-
-
-class PractitionerType(AbstractType):
-    __resource_type__ = "Practitioner"
-
-
-class PractitionerQualificationType(AbstractType):
-    __resource_type__ = "PractitionerQualification"
-
-
-class PractitionerRoleType(AbstractType):
-    __resource_type__ = "PractitionerRole"
-
-
-class PractitionerRoleAvailableTimeType(AbstractType):
-    __resource_type__ = "PractitionerRoleAvailableTime"
-
-
-class PractitionerRoleNotAvailableType(AbstractType):
-    __resource_type__ = "PractitionerRoleNotAvailable"
-
-
-class ProcedureType(AbstractType):
-    __resource_type__ = "Procedure"
-
-
-class ProcedureFocalDeviceType(AbstractType):
-    __resource_type__ = "ProcedureFocalDevice"
-
-
-class ProcedurePerformerType(AbstractType):
-    __resource_type__ = "ProcedurePerformer"
-
-
-class ProdCharacteristicType(AbstractType):
-    __resource_type__ = "ProdCharacteristic"
-
-
-class ProductShelfLifeType(AbstractType):
-    __resource_type__ = "ProductShelfLife"
-
-
-class ProvenanceType(AbstractType):
-    __resource_type__ = "Provenance"
-
-
-class ProvenanceAgentType(AbstractType):
-    __resource_type__ = "ProvenanceAgent"
-
-
-class ProvenanceEntityType(AbstractType):
-    __resource_type__ = "ProvenanceEntity"
-
-
-class QuantityType(AbstractType):
-    __resource_type__ = "Quantity"
-
-
-class QuestionnaireType(AbstractType):
-    __resource_type__ = "Questionnaire"
-
-
-class QuestionnaireItemType(AbstractType):
-    __resource_type__ = "QuestionnaireItem"
-
-
-class QuestionnaireItemAnswerOptionType(AbstractType):
-    __resource_type__ = "QuestionnaireItemAnswerOption"
-
-
-class QuestionnaireItemEnableWhenType(AbstractType):
-    __resource_type__ = "QuestionnaireItemEnableWhen"
-
-
-class QuestionnaireItemInitialType(AbstractType):
-    __resource_type__ = "QuestionnaireItemInitial"
-
-
-class QuestionnaireResponseType(AbstractType):
-    __resource_type__ = "QuestionnaireResponse"
-
-
-class QuestionnaireResponseItemType(AbstractType):
-    __resource_type__ = "QuestionnaireResponseItem"
-
-
-class QuestionnaireResponseItemAnswerType(AbstractType):
-    __resource_type__ = "QuestionnaireResponseItemAnswer"
-
-
-class RangeType(AbstractType):
-    __resource_type__ = "Range"
-
-
-class RatioType(AbstractType):
-    __resource_type__ = "Ratio"
-
-
-class RatioRangeType(AbstractType):
-    __resource_type__ = "RatioRange"
-
-
-class ReferenceType(AbstractType):
-    __resource_type__ = "Reference"
-
-
-class RegulatedAuthorizationType(AbstractType):
-    __resource_type__ = "RegulatedAuthorization"
-
-
-class RegulatedAuthorizationCaseType(AbstractType):
-    __resource_type__ = "RegulatedAuthorizationCase"
-
-
-class RelatedArtifactType(AbstractType):
-    __resource_type__ = "RelatedArtifact"
-
-
-class RelatedPersonType(AbstractType):
-    __resource_type__ = "RelatedPerson"
-
-
-class RelatedPersonCommunicationType(AbstractType):
-    __resource_type__ = "RelatedPersonCommunication"
-
-
-class RequestGroupType(AbstractType):
-    __resource_type__ = "RequestGroup"
-
-
-class RequestGroupActionType(AbstractType):
-    __resource_type__ = "RequestGroupAction"
-
-
-class RequestGroupActionConditionType(AbstractType):
-    __resource_type__ = "RequestGroupActionCondition"
-
-
-class RequestGroupActionRelatedActionType(AbstractType):
-    __resource_type__ = "RequestGroupActionRelatedAction"
-
-
-class ResearchDefinitionType(AbstractType):
-    __resource_type__ = "ResearchDefinition"
-
-
-class ResearchElementDefinitionType(AbstractType):
-    __resource_type__ = "ResearchElementDefinition"
-
-
-class ResearchElementDefinitionCharacteristicType(AbstractType):
-    __resource_type__ = "ResearchElementDefinitionCharacteristic"
-
-
-class ResearchStudyType(AbstractType):
-    __resource_type__ = "ResearchStudy"
-
-
-class ResearchStudyArmType(AbstractType):
-    __resource_type__ = "ResearchStudyArm"
-
-
-class ResearchStudyObjectiveType(AbstractType):
-    __resource_type__ = "ResearchStudyObjective"
-
-
-class ResearchSubjectType(AbstractType):
-    __resource_type__ = "ResearchSubject"
-
-
-class RiskAssessmentType(AbstractType):
-    __resource_type__ = "RiskAssessment"
-
-
-class RiskAssessmentPredictionType(AbstractType):
-    __resource_type__ = "RiskAssessmentPrediction"
-
-
-class SampledDataType(AbstractType):
-    __resource_type__ = "SampledData"
-
-
-class ScheduleType(AbstractType):
-    __resource_type__ = "Schedule"
-
-
-class SearchParameterType(AbstractType):
-    __resource_type__ = "SearchParameter"
-
-
-class SearchParameterComponentType(AbstractType):
-    __resource_type__ = "SearchParameterComponent"
-
-
-class ServiceRequestType(AbstractType):
-    __resource_type__ = "ServiceRequest"
-
-
-class SignatureType(AbstractType):
-    __resource_type__ = "Signature"
-
-
-class SlotType(AbstractType):
-    __resource_type__ = "Slot"
-
-
-class SpecimenType(AbstractType):
-    __resource_type__ = "Specimen"
-
-
-class SpecimenCollectionType(AbstractType):
-    __resource_type__ = "SpecimenCollection"
-
-
-class SpecimenContainerType(AbstractType):
-    __resource_type__ = "SpecimenContainer"
-
-
-class SpecimenDefinitionType(AbstractType):
-    __resource_type__ = "SpecimenDefinition"
-
-
-class SpecimenDefinitionTypeTestedType(AbstractType):
-    __resource_type__ = "SpecimenDefinitionTypeTested"
-
-
-class SpecimenDefinitionTypeTestedContainerType(AbstractType):
-    __resource_type__ = "SpecimenDefinitionTypeTestedContainer"
-
-
-class SpecimenDefinitionTypeTestedContainerAdditiveType(AbstractType):
-    __resource_type__ = "SpecimenDefinitionTypeTestedContainerAdditive"
-
-
-class SpecimenDefinitionTypeTestedHandlingType(AbstractType):
-    __resource_type__ = "SpecimenDefinitionTypeTestedHandling"
-
-
-class SpecimenProcessingType(AbstractType):
-    __resource_type__ = "SpecimenProcessing"
-
-
-class StructureDefinitionType(AbstractType):
-    __resource_type__ = "StructureDefinition"
-
-
-class StructureDefinitionContextType(AbstractType):
-    __resource_type__ = "StructureDefinitionContext"
-
-
-class StructureDefinitionDifferentialType(AbstractType):
-    __resource_type__ = "StructureDefinitionDifferential"
-
-
-class StructureDefinitionMappingType(AbstractType):
-    __resource_type__ = "StructureDefinitionMapping"
-
-
-class StructureDefinitionSnapshotType(AbstractType):
-    __resource_type__ = "StructureDefinitionSnapshot"
-
-
-class StructureMapType(AbstractType):
-    __resource_type__ = "StructureMap"
-
-
-class StructureMapGroupType(AbstractType):
-    __resource_type__ = "StructureMapGroup"
-
-
-class StructureMapGroupInputType(AbstractType):
-    __resource_type__ = "StructureMapGroupInput"
-
-
-class StructureMapGroupRuleType(AbstractType):
-    __resource_type__ = "StructureMapGroupRule"
-
-
-class StructureMapGroupRuleDependentType(AbstractType):
-    __resource_type__ = "StructureMapGroupRuleDependent"
-
-
-class StructureMapGroupRuleSourceType(AbstractType):
-    __resource_type__ = "StructureMapGroupRuleSource"
-
-
-class StructureMapGroupRuleTargetType(AbstractType):
-    __resource_type__ = "StructureMapGroupRuleTarget"
-
-
-class StructureMapGroupRuleTargetParameterType(AbstractType):
-    __resource_type__ = "StructureMapGroupRuleTargetParameter"
-
-
-class StructureMapStructureType(AbstractType):
-    __resource_type__ = "StructureMapStructure"
-
-
-class SubscriptionType(AbstractType):
-    __resource_type__ = "Subscription"
-
-
-class SubscriptionChannelType(AbstractType):
-    __resource_type__ = "SubscriptionChannel"
-
-
-class SubscriptionStatusType(AbstractType):
-    __resource_type__ = "SubscriptionStatus"
-
-
-class SubscriptionStatusNotificationEventType(AbstractType):
-    __resource_type__ = "SubscriptionStatusNotificationEvent"
-
-
-class SubscriptionTopicType(AbstractType):
-    __resource_type__ = "SubscriptionTopic"
-
-
-class SubscriptionTopicCanFilterByType(AbstractType):
-    __resource_type__ = "SubscriptionTopicCanFilterBy"
-
-
-class SubscriptionTopicEventTriggerType(AbstractType):
-    __resource_type__ = "SubscriptionTopicEventTrigger"
-
-
-class SubscriptionTopicNotificationShapeType(AbstractType):
-    __resource_type__ = "SubscriptionTopicNotificationShape"
-
-
-class SubscriptionTopicResourceTriggerType(AbstractType):
-    __resource_type__ = "SubscriptionTopicResourceTrigger"
-
-
-class SubscriptionTopicResourceTriggerQueryCriteriaType(AbstractType):
-    __resource_type__ = "SubscriptionTopicResourceTriggerQueryCriteria"
-
-
-class SubstanceType(AbstractType):
-    __resource_type__ = "Substance"
-
-
-class SubstanceDefinitionType(AbstractType):
-    __resource_type__ = "SubstanceDefinition"
-
-
-class SubstanceDefinitionCodeType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionCode"
-
-
-class SubstanceDefinitionMoietyType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionMoiety"
-
-
-class SubstanceDefinitionMolecularWeightType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionMolecularWeight"
-
-
-class SubstanceDefinitionNameType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionName"
-
-
-class SubstanceDefinitionNameOfficialType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionNameOfficial"
-
-
-class SubstanceDefinitionPropertyType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionProperty"
-
-
-class SubstanceDefinitionRelationshipType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionRelationship"
-
-
-class SubstanceDefinitionSourceMaterialType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionSourceMaterial"
-
-
-class SubstanceDefinitionStructureType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionStructure"
-
-
-class SubstanceDefinitionStructureRepresentationType(AbstractType):
-    __resource_type__ = "SubstanceDefinitionStructureRepresentation"
-
-
-class SubstanceIngredientType(AbstractType):
-    __resource_type__ = "SubstanceIngredient"
-
-
-class SubstanceInstanceType(AbstractType):
-    __resource_type__ = "SubstanceInstance"
-
-
-class SupplyDeliveryType(AbstractType):
-    __resource_type__ = "SupplyDelivery"
-
-
-class SupplyDeliverySuppliedItemType(AbstractType):
-    __resource_type__ = "SupplyDeliverySuppliedItem"
-
-
-class SupplyRequestType(AbstractType):
-    __resource_type__ = "SupplyRequest"
-
-
-class SupplyRequestParameterType(AbstractType):
-    __resource_type__ = "SupplyRequestParameter"
-
-
-class TaskType(AbstractType):
-    __resource_type__ = "Task"
-
-
-class TaskInputType(AbstractType):
-    __resource_type__ = "TaskInput"
-
-
-class TaskOutputType(AbstractType):
-    __resource_type__ = "TaskOutput"
-
-
-class TaskRestrictionType(AbstractType):
-    __resource_type__ = "TaskRestriction"
-
-
-class TerminologyCapabilitiesType(AbstractType):
-    __resource_type__ = "TerminologyCapabilities"
-
-
-class TerminologyCapabilitiesClosureType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesClosure"
-
-
-class TerminologyCapabilitiesCodeSystemType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesCodeSystem"
-
-
-class TerminologyCapabilitiesCodeSystemVersionType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesCodeSystemVersion"
-
-
-class TerminologyCapabilitiesCodeSystemVersionFilterType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesCodeSystemVersionFilter"
-
-
-class TerminologyCapabilitiesExpansionType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesExpansion"
-
-
-class TerminologyCapabilitiesExpansionParameterType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesExpansionParameter"
-
-
-class TerminologyCapabilitiesImplementationType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesImplementation"
-
-
-class TerminologyCapabilitiesSoftwareType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesSoftware"
-
-
-class TerminologyCapabilitiesTranslationType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesTranslation"
-
-
-class TerminologyCapabilitiesValidateCodeType(AbstractType):
-    __resource_type__ = "TerminologyCapabilitiesValidateCode"
-
-
-class TestReportType(AbstractType):
-    __resource_type__ = "TestReport"
-
-
-class TestReportParticipantType(AbstractType):
-    __resource_type__ = "TestReportParticipant"
-
-
-class TestReportSetupType(AbstractType):
-    __resource_type__ = "TestReportSetup"
-
-
-class TestReportSetupActionType(AbstractType):
-    __resource_type__ = "TestReportSetupAction"
-
-
-class TestReportSetupActionAssertType(AbstractType):
-    __resource_type__ = "TestReportSetupActionAssert"
-
-
-class TestReportSetupActionOperationType(AbstractType):
-    __resource_type__ = "TestReportSetupActionOperation"
-
-
-class TestReportTeardownType(AbstractType):
-    __resource_type__ = "TestReportTeardown"
-
-
-class TestReportTeardownActionType(AbstractType):
-    __resource_type__ = "TestReportTeardownAction"
-
-
-class TestReportTestType(AbstractType):
-    __resource_type__ = "TestReportTest"
-
-
-class TestReportTestActionType(AbstractType):
-    __resource_type__ = "TestReportTestAction"
-
-
-class TestScriptType(AbstractType):
-    __resource_type__ = "TestScript"
-
-
-class TestScriptDestinationType(AbstractType):
-    __resource_type__ = "TestScriptDestination"
-
-
-class TestScriptFixtureType(AbstractType):
-    __resource_type__ = "TestScriptFixture"
-
-
-class TestScriptMetadataType(AbstractType):
-    __resource_type__ = "TestScriptMetadata"
-
-
-class TestScriptMetadataCapabilityType(AbstractType):
-    __resource_type__ = "TestScriptMetadataCapability"
-
-
-class TestScriptMetadataLinkType(AbstractType):
-    __resource_type__ = "TestScriptMetadataLink"
-
-
-class TestScriptOriginType(AbstractType):
-    __resource_type__ = "TestScriptOrigin"
-
-
-class TestScriptSetupType(AbstractType):
-    __resource_type__ = "TestScriptSetup"
-
-
-class TestScriptSetupActionType(AbstractType):
-    __resource_type__ = "TestScriptSetupAction"
-
-
-class TestScriptSetupActionAssertType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionAssert"
-
-
-class TestScriptSetupActionOperationType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionOperation"
-
-
-class TestScriptSetupActionOperationRequestHeaderType(AbstractType):
-    __resource_type__ = "TestScriptSetupActionOperationRequestHeader"
-
-
-class TestScriptTeardownType(AbstractType):
-    __resource_type__ = "TestScriptTeardown"
-
-
-class TestScriptTeardownActionType(AbstractType):
-    __resource_type__ = "TestScriptTeardownAction"
-
-
-class TestScriptTestType(AbstractType):
-    __resource_type__ = "TestScriptTest"
-
-
-class TestScriptTestActionType(AbstractType):
-    __resource_type__ = "TestScriptTestAction"
-
-
-class TestScriptVariableType(AbstractType):
-    __resource_type__ = "TestScriptVariable"
-
-
-class TimingType(AbstractType):
-    __resource_type__ = "Timing"
-
-
-class TimingRepeatType(AbstractType):
-    __resource_type__ = "TimingRepeat"
-
-
-class TriggerDefinitionType(AbstractType):
-    __resource_type__ = "TriggerDefinition"
-
-
-class UsageContextType(AbstractType):
-    __resource_type__ = "UsageContext"
-
-
-class ValueSetType(AbstractType):
-    __resource_type__ = "ValueSet"
-
-
-class ValueSetComposeType(AbstractType):
-    __resource_type__ = "ValueSetCompose"
-
-
-class ValueSetComposeIncludeType(AbstractType):
-    __resource_type__ = "ValueSetComposeInclude"
-
-
-class ValueSetComposeIncludeConceptType(AbstractType):
-    __resource_type__ = "ValueSetComposeIncludeConcept"
-
-
-class ValueSetComposeIncludeConceptDesignationType(AbstractType):
-    __resource_type__ = "ValueSetComposeIncludeConceptDesignation"
-
-
-class ValueSetComposeIncludeFilterType(AbstractType):
-    __resource_type__ = "ValueSetComposeIncludeFilter"
-
-
-class ValueSetExpansionType(AbstractType):
-    __resource_type__ = "ValueSetExpansion"
-
-
-class ValueSetExpansionContainsType(AbstractType):
-    __resource_type__ = "ValueSetExpansionContains"
-
-
-class ValueSetExpansionParameterType(AbstractType):
-    __resource_type__ = "ValueSetExpansionParameter"
-
-
-class VerificationResultType(AbstractType):
-    __resource_type__ = "VerificationResult"
-
-
-class VerificationResultAttestationType(AbstractType):
-    __resource_type__ = "VerificationResultAttestation"
-
-
-class VerificationResultPrimarySourceType(AbstractType):
-    __resource_type__ = "VerificationResultPrimarySource"
-
-
-class VerificationResultValidatorType(AbstractType):
-    __resource_type__ = "VerificationResultValidator"
-
-
-class VisionPrescriptionType(AbstractType):
-    __resource_type__ = "VisionPrescription"
-
-
-class VisionPrescriptionLensSpecificationType(AbstractType):
-    __resource_type__ = "VisionPrescriptionLensSpecification"
-
-
-class VisionPrescriptionLensSpecificationPrismType(AbstractType):
-    __resource_type__ = "VisionPrescriptionLensSpecificationPrism"
+def __dir__() -> List[str]:
+    """ """
+    return sorted(set(globals()) | set(__all__))
 
 
-__all__ = [
+# most of names are created on first access, see ``__getattr__``
+__all__ = [  # noqa: F822
     "Boolean",
     "String",
     "Base64Binary",
@@ -17,6 +17,7 @@ if typing.TYPE_CHECKING:
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
+# model name: (model class, once imported; module name)
 MODEL_CLASSES = {
     "FHIRPrimitiveExtension": (None, ".fhirprimitiveextension"),
     "Account": (None, ".account"),
@@ -744,6 +745,15 @@ MODEL_CLASSES = {
     "VisionPrescriptionLensSpecificationPrism": (None, ".visionprescription"),
 }
 
+# resourceType -> (model class, model validator)
+DISPATCH_TABLE: typing.Dict[
+    str, typing.Tuple[typing.Type[FHIRAbstractModel], typing.Callable]
+] = {}
+# type class -> compiled (generic) validators
+GENERIC_VALIDATORS: typing.Dict[type, typing.List[typing.Callable]] = {}
+# ``<model name lower>_validator``: model name, built at first lookup
+VALIDATOR_NAMES: typing.Optional[typing.Dict[str, str]] = None
+
 
 def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
     """"""
@@ -760,12 +770,49 @@ def get_fhir_model_class(model_name: str) -> typing.Type[FHIRAbstractModel]:
 def run_validator_for_fhir_type(model_type_cls, v, values, config, field):
     """ """
     cls = get_fhir_model_class(model_type_cls.__resource_type__)
-    for validator in model_type_cls.__get_validators__():
-        func = make_generic_validator(validator)
+    try:
+        validators = GENERIC_VALIDATORS[model_type_cls]
+    except KeyError:
+        validators = GENERIC_VALIDATORS[model_type_cls] = [
+            make_generic_validator(validator)
+            for validator in model_type_cls.__get_validators__()
+        ]
+    for func in validators:
         v = func(cls, v, values, config, field)
     return v
 
 
+def get_fhir_model_dispatch(
+    resource_type: str,
+) -> typing.Tuple[typing.Type[FHIRAbstractModel], typing.Callable]:
+    """Returns (model class, model validator) of the resource type (element type)
+    from the precomputed dispatch table."""
+    try:
+        return DISPATCH_TABLE[resource_type]
+    except KeyError:
+        pass
+    try:
+        model_class = get_fhir_model_class(resource_type)
+    except KeyError:
+        raise LookupError(
+            f"'{__package__}.fhirtypes.{resource_type}Type' doesnt found."
+        )
+    validator = make_fhir_model_validator(resource_type)
+    DISPATCH_TABLE[resource_type] = (model_class, validator)
+    return model_class, validator
+
+
+def dispatch_fhir_model_validator(
+    resource_type: str, v: Union[dict, FHIRAbstractModel]
+) -> FHIRAbstractModel:
+    """Single pass polymorphic validation (i.e ``Bundle.entry.resource``,
+    ``contained``), already decoded value is validated directly."""
+    model_class, validator = get_fhir_model_dispatch(resource_type)
+    if v.__class__ is dict:
+        return model_class.parse_obj(v)
+    return validator(v)
+
+
 def fhir_model_validator(
     model_name: str, v: Union[StrBytes, dict, Path, FHIRAbstractModel]
 ):
@@ -871,3428 +918,42 @@ def fhir_model_validator(
     return v
 
 
-def fhirprimitiveextension_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("FHIRPrimitiveExtension", v)
-
-
-def account_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Account", v)
-
-
-def accountcoverage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AccountCoverage", v)
-
-
-def accountguarantor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AccountGuarantor", v)
-
-
-def activitydefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ActivityDefinition", v)
-
-
-def activitydefinitiondynamicvalue_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ActivityDefinitionDynamicValue", v)
-
-
-def activitydefinitionparticipant_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ActivityDefinitionParticipant", v)
-
-
-def address_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Address", v)
-
-
-def administrableproductdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AdministrableProductDefinition", v)
-
-
-def administrableproductdefinitionproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AdministrableProductDefinitionProperty", v)
-
-
-def administrableproductdefinitionrouteofadministration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "AdministrableProductDefinitionRouteOfAdministration", v
-    )
-
-
-def administrableproductdefinitionrouteofadministrationtargetspecies_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "AdministrableProductDefinitionRouteOfAdministrationTargetSpecies", v
-    )
-
-
-def administrableproductdefinitionrouteofadministrationtargetspecieswithdrawalperiod_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "AdministrableProductDefinitionRouteOfAdministrationTargetSpeciesWithdrawalPeriod",
-        v,
-    )
-
-
-def adverseevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AdverseEvent", v)
-
-
-def adverseeventsuspectentity_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AdverseEventSuspectEntity", v)
-
-
-def adverseeventsuspectentitycausality_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AdverseEventSuspectEntityCausality", v)
-
-
-def age_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Age", v)
-
-
-def allergyintolerance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AllergyIntolerance", v)
-
-
-def allergyintolerancereaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("AllergyIntoleranceReaction", v)
-
-
-def annotation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Annotation", v)
-
-
-def appointment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Appointment", v)
-
-
-def appointmentparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AppointmentParticipant", v)
-
-
-def appointmentresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AppointmentResponse", v)
-
-
-def attachment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Attachment", v)
-
-
-def auditevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEvent", v)
-
-
-def auditeventagent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventAgent", v)
-
-
-def auditeventagentnetwork_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventAgentNetwork", v)
-
-
-def auditevententity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventEntity", v)
-
-
-def auditevententitydetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventEntityDetail", v)
-
-
-def auditeventsource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("AuditEventSource", v)
-
-
-def backboneelement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BackboneElement", v)
-
-
-def basic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Basic", v)
-
-
-def binary_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Binary", v)
-
-
-def biologicallyderivedproduct_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("BiologicallyDerivedProduct", v)
-
-
-def biologicallyderivedproductcollection_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("BiologicallyDerivedProductCollection", v)
-
-
-def biologicallyderivedproductmanipulation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("BiologicallyDerivedProductManipulation", v)
-
-
-def biologicallyderivedproductprocessing_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("BiologicallyDerivedProductProcessing", v)
-
-
-def biologicallyderivedproductstorage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("BiologicallyDerivedProductStorage", v)
-
-
-def bodystructure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BodyStructure", v)
-
-
-def bundle_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Bundle", v)
-
-
-def bundleentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntry", v)
-
-
-def bundleentryrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntryRequest", v)
-
-
-def bundleentryresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntryResponse", v)
-
-
-def bundleentrysearch_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleEntrySearch", v)
-
-
-def bundlelink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("BundleLink", v)
-
-
-def capabilitystatement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CapabilityStatement", v)
-
-
-def capabilitystatementdocument_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementDocument", v)
-
-
-def capabilitystatementimplementation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementImplementation", v)
-
-
-def capabilitystatementmessaging_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementMessaging", v)
-
-
-def capabilitystatementmessagingendpoint_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementMessagingEndpoint", v)
-
-
-def capabilitystatementmessagingsupportedmessage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementMessagingSupportedMessage", v)
-
-
-def capabilitystatementrest_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRest", v)
-
-
-def capabilitystatementrestinteraction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestInteraction", v)
-
-
-def capabilitystatementrestresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestResource", v)
-
-
-def capabilitystatementrestresourceinteraction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestResourceInteraction", v)
-
-
-def capabilitystatementrestresourceoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestResourceOperation", v)
-
-
-def capabilitystatementrestresourcesearchparam_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestResourceSearchParam", v)
-
-
-def capabilitystatementrestsecurity_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementRestSecurity", v)
-
-
-def capabilitystatementsoftware_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CapabilityStatementSoftware", v)
-
-
-def careplan_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlan", v)
-
-
-def careplanactivity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanActivity", v)
-
-
-def careplanactivitydetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CarePlanActivityDetail", v)
-
-
-def careteam_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CareTeam", v)
-
-
-def careteamparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CareTeamParticipant", v)
-
-
-def catalogentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CatalogEntry", v)
-
-
-def catalogentryrelatedentry_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CatalogEntryRelatedEntry", v)
-
-
-def chargeitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ChargeItem", v)
-
-
-def chargeitemdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ChargeItemDefinition", v)
-
-
-def chargeitemdefinitionapplicability_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ChargeItemDefinitionApplicability", v)
-
-
-def chargeitemdefinitionpropertygroup_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ChargeItemDefinitionPropertyGroup", v)
-
-
-def chargeitemdefinitionpropertygrouppricecomponent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ChargeItemDefinitionPropertyGroupPriceComponent", v)
-
-
-def chargeitemperformer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ChargeItemPerformer", v)
-
-
-def citation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Citation", v)
-
-
-def citationcitedartifact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CitationCitedArtifact", v)
-
-
-def citationcitedartifactabstract_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactAbstract", v)
-
-
-def citationcitedartifactclassification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactClassification", v)
-
-
-def citationcitedartifactclassificationwhoclassified_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactClassificationWhoClassified", v)
-
-
-def citationcitedartifactcontributorship_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactContributorship", v)
-
-
-def citationcitedartifactcontributorshipentry_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactContributorshipEntry", v)
-
-
-def citationcitedartifactcontributorshipentryaffiliationinfo_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "CitationCitedArtifactContributorshipEntryAffiliationInfo", v
-    )
-
-
-def citationcitedartifactcontributorshipentrycontributioninstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "CitationCitedArtifactContributorshipEntryContributionInstance", v
-    )
-
-
-def citationcitedartifactcontributorshipsummary_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactContributorshipSummary", v)
-
-
-def citationcitedartifactpart_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactPart", v)
-
-
-def citationcitedartifactpublicationform_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactPublicationForm", v)
-
-
-def citationcitedartifactpublicationformperiodicrelease_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "CitationCitedArtifactPublicationFormPeriodicRelease", v
-    )
-
-
-def citationcitedartifactpublicationformperiodicreleasedateofpublication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "CitationCitedArtifactPublicationFormPeriodicReleaseDateOfPublication", v
-    )
-
-
-def citationcitedartifactpublicationformpublishedin_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactPublicationFormPublishedIn", v)
-
-
-def citationcitedartifactrelatesto_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactRelatesTo", v)
-
-
-def citationcitedartifactstatusdate_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactStatusDate", v)
-
-
-def citationcitedartifacttitle_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactTitle", v)
-
-
-def citationcitedartifactversion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactVersion", v)
-
-
-def citationcitedartifactweblocation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CitationCitedArtifactWebLocation", v)
-
-
-def citationclassification_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CitationClassification", v)
-
-
-def citationrelatesto_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CitationRelatesTo", v)
-
-
-def citationstatusdate_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CitationStatusDate", v)
-
-
-def citationsummary_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CitationSummary", v)
-
-
-def claim_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Claim", v)
-
-
-def claimaccident_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimAccident", v)
-
-
-def claimcareteam_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimCareTeam", v)
-
-
-def claimdiagnosis_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimDiagnosis", v)
-
+def make_fhir_model_validator(model_name: str) -> typing.Callable:
+    """Validator function of the model (i.e. ``patient_validator`` of
+    ``Patient``), created only once."""
 
-def claiminsurance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimInsurance", v)
+    def validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
+        return fhir_model_validator(model_name, v)
 
+    name = model_name.lower() + "_validator"
+    validator.__name__ = validator.__qualname__ = name
+    # concurrent first access gets the same function
+    return globals().setdefault(name, validator)
 
-def claimitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimItem", v)
 
+def __getattr__(name: str) -> typing.Any:
+    """Model validators (i.e. ``patient_validator``) are created on first access
+    (from ``MODEL_CLASSES`` names), not at import time."""
+    global VALIDATOR_NAMES
+    if name.endswith("_validator"):
+        if VALIDATOR_NAMES is None:
+            VALIDATOR_NAMES = {
+                model_name.lower() + "_validator": model_name
+                for model_name in MODEL_CLASSES
+            }
+        model_name = VALIDATOR_NAMES.get(name, None)
+        if model_name is not None:
+            return make_fhir_model_validator(model_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def claimitemdetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimItemDetail", v)
 
-
-def claimitemdetailsubdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimItemDetailSubDetail", v)
-
-
-def claimpayee_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimPayee", v)
-
-
-def claimprocedure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimProcedure", v)
-
-
-def claimrelated_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimRelated", v)
-
-
-def claimresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponse", v)
-
-
-def claimresponseadditem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseAddItem", v)
-
-
-def claimresponseadditemdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseAddItemDetail", v)
-
-
-def claimresponseadditemdetailsubdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseAddItemDetailSubDetail", v)
-
-
-def claimresponseerror_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseError", v)
-
-
-def claimresponseinsurance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseInsurance", v)
-
-
-def claimresponseitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseItem", v)
-
-
-def claimresponseitemadjudication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseItemAdjudication", v)
-
-
-def claimresponseitemdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseItemDetail", v)
-
-
-def claimresponseitemdetailsubdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseItemDetailSubDetail", v)
-
-
-def claimresponsepayment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponsePayment", v)
-
-
-def claimresponseprocessnote_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClaimResponseProcessNote", v)
-
-
-def claimresponsetotal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimResponseTotal", v)
-
-
-def claimsupportinginfo_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClaimSupportingInfo", v)
-
-
-def clinicalimpression_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClinicalImpression", v)
-
-
-def clinicalimpressionfinding_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalImpressionFinding", v)
-
-
-def clinicalimpressioninvestigation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalImpressionInvestigation", v)
-
-
-def clinicalusedefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ClinicalUseDefinition", v)
-
-
-def clinicalusedefinitioncontraindication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionContraindication", v)
-
-
-def clinicalusedefinitioncontraindicationothertherapy_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionContraindicationOtherTherapy", v)
-
-
-def clinicalusedefinitionindication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionIndication", v)
-
-
-def clinicalusedefinitioninteraction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionInteraction", v)
-
-
-def clinicalusedefinitioninteractioninteractant_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionInteractionInteractant", v)
-
-
-def clinicalusedefinitionundesirableeffect_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionUndesirableEffect", v)
-
-
-def clinicalusedefinitionwarning_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ClinicalUseDefinitionWarning", v)
-
-
-def codesystem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeSystem", v)
-
-
-def codesystemconcept_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeSystemConcept", v)
-
-
-def codesystemconceptdesignation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CodeSystemConceptDesignation", v)
-
-
-def codesystemconceptproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CodeSystemConceptProperty", v)
-
-
-def codesystemfilter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeSystemFilter", v)
-
-
-def codesystemproperty_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeSystemProperty", v)
-
-
-def codeableconcept_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeableConcept", v)
-
-
-def codeablereference_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CodeableReference", v)
-
-
-def coding_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Coding", v)
-
-
-def communication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Communication", v)
-
-
-def communicationpayload_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CommunicationPayload", v)
-
-
-def communicationrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CommunicationRequest", v)
-
-
-def communicationrequestpayload_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CommunicationRequestPayload", v)
-
-
-def compartmentdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompartmentDefinition", v)
-
-
-def compartmentdefinitionresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CompartmentDefinitionResource", v)
-
-
-def composition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Composition", v)
-
-
-def compositionattester_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionAttester", v)
-
-
-def compositionevent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionEvent", v)
-
-
-def compositionrelatesto_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionRelatesTo", v)
-
-
-def compositionsection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CompositionSection", v)
-
-
-def conceptmap_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMap", v)
-
-
-def conceptmapgroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMapGroup", v)
-
-
-def conceptmapgroupelement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConceptMapGroupElement", v)
-
-
-def conceptmapgroupelementtarget_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConceptMapGroupElementTarget", v)
-
-
-def conceptmapgroupelementtargetdependson_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConceptMapGroupElementTargetDependsOn", v)
-
-
-def conceptmapgroupunmapped_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ConceptMapGroupUnmapped", v)
-
-
-def condition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Condition", v)
-
-
-def conditionevidence_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConditionEvidence", v)
-
-
-def conditionstage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConditionStage", v)
-
-
-def consent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Consent", v)
-
-
-def consentpolicy_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConsentPolicy", v)
-
-
-def consentprovision_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConsentProvision", v)
-
-
-def consentprovisionactor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConsentProvisionActor", v)
-
-
-def consentprovisiondata_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConsentProvisionData", v)
-
-
-def consentverification_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ConsentVerification", v)
-
-
-def contactdetail_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContactDetail", v)
-
-
-def contactpoint_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContactPoint", v)
-
-
-def contract_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Contract", v)
-
-
-def contractcontentdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractContentDefinition", v)
-
-
-def contractfriendly_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractFriendly", v)
-
-
-def contractlegal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractLegal", v)
-
-
-def contractrule_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractRule", v)
-
-
-def contractsigner_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractSigner", v)
-
-
-def contractterm_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTerm", v)
-
-
-def contracttermaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermAction", v)
-
-
-def contracttermactionsubject_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractTermActionSubject", v)
-
-
-def contracttermasset_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermAsset", v)
-
-
-def contracttermassetcontext_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractTermAssetContext", v)
-
-
-def contracttermassetvalueditem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractTermAssetValuedItem", v)
-
-
-def contracttermoffer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermOffer", v)
-
-
-def contracttermofferanswer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractTermOfferAnswer", v)
-
-
-def contracttermofferparty_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ContractTermOfferParty", v)
-
-
-def contracttermsecuritylabel_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ContractTermSecurityLabel", v)
-
-
-def contributor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Contributor", v)
-
-
-def count_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Count", v)
-
-
-def coverage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Coverage", v)
-
-
-def coverageclass_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("CoverageClass", v)
-
-
-def coveragecosttobeneficiary_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageCostToBeneficiary", v)
-
-
-def coveragecosttobeneficiaryexception_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageCostToBeneficiaryException", v)
-
-
-def coverageeligibilityrequest_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityRequest", v)
-
-
-def coverageeligibilityrequestinsurance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityRequestInsurance", v)
-
-
-def coverageeligibilityrequestitem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityRequestItem", v)
-
-
-def coverageeligibilityrequestitemdiagnosis_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityRequestItemDiagnosis", v)
-
-
-def coverageeligibilityrequestsupportinginfo_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityRequestSupportingInfo", v)
-
-
-def coverageeligibilityresponse_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityResponse", v)
-
-
-def coverageeligibilityresponseerror_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityResponseError", v)
-
-
-def coverageeligibilityresponseinsurance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityResponseInsurance", v)
-
-
-def coverageeligibilityresponseinsuranceitem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityResponseInsuranceItem", v)
-
-
-def coverageeligibilityresponseinsuranceitembenefit_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("CoverageEligibilityResponseInsuranceItemBenefit", v)
-
-
-def datarequirement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DataRequirement", v)
-
-
-def datarequirementcodefilter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DataRequirementCodeFilter", v)
-
-
-def datarequirementdatefilter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DataRequirementDateFilter", v)
-
-
-def datarequirementsort_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DataRequirementSort", v)
-
-
-def detectedissue_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DetectedIssue", v)
-
-
-def detectedissueevidence_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DetectedIssueEvidence", v)
-
-
-def detectedissuemitigation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DetectedIssueMitigation", v)
-
-
-def device_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Device", v)
-
-
-def devicedefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceDefinition", v)
-
-
-def devicedefinitioncapability_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionCapability", v)
-
-
-def devicedefinitiondevicename_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionDeviceName", v)
-
-
-def devicedefinitionmaterial_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionMaterial", v)
-
-
-def devicedefinitionproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionProperty", v)
-
-
-def devicedefinitionspecialization_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionSpecialization", v)
-
-
-def devicedefinitionudideviceidentifier_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceDefinitionUdiDeviceIdentifier", v)
-
-
-def devicedevicename_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceDeviceName", v)
-
-
-def devicemetric_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceMetric", v)
-
-
-def devicemetriccalibration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DeviceMetricCalibration", v)
-
-
-def deviceproperty_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceProperty", v)
-
-
-def devicerequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceRequest", v)
-
-
-def devicerequestparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceRequestParameter", v)
-
-
-def devicespecialization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceSpecialization", v)
-
-
-def deviceudicarrier_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceUdiCarrier", v)
-
-
-def deviceusestatement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceUseStatement", v)
-
-
-def deviceversion_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DeviceVersion", v)
-
-
-def diagnosticreport_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticReport", v)
-
-
-def diagnosticreportmedia_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DiagnosticReportMedia", v)
-
-
-def distance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Distance", v)
-
-
-def documentmanifest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DocumentManifest", v)
-
-
-def documentmanifestrelated_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentManifestRelated", v)
-
-
-def documentreference_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DocumentReference", v)
-
-
-def documentreferencecontent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceContent", v)
-
-
-def documentreferencecontext_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceContext", v)
-
-
-def documentreferencerelatesto_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("DocumentReferenceRelatesTo", v)
-
-
-def domainresource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DomainResource", v)
-
-
-def dosage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Dosage", v)
-
-
-def dosagedoseandrate_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("DosageDoseAndRate", v)
-
-
-def duration_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Duration", v)
-
-
-def element_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Element", v)
-
-
-def elementdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinition", v)
-
-
-def elementdefinitionbase_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinitionBase", v)
-
-
-def elementdefinitionbinding_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionBinding", v)
-
-
-def elementdefinitionconstraint_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionConstraint", v)
-
-
-def elementdefinitionexample_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionExample", v)
-
-
-def elementdefinitionmapping_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionMapping", v)
-
-
-def elementdefinitionslicing_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionSlicing", v)
-
-
-def elementdefinitionslicingdiscriminator_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ElementDefinitionSlicingDiscriminator", v)
-
-
-def elementdefinitiontype_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ElementDefinitionType", v)
-
-
-def encounter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Encounter", v)
-
-
-def encounterclasshistory_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterClassHistory", v)
-
-
-def encounterdiagnosis_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterDiagnosis", v)
-
-
-def encounterhospitalization_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EncounterHospitalization", v)
-
-
-def encounterlocation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterLocation", v)
-
-
-def encounterparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterParticipant", v)
-
-
-def encounterstatushistory_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EncounterStatusHistory", v)
-
-
-def endpoint_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Endpoint", v)
-
-
-def enrollmentrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EnrollmentRequest", v)
-
-
-def enrollmentresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EnrollmentResponse", v)
-
-
-def episodeofcare_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EpisodeOfCare", v)
-
-
-def episodeofcarediagnosis_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EpisodeOfCareDiagnosis", v)
-
-
-def episodeofcarestatushistory_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EpisodeOfCareStatusHistory", v)
-
-
-def eventdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EventDefinition", v)
-
-
-def evidence_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Evidence", v)
-
-
-def evidencecertainty_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceCertainty", v)
-
-
-def evidencereport_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceReport", v)
-
-
-def evidencereportrelatesto_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceReportRelatesTo", v)
-
-
-def evidencereportsection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceReportSection", v)
-
-
-def evidencereportsubject_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceReportSubject", v)
-
-
-def evidencereportsubjectcharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceReportSubjectCharacteristic", v)
-
-
-def evidencestatistic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceStatistic", v)
-
-
-def evidencestatisticattributeestimate_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceStatisticAttributeEstimate", v)
-
-
-def evidencestatisticmodelcharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceStatisticModelCharacteristic", v)
-
-
-def evidencestatisticmodelcharacteristicvariable_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceStatisticModelCharacteristicVariable", v)
-
-
-def evidencestatisticsamplesize_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceStatisticSampleSize", v)
-
-
-def evidencevariable_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("EvidenceVariable", v)
-
-
-def evidencevariablecategory_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceVariableCategory", v)
-
-
-def evidencevariablecharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceVariableCharacteristic", v)
-
-
-def evidencevariablecharacteristictimefromstart_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceVariableCharacteristicTimeFromStart", v)
-
-
-def evidencevariabledefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("EvidenceVariableDefinition", v)
-
-
-def examplescenario_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ExampleScenario", v)
-
-
-def examplescenarioactor_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ExampleScenarioActor", v)
-
-
-def examplescenarioinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioInstance", v)
-
-
-def examplescenarioinstancecontainedinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioInstanceContainedInstance", v)
-
-
-def examplescenarioinstanceversion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioInstanceVersion", v)
-
-
-def examplescenarioprocess_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ExampleScenarioProcess", v)
-
-
-def examplescenarioprocessstep_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioProcessStep", v)
-
-
-def examplescenarioprocessstepalternative_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioProcessStepAlternative", v)
-
-
-def examplescenarioprocessstepoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExampleScenarioProcessStepOperation", v)
-
-
-def explanationofbenefit_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ExplanationOfBenefit", v)
-
-
-def explanationofbenefitaccident_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitAccident", v)
-
-
-def explanationofbenefitadditem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitAddItem", v)
-
-
-def explanationofbenefitadditemdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitAddItemDetail", v)
-
-
-def explanationofbenefitadditemdetailsubdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitAddItemDetailSubDetail", v)
-
-
-def explanationofbenefitbenefitbalance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitBenefitBalance", v)
-
-
-def explanationofbenefitbenefitbalancefinancial_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitBenefitBalanceFinancial", v)
-
-
-def explanationofbenefitcareteam_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitCareTeam", v)
-
-
-def explanationofbenefitdiagnosis_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitDiagnosis", v)
-
-
-def explanationofbenefitinsurance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitInsurance", v)
-
-
-def explanationofbenefititem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitItem", v)
-
-
-def explanationofbenefititemadjudication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitItemAdjudication", v)
-
-
-def explanationofbenefititemdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitItemDetail", v)
-
-
-def explanationofbenefititemdetailsubdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitItemDetailSubDetail", v)
-
-
-def explanationofbenefitpayee_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitPayee", v)
-
-
-def explanationofbenefitpayment_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitPayment", v)
-
-
-def explanationofbenefitprocedure_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitProcedure", v)
-
-
-def explanationofbenefitprocessnote_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitProcessNote", v)
-
-
-def explanationofbenefitrelated_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitRelated", v)
-
-
-def explanationofbenefitsupportinginfo_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitSupportingInfo", v)
-
-
-def explanationofbenefittotal_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ExplanationOfBenefitTotal", v)
-
-
-def expression_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Expression", v)
-
-
-def extension_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Extension", v)
-
-
-def familymemberhistory_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("FamilyMemberHistory", v)
-
-
-def familymemberhistorycondition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("FamilyMemberHistoryCondition", v)
-
-
-def flag_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Flag", v)
-
-
-def goal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Goal", v)
-
-
-def goaltarget_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GoalTarget", v)
-
-
-def graphdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GraphDefinition", v)
-
-
-def graphdefinitionlink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GraphDefinitionLink", v)
-
-
-def graphdefinitionlinktarget_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("GraphDefinitionLinkTarget", v)
-
-
-def graphdefinitionlinktargetcompartment_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("GraphDefinitionLinkTargetCompartment", v)
-
-
-def group_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Group", v)
-
-
-def groupcharacteristic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GroupCharacteristic", v)
-
-
-def groupmember_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GroupMember", v)
-
-
-def guidanceresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("GuidanceResponse", v)
-
-
-def healthcareservice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("HealthcareService", v)
-
-
-def healthcareserviceavailabletime_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceAvailableTime", v)
-
-
-def healthcareserviceeligibility_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceEligibility", v)
-
-
-def healthcareservicenotavailable_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("HealthcareServiceNotAvailable", v)
-
-
-def humanname_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("HumanName", v)
-
-
-def identifier_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Identifier", v)
-
-
-def imagingstudy_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImagingStudy", v)
-
-
-def imagingstudyseries_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImagingStudySeries", v)
-
-
-def imagingstudyseriesinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingStudySeriesInstance", v)
-
-
-def imagingstudyseriesperformer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImagingStudySeriesPerformer", v)
-
-
-def immunization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Immunization", v)
-
-
-def immunizationeducation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImmunizationEducation", v)
-
-
-def immunizationevaluation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImmunizationEvaluation", v)
-
-
-def immunizationperformer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImmunizationPerformer", v)
-
-
-def immunizationprotocolapplied_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationProtocolApplied", v)
-
-
-def immunizationreaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImmunizationReaction", v)
-
-
-def immunizationrecommendation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationRecommendation", v)
-
-
-def immunizationrecommendationrecommendation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImmunizationRecommendationRecommendation", v)
-
-
-def immunizationrecommendationrecommendationdatecriterion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "ImmunizationRecommendationRecommendationDateCriterion", v
-    )
-
-
-def implementationguide_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ImplementationGuide", v)
-
-
-def implementationguidedefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinition", v)
-
-
-def implementationguidedefinitiongrouping_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinitionGrouping", v)
-
-
-def implementationguidedefinitionpage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinitionPage", v)
-
-
-def implementationguidedefinitionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinitionParameter", v)
-
-
-def implementationguidedefinitionresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinitionResource", v)
-
-
-def implementationguidedefinitiontemplate_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDefinitionTemplate", v)
-
-
-def implementationguidedependson_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideDependsOn", v)
-
-
-def implementationguideglobal_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideGlobal", v)
-
-
-def implementationguidemanifest_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideManifest", v)
-
-
-def implementationguidemanifestpage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideManifestPage", v)
-
-
-def implementationguidemanifestresource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ImplementationGuideManifestResource", v)
-
-
-def ingredient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Ingredient", v)
-
-
-def ingredientmanufacturer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("IngredientManufacturer", v)
-
-
-def ingredientsubstance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("IngredientSubstance", v)
-
-
-def ingredientsubstancestrength_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("IngredientSubstanceStrength", v)
-
-
-def ingredientsubstancestrengthreferencestrength_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("IngredientSubstanceStrengthReferenceStrength", v)
-
-
-def insuranceplan_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InsurancePlan", v)
-
-
-def insuranceplancontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InsurancePlanContact", v)
-
-
-def insuranceplancoverage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InsurancePlanCoverage", v)
-
-
-def insuranceplancoveragebenefit_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanCoverageBenefit", v)
-
-
-def insuranceplancoveragebenefitlimit_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanCoverageBenefitLimit", v)
-
-
-def insuranceplanplan_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InsurancePlanPlan", v)
-
-
-def insuranceplanplangeneralcost_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanPlanGeneralCost", v)
-
-
-def insuranceplanplanspecificcost_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanPlanSpecificCost", v)
-
-
-def insuranceplanplanspecificcostbenefit_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanPlanSpecificCostBenefit", v)
-
-
-def insuranceplanplanspecificcostbenefitcost_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InsurancePlanPlanSpecificCostBenefitCost", v)
-
-
-def invoice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Invoice", v)
-
-
-def invoicelineitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InvoiceLineItem", v)
-
-
-def invoicelineitempricecomponent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("InvoiceLineItemPriceComponent", v)
-
-
-def invoiceparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("InvoiceParticipant", v)
-
-
-def library_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Library", v)
-
-
-def linkage_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Linkage", v)
-
-
-def linkageitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("LinkageItem", v)
-
-
-def list_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("List", v)
-
-
-def listentry_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ListEntry", v)
-
-
-def location_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Location", v)
-
-
-def locationhoursofoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("LocationHoursOfOperation", v)
-
-
-def locationposition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("LocationPosition", v)
-
-
-def manufactureditemdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ManufacturedItemDefinition", v)
-
-
-def manufactureditemdefinitionproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ManufacturedItemDefinitionProperty", v)
-
-
-def marketingstatus_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MarketingStatus", v)
-
-
-def measure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Measure", v)
-
-
-def measuregroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MeasureGroup", v)
-
-
-def measuregrouppopulation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MeasureGroupPopulation", v)
-
-
-def measuregroupstratifier_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MeasureGroupStratifier", v)
-
-
-def measuregroupstratifiercomponent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureGroupStratifierComponent", v)
-
-
-def measurereport_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MeasureReport", v)
-
-
-def measurereportgroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MeasureReportGroup", v)
-
-
-def measurereportgrouppopulation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureReportGroupPopulation", v)
-
-
-def measurereportgroupstratifier_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureReportGroupStratifier", v)
-
-
-def measurereportgroupstratifierstratum_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureReportGroupStratifierStratum", v)
-
-
-def measurereportgroupstratifierstratumcomponent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureReportGroupStratifierStratumComponent", v)
-
-
-def measurereportgroupstratifierstratumpopulation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureReportGroupStratifierStratumPopulation", v)
-
-
-def measuresupplementaldata_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MeasureSupplementalData", v)
-
-
-def media_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Media", v)
-
-
-def medication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Medication", v)
-
-
-def medicationadministration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationAdministration", v)
-
-
-def medicationadministrationdosage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationAdministrationDosage", v)
-
-
-def medicationadministrationperformer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationAdministrationPerformer", v)
-
-
-def medicationbatch_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationBatch", v)
-
-
-def medicationdispense_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationDispense", v)
-
-
-def medicationdispenseperformer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationDispensePerformer", v)
-
-
-def medicationdispensesubstitution_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationDispenseSubstitution", v)
-
-
-def medicationingredient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationIngredient", v)
-
-
-def medicationknowledge_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationKnowledge", v)
-
-
-def medicationknowledgeadministrationguidelines_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeAdministrationGuidelines", v)
-
-
-def medicationknowledgeadministrationguidelinesdosage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeAdministrationGuidelinesDosage", v)
-
-
-def medicationknowledgeadministrationguidelinespatientcharacteristics_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator(
-        "MedicationKnowledgeAdministrationGuidelinesPatientCharacteristics", v
-    )
-
-
-def medicationknowledgecost_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeCost", v)
-
-
-def medicationknowledgedrugcharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeDrugCharacteristic", v)
-
-
-def medicationknowledgeingredient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeIngredient", v)
-
-
-def medicationknowledgekinetics_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeKinetics", v)
-
-
-def medicationknowledgemedicineclassification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeMedicineClassification", v)
-
-
-def medicationknowledgemonitoringprogram_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeMonitoringProgram", v)
-
-
-def medicationknowledgemonograph_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeMonograph", v)
-
-
-def medicationknowledgepackaging_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgePackaging", v)
-
-
-def medicationknowledgeregulatory_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeRegulatory", v)
-
-
-def medicationknowledgeregulatorymaxdispense_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeRegulatoryMaxDispense", v)
-
-
-def medicationknowledgeregulatoryschedule_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeRegulatorySchedule", v)
-
-
-def medicationknowledgeregulatorysubstitution_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeRegulatorySubstitution", v)
-
-
-def medicationknowledgerelatedmedicationknowledge_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationKnowledgeRelatedMedicationKnowledge", v)
-
-
-def medicationrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationRequest", v)
-
-
-def medicationrequestdispenserequest_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationRequestDispenseRequest", v)
-
-
-def medicationrequestdispenserequestinitialfill_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationRequestDispenseRequestInitialFill", v)
-
-
-def medicationrequestsubstitution_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicationRequestSubstitution", v)
-
-
-def medicationstatement_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MedicationStatement", v)
-
-
-def medicinalproductdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinition", v)
-
-
-def medicinalproductdefinitioncharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionCharacteristic", v)
-
-
-def medicinalproductdefinitioncontact_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionContact", v)
-
-
-def medicinalproductdefinitioncrossreference_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionCrossReference", v)
-
-
-def medicinalproductdefinitionname_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionName", v)
-
-
-def medicinalproductdefinitionnamecountrylanguage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionNameCountryLanguage", v)
-
-
-def medicinalproductdefinitionnamenamepart_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionNameNamePart", v)
-
-
-def medicinalproductdefinitionoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MedicinalProductDefinitionOperation", v)
-
-
-def messagedefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageDefinition", v)
-
-
-def messagedefinitionallowedresponse_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MessageDefinitionAllowedResponse", v)
-
-
-def messagedefinitionfocus_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageDefinitionFocus", v)
-
-
-def messageheader_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeader", v)
-
-
-def messageheaderdestination_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MessageHeaderDestination", v)
-
-
-def messageheaderresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeaderResponse", v)
-
-
-def messageheadersource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MessageHeaderSource", v)
-
-
-def meta_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Meta", v)
-
-
-def molecularsequence_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("MolecularSequence", v)
-
-
-def molecularsequencequality_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceQuality", v)
-
-
-def molecularsequencequalityroc_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceQualityRoc", v)
-
-
-def molecularsequencereferenceseq_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceReferenceSeq", v)
-
-
-def molecularsequencerepository_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceRepository", v)
-
-
-def molecularsequencestructurevariant_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceStructureVariant", v)
-
-
-def molecularsequencestructurevariantinner_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceStructureVariantInner", v)
-
-
-def molecularsequencestructurevariantouter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceStructureVariantOuter", v)
-
-
-def molecularsequencevariant_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("MolecularSequenceVariant", v)
-
-
-def money_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Money", v)
-
-
-def namingsystem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NamingSystem", v)
-
-
-def namingsystemuniqueid_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NamingSystemUniqueId", v)
-
-
-def narrative_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Narrative", v)
-
-
-def nutritionorder_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NutritionOrder", v)
-
-
-def nutritionorderenteralformula_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderEnteralFormula", v)
-
-
-def nutritionorderenteralformulaadministration_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderEnteralFormulaAdministration", v)
-
-
-def nutritionorderoraldiet_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NutritionOrderOralDiet", v)
-
-
-def nutritionorderoraldietnutrient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderOralDietNutrient", v)
-
-
-def nutritionorderoraldiettexture_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderOralDietTexture", v)
-
-
-def nutritionordersupplement_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionOrderSupplement", v)
-
-
-def nutritionproduct_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("NutritionProduct", v)
-
-
-def nutritionproductingredient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionProductIngredient", v)
-
-
-def nutritionproductinstance_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionProductInstance", v)
-
-
-def nutritionproductnutrient_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionProductNutrient", v)
-
-
-def nutritionproductproductcharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("NutritionProductProductCharacteristic", v)
-
-
-def observation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Observation", v)
-
-
-def observationcomponent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ObservationComponent", v)
-
-
-def observationdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ObservationDefinition", v)
-
-
-def observationdefinitionqualifiedinterval_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ObservationDefinitionQualifiedInterval", v)
-
-
-def observationdefinitionquantitativedetails_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ObservationDefinitionQuantitativeDetails", v)
-
-
-def observationreferencerange_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ObservationReferenceRange", v)
-
-
-def operationdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationDefinition", v)
-
-
-def operationdefinitionoverload_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionOverload", v)
-
-
-def operationdefinitionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionParameter", v)
-
-
-def operationdefinitionparameterbinding_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionParameterBinding", v)
-
-
-def operationdefinitionparameterreferencedfrom_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OperationDefinitionParameterReferencedFrom", v)
-
-
-def operationoutcome_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationOutcome", v)
-
-
-def operationoutcomeissue_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OperationOutcomeIssue", v)
-
-
-def organization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Organization", v)
-
-
-def organizationaffiliation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("OrganizationAffiliation", v)
-
-
-def organizationcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("OrganizationContact", v)
-
-
-def packagedproductdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinition", v)
-
-
-def packagedproductdefinitionlegalstatusofsupply_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinitionLegalStatusOfSupply", v)
-
-
-def packagedproductdefinitionpackage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinitionPackage", v)
-
-
-def packagedproductdefinitionpackagecontaineditem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinitionPackageContainedItem", v)
-
-
-def packagedproductdefinitionpackageproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinitionPackageProperty", v)
-
-
-def packagedproductdefinitionpackageshelflifestorage_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PackagedProductDefinitionPackageShelfLifeStorage", v)
-
-
-def parameterdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ParameterDefinition", v)
-
-
-def parameters_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Parameters", v)
-
-
-def parametersparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ParametersParameter", v)
-
-
-def patient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Patient", v)
-
-
-def patientcommunication_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientCommunication", v)
-
-
-def patientcontact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientContact", v)
-
-
-def patientlink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PatientLink", v)
-
-
-def paymentnotice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PaymentNotice", v)
-
-
-def paymentreconciliation_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PaymentReconciliation", v)
-
-
-def paymentreconciliationdetail_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PaymentReconciliationDetail", v)
-
-
-def paymentreconciliationprocessnote_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PaymentReconciliationProcessNote", v)
-
-
-def period_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Period", v)
-
-
-def person_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Person", v)
-
-
-def personlink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PersonLink", v)
-
-
-def plandefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PlanDefinition", v)
-
-
-def plandefinitionaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PlanDefinitionAction", v)
-
-
-def plandefinitionactioncondition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PlanDefinitionActionCondition", v)
-
-
-def plandefinitionactiondynamicvalue_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PlanDefinitionActionDynamicValue", v)
-
-
-def plandefinitionactionparticipant_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PlanDefinitionActionParticipant", v)
-
-
-def plandefinitionactionrelatedaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PlanDefinitionActionRelatedAction", v)
-
-
-def plandefinitiongoal_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PlanDefinitionGoal", v)
-
-
-def plandefinitiongoaltarget_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PlanDefinitionGoalTarget", v)
-
-
-def population_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Population", v)
-
-
-def practitioner_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Practitioner", v)
-
-
-def practitionerqualification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PractitionerQualification", v)
-
-
-def practitionerrole_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("PractitionerRole", v)
-
-
-def practitionerroleavailabletime_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PractitionerRoleAvailableTime", v)
-
-
-def practitionerrolenotavailable_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("PractitionerRoleNotAvailable", v)
-
-
-def procedure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Procedure", v)
-
-
-def procedurefocaldevice_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcedureFocalDevice", v)
-
-
-def procedureperformer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProcedurePerformer", v)
-
-
-def prodcharacteristic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProdCharacteristic", v)
-
-
-def productshelflife_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProductShelfLife", v)
-
-
-def provenance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Provenance", v)
-
-
-def provenanceagent_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProvenanceAgent", v)
-
-
-def provenanceentity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ProvenanceEntity", v)
-
-
-def quantity_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Quantity", v)
-
-
-def questionnaire_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Questionnaire", v)
-
-
-def questionnaireitem_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("QuestionnaireItem", v)
-
-
-def questionnaireitemansweroption_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireItemAnswerOption", v)
-
-
-def questionnaireitemenablewhen_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireItemEnableWhen", v)
-
-
-def questionnaireiteminitial_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireItemInitial", v)
-
-
-def questionnaireresponse_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("QuestionnaireResponse", v)
-
-
-def questionnaireresponseitem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireResponseItem", v)
-
-
-def questionnaireresponseitemanswer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("QuestionnaireResponseItemAnswer", v)
-
-
-def range_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Range", v)
-
-
-def ratio_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Ratio", v)
-
-
-def ratiorange_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RatioRange", v)
-
-
-def reference_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Reference", v)
-
-
-def regulatedauthorization_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RegulatedAuthorization", v)
-
-
-def regulatedauthorizationcase_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RegulatedAuthorizationCase", v)
-
-
-def relatedartifact_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RelatedArtifact", v)
-
-
-def relatedperson_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RelatedPerson", v)
-
-
-def relatedpersoncommunication_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RelatedPersonCommunication", v)
-
-
-def requestgroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RequestGroup", v)
-
-
-def requestgroupaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RequestGroupAction", v)
-
-
-def requestgroupactioncondition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RequestGroupActionCondition", v)
-
-
-def requestgroupactionrelatedaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RequestGroupActionRelatedAction", v)
-
-
-def researchdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ResearchDefinition", v)
-
-
-def researchelementdefinition_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ResearchElementDefinition", v)
-
-
-def researchelementdefinitioncharacteristic_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ResearchElementDefinitionCharacteristic", v)
-
-
-def researchstudy_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ResearchStudy", v)
-
-
-def researchstudyarm_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ResearchStudyArm", v)
-
-
-def researchstudyobjective_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ResearchStudyObjective", v)
-
-
-def researchsubject_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ResearchSubject", v)
-
-
-def resource_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Resource", v)
-
-
-def riskassessment_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("RiskAssessment", v)
-
-
-def riskassessmentprediction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("RiskAssessmentPrediction", v)
-
-
-def sampleddata_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SampledData", v)
-
-
-def schedule_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Schedule", v)
-
-
-def searchparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SearchParameter", v)
-
-
-def searchparametercomponent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SearchParameterComponent", v)
-
-
-def servicerequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ServiceRequest", v)
-
-
-def signature_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Signature", v)
-
-
-def slot_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Slot", v)
-
-
-def specimen_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Specimen", v)
-
-
-def specimencollection_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenCollection", v)
-
-
-def specimencontainer_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenContainer", v)
-
-
-def specimendefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenDefinition", v)
-
-
-def specimendefinitiontypetested_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SpecimenDefinitionTypeTested", v)
-
-
-def specimendefinitiontypetestedcontainer_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SpecimenDefinitionTypeTestedContainer", v)
-
-
-def specimendefinitiontypetestedcontaineradditive_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SpecimenDefinitionTypeTestedContainerAdditive", v)
-
-
-def specimendefinitiontypetestedhandling_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SpecimenDefinitionTypeTestedHandling", v)
-
-
-def specimenprocessing_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SpecimenProcessing", v)
-
-
-def structuredefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureDefinition", v)
-
-
-def structuredefinitioncontext_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureDefinitionContext", v)
-
-
-def structuredefinitiondifferential_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureDefinitionDifferential", v)
-
-
-def structuredefinitionmapping_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureDefinitionMapping", v)
-
-
-def structuredefinitionsnapshot_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureDefinitionSnapshot", v)
-
-
-def structuremap_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureMap", v)
-
-
-def structuremapgroup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureMapGroup", v)
-
-
-def structuremapgroupinput_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureMapGroupInput", v)
-
-
-def structuremapgrouprule_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureMapGroupRule", v)
-
-
-def structuremapgroupruledependent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureMapGroupRuleDependent", v)
-
-
-def structuremapgrouprulesource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureMapGroupRuleSource", v)
-
-
-def structuremapgroupruletarget_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureMapGroupRuleTarget", v)
-
-
-def structuremapgroupruletargetparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("StructureMapGroupRuleTargetParameter", v)
-
-
-def structuremapstructure_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("StructureMapStructure", v)
-
-
-def subscription_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Subscription", v)
-
-
-def subscriptionchannel_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubscriptionChannel", v)
-
-
-def subscriptionstatus_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubscriptionStatus", v)
-
-
-def subscriptionstatusnotificationevent_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionStatusNotificationEvent", v)
-
-
-def subscriptiontopic_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubscriptionTopic", v)
-
-
-def subscriptiontopiccanfilterby_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionTopicCanFilterBy", v)
-
-
-def subscriptiontopiceventtrigger_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionTopicEventTrigger", v)
-
-
-def subscriptiontopicnotificationshape_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionTopicNotificationShape", v)
-
-
-def subscriptiontopicresourcetrigger_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionTopicResourceTrigger", v)
-
-
-def subscriptiontopicresourcetriggerquerycriteria_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubscriptionTopicResourceTriggerQueryCriteria", v)
-
-
-def substance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Substance", v)
-
-
-def substancedefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubstanceDefinition", v)
-
-
-def substancedefinitioncode_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionCode", v)
-
-
-def substancedefinitionmoiety_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionMoiety", v)
-
-
-def substancedefinitionmolecularweight_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionMolecularWeight", v)
-
-
-def substancedefinitionname_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionName", v)
-
-
-def substancedefinitionnameofficial_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionNameOfficial", v)
-
-
-def substancedefinitionproperty_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionProperty", v)
-
-
-def substancedefinitionrelationship_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionRelationship", v)
-
-
-def substancedefinitionsourcematerial_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionSourceMaterial", v)
-
-
-def substancedefinitionstructure_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionStructure", v)
-
-
-def substancedefinitionstructurerepresentation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SubstanceDefinitionStructureRepresentation", v)
-
-
-def substanceingredient_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubstanceIngredient", v)
-
-
-def substanceinstance_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SubstanceInstance", v)
-
-
-def supplydelivery_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyDelivery", v)
-
-
-def supplydeliverysupplieditem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("SupplyDeliverySuppliedItem", v)
-
-
-def supplyrequest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyRequest", v)
-
-
-def supplyrequestparameter_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("SupplyRequestParameter", v)
-
-
-def task_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Task", v)
-
-
-def taskinput_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TaskInput", v)
-
-
-def taskoutput_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TaskOutput", v)
-
-
-def taskrestriction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TaskRestriction", v)
-
-
-def terminologycapabilities_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilities", v)
-
-
-def terminologycapabilitiesclosure_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesClosure", v)
-
-
-def terminologycapabilitiescodesystem_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesCodeSystem", v)
-
-
-def terminologycapabilitiescodesystemversion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesCodeSystemVersion", v)
-
-
-def terminologycapabilitiescodesystemversionfilter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesCodeSystemVersionFilter", v)
-
-
-def terminologycapabilitiesexpansion_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesExpansion", v)
-
-
-def terminologycapabilitiesexpansionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesExpansionParameter", v)
-
-
-def terminologycapabilitiesimplementation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesImplementation", v)
-
-
-def terminologycapabilitiessoftware_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesSoftware", v)
-
-
-def terminologycapabilitiestranslation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesTranslation", v)
-
-
-def terminologycapabilitiesvalidatecode_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TerminologyCapabilitiesValidateCode", v)
-
-
-def testreport_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReport", v)
-
-
-def testreportparticipant_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportParticipant", v)
-
-
-def testreportsetup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportSetup", v)
-
-
-def testreportsetupaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportSetupAction", v)
-
-
-def testreportsetupactionassert_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestReportSetupActionAssert", v)
-
-
-def testreportsetupactionoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestReportSetupActionOperation", v)
-
-
-def testreportteardown_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportTeardown", v)
-
-
-def testreportteardownaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestReportTeardownAction", v)
-
-
-def testreporttest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportTest", v)
-
-
-def testreporttestaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestReportTestAction", v)
-
-
-def testscript_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScript", v)
-
-
-def testscriptdestination_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptDestination", v)
-
-
-def testscriptfixture_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptFixture", v)
-
-
-def testscriptmetadata_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptMetadata", v)
-
-
-def testscriptmetadatacapability_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptMetadataCapability", v)
-
-
-def testscriptmetadatalink_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptMetadataLink", v)
-
-
-def testscriptorigin_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptOrigin", v)
-
-
-def testscriptsetup_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptSetup", v)
-
-
-def testscriptsetupaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptSetupAction", v)
-
-
-def testscriptsetupactionassert_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionAssert", v)
-
-
-def testscriptsetupactionoperation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionOperation", v)
-
-
-def testscriptsetupactionoperationrequestheader_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptSetupActionOperationRequestHeader", v)
-
-
-def testscriptteardown_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTeardown", v)
-
-
-def testscriptteardownaction_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("TestScriptTeardownAction", v)
-
-
-def testscripttest_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTest", v)
-
-
-def testscripttestaction_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptTestAction", v)
-
-
-def testscriptvariable_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TestScriptVariable", v)
-
-
-def timing_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("Timing", v)
-
-
-def timingrepeat_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TimingRepeat", v)
-
-
-def triggerdefinition_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("TriggerDefinition", v)
-
-
-def usagecontext_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("UsageContext", v)
-
-
-def valueset_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSet", v)
-
-
-def valuesetcompose_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetCompose", v)
-
-
-def valuesetcomposeinclude_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetComposeInclude", v)
-
-
-def valuesetcomposeincludeconcept_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetComposeIncludeConcept", v)
-
-
-def valuesetcomposeincludeconceptdesignation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetComposeIncludeConceptDesignation", v)
-
-
-def valuesetcomposeincludefilter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetComposeIncludeFilter", v)
-
-
-def valuesetexpansion_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("ValueSetExpansion", v)
-
-
-def valuesetexpansioncontains_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetExpansionContains", v)
-
-
-def valuesetexpansionparameter_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("ValueSetExpansionParameter", v)
-
-
-def verificationresult_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("VerificationResult", v)
-
-
-def verificationresultattestation_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VerificationResultAttestation", v)
-
-
-def verificationresultprimarysource_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VerificationResultPrimarySource", v)
-
-
-def verificationresultvalidator_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VerificationResultValidator", v)
-
-
-def visionprescription_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
-    return fhir_model_validator("VisionPrescription", v)
-
-
-def visionprescriptionlensspecification_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VisionPrescriptionLensSpecification", v)
-
-
-def visionprescriptionlensspecificationprism_validator(
-    v: Union[StrBytes, dict, Path, FHIRAbstractModel]
-):
-    return fhir_model_validator("VisionPrescriptionLensSpecificationPrism", v)
+def __dir__() -> typing.List[str]:
+    """ """
+    return sorted(set(globals()) | set(__all__))
 
 
-__all__ = [
+# most of names are created on first access, see ``__getattr__``
+__all__ = [  # noqa: F822
     "fhirprimitiveextension_validator",
     "account_validator",
     "accountcoverage_validator",
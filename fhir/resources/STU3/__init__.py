@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.core.parsecache import ParseCache
+from fhir.resources.core.utils import load_file, load_str_bytes
 
 from .fhirtypesvalidators import get_fhir_model_class
 
@@ -10,16 +12,35 @@ __fhir_version__ = "3.0.2"
 
 
 def construct_fhir_element(
-    element_type: str, data: Union[Dict[str, Any], str, bytes, Path]
+    element_type: str,
+    data: Union[Dict[str, Any], str, bytes, bytearray, memoryview, Path],
+    *,
+    trusted: bool = False,
+    cache: Optional[ParseCache] = None,
 ) -> FHIRAbstractModel:
+    """``trusted``: data is already validated (i.e. came out from own database),
+    model is constructed without any validation (see
+    ``FHIRAbstractModel.construct_trusted``).
+    ``cache``: parsed model of the same JSON payload is taken from the cache
+    (see ``fhir.resources.core.parsecache.ParseCache``)."""
     try:
         klass = get_fhir_model_class(element_type)
     except KeyError:
         raise LookupError(
             f"'{element_type}' is not valid FHIRModel (element type) name!"
         )
-    if isinstance(data, (str, bytes)):
-        return klass.parse_raw(data, content_type="application/json")
+    if trusted is True:
+        json_loads = klass.__config__.json_loads
+        if isinstance(data, (str, bytes, bytearray, memoryview)):
+            data = load_str_bytes(data, json_loads=json_loads)
+        elif isinstance(data, Path):
+            data = load_file(data, json_loads=json_loads, cls=klass)
+            if isinstance(data, FHIRAbstractModel):
+                # XML is parsed into model directly
+                return data
+        return klass.construct_trusted(data)
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        return klass.parse_raw(data, content_type="application/json", cache=cache)
     elif isinstance(data, Path):
         return klass.parse_file(data)
     return klass.parse_obj(data)
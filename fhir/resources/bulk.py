@@ -0,0 +1,164 @@
+# _*_ coding: utf-8 _*_
+"""FHIR Bulk Data (NDJSON) support.
+see https://hl7.org/fhir/uv/bulkdata/
+"""
+import pathlib
+import typing
+
+from pydantic.v1.error_wrappers import ValidationError
+
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel, json_loads
+from fhir.resources.core.serializer import write_json_value
+from fhir.resources.core.utils.common import get_fhir_root_module
+from fhir.resources.core.utils.fileio import open_file
+from fhir.resources.core.utils.jsonstream import JSONStreamWriter
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+FHIR_RELEASES = ("R5", "R4B", "STU3", "DSTU2")
+
+NDJSONSource = typing.Union[str, pathlib.Path, typing.IO]
+NDJSONTarget = NDJSONSource
+NDJSONItem = typing.Union[FHIRAbstractModel, typing.Tuple[int, Exception]]
+
+
+def iter_ndjson(
+    source: NDJSONSource,
+    release: str = "R5",
+    *,
+    lenient: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> typing.Iterator[NDJSONItem]:
+    """Reads NDJSON (one resource per line) file line by line with bounded memory,
+    each line is dispatched to right model class by its ``resourceType``.
+
+    :param source: file path (optionally ``gzip``, ``bz2`` or ``xz`` compressed)
+        or (binary or text) file object.
+    :param release: FHIR release name, i.e ``R5``, ``R4B``, ``STU3`` and ``DSTU2``.
+    :param lenient: instead of raising error, ``(line number, error)`` tuple is
+        yielded for the invalid line.
+    :param buffer_size: read buffer size, used when file path is provided.
+    """
+    if release not in FHIR_RELEASES:
+        raise ValueError(
+            f"Unsupported FHIR release '{release}', "
+            f"should be one of {FHIR_RELEASES}"
+        )
+    get_fhir_model_class = get_fhir_root_module(release).get_fhir_model_class
+
+    if isinstance(source, (str, pathlib.Path)):
+        # compressed (i.e. ``Patient.ndjson.gz``) file is decompressed on the fly
+        fp = open_file(source, buffer_size)
+        close = True
+    else:
+        fp = source
+        close = False
+    try:
+        for line_no, line in enumerate(fp, start=1):
+            if not line.strip():
+                # blank line is allowed (i.e end of file)
+                continue
+            try:
+                yield parse_ndjson_line(line, get_fhir_model_class)
+            except (ValidationError, ValueError, LookupError) as exc:
+                if lenient is False:
+                    raise
+                yield line_no, exc
+    finally:
+        if close:
+            fp.close()
+
+
+def parse_ndjson_line(
+    line: typing.Union[str, bytes],
+    get_fhir_model_class: typing.Callable[[str], typing.Type[FHIRAbstractModel]],
+) -> FHIRAbstractModel:
+    """JSON is decoded only once, ``resourceType`` is sniffed from decoded value."""
+    data = json_loads(line)
+    if not isinstance(data, dict):
+        raise ValueError(f"JSON object is expected, but got {type(data)}")
+    resource_type = data.get("resourceType", None)
+    if resource_type is None:
+        raise ValueError("'resourceType' is missing.")
+    try:
+        klass = get_fhir_model_class(resource_type)
+    except KeyError:
+        raise LookupError(
+            f"'{resource_type}' is not valid FHIRModel (element type) name!"
+        )
+    return klass.parse_obj(data)
+
+
+class NDJSONWriter:
+    """Writes NDJSON (one resource per line) with bounded memory, lines are
+    buffered and flushed in batches (whenever buffer grows over ``buffer_size``).
+    Resource could be model or raw ``dict`` (written as it is).
+
+    Examples::
+
+        >>> with NDJSONWriter("Patient.ndjson.gz", compress=True) as writer:
+        ...     writer.write_many(patients)
+    """
+
+    def __init__(
+        self,
+        target: NDJSONTarget,
+        *,
+        compress: bool = False,
+        compresslevel: int = 6,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        exclude_comments: bool = False,
+    ):
+        """
+        :param target: file path or (binary or text) file object.
+        :param compress: gzip compressed output.
+        :param compresslevel: gzip compression level.
+        :param buffer_size: flush threshold of write buffer in bytes.
+        """
+        self._writer = JSONStreamWriter(
+            target,
+            buffer_size=buffer_size,
+            compress=compress,
+            compresslevel=compresslevel,
+        )
+        self.exclude_comments = exclude_comments
+        self.count = 0
+
+    def write(self, resource: typing.Union[FHIRAbstractModel, typing.Dict]):
+        """ """
+        writer = self._writer
+        write_json_value(
+            resource, writer.buffer, exclude_comments=self.exclude_comments
+        )
+        writer.buffer += b"\n"
+        self.count += 1
+        writer.written()
+
+    def write_many(
+        self, resources: typing.Iterable[typing.Union[FHIRAbstractModel, typing.Dict]]
+    ) -> int:
+        """Writes every resource, returns number of written lines."""
+        count = self.count
+        for resource in resources:
+            self.write(resource)
+        return self.count - count
+
+    def flush(self):
+        """ """
+        self._writer.flush()
+
+    def close(self):
+        """ """
+        self._writer.close()
+
+    def __enter__(self) -> "NDJSONWriter":
+        """ """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ """
+        self.close()
+
+
+__all__ = ["iter_ndjson", "NDJSONWriter"]
@@ -0,0 +1,569 @@
+# _*_ coding: utf-8 _*_
+"""Bundle specific helpers (incremental reading and writing of huge Bundle
+documents)."""
+import io
+import pathlib
+import typing
+from copy import copy
+
+from .serializer import FHIR_COMMENTS_FIELD_NAME, json_dumps_bytes, write_json_value
+from .utils.common import get_fhir_root_module
+from .utils.fileio import open_file
+from .utils.jsonstream import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    JSONStreamTokenizer,
+    JSONStreamWriter,
+)
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+EntryFilter = typing.Union[
+    typing.Callable[[typing.Optional[str]], bool], typing.Collection[str]
+]
+BundleSource = typing.Union[str, bytes, pathlib.Path, typing.IO]
+BundleTarget = typing.Union[str, pathlib.Path, typing.IO]
+# entry elements those come after ``resource``
+ENTRY_ELEMENTS_AFTER_RESOURCE = ("search", "request", "response")
+
+
+def get_bundle_entry_class(
+    bundle_cls: typing.Type["FHIRAbstractModel"],
+) -> typing.Type["FHIRAbstractModel"]:
+    """ """
+    type_ = bundle_cls.__fields__["entry"].type_
+    return get_fhir_root_module(type_.__fhir_release__).get_fhir_model_class(
+        type_.__resource_type__
+    )
+
+
+class BundleEntryReader:
+    """Incremental (constant memory) reader of Bundle JSON document.
+    Bundle envelope (everything except ``entry``) is validated and available
+    as ``bundle`` attribute (without entries),
+    then each ``BundleEntry`` is constructed and yielded one at a time.
+
+    Envelope is validated before first entry is yielded, unless required
+    ``type`` element comes after the ``entry`` in the document, in that case
+    it is validated at the end of the document. It is validated again at the
+    end, only if other envelope elements come after the entries.
+    """
+
+    def __init__(
+        self,
+        bundle_cls: typing.Type["FHIRAbstractModel"],
+        source: BundleSource,
+        *,
+        entry_filter: typing.Optional[EntryFilter] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """ """
+        self.bundle_cls = bundle_cls
+        self.entry_cls = get_bundle_entry_class(bundle_cls)
+        self.source = source
+        self.chunk_size = chunk_size
+        self.bundle: typing.Optional["FHIRAbstractModel"] = None
+        self._entries: typing.Optional[typing.Iterator["FHIRAbstractModel"]] = None
+
+        if entry_filter is not None and not callable(entry_filter):
+            resource_types = frozenset(entry_filter)
+
+            def entry_filter(resource_type):
+                return resource_type in resource_types
+
+        self.entry_filter = entry_filter
+
+    def __iter__(self) -> "BundleEntryReader":
+        """ """
+        return self
+
+    def __next__(self) -> "FHIRAbstractModel":
+        """ """
+        if self._entries is None:
+            self._entries = self._iter_source()
+        return next(self._entries)
+
+    def _iter_source(self) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        source = self.source
+        if isinstance(source, (str, pathlib.Path)):
+            with open_file(source) as fp:
+                yield from self._iter_entries(fp)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            yield from self._iter_entries(io.BytesIO(source))
+        else:
+            yield from self._iter_entries(source)
+
+    def _iter_entries(self, fp: typing.IO) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        tokenizer = JSONStreamTokenizer(fp, chunk_size=self.chunk_size)
+        envelope: typing.Dict[str, typing.Any] = {}
+        after_entry = False
+        # envelope elements (other than already validated ones) after entries
+        envelope_changed = False
+
+        tokenizer.expect("{")
+        if tokenizer.peek() == "}":
+            tokenizer.expect("}")
+        else:
+            while True:
+                key = tokenizer.read_value()
+                tokenizer.expect(":")
+                if key == "entry":
+                    if "type" in envelope:
+                        self.validate_envelope(envelope)
+                    yield from self._iter_entry_items(tokenizer)
+                    after_entry = True
+                else:
+                    envelope[key] = tokenizer.read_value()
+                    if after_entry and key not in ("resourceType", "type"):
+                        envelope_changed = True
+                if tokenizer.expect(",}") == "}":
+                    break
+
+        if tokenizer.peek() != "":
+            raise ValueError("Invalid JSON: extra data after Bundle document.")
+        if self.bundle is None or envelope_changed:
+            self.validate_envelope(envelope)
+
+    def _iter_entry_items(
+        self, tokenizer: JSONStreamTokenizer
+    ) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        tokenizer.expect("[")
+        if tokenizer.peek() == "]":
+            tokenizer.expect("]")
+            return
+        entry_filter = self.entry_filter
+        entry_cls = self.entry_cls
+        while True:
+            entry = tokenizer.read_value()
+            if entry_filter is None or entry_filter(get_entry_resource_type(entry)):
+                yield entry_cls.parse_obj(entry)
+            if tokenizer.expect(",]") == "]":
+                break
+
+    def validate_envelope(self, envelope: typing.Dict[str, typing.Any]):
+        """ """
+        resource_type = envelope.get("resourceType", None)
+        if resource_type != self.bundle_cls.get_resource_type():
+            raise ValueError(
+                f"Expected resourceType is '{self.bundle_cls.get_resource_type()}', "
+                f"but got '{resource_type}'"
+            )
+        self.bundle = self.bundle_cls.parse_obj(envelope)
+
+
+class XMLBundleEntryReader(BundleEntryReader):
+    """Incremental (constant memory) reader of Bundle XML document, based on
+    ``lxml.etree.iterparse``. Each ``BundleEntry`` is constructed and yielded
+    as soon as its closing tag is seen, then the element is removed from the
+    tree. Comments right before ``entry`` are kept (as ``fhir_comments``),
+    the same as ``xml_loads``.
+
+    Envelope is validated before first entry is yielded and validated again
+    at the end of the document, if any element comes after the entries.
+    """
+
+    def _iter_source(self) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            yield from self._iter_entries(io.BytesIO(source))
+        elif isinstance(source, (str, pathlib.Path)):
+            with open_file(source) as fp:
+                yield from self._iter_entries(fp)
+        else:
+            yield from self._iter_entries(source)
+
+    def _iter_entries(self, fp: typing.Any) -> typing.Iterator["FHIRAbstractModel"]:
+        """ """
+        from lxml import etree  # type: ignore
+
+        from .utils.xml import Node, element_to_fhir
+
+        entry_filter = self.entry_filter
+        entry_cls = self.entry_cls
+        root = None
+        # copy of every envelope element (with comments)
+        envelope = None
+        envelope_changed = False
+        depth = 0
+        for event, element in etree.iterparse(fp, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = element
+                    self.validate_root(root)
+                    envelope = etree.Element(root.tag, nsmap=root.nsmap)
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+
+            comments = []
+            previous = element.getprevious()
+            while isinstance(previous, etree._Comment):
+                comments.insert(0, previous)
+                previous = previous.getprevious()
+
+            if Node.clean_tag(element) != "entry":
+                for item in comments + [element]:
+                    envelope.append(copy(item))
+                envelope_changed = True
+                continue
+
+            if self.bundle is None or envelope_changed:
+                self.validate_xml_envelope(envelope)
+                envelope_changed = False
+
+            if entry_filter is None or entry_filter(
+                get_xml_entry_resource_type(element)
+            ):
+                yield element_to_fhir(
+                    element, entry_cls, [c.text for c in comments] or None
+                )
+
+            # processed elements are dropped
+            element.clear()
+            while element.getprevious() is not None:
+                del root[0]
+
+        if root is None:
+            raise ValueError("Invalid XML: empty document.")
+        if self.bundle is None or envelope_changed:
+            self.validate_xml_envelope(envelope)
+
+    def validate_root(self, root: typing.Any):
+        """ """
+        from .utils.xml import Node
+
+        resource_type = Node.clean_tag(root)
+        if resource_type != self.bundle_cls.get_resource_type():
+            raise ValueError(
+                f"Expected resourceType is '{self.bundle_cls.get_resource_type()}', "
+                f"but got '{resource_type}'"
+            )
+
+    def validate_xml_envelope(self, envelope: typing.Any):
+        """ """
+        from .utils.xml import element_to_fhir
+
+        self.bundle = element_to_fhir(envelope, self.bundle_cls)
+
+
+def get_xml_entry_resource_type(entry: typing.Any) -> typing.Optional[str]:
+    """ """
+    from .utils.xml import Node
+
+    for child in entry:
+        if isinstance(child.tag, str) and Node.clean_tag(child) == "resource":
+            for resource in child:
+                if isinstance(resource.tag, str):
+                    return Node.clean_tag(resource)
+    return None
+
+
+def get_entry_resource_type(entry: typing.Any) -> typing.Optional[str]:
+    """ """
+    if isinstance(entry, dict):
+        resource = entry.get("resource", None)
+        if isinstance(resource, dict):
+            return resource.get("resourceType", None)
+    return None
+
+
+class BundleWriter:
+    """Streaming (constant memory) writer of Bundle JSON document.
+    Envelope is written first, then entries one at a time, finally ``total``
+    and ``link`` (which are usually known only at the end of a search),
+    so neither entries nor their ``dict`` copies are held in memory.
+
+    Entry could be ``BundleEntry`` model, resource model or raw ``dict``
+    (raw ``dict`` with ``resourceType`` is resource, otherwise entry). Raw
+    values are written as they are, without validation.
+
+    Examples::
+
+        >>> with BundleWriter("result.json", type="searchset") as writer:
+        ...     for patient in patients:
+        ...         writer.write(patient, fullUrl=f"Patient/{patient.id}")
+        ...     writer.total = count
+    """
+
+    def __init__(
+        self,
+        target: BundleTarget,
+        type: str,
+        *,
+        release: str = "R5",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        exclude_comments: bool = False,
+        **envelope: typing.Any,
+    ):
+        """
+        :param target: file path or (binary or text) file object.
+        :param type: Bundle type, i.e ``searchset``, ``collection``...
+        :param release: FHIR release name, i.e ``R5``, ``R4B``, ``STU3`` and ``DSTU2``.
+        :param envelope: other Bundle elements (``id``, ``meta``, ``timestamp``...),
+            ``total`` and ``link`` are written at the end (could be changed
+            until the writer is closed).
+        """
+        self.release = release
+        root_module = get_fhir_root_module(release)
+        self.bundle_cls = root_module.get_fhir_model_class("Bundle")
+        self.entry_cls = get_bundle_entry_class(self.bundle_cls)
+        self.type = type
+        self.total: typing.Optional[int] = envelope.pop("total", None)
+        self.link: typing.Optional[typing.List[typing.Any]] = envelope.pop("link", None)
+        self.exclude_comments = exclude_comments
+        self.count = 0
+
+        bundle = self.bundle_cls.parse_obj({"type": type, **envelope})
+        self._writer = JSONStreamWriter(target, buffer_size=buffer_size)
+        buffer = self._writer.buffer
+        write_json_value(bundle, buffer, exclude_comments=exclude_comments)
+        # closing brace is written at the end
+        del buffer[-1:]
+
+    def write(self, item: typing.Any, **entry: typing.Any):
+        """Writes single entry.
+
+        :param item: ``BundleEntry``, resource model or raw ``dict``.
+        :param entry: other entry elements (``fullUrl``, ``search``...),
+            only when resource is provided.
+        """
+        buffer = self._writer.buffer
+        if self.count == 0:
+            buffer += b',"entry":['
+        else:
+            buffer += b","
+
+        if isinstance(item, self.entry_cls) or (
+            isinstance(item, dict) and "resourceType" not in item
+        ):
+            if entry:
+                raise TypeError("Entry elements are only accepted along with resource.")
+            write_json_value(item, buffer, exclude_comments=self.exclude_comments)
+        else:
+            self._write_resource_entry(item, entry, buffer)
+        self.count += 1
+        self._writer.written()
+
+    def write_many(self, items: typing.Iterable[typing.Any]) -> int:
+        """Writes every entry, returns number of written entries."""
+        count = self.count
+        for item in items:
+            self.write(item)
+        return self.count - count
+
+    def _write_resource_entry(
+        self,
+        resource: typing.Any,
+        entry: typing.Dict[str, typing.Any],
+        buffer: bytearray,
+    ):
+        """``entry`` elements are validated, resource is written as it is."""
+        elements = ()
+        if entry:
+            elements = self.get_values(self.entry_cls.parse_obj(entry)).items()
+        buffer += b"{"
+        resource_written = False
+        for key, value in elements:
+            if not resource_written and key in ENTRY_ELEMENTS_AFTER_RESOURCE:
+                self._write_resource(resource, buffer)
+                resource_written = True
+            buffer += json_dumps_bytes(key)
+            buffer += b":"
+            buffer += json_dumps_bytes(value)
+            buffer += b","
+        if not resource_written:
+            self._write_resource(resource, buffer)
+        # replace trailing comma
+        buffer[-1:] = b"}"
+
+    def _write_resource(self, resource: typing.Any, buffer: bytearray):
+        """ """
+        buffer += b'"resource":'
+        write_json_value(resource, buffer, exclude_comments=self.exclude_comments)
+        buffer += b","
+
+    def get_values(self, model: "FHIRAbstractModel") -> typing.Dict[str, typing.Any]:
+        """ """
+        if not self.exclude_comments:
+            return model.dict()
+        if self.release == "DSTU2":
+            return model.dict(exclude={FHIR_COMMENTS_FIELD_NAME})
+        return model.dict(exclude_comments=True)
+
+    def close(self):
+        """Writes ``total`` and ``link`` (validated), then closes the document."""
+        writer = self._writer
+        if writer.closed:
+            return
+        try:
+            buffer = writer.buffer
+            if self.count > 0:
+                buffer += b"]"
+            if self.total is not None or self.link is not None:
+                trailer = self.get_values(
+                    self.bundle_cls.parse_obj(
+                        {"type": self.type, "total": self.total, "link": self.link}
+                    )
+                )
+                for key in ("total", "link"):
+                    if key in trailer:
+                        buffer += b","
+                        buffer += json_dumps_bytes(key)
+                        buffer += b":"
+                        buffer += json_dumps_bytes(trailer[key])
+            buffer += b"}"
+        finally:
+            writer.close()
+
+    def abort(self):
+        """Closes the writer without completing the document."""
+        writer = self._writer
+        del writer.buffer[:]
+        writer.close()
+
+    def __enter__(self) -> "BundleWriter":
+        """ """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Document is completed only if no error occurred."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class XMLBundleWriter:
+    """Streaming writer of Bundle XML document, entries are written one at a
+    time. Unlike JSON, XML elements must follow ``elements_sequence`` order,
+    so ``total`` and ``link`` have to be provided up front (with envelope).
+    Output is the same as ``Bundle.xml()`` of the whole Bundle.
+    Not available for ``DSTU2``.
+    """
+
+    def __init__(
+        self,
+        target: BundleTarget,
+        type: str,
+        *,
+        release: str = "R5",
+        pretty_print=False,
+        xml_declaration=True,
+        **envelope: typing.Any,
+    ):
+        """
+        :param target: file path or binary file object.
+        :param type: Bundle type, i.e ``searchset``, ``collection``...
+        :param release: FHIR release name, i.e ``R5``, ``R4B`` and ``STU3``.
+        :param envelope: other Bundle elements (``id``, ``total``, ``link``...).
+        """
+        from .utils.xml import XMLStreamWriter, iter_fhir_obj_values
+
+        if release == "DSTU2":
+            raise ValueError("XML Bundle writer is not available for DSTU2.")
+        self.bundle_cls = get_fhir_root_module(release).get_fhir_model_class("Bundle")
+        self.entry_cls = get_bundle_entry_class(self.bundle_cls)
+        self.entry_field = self.bundle_cls.__fields__["entry"]
+        self.count = 0
+
+        bundle = self.bundle_cls.parse_obj({"type": type, **envelope})
+        if isinstance(target, (str, pathlib.Path)):
+            self._fp: typing.Optional[typing.IO] = io.open(target, "wb")
+            fp = self._fp
+        else:
+            self._fp = None
+            fp = target
+        self._writer = XMLStreamWriter(
+            fp,
+            bundle.resource_type,
+            pretty_print=pretty_print,
+            xml_declaration=xml_declaration,
+        )
+        # elements after ``entry`` are written at the end
+        self._trailer = []
+        for field, value, ext, ext_field in iter_fhir_obj_values(bundle):
+            if field.name == "entry":
+                continue
+            if self._is_before_entry(field.alias):
+                self._writer.write(field, value, ext, ext_field)
+            else:
+                self._trailer.append((field, value, ext, ext_field))
+
+    def _is_before_entry(self, alias: str) -> bool:
+        """ """
+        sequence = self.bundle_cls.elements_sequence()
+        return sequence.index(alias) < sequence.index("entry")
+
+    def write(self, item: typing.Any, **entry: typing.Any):
+        """Writes single entry.
+
+        :param item: ``BundleEntry``, resource model or raw ``dict``
+            (raw ``dict`` with ``resourceType`` is resource, otherwise entry).
+        :param entry: other entry elements (``fullUrl``, ``search``...),
+            only when resource is provided.
+        """
+        if isinstance(item, self.entry_cls):
+            if entry:
+                raise TypeError("Entry elements are only accepted along with resource.")
+        elif isinstance(item, dict) and "resourceType" not in item:
+            if entry:
+                raise TypeError("Entry elements are only accepted along with resource.")
+            item = self.entry_cls.parse_obj(item)
+        else:
+            item = self.entry_cls.parse_obj({**entry, "resource": item})
+        self._writer.write(self.entry_field, item)
+        self.count += 1
+
+    def write_many(self, items: typing.Iterable[typing.Any]) -> int:
+        """Writes every entry, returns number of written entries."""
+        count = self.count
+        for item in items:
+            self.write(item)
+        return self.count - count
+
+    def close(self):
+        """ """
+        writer = self._writer
+        if writer.closed:
+            return
+        try:
+            for field, value, ext, ext_field in self._trailer:
+                writer.write(field, value, ext, ext_field)
+            writer.close()
+        finally:
+            if self._fp is not None:
+                self._fp.close()
+
+    def abort(self):
+        """Closes the writer without completing the document."""
+        self._writer.closed = True
+        if self._fp is not None:
+            self._fp.close()
+
+    def __enter__(self) -> "XMLBundleWriter":
+        """ """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Document is completed only if no error occurred."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+__all__ = [
+    "BundleEntryReader",
+    "BundleWriter",
+    "XMLBundleEntryReader",
+    "XMLBundleWriter",
+]
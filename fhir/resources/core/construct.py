@@ -0,0 +1,189 @@
+# _*_ coding: utf-8 _*_
+"""Trusted (validation free) construction of FHIR models.
+
+Data coming from a trusted source (i.e. own database, which has been validated
+on the way in) doesn't need to go through the whole pydantic validation chain.
+Every model class gets a compiled ``ConstructPlan`` (the first time it is used),
+which maps each JSON key (alias or field name) to how its value is built.
+"""
+import typing
+
+from pydantic.v1 import AnyUrl
+from pydantic.v1.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.v1.fields import SHAPE_SINGLETON
+from pydantic.v1.utils import ROOT_KEY
+
+from .utils.common import get_fhir_root_module, normalize_fhir_type_class
+
+if typing.TYPE_CHECKING:
+    from pydantic.v1.fields import ModelField
+
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# value kinds
+VALUE_AS_IS = 0
+VALUE_CONVERT = 1
+VALUE_MODEL = 2
+VALUE_POLYMORPHIC = 3
+VALUE_RESOURCE_TYPE = 4
+
+_PLANS: typing.Dict[type, "ConstructPlan"] = {}
+_object_setattr = object.__setattr__
+
+
+class ConstructPlan:
+    """Precomputed construction table of a FHIR model class.
+
+    ``fields``: mapping of alias and field name to
+    (field name, value kind, model field, target)
+    ``defaults``: default values of all fields (preserving fields order)
+    ``sparse_defaults``: not ``None`` default values only (``sparse_storage``)
+    """
+
+    __slots__ = ("model_cls", "fields", "defaults", "sparse_defaults")
+
+    def __init__(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        fields: typing.Dict[str, typing.Tuple[str, int, "ModelField", typing.Any]],
+        defaults: typing.Dict[str, typing.Any],
+    ):
+        """ """
+        self.model_cls = model_cls
+        self.fields = fields
+        self.defaults = defaults
+        self.sparse_defaults = {k: v for k, v in defaults.items() if v is not None}
+
+    @classmethod
+    def compile(cls, model_cls: typing.Type["FHIRAbstractModel"]) -> "ConstructPlan":
+        """ """
+        fields = {}
+        defaults = {}
+        for name, field in model_cls.__fields__.items():
+            defaults[name] = None if field.required else field.get_default()
+            if name == "resource_type":
+                entry = (name, VALUE_RESOURCE_TYPE, field, None)
+                fields["resourceType"] = entry
+            else:
+                entry = (name,) + get_value_kind(field)
+            fields[name] = entry
+            fields[field.alias] = entry
+        return cls(model_cls, fields, defaults)
+
+    def construct(self, data: typing.Dict[str, typing.Any]) -> "FHIRAbstractModel":
+        """ """
+        model_cls = self.model_cls
+        plan_fields = self.fields
+        sparse = getattr(model_cls.__config__, "sparse_storage", False)
+        values = (self.sparse_defaults if sparse else self.defaults).copy()
+        fields_set = set()
+
+        for key, value in data.items():
+            try:
+                name, kind, field, target = plan_fields[key]
+            except KeyError:
+                raise ValueError(f"{model_cls.__name__} has no field or alias '{key}'.")
+            if kind == VALUE_RESOURCE_TYPE:
+                if value != values[name]:
+                    raise ValueError(
+                        f"{model_cls.__name__} expects resource type "
+                        f"'{values[name]}', but got '{value}'."
+                    )
+                continue
+
+            if value is not None:
+                if kind == VALUE_AS_IS:
+                    if value.__class__ is list:
+                        value = list(value)
+                elif kind == VALUE_CONVERT:
+                    value, error = field.validate(
+                        value, values, loc=field.alias, cls=model_cls
+                    )
+                    if error:
+                        raise ValidationError([error], model_cls)  # type: ignore
+                elif field.shape == SHAPE_SINGLETON:
+                    value = construct_value(value, kind, target)
+                else:
+                    value = [
+                        None if item is None else construct_value(item, kind, target)
+                        for item in value
+                    ]
+            elif sparse:
+                values.pop(name, None)
+                fields_set.add(name)
+                continue
+            values[name] = value
+            fields_set.add(name)
+
+        obj = model_cls.__new__(model_cls)
+        _object_setattr(obj, "__dict__", values)
+        _object_setattr(obj, "__fields_set__", fields_set)
+        obj._init_private_attributes()
+        return obj
+
+
+def get_value_kind(field: "ModelField") -> typing.Tuple[int, "ModelField", typing.Any]:
+    """Find out, how value of the field should be constructed."""
+    type_ = normalize_fhir_type_class(field.type_)
+    if not hasattr(type_, "is_primitive"):
+        # python native type i.e ``fhir_comments``
+        return VALUE_AS_IS, field, None
+
+    if type_.is_primitive():
+        # string based types are kept as it is, others are converted to
+        # python type (i.e date, decimal) the same way validation does.
+        if issubclass(type_, str) and not issubclass(type_, AnyUrl):
+            return VALUE_AS_IS, field, None
+        if type_.fhir_type_name() == "boolean":
+            return VALUE_AS_IS, field, None
+        return VALUE_CONVERT, field, None
+
+    root_module = get_fhir_root_module(type_.__fhir_release__)
+    target = (root_module.get_fhir_model_class, type_.__resource_type__)
+    if any(klass.__name__ == "AbstractBaseType" for klass in type_.__mro__):
+        return VALUE_POLYMORPHIC, field, target
+    return VALUE_MODEL, field, target
+
+
+def construct_value(value: typing.Any, kind: int, target: typing.Any) -> typing.Any:
+    """ """
+    if not isinstance(value, dict):
+        # already model instance
+        return value
+    get_model_class, resource_type = target
+    if kind == VALUE_POLYMORPHIC:
+        resource_type = value.get("resourceType", None) or resource_type
+    return get_construct_plan(get_model_class(resource_type)).construct(value)
+
+
+def get_construct_plan(
+    model_cls: typing.Type["FHIRAbstractModel"],
+) -> ConstructPlan:
+    """Returns compiled (cached) construct plan for the model class."""
+    try:
+        return _PLANS[model_cls]
+    except KeyError:
+        plan = _PLANS[model_cls] = ConstructPlan.compile(model_cls)
+        return plan
+
+
+def construct_trusted(
+    model_cls: typing.Type["FHIRAbstractModel"], data: typing.Dict[str, typing.Any]
+) -> "FHIRAbstractModel":
+    """Build model (including all nested models) from already validated data,
+    without any validation."""
+    if not isinstance(data, dict):
+        raise ValidationError(
+            [
+                ErrorWrapper(
+                    TypeError(
+                        f"{model_cls.__name__} expects dict, but got {type(data)}"
+                    ),
+                    loc=ROOT_KEY,
+                )
+            ],
+            model_cls,
+        )
+    return get_construct_plan(model_cls).construct(data)
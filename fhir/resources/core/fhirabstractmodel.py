@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Base class for all FHIR elements. """
 import abc
+import functools
 import inspect
 import logging
 import pathlib
@@ -14,10 +15,19 @@ from pydantic.v1.class_validators import ROOT_VALIDATOR_CONFIG_KEY, root_validat
 from pydantic.v1.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.v1.errors import ConfigError, PydanticValueError
 from pydantic.v1.fields import ModelField
+from pydantic.v1.json import pydantic_encoder
 from pydantic.v1.parse import Protocol
 from pydantic.v1.utils import ROOT_KEY, sequence_like
 
-from .utils import is_primitive_type, load_file, load_str_bytes, xml_dumps, yaml_dumps
+from .construct import construct_trusted
+from .flyweight import FlyweightPool, detach, is_shared, share_datatypes
+from .frozen import freeze_model, get_frozen_hash, is_frozen
+from .lazy import LazyResource, wrap_lazy_resources
+from .parsecache import ParseCache
+from .projection import elide_data, project_data
+from .serializer import get_serializer_plan
+from .utils import load_file, load_str_bytes, xml_dumps, yaml_dumps
+from .validators import validate_fhir_element
 
 try:
     import orjson
@@ -55,6 +65,7 @@ __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
 logger = logging.getLogger(__name__)
 FHIR_COMMENTS_FIELD_NAME = "fhir_comments"
+_object_setattr = object.__setattr__
 
 
 class WrongResourceType(PydanticValueError):
@@ -65,6 +76,9 @@ class WrongResourceType(PydanticValueError):
 class FHIRAbstractModel(BaseModel, abc.ABC):
     """Abstract base model class for all FHIR elements."""
 
+    # cached hash of frozen model
+    __slots__ = ("__fhir_hash__",)
+
     resource_type: str = ...  # type: ignore
 
     fhir_comments: typing.Union[str, typing.List[str]] = Field(
@@ -103,6 +117,87 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             raise ValidationError(errors, __pydantic_self__.__class__)
 
         BaseModel.__init__(__pydantic_self__, **data)
+        if __pydantic_self__.__config__.sparse_storage:
+            values = __pydantic_self__.__dict__
+            _object_setattr(
+                __pydantic_self__,
+                "__dict__",
+                {k: v for k, v in values.items() if v is not None},
+            )
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Absent element of the model with ``sparse_storage`` (not stored in
+        instance ``__dict__``) is resolved to its default value."""
+        field = self.__class__.__fields__.get(name, None)
+        if field is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        return field.get_default()
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """ """
+        if is_frozen(self):
+            raise TypeError(
+                f'"{self.__class__.__name__}" is frozen and does not support '
+                "item assignment"
+            )
+        if is_shared(self):
+            detach(self)
+        BaseModel.__setattr__(self, name, value)
+        if value is None and self.__config__.sparse_storage:
+            self.__dict__.pop(name, None)
+
+    def __delattr__(self, name: str) -> None:
+        """ """
+        if is_frozen(self):
+            raise TypeError(
+                f'"{self.__class__.__name__}" is frozen and does not support '
+                "item deletion"
+            )
+        if is_shared(self):
+            detach(self)
+        BaseModel.__delattr__(self, name)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Frozen models are compared by their (cached) hash first."""
+        if self is other:
+            return True
+        if (
+            isinstance(other, FHIRAbstractModel)
+            and is_frozen(self)
+            and is_frozen(other)
+            and get_frozen_hash(self) != get_frozen_hash(other)
+        ):
+            return False
+        return BaseModel.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        """Only frozen model is hashable."""
+        if not is_frozen(self):
+            raise TypeError(
+                f"unhashable type: '{self.__class__.__name__}' "
+                "(only frozen model is hashable, see ``freeze``)"
+            )
+        return get_frozen_hash(self)
+
+    def freeze(self: "Model") -> "Model":
+        """Makes the model (and all nested models) read-only and compact,
+        frozen model is hashable. see ``fhir.resources.core.frozen``"""
+        return typing.cast("Model", freeze_model(self))
+
+    def is_frozen(self) -> bool:
+        """ """
+        return is_frozen(self)
+
+    @root_validator(pre=True, allow_reuse=True)
+    def validate_fhir_element_plan(
+        cls, values: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        """Required primitive elements and choice type (one_of_many) elements
+        validation, driven by the precomputed validation plan of the class.
+        see ``fhir.resources.core.validators.ValidationPlan``"""
+        return validate_fhir_element(cls, values)
 
     @classmethod
     def add_root_validator(
@@ -219,6 +314,42 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         """ """
         return cls.__json_encoder__
 
+    @classmethod
+    def parse_obj(
+        cls: typing.Type["Model"],
+        obj: typing.Any,
+        *,
+        elements: typing.Optional[typing.Iterable[str]] = None,
+        frozen: bool = False,
+        shared: typing.Union[bool, FlyweightPool] = False,
+    ) -> "Model":
+        """``elements``: only selected elements (i.e. ``{"id", "code.coding"}``)
+        are validated and constructed, see ``fhir.resources.core.projection``.
+        ``frozen``: read-only model is returned, see ``freeze``.
+        ``shared``: repeated datatypes (``Coding``, ``Reference``...) are validated
+        once and shared (copy-on-write), ``FlyweightPool`` could be passed to
+        share them among many parsing. see ``fhir.resources.core.flyweight``."""
+        if elements is not None:
+            obj = project_data(cls, obj, elements=elements)
+        if shared is not False:
+            if shared is True:
+                shared = FlyweightPool(frozen=frozen)
+            obj = share_datatypes(cls, obj, shared)
+        model = super().parse_obj(obj)
+        if frozen is True:
+            model.freeze()
+        return model
+
+    @classmethod
+    def construct_trusted(
+        cls: typing.Type["Model"], data: typing.Dict[str, typing.Any]
+    ) -> "Model":
+        """Creates a new model (including all nested models) from already validated
+        data (i.e. which came out from own database), without any validation.
+        Keys are accepted as alias or as field name, like ``parse_obj``.
+        Important! Don't use it with untrusted data, use ``parse_obj`` instead."""
+        return construct_trusted(cls, data)
+
     @classmethod
     def parse_file(
         cls: typing.Type["Model"],
@@ -228,9 +359,24 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         encoding: str = "utf8",
         proto: typing.Optional[Protocol] = None,
         allow_pickle: bool = False,
+        lazy: bool = False,
+        elements: typing.Optional[typing.Iterable[str]] = None,
+        drop_narrative: bool = False,
+        drop_comments: bool = False,
+        frozen: bool = False,
+        shared: typing.Union[bool, FlyweightPool] = False,
         **extra,
     ) -> "Model":
+        """``lazy``: nested resources (i.e. ``Bundle.entry.resource``) are validated
+        at first access, see ``fhir.resources.core.lazy.LazyResource``.
+        ``elements``: see ``parse_obj``.
+        ``drop_narrative``, ``drop_comments``: resource narrative (``text``) and
+        ``fhir_comments`` are dropped while loading (neither validated nor kept).
+        ``frozen``, ``shared``: see ``parse_obj``."""
         extra.update({"cls": cls})
+        if drop_narrative or drop_comments:
+            # XML is bound without them
+            extra.update(drop_narrative=drop_narrative, drop_comments=drop_comments)
         obj = load_file(
             path,
             proto=proto,  # type: ignore[arg-type]
@@ -240,20 +386,81 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             json_loads=cls.__config__.json_loads,
             **extra,
         )
-        return cls.parse_obj(obj)
+        return cls._parse_loaded(
+            obj,
+            lazy=lazy,
+            elements=elements,
+            drop_narrative=drop_narrative,
+            drop_comments=drop_comments,
+            frozen=frozen,
+            shared=shared,
+        )
 
     @classmethod
     def parse_raw(
         cls: typing.Type["Model"],
-        b: "StrBytes",
+        b: typing.Union["StrBytes", bytearray, memoryview],
         *,
         content_type: typing.Optional[str] = None,
         encoding: str = "utf8",
         proto: typing.Optional[Protocol] = None,
         allow_pickle: bool = False,
+        lazy: bool = False,
+        elements: typing.Optional[typing.Iterable[str]] = None,
+        drop_narrative: bool = False,
+        drop_comments: bool = False,
+        frozen: bool = False,
+        shared: typing.Union[bool, FlyweightPool] = False,
+        cache: typing.Optional[ParseCache] = None,
         **extra,
     ) -> "Model":
+        """``lazy``: nested resources (i.e. ``Bundle.entry.resource``) are validated
+        at first access, see ``fhir.resources.core.lazy.LazyResource``.
+        ``bytes``, ``bytearray`` and ``memoryview`` JSON is passed to ``orjson``
+        as it is (without decoding).
+        ``cache``: parsed model of the same payload is taken from the cache
+        (fully validated, ``lazy`` has no effect), see
+        ``fhir.resources.core.parsecache``. Other parameters, see ``parse_file``."""
+        if cache is not None:
+            try:
+                options = (
+                    content_type,
+                    encoding,
+                    proto,
+                    allow_pickle,
+                    elements if elements is None else frozenset(elements),
+                    drop_narrative,
+                    drop_comments,
+                    tuple(sorted(extra.items())),
+                )
+                hash(options)
+            except TypeError:
+                options = None
+            if options is not None:
+                model = cache.get_or_parse(
+                    cls,
+                    b,
+                    functools.partial(
+                        cls.parse_raw,
+                        b,
+                        content_type=content_type,
+                        encoding=encoding,
+                        proto=proto,
+                        allow_pickle=allow_pickle,
+                        elements=elements,
+                        drop_narrative=drop_narrative,
+                        drop_comments=drop_comments,
+                        shared=shared,
+                        **extra,
+                    ),
+                    options,
+                )
+                if frozen is True:
+                    model.freeze()
+                return typing.cast("Model", model)
         extra.update({"cls": cls})
+        if drop_narrative or drop_comments:
+            extra.update(drop_narrative=drop_narrative, drop_comments=drop_comments)
         try:
             obj = load_str_bytes(
                 b,
@@ -266,7 +473,38 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
             )
         except (ValueError, TypeError, UnicodeDecodeError) as e:  # noqa: B014
             raise ValidationError([ErrorWrapper(e, loc=ROOT_KEY)], cls)
-        return cls.parse_obj(obj)
+        return cls._parse_loaded(
+            obj,
+            lazy=lazy,
+            elements=elements,
+            drop_narrative=drop_narrative,
+            drop_comments=drop_comments,
+            frozen=frozen,
+            shared=shared,
+        )
+
+    @classmethod
+    def _parse_loaded(
+        cls: typing.Type["Model"],
+        obj: typing.Any,
+        *,
+        lazy: bool,
+        elements: typing.Optional[typing.Iterable[str]],
+        drop_narrative: bool,
+        drop_comments: bool,
+        frozen: bool,
+        shared: typing.Union[bool, FlyweightPool],
+    ) -> "Model":
+        """Loaded (own) raw data is trimmed in place, then validated."""
+        if drop_narrative or drop_comments:
+            obj = elide_data(
+                cls, obj, drop_narrative=drop_narrative, drop_comments=drop_comments
+            )
+        if elements is not None:
+            obj = project_data(cls, obj, elements=elements)
+        if lazy is True:
+            obj = wrap_lazy_resources(cls, obj)
+        return cls.parse_obj(obj, frozen=frozen, shared=shared)
 
     def yaml(  # type: ignore
         self,
@@ -370,13 +608,38 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
 
             dumps_kwargs["return_bytes"] = return_bytes
 
-        data = self.dict(
-            by_alias=by_alias,
-            exclude_none=exclude_none,
-            exclude_comments=exclude_comments,
-        )
-        if self.__custom_root_type__:
-            data = data[ROOT_KEY]
+            plan = get_serializer_plan(self.__class__)
+            if option == 0 and encoder is None and plan.native_json:
+                # JSON bytes are written directly (member by member),
+                # without building dict tree of the whole model.
+                out = bytearray()
+                if not plan.write_json(
+                    self,
+                    by_alias,
+                    exclude_none,
+                    exclude_comments,
+                    functools.partial(orjson.dumps, default=pydantic_encoder),
+                    out,
+                ):
+                    out += b"{}"
+                if return_bytes is False:
+                    return out.decode()
+                return bytes(out)
+
+        plan = get_serializer_plan(self.__class__)
+        if encoder is None and plan.native_json:
+            # plain (json native) data, ``encoder`` won't be called.
+            data = plan.to_dict(
+                self, by_alias, exclude_none, exclude_comments, json_compatible=True
+            )
+        else:
+            data = self.dict(
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+            )
+            if self.__custom_root_type__:
+                data = data[ROOT_KEY]
 
         encoder = typing.cast(
             typing.Callable[[typing.Any], typing.Any], encoder or self.__json_encoder__
@@ -417,6 +680,9 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
                 " since version v6.2.0, any extra parameter is simply ignored. "
                 "You should not provide any extra argument."
             )
+        plan = get_serializer_plan(self.__class__)
+        if plan.native:
+            return plan.to_dict(self, by_alias, exclude_none, exclude_comments)
         return OrderedDict(
             self._fhir_iter(
                 by_alias=by_alias,
@@ -429,52 +695,23 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
     def _fhir_iter(
         self, *, by_alias: bool, exclude_none: bool, exclude_comments: bool
     ) -> "TupleGenerator":
-        if self.__class__.has_resource_base():
-            yield "resourceType", self.resource_type
-
-        alias_maps = self.get_alias_mapping()
-        for prop_name in self.elements_sequence():
-            field_key = alias_maps[prop_name]
-
-            field = self.__fields__[field_key]
-            is_primitive = is_primitive_type(field)
-            v = self.__dict__.get(field_key, None)
-            dict_key = by_alias and field.alias or field_key
-            if v is not None:
-                v = self._fhir_get_value(
-                    v,
-                    by_alias=by_alias,
-                    exclude_none=exclude_none,
-                    exclude_comments=exclude_comments,
-                )
-
-            if v is not None or (exclude_none is False and v is None):
-                yield dict_key, v
-
-            # looking for comments or primitive extension for primitive data type
-            if is_primitive:
-                ext_key = f"{field_key}__ext"
-                ext_val = self.__dict__.get(ext_key, None)
-                if ext_val is not None:
-                    dict_key_ = by_alias and self.__fields__[ext_key].alias or ext_key
-                    ext_val = self._fhir_get_value(
-                        ext_val,
-                        by_alias=by_alias,
-                        exclude_none=exclude_none,
-                        exclude_comments=exclude_comments,
-                    )
-                    if ext_val is not None and len(ext_val) > 0:
-                        yield dict_key_, ext_val
-        # looking for comments
-        comments = self.__dict__.get(FHIR_COMMENTS_FIELD_NAME, None)
-        if comments is not None and not exclude_comments:
-            yield FHIR_COMMENTS_FIELD_NAME, comments
+        """Elements in ``elements_sequence`` order (including primitive extension
+        and comments), see ``fhir.resources.core.serializer.SerializerPlan``."""
+        yield from get_serializer_plan(self.__class__).to_dict(
+            self, by_alias, exclude_none, exclude_comments
+        ).items()
 
     @classmethod
     @typing.no_type_check
     def _fhir_get_value(
         cls, v: typing.Any, by_alias: bool, exclude_none: bool, exclude_comments: bool
     ) -> typing.Any:
+        if isinstance(v, LazyResource):
+            return v.fhir_value(
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+            )
         if isinstance(v, (FHIRAbstractModel, BaseModel)):
             v_dict = v.dict(
                 by_alias=by_alias,
@@ -526,3 +763,6 @@ class FHIRAbstractModel(BaseModel, abc.ABC):
         extra = Extra.forbid
         validate_assignment = True
         error_msg_templates = {"value_error.extra": "extra fields not permitted"}
+        # ``None`` (absent) elements are not kept in instance ``__dict__``,
+        # could be enabled by ``FHIRAbstractModel.__config__.sparse_storage = True``
+        sparse_storage = False
@@ -0,0 +1,250 @@
+# _*_ coding: utf-8 _*_
+"""Flyweight sharing of identical datatype subtrees.
+
+Clinical data repeats the same small datatypes (``Coding``, ``CodeableConcept``,
+``Reference``, ``Quantity``...) over and over. With ``parse_raw(...,
+shared=True)`` (or ``parse_obj``, ``parse_file``), such subtree is validated
+only once per distinct content (``FlyweightPool``), every occurrence gets own
+lightweight model instance, which shares ``__dict__`` of the validated one
+(leaf models only, lists and nested models are never shared).
+
+Shared instance is copy-on-write, the first assignment (or deletion) detaches
+it (``__dict__`` is copied), so other occurrences are never affected. With
+``frozen=True``, the same frozen instance is shared by every occurrence.
+"""
+import typing
+
+from pydantic.v1.error_wrappers import ValidationError
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# datatypes which are mostly repeated (with the same content) in real data
+SHARED_TYPES = frozenset(
+    (
+        "Coding",
+        "CodeableConcept",
+        "CodeableReference",
+        "Reference",
+        "Quantity",
+        "SimpleQuantity",
+        "Age",
+        "Count",
+        "Distance",
+        "Duration",
+        "MoneyQuantity",
+        "Period",
+        "Range",
+    )
+)
+
+_object_setattr = object.__setattr__
+
+
+class SharedFieldsSet(frozenset):
+    """``__fields_set__`` of model which shares its ``__dict__`` with others.
+    Copy of it (i.e. ``model.copy()``, pickle) is regular (mutable) ``set``."""
+
+    __slots__ = ()
+
+    def copy(self) -> typing.Set[str]:  # type: ignore[override]
+        """ """
+        return set(self)
+
+    def __reduce__(self):
+        """ """
+        return set, (list(self),)
+
+
+def is_shared(model: "FHIRAbstractModel") -> bool:
+    """ """
+    return model.__fields_set__.__class__ is SharedFieldsSet
+
+
+def detach(model: "FHIRAbstractModel"):
+    """Copy-on-write, the model gets own ``__dict__`` and ``__fields_set__``."""
+    _object_setattr(model, "__dict__", model.__dict__.copy())
+    _object_setattr(model, "__fields_set__", set(model.__fields_set__))
+
+
+class FlyweightPool:
+    """Validated models (templates) by model class and content of raw data.
+    Could be used for a single parsing (``shared=True``) or could be passed as
+    ``shared`` value to share the same instances among many parsing
+    (i.e. lines of NDJSON)."""
+
+    def __init__(
+        self,
+        types: typing.Optional[typing.Iterable[str]] = None,
+        *,
+        frozen: bool = False,
+    ):
+        """``types``: datatype names, default ``SHARED_TYPES``.
+        ``frozen``: every occurrence gets the same frozen instance."""
+        self.types = frozenset(types or SHARED_TYPES)
+        self.frozen = frozen
+        self.hits = 0
+        self.misses = 0
+        self._templates: typing.Dict[
+            typing.Tuple[type, typing.Any], "FHIRAbstractModel"
+        ] = {}
+
+    def __len__(self) -> int:
+        """ """
+        return len(self._templates)
+
+    def get(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        data: typing.Dict[str, typing.Any],
+    ) -> typing.Any:
+        """Shared model instance for the raw data, raw data is returned as it is,
+        if it is invalid (so regular validation reports the error)."""
+        try:
+            key = (model_cls, make_key(data))
+        except TypeError:
+            # unhashable, i.e. model instance inside
+            return data
+        template = self._templates.get(key, None)
+        if template is None:
+            try:
+                template = model_cls.parse_obj(share_datatypes(model_cls, data, self))
+            except ValidationError:
+                return data
+            if self.frozen:
+                template.freeze()
+            else:
+                mark_shared(template)
+            self._templates[key] = template
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self.frozen:
+            return template
+        return clone(template)
+
+    def clear(self):
+        """ """
+        self._templates.clear()
+        self.hits = self.misses = 0
+
+
+def make_key(value: typing.Any) -> typing.Any:
+    """Hashable representation of raw (JSON) data, type of non string value
+    is a part of the key (``1``, ``1.0`` and ``True`` are different)."""
+    klass = value.__class__
+    if klass is str:
+        return value
+    if klass is dict:
+        return tuple(sorted((k, make_key(v)) for k, v in value.items()))
+    if klass is list:
+        return klass, tuple(make_key(item) for item in value)
+    hash(value)
+    return klass, value
+
+
+def share_datatypes(
+    model_cls: typing.Type["FHIRAbstractModel"],
+    data: typing.Any,
+    pool: FlyweightPool,
+) -> typing.Any:
+    """Returns copy of (not yet validated) ``data``, where datatypes of
+    ``pool.types`` are replaced with shared model instances. Anything unexpected
+    is kept as it is, so regular validation reports the error."""
+    from .construct import VALUE_MODEL, VALUE_POLYMORPHIC, get_construct_plan
+
+    if data.__class__ is not dict:
+        return data
+    plan_fields = get_construct_plan(model_cls).fields
+    result = {}
+    for key, value in data.items():
+        try:
+            _, kind, _, target = plan_fields[key]
+        except KeyError:
+            result[key] = value
+            continue
+        if value is None or kind not in (VALUE_MODEL, VALUE_POLYMORPHIC):
+            result[key] = value
+        elif value.__class__ is list:
+            result[key] = [_share_value(item, kind, target, pool) for item in value]
+        else:
+            result[key] = _share_value(value, kind, target, pool)
+    return result
+
+
+def _share_value(
+    value: typing.Any, kind: int, target: typing.Any, pool: FlyweightPool
+) -> typing.Any:
+    """ """
+    from .construct import VALUE_POLYMORPHIC
+
+    if value.__class__ is not dict:
+        return value
+    get_model_class, resource_type = target
+    if kind == VALUE_POLYMORPHIC:
+        if resource_type != "Resource":
+            return value
+        resource_type = value.get("resourceType", None)
+        try:
+            model_class = get_model_class(resource_type)
+        except (KeyError, TypeError, AttributeError):
+            return value
+        return share_datatypes(model_class, value, pool)
+    model_class = get_model_class(resource_type)
+    if resource_type in pool.types:
+        return pool.get(model_class, value)
+    return share_datatypes(model_class, value, pool)
+
+
+def mark_shared(model: "FHIRAbstractModel"):
+    """Leaf models (without nested models and lists) of the template are marked
+    as shared, their ``__dict__`` is used by every clone."""
+    leaf = True
+    for value in model.__dict__.values():
+        if value.__class__ is list:
+            leaf = False
+            for item in value:
+                if hasattr(item, "__fields_set__"):
+                    mark_shared(item)
+        elif hasattr(value, "__fields_set__"):
+            leaf = False
+            mark_shared(value)
+    if leaf:
+        _object_setattr(model, "__fields_set__", SharedFieldsSet(model.__fields_set__))
+
+
+def clone(model: "FHIRAbstractModel") -> "FHIRAbstractModel":
+    """New instance of the template, leaf models share ``__dict__``, everything
+    else (models, lists) is copied."""
+    fields_set = model.__fields_set__
+    if fields_set.__class__ is SharedFieldsSet:
+        values = model.__dict__
+    else:
+        values = {}
+        for name, value in model.__dict__.items():
+            if value.__class__ is list:
+                value = [
+                    clone(item) if hasattr(item, "__fields_set__") else item
+                    for item in value
+                ]
+            elif hasattr(value, "__fields_set__"):
+                value = clone(value)
+            values[name] = value
+        fields_set = set(fields_set)
+    klass = model.__class__
+    obj = klass.__new__(klass)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__fields_set__", fields_set)
+    obj._init_private_attributes()
+    return obj
+
+
+__all__ = [
+    "FlyweightPool",
+    "SharedFieldsSet",
+    "is_shared",
+    "detach",
+    "share_datatypes",
+]
@@ -0,0 +1,115 @@
+# _*_ coding: utf-8 _*_
+"""Read-only (frozen) models.
+
+``model.freeze()`` (or ``parse_raw(..., frozen=True)``) makes the model and all
+of its nested models immutable and compact: absent (``None``) elements are not
+stored, ``__fields_set__`` is shared (interned) ``frozenset`` and short string
+values are interned. Frozen model is hashable (hash is computed only once), so
+it could be used as set member or dict key, and could be shared among threads.
+Lists (i.e. ``Patient.name``) become ``FrozenList``, in place change of them is
+rejected as well.
+"""
+import sys
+import threading
+import typing
+
+from .lazy import LazyResource
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# longer strings (i.e. narrative, attachment data) are hardly ever repeated
+INTERN_MAX_LENGTH = 128
+
+_object_setattr = object.__setattr__
+_FIELDS_SETS: typing.Dict[typing.FrozenSet[str], typing.FrozenSet[str]] = {}
+_lock = threading.Lock()
+
+
+class FrozenList(list):
+    """List of frozen model, any change raises ``TypeError``. It is still
+    ``list``, so it is serialized and compared as regular list, copy of it
+    (i.e. ``copy.deepcopy``, pickle) is ``FrozenList`` as well."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        """ """
+        raise TypeError(
+            f"'{self.__class__.__name__}' of frozen model does not support "
+            "item assignment"
+        )
+
+    append = extend = insert = pop = remove = clear = _immutable
+    sort = reverse = __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self):
+        """ """
+        return self.__class__, (list(self),)
+
+
+def is_frozen(model: "FHIRAbstractModel") -> bool:
+    """ """
+    return model.__fields_set__.__class__ is frozenset
+
+
+def intern_fields_set(fields_set: typing.AbstractSet[str]) -> typing.FrozenSet[str]:
+    """The same ``frozenset`` instance for the same fields (models of the same
+    shape share it)."""
+    fields_set = frozenset(fields_set)
+    interned = _FIELDS_SETS.get(fields_set)
+    if interned is None:
+        with _lock:
+            interned = _FIELDS_SETS.setdefault(fields_set, fields_set)
+    return interned
+
+
+def freeze_model(model: "FHIRAbstractModel") -> "FHIRAbstractModel":
+    """Freezes the model (including nested models) in place."""
+    if is_frozen(model):
+        return model
+    values = {}
+    for name, value in model.__dict__.items():
+        if value is None:
+            continue
+        values[name] = freeze_value(value)
+    _object_setattr(model, "__dict__", values)
+    _object_setattr(model, "__fhir_hash__", None)
+    # must be the last one, it marks the model as frozen
+    _object_setattr(model, "__fields_set__", intern_fields_set(model.__fields_set__))
+    return model
+
+
+def freeze_value(value: typing.Any) -> typing.Any:
+    """ """
+    klass = value.__class__
+    if klass is str:
+        if len(value) <= INTERN_MAX_LENGTH:
+            return sys.intern(value)
+        return value
+    if klass is list or klass is FrozenList:
+        return FrozenList([freeze_value(item) for item in value])
+    if klass is LazyResource:
+        # read-only model is fully validated
+        value = value.resolve()
+    if hasattr(value, "freeze"):
+        return value.freeze()
+    return value
+
+
+def get_frozen_hash(model: "FHIRAbstractModel") -> int:
+    """Hash of serialized model, computed only the first time."""
+    try:
+        value = model.__fhir_hash__
+    except AttributeError:
+        # copy of frozen model
+        value = None
+    if value is None:
+        value = hash(model.json(return_bytes=True))
+        _object_setattr(model, "__fhir_hash__", value)
+    return value
+
+
+__all__ = ["FrozenList", "is_frozen", "freeze_model", "get_frozen_hash"]
@@ -0,0 +1,155 @@
+# _*_ coding: utf-8 _*_
+"""Lazy (deferred) validation of nested resources.
+
+With ``parse_raw(..., lazy=True)`` (or ``parse_file``), every nested resource
+(i.e. ``Bundle.entry.resource``, ``DomainResource.contained``) is kept as raw
+data inside ``LazyResource`` proxy. It is validated only once, at first
+attribute access. Untouched resource is serialized back from its raw data.
+"""
+import typing
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+_object_setattr = object.__setattr__
+
+
+class LazyResource:
+    """Proxy of not yet validated resource."""
+
+    __slots__ = ("__model_class__", "__raw__", "__model__")
+
+    def __init__(
+        self,
+        model_class: typing.Type["FHIRAbstractModel"],
+        raw: typing.Dict[str, typing.Any],
+    ):
+        """ """
+        _object_setattr(self, "__model_class__", model_class)
+        _object_setattr(self, "__raw__", raw)
+        _object_setattr(self, "__model__", None)
+
+    def is_resolved(self) -> bool:
+        """ """
+        return self.__model__ is not None
+
+    def resolve(self) -> "FHIRAbstractModel":
+        """Validates raw data (only the first time), returns model instance."""
+        model = self.__model__
+        if model is None:
+            model = self.__model_class__.parse_obj(self.__raw__)
+            _object_setattr(self, "__model__", model)
+            # raw data is no longer needed
+            _object_setattr(self, "__raw__", None)
+        return model
+
+    def fhir_value(
+        self, *, by_alias: bool, exclude_none: bool, exclude_comments: bool
+    ) -> typing.Any:
+        """Serializable value, original raw data is returned as it is (not copied),
+        if the resource has not been touched and the default serialization options
+        are used."""
+        if self.__model__ is None and (
+            by_alias is True and exclude_none is True and exclude_comments is False
+        ):
+            return self.__raw__
+        return self.resolve().dict(
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_comments=exclude_comments,
+        )
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """ """
+        if name.startswith("__") and name.endswith("__"):
+            # protocol lookups (copy, pickle...) should not resolve
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        """ """
+        setattr(self.resolve(), name, value)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """ """
+        if isinstance(other, LazyResource):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __repr__(self) -> str:
+        """ """
+        if self.__model__ is None:
+            return f"<LazyResource {self.__model_class__.__name__} (not resolved)>"
+        return repr(self.__model__)
+
+    def __reduce__(self):
+        """ """
+        if self.__model__ is None:
+            return LazyResource, (self.__model_class__, self.__raw__)
+        return _identity, (self.__model__,)
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    """ """
+    return value
+
+
+def resolve_lazy(value: typing.Any) -> typing.Any:
+    """ """
+    if isinstance(value, LazyResource):
+        return value.resolve()
+    return value
+
+
+def wrap_lazy_resources(
+    model_cls: typing.Type["FHIRAbstractModel"], data: typing.Any
+) -> typing.Any:
+    """Returns copy of (not yet validated) ``data``, where every nested resource
+    is replaced with ``LazyResource``. Anything unexpected is kept as it is,
+    so regular validation reports the error."""
+    from .construct import VALUE_MODEL, VALUE_POLYMORPHIC, get_construct_plan
+
+    if not isinstance(data, dict):
+        return data
+    plan_fields = get_construct_plan(model_cls).fields
+    result = {}
+    for key, value in data.items():
+        try:
+            _, kind, _, target = plan_fields[key]
+        except KeyError:
+            result[key] = value
+            continue
+        if value is None or kind not in (VALUE_MODEL, VALUE_POLYMORPHIC):
+            result[key] = value
+        elif isinstance(value, list):
+            result[key] = [_wrap_value(item, kind, target) for item in value]
+        else:
+            result[key] = _wrap_value(value, kind, target)
+    return result
+
+
+def _wrap_value(value: typing.Any, kind: int, target: typing.Any) -> typing.Any:
+    """ """
+    from .construct import VALUE_POLYMORPHIC
+
+    if not isinstance(value, dict):
+        return value
+    get_model_class, resource_type = target
+    if kind == VALUE_POLYMORPHIC:
+        if resource_type != "Resource":
+            # polymorphic element, not resource
+            return value
+        resource_type = value.get("resourceType", None)
+        try:
+            model_class = get_model_class(resource_type)
+        except (KeyError, TypeError, AttributeError):
+            return value
+        if not model_class.has_resource_base():
+            return value
+        return LazyResource(model_class, value)
+    return wrap_lazy_resources(get_model_class(resource_type), value)
+
+
+__all__ = ["LazyResource", "resolve_lazy", "wrap_lazy_resources"]
@@ -0,0 +1,147 @@
+# _*_ coding: utf-8 _*_
+"""Content-addressed cache of parsed models.
+
+Services receive the same payloads (conformance resources, cached responses,
+retries) again and again. ``ParseCache`` keeps parsed models keyed by model
+class (so FHIR release and type), parsing options and SHA-256 digest of the raw
+payload (hardware accelerated on most of CPUs). On a hit, the payload is only
+hashed, no parsing and no validation::
+
+    >>> cache = ParseCache(maxsize=256, max_bytes=128 * 1024 * 1024)
+    >>> value_set = ValueSet.parse_raw(payload, cache=cache)
+    >>> value_set = construct_fhir_element("ValueSet", payload, cache=cache)
+
+By default, cached models are frozen (see ``FHIRAbstractModel.freeze``) and
+the same instance is returned for every hit. With ``frozen=False``, every hit
+gets own copy-on-write model (see ``fhir.resources.core.flyweight``).
+Cache is bounded by number of entries and by total size of cached payloads,
+least recently used entries are evicted. Invalid payloads are never cached,
+payloads larger than ``max_bytes`` are not cached, but their models are frozen
+as well.
+"""
+import hashlib
+import threading
+import typing
+from collections import OrderedDict
+
+from .flyweight import clone, mark_shared
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+class ParseCache:
+    """Thread-safe LRU cache of parsed models."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        *,
+        frozen: bool = True,
+    ):
+        """``maxsize``: max number of cached models, ``max_bytes``: max total size
+        of cached (raw) payloads, larger payload is never cached.
+        ``frozen``: every hit returns the same frozen model, otherwise own
+        copy-on-write model."""
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.frozen = frozen
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[typing.Any, typing.Tuple[FHIRAbstractModel, int]]" = (  # noqa: B950
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """ """
+        return len(self._entries)
+
+    def get_or_parse(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        data: typing.Union[str, bytes, bytearray, memoryview],
+        parse: typing.Callable[[], "FHIRAbstractModel"],
+        options: typing.Tuple[typing.Any, ...] = (),
+    ) -> "FHIRAbstractModel":
+        """Cached model of the payload or the result of ``parse()`` (which
+        is cached, if no exception is raised). ``options``: hashable parsing
+        options, which change the result."""
+        if isinstance(data, str):
+            payload: typing.Any = data.encode("utf-8", "surrogatepass")
+        else:
+            payload = data
+        size = payload.nbytes if isinstance(payload, memoryview) else len(payload)
+        key = (
+            model_cls,
+            options,
+            size,
+            hashlib.sha256(payload).digest(),
+        )
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            return self._get_model(entry[0])
+
+        model = parse()
+        if self.frozen:
+            model.freeze()
+        if size > self.max_bytes:
+            # not cached, but of the same kind (frozen or mutable) as cached
+            return model
+        if not self.frozen:
+            # kept as template (never returned), every hit gets own clone
+            mark_shared(model)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                entry = self._entries[key] = (model, size)
+                self.bytes += size
+                self._evict()
+        return self._get_model(entry[0])
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """ """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": requests and self.hits / requests or 0.0,
+                "size": len(self._entries),
+                "bytes": self.bytes,
+            }
+
+    def clear(self):
+        """Drops cached models and metrics."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def _get_model(self, model: "FHIRAbstractModel") -> "FHIRAbstractModel":
+        """ """
+        if self.frozen:
+            return model
+        return clone(model)
+
+    def _evict(self):
+        """ """
+        entries = self._entries
+        while entries and (len(entries) > self.maxsize or self.bytes > self.max_bytes):
+            _, (_, size) = entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+
+__all__ = ["ParseCache"]
@@ -0,0 +1,531 @@
+# _*_ coding: utf-8 _*_
+"""Fast path validation of FHIR primitive data types.
+
+Common input (plain ``str`` of the expected form) is accepted by cheap checks
+(``str`` methods, ``datetime.fromisoformat``...) instead of the regex based
+validation chain. Anything else (including every invalid value) falls back to
+the original validation, so results and errors are the same.
+
+Repeated values (codes, systems, references, timestamps) could be served from
+opt-in bounded LRU cache of validated values, see ``enable_primitive_cache``.
+"""
+import datetime
+import functools
+import sys
+import threading
+import typing
+from collections import OrderedDict
+
+from pydantic.v1.class_validators import make_generic_validator
+from pydantic.v1.types import ConstrainedDecimal, ConstrainedStr
+from pydantic.v1.validators import decimal_validator
+
+if typing.TYPE_CHECKING:
+    from pydantic.v1 import BaseConfig
+    from pydantic.v1.fields import ModelField
+    from pydantic.v1.typing import CallableGenerator
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# ``Z`` suffix and any fraction of second are supported since python 3.11
+FROMISOFORMAT = sys.version_info >= (3, 11)
+RESOURCE_TYPE_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-.#"
+)
+
+
+def _is_string(value: str) -> bool:
+    """``[ \\r\\n\\t\\S]+`` (match), only the first character matters."""
+    if not value:
+        return False
+    first = value[0]
+    return first in " \r\n\t" or not first.isspace()
+
+
+def _is_code(value: str) -> bool:
+    """``^[^\\s]+(\\s[^\\s]+)*$``, printable value could have space only."""
+    return (
+        value.isprintable()
+        and value != ""
+        and value[0] != " "
+        and value[-1] != " "
+        and "  " not in value
+    )
+
+
+def _is_id(value: str) -> bool:
+    """``^[A-Za-z0-9\\-.]+$``"""
+    return value.isascii() and value.replace("-", "").replace(".", "").isalnum()
+
+
+def _any(value: str) -> bool:
+    """``\\S*`` and ``\\s*(\\S|\\s)*`` (match) accept anything."""
+    return True
+
+
+# default regex pattern of primitive type: check which is True only if the
+# regex would match (``False`` means, let the regex decide).
+STR_FAST_CHECKS: typing.Dict[str, typing.Callable[[str], bool]] = {
+    r"[ \r\n\t\S]+": _is_string,
+    r"^[^\s]+(\s[^\s]+)*$": _is_code,
+    r"^[A-Za-z0-9\-.]+$": _is_id,
+    r"\S*": _any,
+    r"\s*(\S|\s)*": _any,
+}
+
+
+class FastConstrainedStr(ConstrainedStr):
+    """``ConstrainedStr`` with single validator, plain ``str`` value (with default
+    constraints) is checked at once, otherwise pydantic validators chain is used.
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> "CallableGenerator":
+        chain = [
+            make_generic_validator(validator)
+            for validator in ConstrainedStr.__get_validators__.__func__(cls)
+        ]
+
+        def validate_str(
+            cls_: typing.Type["FastConstrainedStr"],
+            value: typing.Any,
+            values: typing.Dict[str, typing.Any],
+            field: "ModelField",
+            config: typing.Type["BaseConfig"],
+        ) -> typing.Any:
+            if value.__class__ is str and cls.is_fast_valid(value, config):
+                return value
+            for validator in chain:
+                value = validator(cls, value, values, field, config)
+            return value
+
+        def validate(
+            value: typing.Any,
+            values: typing.Dict[str, typing.Any],
+            field: "ModelField",
+            config: typing.Type["BaseConfig"],
+        ) -> typing.Any:
+            if (
+                value.__class__ is str
+                and getattr(cls, "__visit_name__", None) in PRIMITIVE_CACHE.types
+                and cls.has_default_constraints(config)
+            ):
+                return PRIMITIVE_CACHE.get_or_validate(
+                    cls, value, validate_str, values, field, config
+                )
+            return validate_str(cls, value, values, field, config)
+
+        yield validate
+
+    @classmethod
+    def has_default_constraints(cls, config: typing.Type["BaseConfig"]) -> bool:
+        """Value is neither transformed nor constrained (other than by the type
+        itself), so validated value could be cached."""
+        return not (
+            cls.strict
+            or cls.strip_whitespace
+            or cls.to_upper
+            or cls.to_lower
+            or cls.curtail_length
+            or config.anystr_strip_whitespace
+            or config.anystr_upper
+            or config.anystr_lower
+            or config.min_anystr_length
+            or config.max_anystr_length is not None
+        )
+
+    @classmethod
+    def is_fast_valid(cls, value: str, config: typing.Type["BaseConfig"]) -> bool:
+        """ """
+        if not cls.has_default_constraints(config):
+            return False
+        length = len(value)
+        if cls.min_length is not None and length < cls.min_length:
+            return False
+        if cls.max_length is not None and length > cls.max_length:
+            return False
+
+        regex = cls.regex
+        if regex is None:
+            return True
+        if regex.__class__ is str:
+            return False
+        check = STR_FAST_CHECKS.get(regex.pattern, None)  # type: ignore[union-attr]
+        if check is not None and check(value):
+            return True
+        # the same as ``re.match`` of pydantic
+        return regex.match(value) is not None  # type: ignore[union-attr]
+
+
+class FastConstrainedDecimal(ConstrainedDecimal):
+    """``ConstrainedDecimal`` with single validator, unconstrained value is only
+    converted (pydantic validators chain is used otherwise)."""
+
+    @classmethod
+    def __get_validators__(cls) -> "CallableGenerator":
+        chain = [
+            make_generic_validator(validator)
+            for validator in ConstrainedDecimal.__get_validators__.__func__(cls)
+        ]
+
+        def validate(
+            value: typing.Any,
+            values: typing.Dict[str, typing.Any],
+            field: "ModelField",
+            config: typing.Type["BaseConfig"],
+        ) -> typing.Any:
+            if cls.is_unconstrained():
+                try:
+                    result = decimal_validator(value)
+                except (TypeError, ValueError):
+                    result = None
+                if result is not None and result.is_finite():
+                    return result
+            for validator in chain:
+                value = validator(cls, value, values, field, config)
+            return value
+
+        yield validate
+
+    @classmethod
+    def is_unconstrained(cls) -> bool:
+        """ """
+        return (
+            cls.gt is None
+            and cls.ge is None
+            and cls.lt is None
+            and cls.le is None
+            and cls.multiple_of is None
+            and cls.max_digits is None
+            and cls.decimal_places is None
+        )
+
+
+def _fraction_end(value: str, start: int) -> int:
+    """End of optional fraction of second (one up to six digits), ``-1`` if
+    it is not supported by the fast path."""
+    if len(value) == start or value[start] != ".":
+        return start
+    end = start + 1
+    while end < len(value) and value[end].isdigit():
+        end += 1
+    if end == start + 1 or end - start - 1 > 6:
+        return -1
+    return end
+
+
+def _is_timezone(value: str, strict: bool) -> bool:
+    """``Z`` or ``(+|-)hh:mm``, ``strict``: FHIR range (up to ``14:00``)."""
+    if value == "Z":
+        return True
+    if len(value) != 6 or value[0] not in "+-" or value[3] != ":":
+        return False
+    if not (value[1:3].isdigit() and value[4:6].isdigit()):
+        return False
+    if strict:
+        if value[1:3] == "14":
+            return value[4:6] == "00"
+        return value[1:3] <= "13" and value[4] <= "5"
+    return True
+
+
+def _is_date(value: str) -> bool:
+    """``YYYY-MM-DD`` (ISO week and ordinal dates are not FHIR dates)."""
+    return (
+        value[4] == "-"
+        and value[7] == "-"
+        and value[0:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+    )
+
+
+def fast_date(value: str) -> typing.Optional[datetime.date]:
+    """``date`` of complete ``YYYY-MM-DD`` value, ``None`` if the fast path
+    does not apply."""
+    if len(value) != 10 or not value.isascii() or not _is_date(value):
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def fast_datetime(
+    value: str, require_timezone: bool = False
+) -> typing.Optional[datetime.datetime]:
+    """``datetime`` of ``YYYY-MM-DDThh:mm:ss[.sss][Z|(+|-)hh:mm]`` value, the same
+    as pydantic ``parse_datetime`` would return. ``None`` if the fast path does
+    not apply (caller validates the value by the full path).
+    ``require_timezone``: value must match FHIR ``instant`` (with timezone)."""
+    if (
+        not FROMISOFORMAT
+        or len(value) < 19
+        or value[10] != "T"
+        or value[13] != ":"
+        or value[16] != ":"
+        or not value.isascii()
+        or not _is_date(value)
+        or not value[11:13].isdigit()
+        or not value[14:16].isdigit()
+        or not value[17:19].isdigit()
+    ):
+        return None
+    end = _fraction_end(value, 19)
+    if end == -1:
+        return None
+    timezone = value[end:]
+    if timezone == "":
+        if require_timezone:
+            return None
+    elif not _is_timezone(timezone, require_timezone):
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def fast_time(value: str) -> typing.Optional[datetime.time]:
+    """``time`` of ``hh:mm:ss[.sss]`` value, ``None`` if the fast path does
+    not apply."""
+    if (
+        not FROMISOFORMAT
+        or len(value) < 8
+        or value[2] != ":"
+        or value[5] != ":"
+        or not value.isascii()
+        or not (value[0:2] + value[3:5] + value[6:8]).isdigit()
+        or _fraction_end(value, 8) != len(value)
+    ):
+        return None
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def is_relative_url(value: str) -> bool:
+    """Relative reference (``[/]ResourceType/...``), the same as
+    ``^/(?P<resourceType>[^\\s?/]+)(/[^\\s?/]+)*`` (match) and resource type
+    of ``^[A-Za-z0-9\\-.#]+$``. Such value never has scheme, so it is not
+    an absolute URL."""
+    start = 1 if value.startswith("/") else 0
+    end = start
+    length = len(value)
+    while end < length:
+        char = value[end]
+        if char == "/" or char == "?" or char.isspace():
+            break
+        if char not in RESOURCE_TYPE_CHARS:
+            return False
+        end += 1
+    return end > start
+
+
+# cached by default: few distinct values are repeated many times
+# (unlike ``id``, ``string`` or ``markdown``)
+DEFAULT_CACHED_TYPES = frozenset(
+    (
+        "code",
+        "uri",
+        "canonical",
+        "oid",
+        "url",
+        "date",
+        "dateTime",
+        "instant",
+        "time",
+    )
+)
+DEFAULT_CACHE_MAXSIZE = 100000
+DEFAULT_CACHE_MAX_MEMORY = 64 * 1024 * 1024
+# approximate size of LRU entry (key tuple, linked list node, dict slot)
+CACHE_ENTRY_OVERHEAD = 160
+
+
+class PrimitiveCache:
+    """Thread-safe bounded LRU cache of validated primitive values, keyed by
+    type and input ``str``. Only valid values are cached, ``str`` values are
+    interned. All types share the same limits (``maxsize`` entries and
+    approximate ``max_memory`` bytes), the least recently used are evicted.
+    """
+
+    def __init__(self):
+        """ """
+        # FHIR type names (``__visit_name__``), empty when disabled
+        self.types: typing.FrozenSet[str] = frozenset()
+        self.maxsize = DEFAULT_CACHE_MAXSIZE
+        self.max_memory = DEFAULT_CACHE_MAX_MEMORY
+        self.memory = 0
+        self._entries: "OrderedDict[typing.Tuple[type, str], typing.Tuple[typing.Any, int]]" = (  # noqa: B950
+            OrderedDict()
+        )
+        # type name: [hits, misses]
+        self._counters: typing.Dict[str, typing.List[int]] = {}
+        self._lock = threading.Lock()
+
+    def enable(
+        self,
+        types: typing.Optional[typing.Iterable[str]] = None,
+        *,
+        maxsize: typing.Optional[int] = None,
+        max_memory: typing.Optional[int] = None,
+    ):
+        """``types``: FHIR primitive type names (i.e. ``"code"``, ``"dateTime"``),
+        default ``DEFAULT_CACHED_TYPES``."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if max_memory is not None:
+                self.max_memory = max_memory
+            self.types = frozenset(types or DEFAULT_CACHED_TYPES)
+            self._evict()
+
+    def disable(self):
+        """ """
+        with self._lock:
+            self.types = frozenset()
+            self._clear()
+
+    def clear(self):
+        """Drops cached values and statistics (i.e. after constraints of the type
+        have been changed)."""
+        with self._lock:
+            self._clear()
+
+    def get_or_validate(
+        self,
+        cls: type,
+        value: str,
+        validator: typing.Callable[..., typing.Any],
+        *args,
+        **kwargs,
+    ) -> typing.Any:
+        """Cached result or the result of ``validator(cls, value, *args, **kwargs)``
+        (which is cached, if no exception is raised)."""
+        key = (cls, value)
+        name = cls.__visit_name__  # type: ignore[attr-defined]
+        with self._lock:
+            entry = self._entries.get(key, None)
+            counters = self._counters.get(name, None)
+            if counters is None:
+                counters = self._counters[name] = [0, 0]
+            if entry is not None:
+                self._entries.move_to_end(key)
+                counters[0] += 1
+                return entry[0]
+            counters[1] += 1
+
+        result = validator(cls, value, *args, **kwargs)
+        value = sys.intern(value)
+        size = sys.getsizeof(value) + CACHE_ENTRY_OVERHEAD
+        if result.__class__ is str and result == value:
+            result = value
+        else:
+            size += sys.getsizeof(result)
+
+        with self._lock:
+            if key not in self._entries and name in self.types:
+                self._entries[(cls, value)] = (result, size)
+                self.memory += size
+                self._evict()
+        return result
+
+    def stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Statistics per type: ``hits``, ``misses``, ``hit_rate`` and ``size``
+        (number of cached values), ``total`` with ``memory`` as well."""
+        with self._lock:
+            sizes: typing.Dict[str, int] = {}
+            for cls, _ in self._entries:
+                name = cls.__visit_name__  # type: ignore[attr-defined]
+                sizes[name] = sizes.get(name, 0) + 1
+            result = {}
+            total_hits = total_misses = 0
+            for name, (hits, misses) in self._counters.items():
+                result[name] = _get_stats(hits, misses, sizes.get(name, 0))
+                total_hits += hits
+                total_misses += misses
+            result["total"] = _get_stats(total_hits, total_misses, len(self._entries))
+            result["total"]["memory"] = self.memory
+            return result
+
+    def _evict(self):
+        """ """
+        entries = self._entries
+        while entries and (
+            len(entries) > self.maxsize or self.memory > self.max_memory
+        ):
+            _, (_, size) = entries.popitem(last=False)
+            self.memory -= size
+
+    def _clear(self):
+        """ """
+        self._entries.clear()
+        self._counters.clear()
+        self.memory = 0
+
+
+def _get_stats(hits: int, misses: int, size: int) -> typing.Dict[str, typing.Any]:
+    """ """
+    requests = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": requests and hits / requests or 0.0,
+        "size": size,
+    }
+
+
+PRIMITIVE_CACHE = PrimitiveCache()
+
+
+def cached_validator(func: typing.Callable[..., typing.Any]):
+    """Decorator of primitive type ``validate`` (class method), ``str`` value is
+    served from ``PRIMITIVE_CACHE`` (when it is enabled for the type)."""
+
+    @functools.wraps(func)
+    def validate(cls, value, *args, **kwargs):
+        if value.__class__ is str and cls.__visit_name__ in PRIMITIVE_CACHE.types:
+            return PRIMITIVE_CACHE.get_or_validate(cls, value, func, *args, **kwargs)
+        return func(cls, value, *args, **kwargs)
+
+    return validate
+
+
+def enable_primitive_cache(
+    types: typing.Optional[typing.Iterable[str]] = None,
+    *,
+    maxsize: typing.Optional[int] = None,
+    max_memory: typing.Optional[int] = None,
+):
+    """Enables cache of validated primitive values (of ``types``, by default
+    ``code``, ``uri``, ``canonical``, ``oid``, ``url``, ``date``,
+    ``dateTime``, ``instant`` and ``time``) for every release."""
+    PRIMITIVE_CACHE.enable(types, maxsize=maxsize, max_memory=max_memory)
+
+
+def disable_primitive_cache():
+    """ """
+    PRIMITIVE_CACHE.disable()
+
+
+def primitive_cache_stats() -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """ """
+    return PRIMITIVE_CACHE.stats()
+
+
+__all__ = [
+    "PrimitiveCache",
+    "PRIMITIVE_CACHE",
+    "cached_validator",
+    "enable_primitive_cache",
+    "disable_primitive_cache",
+    "primitive_cache_stats",
+    "FastConstrainedStr",
+    "FastConstrainedDecimal",
+    "fast_date",
+    "fast_datetime",
+    "fast_time",
+    "is_relative_url",
+]
@@ -0,0 +1,353 @@
+# _*_ coding: utf-8 _*_
+"""Field projection (FHIR ``_elements``) at parse time.
+
+With ``parse_obj(..., elements={"id", "subject", "code.coding"})`` (or
+``parse_raw``, ``parse_file``) unselected elements are dropped from the raw
+data before validation, so they are neither validated nor constructed.
+Mandatory elements, ``id`` and ``meta`` are always kept and the resource
+is marked as partial with ``SUBSETTED`` ``meta.tag``.
+
+Likewise, ``drop_narrative`` (resource ``text``) and ``drop_comments``
+(``fhir_comments``) parse options drop them before validation.
+"""
+import typing
+
+from .utils.common import get_fhir_root_module
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+SUBSETTED_CODE = "SUBSETTED"
+SUBSETTED_SYSTEMS = {
+    "R5": "http://terminology.hl7.org/CodeSystem/v3-ObservationValue",
+    "R4B": "http://terminology.hl7.org/CodeSystem/v3-ObservationValue",
+    "STU3": "http://hl7.org/fhir/v3/ObservationValue",
+}
+# always included elements of resource
+RESOURCE_ELEMENTS = ("resourceType", "id", "meta", "fhir_comments")
+
+# selection of nested element, whole element
+ALL = None
+
+Selection = typing.Dict[str, typing.Any]
+_PLANS: typing.Dict[type, "ProjectionPlan"] = {}
+
+
+class ProjectionPlan:
+    """Precomputed projection table of a FHIR model class.
+
+    ``keys``: mapping of JSON key (alias, ``_`` primitive extension alias) to
+    element name (choice type elements share the name, i.e. ``effective``)
+    ``mandatory``: names of always included elements
+    """
+
+    __slots__ = ("model_cls", "keys", "mandatory", "is_resource")
+
+    def __init__(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        keys: typing.Dict[str, str],
+        mandatory: typing.FrozenSet[str],
+        is_resource: bool,
+    ):
+        """ """
+        self.model_cls = model_cls
+        self.keys = keys
+        self.mandatory = mandatory
+        self.is_resource = is_resource
+
+    @classmethod
+    def compile(cls, model_cls: typing.Type["FHIRAbstractModel"]) -> "ProjectionPlan":
+        """ """
+        fields = model_cls.__fields__
+        keys = {}
+        mandatory = set()
+        for name, field in fields.items():
+            extra = field.field_info.extra
+            if name.endswith("__ext"):
+                # primitive extension follows its element
+                field = fields.get(name[:-5], field)
+                extra = field.field_info.extra
+            element = extra.get("one_of_many", None) or field.alias
+            if name == "resource_type":
+                element = keys["resourceType"] = "resourceType"
+            keys[fields[name].alias] = element
+            if field.required or extra.get("element_required", False) is True:
+                mandatory.add(element)
+            elif extra.get("one_of_many_required", False) is True:
+                mandatory.add(element)
+
+        is_resource = model_cls.has_resource_base()
+        if is_resource:
+            mandatory.update(e for e in RESOURCE_ELEMENTS if e in keys.values())
+        else:
+            mandatory.add("fhir_comments")
+        return cls(model_cls, keys, frozenset(mandatory), is_resource)
+
+    def check_selection(self, selection: Selection):
+        """ """
+        names = set(self.keys.values())
+        for name in selection:
+            if name not in names:
+                raise ValueError(f"{self.model_cls.__name__} has no element '{name}'.")
+
+
+def get_projection_plan(
+    model_cls: typing.Type["FHIRAbstractModel"],
+) -> ProjectionPlan:
+    """Returns compiled (cached) projection plan for the model class."""
+    try:
+        return _PLANS[model_cls]
+    except KeyError:
+        plan = _PLANS[model_cls] = ProjectionPlan.compile(model_cls)
+        return plan
+
+
+def parse_elements(
+    model_cls: typing.Type["FHIRAbstractModel"], elements: typing.Iterable[str]
+) -> Selection:
+    """Selection tree of element paths, i.e. ``{"code.coding", "subject"}``
+    -> ``{"code": {"coding": None}, "subject": None}``. Path could be
+    prefixed with resource type (``Observation.code``)."""
+    if isinstance(elements, str):
+        elements = elements.split(",")
+    resource_type = model_cls.get_resource_type()
+    selection: Selection = {}
+    for path in elements:
+        parts = path.strip().split(".")
+        if len(parts) > 1 and parts[0] == resource_type:
+            parts = parts[1:]
+        node: typing.Optional[Selection] = selection
+        for index, part in enumerate(parts):
+            if node is None:
+                # parent element is already selected as a whole
+                break
+            if index == len(parts) - 1:
+                node[part] = ALL
+            else:
+                if part not in node:
+                    node[part] = {}
+                node = node[part]
+    return selection
+
+
+def project_data(
+    model_cls: typing.Type["FHIRAbstractModel"],
+    data: typing.Any,
+    *,
+    elements: typing.Iterable[str],
+) -> typing.Any:
+    """Returns copy of (not yet validated) ``data`` with selected elements only.
+    Anything unexpected is kept as it is, so regular validation reports the
+    error."""
+    if not isinstance(data, dict):
+        return data
+    plan = get_projection_plan(model_cls)
+    return _project(plan, data, parse_elements(model_cls, elements))
+
+
+def _project(
+    plan: ProjectionPlan, data: typing.Dict[str, typing.Any], selection: Selection
+) -> typing.Dict[str, typing.Any]:
+    """ """
+    from .construct import VALUE_MODEL, VALUE_POLYMORPHIC, get_construct_plan
+
+    plan.check_selection(selection)
+    plan_keys = plan.keys
+    mandatory = plan.mandatory
+    construct_fields = get_construct_plan(plan.model_cls).fields
+    result = {}
+    for key, value in data.items():
+        element = plan_keys.get(key, None)
+        if element is None:
+            result[key] = value
+            continue
+        if element in selection:
+            nested = selection[element]
+        elif element in mandatory:
+            nested = ALL
+        else:
+            continue
+        if nested is not ALL and value is not None and not key.startswith("_"):
+            _, kind, _, target = construct_fields[key]
+            if kind in (VALUE_MODEL, VALUE_POLYMORPHIC):
+                if isinstance(value, list):
+                    value = [
+                        _project_value(item, kind, target, nested) for item in value
+                    ]
+                else:
+                    value = _project_value(value, kind, target, nested)
+        result[key] = value
+
+    if plan.is_resource:
+        mark_subsetted(plan.model_cls, result)
+    return result
+
+
+def _project_value(
+    value: typing.Any, kind: int, target: typing.Any, selection: typing.Any
+) -> typing.Any:
+    """ """
+    from .construct import VALUE_POLYMORPHIC
+
+    if not isinstance(value, dict):
+        return value
+    get_model_class, resource_type = target
+    if kind == VALUE_POLYMORPHIC:
+        resource_type = value.get("resourceType", None) or resource_type
+    try:
+        model_cls = get_model_class(resource_type)
+    except (KeyError, TypeError, AttributeError):
+        return value
+    plan = get_projection_plan(model_cls)
+    if kind == VALUE_POLYMORPHIC:
+        # resource type specific selection could not be checked
+        selection = {k: v for k, v in selection.items() if k in plan.keys.values()}
+    return _project(plan, value, selection)
+
+
+def get_fhir_release(model_cls: typing.Type["FHIRAbstractModel"]) -> str:
+    """FHIR release of the model class (or of its FHIR base class, i.e. user
+    defined subclass), default is R5."""
+    for klass in model_cls.__mro__:
+        parts = klass.__module__.split(".")
+        if parts[:2] != ["fhir", "resources"]:
+            continue
+        if len(parts) > 3 and parts[2] in SUBSETTED_SYSTEMS:
+            return parts[2]
+        return "R5"
+    return "R5"
+
+
+def mark_subsetted(
+    model_cls: typing.Type["FHIRAbstractModel"], data: typing.Dict[str, typing.Any]
+):
+    """Adds ``SUBSETTED`` tag into ``meta.tag`` of raw resource data."""
+    tag = {
+        "system": SUBSETTED_SYSTEMS[get_fhir_release(model_cls)],
+        "code": SUBSETTED_CODE,
+    }
+    meta = data.get("meta", None)
+    if meta is None:
+        meta = {}
+    elif isinstance(meta, dict):
+        meta = meta.copy()
+    else:
+        # already model instance
+        meta = meta.dict(by_alias=True, exclude_none=True)
+    tags = list(meta.get("tag", None) or [])
+    if not any(is_subsetted_tag(t) for t in tags):
+        tags.append(tag)
+    meta["tag"] = tags
+    data["meta"] = meta
+
+
+def is_subsetted_tag(tag: typing.Any) -> bool:
+    """ """
+    if isinstance(tag, dict):
+        return tag.get("code", None) == SUBSETTED_CODE
+    return getattr(tag, "code", None) == SUBSETTED_CODE
+
+
+def is_subsetted(model: "FHIRAbstractModel") -> bool:
+    """Whether the resource is partial (``SUBSETTED`` tag)."""
+    meta = getattr(model, "meta", None)
+    if meta is None or not meta.tag:
+        return False
+    return any(is_subsetted_tag(tag) for tag in meta.tag)
+
+
+def elide_data(
+    model_cls: typing.Type["FHIRAbstractModel"],
+    data: typing.Any,
+    *,
+    drop_narrative: bool = False,
+    drop_comments: bool = False,
+) -> typing.Any:
+    """Drops narrative of every (including nested) resource and/or every
+    ``fhir_comments`` from (not yet validated, own) ``data``, in place."""
+    if not isinstance(data, dict) or not (drop_narrative or drop_comments):
+        return data
+    has_narrative = None
+    if drop_narrative:
+        release = model_cls.__fields__["id"].type_.__fhir_release__
+        has_narrative = _NarrativeLookup(get_fhir_root_module(release))
+        if "resourceType" not in data and has_narrative.has_field(model_cls):
+            data.pop("text", None)
+            data.pop("_text", None)
+    _elide(data, has_narrative, drop_comments)
+    return data
+
+
+class _NarrativeLookup:
+    """Whether resource type has ``text`` narrative element (cached)."""
+
+    __slots__ = ("root_module", "cache")
+
+    def __init__(self, root_module):
+        """ """
+        self.root_module = root_module
+        self.cache: typing.Dict[str, bool] = {}
+
+    def __call__(self, resource_type: typing.Any) -> bool:
+        """ """
+        try:
+            return self.cache[resource_type]
+        except (KeyError, TypeError):
+            pass
+        try:
+            model_cls = self.root_module.get_fhir_model_class(resource_type)
+        except (KeyError, TypeError, AttributeError):
+            result = False
+        else:
+            result = self.has_field(model_cls)
+        if isinstance(resource_type, str):
+            self.cache[resource_type] = result
+        return result
+
+    @staticmethod
+    def has_field(model_cls: typing.Type["FHIRAbstractModel"]) -> bool:
+        """ """
+        from .construct import VALUE_MODEL, get_construct_plan
+
+        try:
+            _, kind, _, target = get_construct_plan(model_cls).fields["text"]
+        except KeyError:
+            return False
+        return kind == VALUE_MODEL and target[1] == "Narrative"
+
+
+def _elide(
+    data: typing.Dict[str, typing.Any],
+    has_narrative: typing.Optional[_NarrativeLookup],
+    drop_comments: bool,
+):
+    """ """
+    if drop_comments:
+        data.pop("fhir_comments", None)
+    if has_narrative is not None and "resourceType" in data:
+        if has_narrative(data["resourceType"]):
+            data.pop("text", None)
+            data.pop("_text", None)
+    empty = []
+    for key, value in data.items():
+        if value.__class__ is dict:
+            _elide(value, has_narrative, drop_comments)
+            if not value and key[0] == "_":
+                # primitive extension was holding comments only
+                empty.append(key)
+        elif value.__class__ is list:
+            for index, item in enumerate(value):
+                if item.__class__ is dict:
+                    _elide(item, has_narrative, drop_comments)
+                    if not item and key[0] == "_":
+                        value[index] = None
+            if key[0] == "_" and all(item is None for item in value):
+                empty.append(key)
+    for key in empty:
+        del data[key]
+
+
+__all__ = ["project_data", "get_projection_plan", "is_subsetted", "elide_data"]
@@ -0,0 +1,443 @@
+# _*_ coding: utf-8 _*_
+"""Compiled serialization (``dict``, ``json``, ``yaml``) of FHIR models.
+
+Every model class gets a ``SerializerPlan`` (the first time it is serialized),
+which holds fields in ``elements_sequence`` order with the dict keys, primitive
+extension twin and whether the value could be used as it is. Output is exactly
+the same as the generic ``FHIRAbstractModel._fhir_get_value`` way.
+
+For ``json``, plain ``dict`` tree (instead of ``OrderedDict``) is built with
+``Decimal`` values already encoded, so that ``orjson`` serializes it natively
+without calling ``default`` encoder. With ``SerializerPlan.write_json``, JSON bytes
+are written member by member and list of nested models item by item, so dict
+tree of the whole resource (i.e. ``Bundle``) is never held in memory.
+"""
+import decimal
+import json
+import typing
+from collections import OrderedDict, deque
+from enum import Enum
+from types import GeneratorType
+
+from pydantic.v1 import BaseModel
+from pydantic.v1.fields import SHAPE_SINGLETON
+from pydantic.v1.json import decimal_encoder, pydantic_encoder
+
+from .frozen import FrozenList
+from .lazy import LazyResource
+from .utils import is_primitive_type
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if typing.TYPE_CHECKING:
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+FHIR_COMMENTS_FIELD_NAME = "fhir_comments"
+# values of these types need to be converted (others are used as it is)
+CONTAINER_TYPES = (
+    BaseModel,
+    dict,
+    list,
+    tuple,
+    set,
+    frozenset,
+    GeneratorType,
+    deque,
+    Enum,
+    LazyResource,
+)
+
+_PLANS: typing.Dict[type, "SerializerPlan"] = {}
+
+
+class SerializerPlan:
+    """Precomputed serialization table of a FHIR model class.
+
+    ``fields``: tuple of (field name, alias, is scalar, ext field name, ext alias)
+    in ``elements_sequence`` order.
+    ``native``: neither ``dict`` nor ``_fhir_iter`` is overridden, so the plan
+    could be used directly for nested values.
+    ``native_json``: default json encoder is used (no custom ``json_encoders``).
+    ``json_keys``: encoded JSON keys (alias, name, ext alias, ext name) of fields.
+    """
+
+    __slots__ = (
+        "model_cls",
+        "fields",
+        "resource_type",
+        "native",
+        "native_json",
+        "json_keys",
+    )
+
+    def __init__(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        fields: typing.Tuple[
+            typing.Tuple[str, str, bool, typing.Optional[str], typing.Optional[str]],
+            ...,
+        ],
+        resource_type: bool,
+        native: bool,
+        native_json: bool,
+    ):
+        """ """
+        self.model_cls = model_cls
+        self.fields = fields
+        self.resource_type = resource_type
+        self.native = native
+        self.native_json = native_json
+        self.json_keys = tuple(
+            tuple(json_key(key) for key in (alias, name, ext_alias, ext_name))
+            for name, alias, _, ext_name, ext_alias in fields
+        )
+
+    @classmethod
+    def compile(cls, model_cls: typing.Type["FHIRAbstractModel"]) -> "SerializerPlan":
+        """ """
+        from .fhirabstractmodel import FHIRAbstractModel
+
+        alias_maps = model_cls.get_alias_mapping()
+        model_fields = model_cls.__fields__
+        fields = []
+        seen = set()
+        for prop_name in model_cls.elements_sequence():
+            name = alias_maps[prop_name]
+            if name in seen:
+                # some of the generated sequences have duplicate
+                continue
+            seen.add(name)
+            field = model_fields[name]
+            ext_name, ext_alias = None, None
+            is_primitive = is_primitive_type(field)
+            if is_primitive and f"{name}__ext" in model_fields:
+                ext_name = f"{name}__ext"
+                ext_alias = model_fields[ext_name].alias
+            is_scalar = is_primitive and field.shape == SHAPE_SINGLETON
+            fields.append((name, field.alias, is_scalar, ext_name, ext_alias))
+
+        native = (
+            model_cls.dict is FHIRAbstractModel.dict
+            and model_cls._fhir_iter is FHIRAbstractModel._fhir_iter
+            and not model_cls.__custom_root_type__
+            and not getattr(model_cls.Config, "use_enum_values", False)
+        )
+        native_json = native and model_cls.__json_encoder__ is pydantic_encoder
+        return cls(
+            model_cls,
+            tuple(fields),
+            model_cls.has_resource_base(),
+            native,
+            native_json,
+        )
+
+    def to_dict(
+        self,
+        obj: "FHIRAbstractModel",
+        by_alias: bool,
+        exclude_none: bool,
+        exclude_comments: bool,
+        json_compatible: bool = False,
+    ) -> typing.Dict[str, typing.Any]:
+        """``json_compatible``: plain dict with encoded ``Decimal`` is returned,
+        otherwise ``OrderedDict``."""
+        values = obj.__dict__
+        result = json_compatible and {} or OrderedDict()
+        if self.resource_type:
+            result["resourceType"] = obj.resource_type
+
+        model_cls = self.model_cls
+        for name, alias, is_scalar, ext_name, ext_alias in self.fields:
+            v = values.get(name, None)
+            if v is None:
+                pass
+            elif not is_scalar or isinstance(v, CONTAINER_TYPES):
+                v = get_value(
+                    v,
+                    model_cls,
+                    by_alias,
+                    exclude_none,
+                    exclude_comments,
+                    json_compatible,
+                )
+            elif json_compatible and v.__class__ is decimal.Decimal:
+                v = decimal_encoder(v)
+            if v is not None or exclude_none is False:
+                result[by_alias and alias or name] = v
+
+            if ext_name is not None:
+                ext_val = values.get(ext_name, None)
+                if ext_val is not None:
+                    ext_val = get_value(
+                        ext_val,
+                        model_cls,
+                        by_alias,
+                        exclude_none,
+                        exclude_comments,
+                        json_compatible,
+                    )
+                    if ext_val is not None and len(ext_val) > 0:
+                        result[by_alias and ext_alias or ext_name] = ext_val
+
+        comments = values.get(FHIR_COMMENTS_FIELD_NAME, None)
+        if comments is not None and not exclude_comments:
+            result[FHIR_COMMENTS_FIELD_NAME] = comments
+        return result
+
+    def write_json(
+        self,
+        obj: "FHIRAbstractModel",
+        by_alias: bool,
+        exclude_none: bool,
+        exclude_comments: bool,
+        dumps: typing.Callable[[typing.Any], bytes],
+        out: bytearray,
+    ) -> bool:
+        """Appends compact JSON object (the same as ``dumps(to_dict(...))``) to
+        ``out``. Nothing is appended and ``False`` is returned for empty model,
+        if ``exclude_none``. ``dumps`` must return compact JSON bytes."""
+        values = obj.__dict__
+        start = len(out)
+        out += b"{"
+        if self.resource_type:
+            out += b'"resourceType":'
+            out += dumps(obj.resource_type)
+            out += b","
+
+        model_cls = self.model_cls
+        key_index = 0 if by_alias else 1
+        for (name, _, is_scalar, ext_name, _), keys in zip(self.fields, self.json_keys):
+            v = values.get(name, None)
+            if v is None:
+                pass
+            elif (
+                (v.__class__ is list or v.__class__ is FrozenList)
+                and not is_scalar
+                and ext_name is None
+            ):
+                if len(v) > 0:
+                    out += keys[key_index]
+                    write_json_list(
+                        v,
+                        model_cls,
+                        by_alias,
+                        exclude_none,
+                        exclude_comments,
+                        dumps,
+                        out,
+                    )
+                    out += b","
+                    continue
+                v = None if exclude_none else []
+            else:
+                if not is_scalar or isinstance(v, CONTAINER_TYPES):
+                    v = get_value(
+                        v, model_cls, by_alias, exclude_none, exclude_comments, True
+                    )
+                elif v.__class__ is decimal.Decimal:
+                    v = decimal_encoder(v)
+            if v is not None or exclude_none is False:
+                out += keys[key_index]
+                out += dumps(v)
+                out += b","
+
+            if ext_name is not None:
+                ext_val = values.get(ext_name, None)
+                if ext_val is not None:
+                    ext_val = get_value(
+                        ext_val,
+                        model_cls,
+                        by_alias,
+                        exclude_none,
+                        exclude_comments,
+                        True,
+                    )
+                    if ext_val is not None and len(ext_val) > 0:
+                        out += keys[key_index + 2]
+                        out += dumps(ext_val)
+                        out += b","
+
+        comments = values.get(FHIR_COMMENTS_FIELD_NAME, None)
+        if comments is not None and not exclude_comments:
+            out += FHIR_COMMENTS_JSON_KEY
+            out += dumps(comments)
+            out += b","
+
+        if len(out) == start + 1:
+            if exclude_none is True:
+                del out[start:]
+                return False
+            out += b"}"
+        else:
+            # replace trailing comma
+            out[-1:] = b"}"
+        return True
+
+
+def write_json_list(
+    items: typing.List[typing.Any],
+    owner_cls: typing.Type["FHIRAbstractModel"],
+    by_alias: bool,
+    exclude_none: bool,
+    exclude_comments: bool,
+    dumps: typing.Callable[[typing.Any], bytes],
+    out: bytearray,
+):
+    """List of (nested) models are written item by item."""
+    out += b"["
+    for index, item in enumerate(items):
+        if index > 0:
+            out += b","
+        plan = _PLANS.get(item.__class__, None)
+        if plan is None and isinstance(item, BaseModel) and hasattr(item, "_fhir_iter"):
+            plan = get_serializer_plan(item.__class__)
+        if plan is not None and plan.native_json:
+            if not plan.write_json(
+                item, by_alias, exclude_none, exclude_comments, dumps, out
+            ):
+                out += b"null"
+            continue
+        if item is not None:
+            item = get_value(
+                item, owner_cls, by_alias, exclude_none, exclude_comments, True
+            )
+        out += dumps(item)
+    out += b"]"
+
+
+def json_key(key: typing.Optional[str]) -> typing.Optional[bytes]:
+    """ """
+    if key is None:
+        return None
+    return json.dumps(key, ensure_ascii=False).encode("utf-8") + b":"
+
+
+FHIR_COMMENTS_JSON_KEY = json_key(FHIR_COMMENTS_FIELD_NAME)
+
+
+def json_dumps_bytes(value: typing.Any) -> bytes:
+    """Compact JSON bytes, ``orjson`` is used if available."""
+    if orjson is not None:
+        return orjson.dumps(value, default=pydantic_encoder)
+    return json.dumps(
+        value, default=pydantic_encoder, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def write_json_value(
+    value: typing.Any,
+    out: bytearray,
+    *,
+    by_alias: bool = True,
+    exclude_none: bool = True,
+    exclude_comments: bool = False,
+):
+    """Appends compact JSON of FHIR model (or raw JSON compatible value) to ``out``."""
+    from .fhirabstractmodel import FHIRAbstractModel
+
+    if isinstance(value, LazyResource):
+        value = value.fhir_value(
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_comments=exclude_comments,
+        )
+    elif isinstance(value, FHIRAbstractModel):
+        plan = get_serializer_plan(value.__class__)
+        if plan.native_json:
+            if not plan.write_json(
+                value, by_alias, exclude_none, exclude_comments, json_dumps_bytes, out
+            ):
+                out += b"{}"
+            return
+    if isinstance(value, BaseModel):
+        # i.e DSTU2 models
+        result = value.json(  # type: ignore
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_comments=exclude_comments,
+            return_bytes=True,
+        )
+        if isinstance(result, str):
+            result = result.encode("utf-8")
+        out += result
+        return
+    out += json_dumps_bytes(value)
+
+
+def get_value(
+    v: typing.Any,
+    owner_cls: typing.Type["FHIRAbstractModel"],
+    by_alias: bool,
+    exclude_none: bool,
+    exclude_comments: bool,
+    json_compatible: bool = False,
+) -> typing.Any:
+    """Same as ``FHIRAbstractModel._fhir_get_value``, but nested FHIR models
+    are serialized by their compiled plan."""
+    klass = v.__class__
+    plan = _PLANS.get(klass, None)
+    if plan is None:
+        if klass is list or klass is FrozenList:
+            value = [
+                get_value(
+                    v_,
+                    owner_cls,
+                    by_alias,
+                    exclude_none,
+                    exclude_comments,
+                    json_compatible,
+                )
+                for v_ in v
+            ]
+            if exclude_none is True and len(value) == 0:
+                return None
+            return value
+        if not isinstance(v, CONTAINER_TYPES):
+            if json_compatible and klass is decimal.Decimal:
+                return decimal_encoder(v)
+            return v
+        if isinstance(v, BaseModel) and hasattr(klass, "_fhir_iter"):
+            plan = get_serializer_plan(klass)
+        else:
+            return owner_cls._fhir_get_value(
+                v,
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+                exclude_comments=exclude_comments,
+            )
+
+    if plan.native:
+        value = plan.to_dict(
+            v,
+            by_alias,
+            exclude_none,
+            exclude_comments,
+            json_compatible and plan.native_json,
+        )
+    else:
+        value = v.dict(
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            exclude_comments=exclude_comments,
+        )
+        if "__root__" in value:
+            return value["__root__"]
+    if exclude_none is True and len(value) == 0:
+        return None
+    return value
+
+
+def get_serializer_plan(
+    model_cls: typing.Type["FHIRAbstractModel"],
+) -> SerializerPlan:
+    """Returns compiled (cached) serializer plan for the model class."""
+    try:
+        return _PLANS[model_cls]
+    except KeyError:
+        plan = _PLANS[model_cls] = SerializerPlan.compile(model_cls)
+        return plan
@@ -1,14 +1,24 @@
 # _*_ coding: utf-8 _*_
 import json
 import pathlib
-from typing import TYPE_CHECKING, Any, Callable, Union, cast, no_type_check, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast, no_type_check
 
 from pydantic.v1.parse import Protocol
-from pydantic.v1.parse import load_file as default_load_file
 from pydantic.v1.parse import load_str_bytes as default_load_str_bytes
-from pydantic.v1.types import StrBytes
 
 from .common import is_primitive_type  # noqa: F401
+from .fileio import file_buffer, read_file, strip_compression_suffix
+
+try:
+    import orjson
+
+    # JSON loaders, those parse (UTF-8) bytes like buffer natively.
+    BYTES_JSON_LOADS = {orjson.loads}
+except ImportError:
+    BYTES_JSON_LOADS = set()
+
+BytesLike = Union[bytes, bytearray, memoryview]
+StrBytesBuffer = Union[str, BytesLike]
 
 try:
     from .yaml import yaml_dumps, yaml_loads
@@ -39,7 +49,8 @@ except ImportError:
 
 
 try:
-    from .xml import xml_dumps, xml_loads
+    from .xml import xml_dump, xml_dumps, xml_loads
+    from .xsd import validate_xml
 except ImportError:
 
     def raise_lxml_import_error():
@@ -61,7 +72,23 @@ except ImportError:
         raise_lxml_import_error()
 
     @no_type_check
-    def xml_loads(cls, b, xmlparser=None):
+    def xml_dump(
+        model: "FHIRAbstractModel",  # noqa: F821
+        fp,
+        *,
+        pretty_print=False,
+        xml_declaration=True,
+        with_comments=True,
+        strip_text=False,
+    ):
+        raise_lxml_import_error()
+
+    @no_type_check
+    def xml_loads(cls, b, xmlparser=None, *, drop_narrative=False, drop_comments=False):
+        raise_lxml_import_error()
+
+    @no_type_check
+    def validate_xml(content, release="R5", *, xsd_file=None):
         raise_lxml_import_error()
 
 
@@ -69,7 +96,7 @@ __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
 
 def load_str_bytes(
-    b: StrBytes,
+    b: StrBytesBuffer,
     *,
     content_type: Optional[str] = None,
     encoding: str = "utf8",
@@ -78,6 +105,19 @@ def load_str_bytes(
     json_loads: Callable[[str], Any] = json.loads,
     **extra,
 ) -> Any:
+    if isinstance(b, (bytes, bytearray, memoryview)):
+        if (
+            json_loads in BYTES_JSON_LOADS
+            and is_json_content(content_type, proto)
+            and encoding.lower().replace("-", "") == "utf8"
+        ):
+            # zero copy, buffer (i.e. sliced out of network read) is parsed
+            # as it is, without intermediate decoded ``str``.
+            if isinstance(b, memoryview) and not b.contiguous:
+                b = b.tobytes()
+            return json_loads(b)
+        if not isinstance(b, bytes):
+            b = bytes(b)
     if content_type:
         if content_type.endswith(("yml", "yaml")):
             params = {"stream": b}
@@ -89,8 +129,9 @@ def load_str_bytes(
             if "cls" not in extra:
                 raise ValueError("'cls:FHIRAbstractModel' is required parameter.")
             params = {}
-            if "xmlparser" in extra:
-                params["xmlparser"] = extra["xmlparser"]
+            for name in ("xmlparser", "drop_narrative", "drop_comments"):
+                if name in extra:
+                    params[name] = extra[name]
             if TYPE_CHECKING:
                 b = cast(bytes, b)
             obj = xml_loads(extra["cls"], b, **params)
@@ -106,6 +147,15 @@ def load_str_bytes(
     return obj
 
 
+def is_json_content(
+    content_type: Optional[str] = None, proto: Optional[Protocol] = None
+) -> bool:
+    """ """
+    if proto is not None:
+        return proto == Protocol.json
+    return not content_type or content_type.endswith(("json", "javascript"))
+
+
 def load_file(
     path: Union[str, pathlib.Path],
     *,
@@ -114,34 +164,42 @@ def load_file(
     proto: Optional[Protocol] = None,
     allow_pickle: bool = False,
     json_loads: Callable[[str], Any] = json.loads,
+    use_mmap: Optional[bool] = None,
     **extra,
 ) -> Any:
+    """Compressed (``gzip``, ``bz2``, ``xz``) file is decompressed, format is
+    recognized by the suffix without compression suffix (i.e. ``.json.gz``).
+    Large uncompressed JSON file is memory-mapped (``use_mmap``), see
+    ``fhir.resources.core.utils.fileio.file_buffer``."""
     if isinstance(path, str):
         path = pathlib.Path(path)
+    suffix = strip_compression_suffix(path).suffix.lower()
     # Check for YAML
-    if path.suffix.lower() in (".yml", ".yaml") or (
+    if suffix in (".yml", ".yaml") or (
         content_type and content_type.endswith(("yml", "yaml"))
     ):
-        params = {"stream": path.read_bytes()}
+        params = {"stream": read_file(path)}
         if "loader" in extra:
             params["loader"] = extra["loader"]
         obj = yaml_loads(**params)
-    elif path.suffix.lower() == ".xml" or (
-        content_type and content_type.endswith("xml")
-    ):
+    elif suffix == ".xml" or (content_type and content_type.endswith("xml")):
         if "cls" not in extra:
             raise ValueError("'cls:FHIRAbstractModel' is required parameter.")
         params = {}
-        if "xmlparser" in extra:
-            params["xmlparser"] = extra["xmlparser"]
-        obj = xml_loads(extra["cls"], path.read_bytes(), **params)
+        for name in ("xmlparser", "drop_narrative", "drop_comments"):
+            if name in extra:
+                params[name] = extra[name]
+        obj = xml_loads(extra["cls"], read_file(path), **params)
     else:
-        obj = default_load_file(
-            path,
-            proto=proto,  # type: ignore[arg-type]
-            content_type=content_type,  # type: ignore[arg-type]
-            encoding=encoding,
-            allow_pickle=allow_pickle,
-            json_loads=json_loads,
-        )
+        if proto is None and suffix in (".pkl", ".pickle"):
+            proto = Protocol.pickle
+        with file_buffer(path, use_mmap=use_mmap) as buffer:
+            obj = load_str_bytes(
+                buffer,
+                proto=proto,
+                content_type=content_type,
+                encoding=encoding,
+                allow_pickle=allow_pickle,
+                json_loads=json_loads,
+            )
     return obj
@@ -1,4 +1,6 @@
 # _*_ coding: utf-8 _*_
+import importlib
+import typing
 from functools import lru_cache
 
 from pydantic.v1.fields import ModelField
@@ -6,6 +8,14 @@ from pydantic.v1.typing import get_args, get_origin
 
 __author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
 
+FHIR_ROOT_MODULES: typing.Dict[str, typing.Any] = {
+    "R5": None,
+    "R4": None,
+    "R4B": None,
+    "STU3": None,
+    "DSTU2": None,
+}
+
 
 @lru_cache(maxsize=1024, typed=True)
 def is_list_type(field: ModelField) -> bool:
@@ -66,3 +76,14 @@ def normalize_fhir_type_class(type_):
                 return normalize_fhir_type_class(tp_)
     else:
         return type_
+
+
+def get_fhir_root_module(fhir_release: str):
+    """ """
+    if FHIR_ROOT_MODULES[fhir_release] is None:
+        mod_name = "fhir.resources"
+        if fhir_release != "R5":
+            mod_name += f".{fhir_release}"
+        FHIR_ROOT_MODULES[fhir_release] = importlib.import_module(mod_name)
+
+    return FHIR_ROOT_MODULES[fhir_release]
@@ -0,0 +1,128 @@
+# _*_ coding: utf-8 _*_
+"""Reading of (optionally compressed) files.
+
+Compressed (``gzip``, ``bz2`` and ``xz``) file is recognized by its suffix
+(i.e. ``Patient.ndjson.gz``) or by its magic bytes (regular file only) and is
+decompressed as stream. Large uncompressed file is memory-mapped, instead of
+read into memory.
+"""
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import mmap
+import os
+import pathlib
+import stat
+import typing
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# smaller file is just read, mapping is not worth it.
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+}
+COMPRESSION_MAGIC_NUMBERS = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+COMPRESSION_OPENERS: typing.Dict[str, typing.Callable[..., typing.BinaryIO]] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+FilePath = typing.Union[str, pathlib.Path]
+
+
+def get_compression(path: FilePath) -> typing.Optional[str]:
+    """Compression name by file suffix or else by magic bytes. Only regular
+    file is sniffed, reading of pipe (i.e. ``/dev/stdin``) would consume the
+    content."""
+    path = pathlib.Path(path)
+    compression = COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    if compression is not None:
+        return compression
+    if not stat.S_ISREG(path.stat().st_mode):
+        return None
+    with io.open(path, "rb") as fp:
+        head = fp.read(6)
+    for magic, name in COMPRESSION_MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def strip_compression_suffix(path: FilePath) -> pathlib.Path:
+    """``Patient.json.gz`` -> ``Patient.json``, so the content format
+    could be recognized by suffix."""
+    path = pathlib.Path(path)
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return path.with_suffix("")
+    return path
+
+
+def open_file(
+    path: FilePath, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> typing.BinaryIO:
+    """Opens binary file object for reading, compressed file is decompressed
+    on the fly."""
+    compression = get_compression(path)
+    if compression is None:
+        return io.open(path, "rb", buffering=buffer_size)
+    return COMPRESSION_OPENERS[compression](path, "rb")
+
+
+def read_file(path: FilePath) -> bytes:
+    """Whole (decompressed) content of the file."""
+    compression = get_compression(path)
+    if compression is None:
+        return pathlib.Path(path).read_bytes()
+    with COMPRESSION_OPENERS[compression](path, "rb") as fp:
+        return fp.read()
+
+
+@contextlib.contextmanager
+def file_buffer(
+    path: FilePath, use_mmap: typing.Optional[bool] = None
+) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+    """Content of the file as bytes buffer. Uncompressed file is memory-mapped
+    (when ``use_mmap`` is ``None``, only file larger than ``MMAP_THRESHOLD``),
+    buffer must not be used after exiting the context."""
+    compression = get_compression(path)
+    if compression is not None:
+        with COMPRESSION_OPENERS[compression](path, "rb") as fp:
+            yield fp.read()
+        return
+    with io.open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if use_mmap is None:
+            use_mmap = size >= MMAP_THRESHOLD
+        if use_mmap is False or size == 0:
+            # empty file could not be mapped
+            yield fp.read()
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+__all__ = [
+    "get_compression",
+    "strip_compression_suffix",
+    "open_file",
+    "read_file",
+    "file_buffer",
+]
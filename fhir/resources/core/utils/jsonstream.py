@@ -0,0 +1,177 @@
+# _*_ coding: utf-8 _*_
+"""Minimal incremental JSON tokenizer and buffered writer.
+
+Reads JSON document from file object chunk by chunk, so only the currently
+decoded value (i.e one ``Bundle.entry`` item) has to be kept in memory,
+instead of the whole document. Likewise, ``JSONStreamWriter`` writes
+document piece by piece through fixed size buffer.
+"""
+import codecs
+import gzip
+import io
+import json
+import pathlib
+import typing
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+WHITESPACES = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class JSONStreamTokenizer:
+    """ """
+
+    __slots__ = ("_fp", "_buffer", "_pos", "_eof", "_decoder", "chunk_size")
+
+    def __init__(self, fp: typing.IO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """``fp`` could be binary (utf-8 encoded) or text file object."""
+        self._fp = fp
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.chunk_size = chunk_size
+
+    def _read(self, size: int) -> bool:
+        """Reads more data into buffer, consumed part of buffer is dropped."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+            chunk = self._decoder.decode(b"", final=True)
+            if not chunk:
+                return False
+        elif isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+
+        if self._pos > 0:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Returns next non whitespace character (without consuming it),
+        empty string at the end of document."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in WHITESPACES:
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._read(self.chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consumes next non whitespace character, which must be one of ``chars``."""
+        char = self.peek()
+        if char == "" or char not in chars:
+            raise ValueError(
+                f"Invalid JSON: expected one of {list(chars)} at position "
+                f"{self._pos}, but got {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def read_value(self) -> typing.Any:
+        """Decodes next complete JSON value (string, number, object, array...)."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # value might be incomplete, read more (growing read size, so
+                # large value is not re-scanned too many times).
+                if not self._read(max(self.chunk_size, len(self._buffer))):
+                    raise
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # i.e number might be truncated by chunk boundary
+                if self._read(self.chunk_size):
+                    continue
+            self._pos = end
+            return value
+
+
+class JSONStreamWriter:
+    """Buffered writer of utf-8 encoded JSON bytes. Data is appended to
+    ``buffer`` (bytearray), which is flushed into the file object in batches,
+    whenever it grows over ``buffer_size``."""
+
+    __slots__ = ("_fp", "_owned", "_text", "buffer", "buffer_size", "closed")
+
+    def __init__(
+        self,
+        target: typing.Union[str, pathlib.Path, typing.IO],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compress: bool = False,
+        compresslevel: int = 6,
+    ):
+        """``target`` could be file path or (binary or text) file object.
+        With ``compress``, output is gzip compressed (binary target only)."""
+        owned: typing.List[typing.IO] = []
+        if isinstance(target, (str, pathlib.Path)):
+            fp = io.open(target, "wb")
+            owned.append(fp)
+        else:
+            fp = target
+        text = isinstance(fp, io.TextIOBase)
+        if compress:
+            if text:
+                raise ValueError("Compressed output requires binary file object.")
+            # gzip file is closed before underlying file
+            fp = gzip.GzipFile(fileobj=fp, mode="wb", compresslevel=compresslevel)
+            owned.insert(0, fp)
+
+        self._fp = fp
+        self._owned = owned
+        self._text = text
+        self.buffer = bytearray()
+        self.buffer_size = buffer_size
+        self.closed = False
+
+    def write(self, data: bytes):
+        """ """
+        self.buffer += data
+        self.written()
+
+    def written(self):
+        """Should be called after data is appended directly to ``buffer``."""
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """ """
+        if self.closed:
+            raise ValueError("I/O operation on closed writer.")
+        if len(self.buffer) > 0:
+            if self._text:
+                self._fp.write(self.buffer.decode("utf-8"))
+            else:
+                self._fp.write(self.buffer)
+            del self.buffer[:]
+
+    def close(self):
+        """Flushes buffer, file object is only closed if it is opened by the writer."""
+        if self.closed:
+            return
+        try:
+            self.flush()
+            if not self._owned:
+                self._fp.flush()
+        finally:
+            self.closed = True
+            for fp in self._owned:
+                fp.close()
+
+
+__all__ = ["JSONStreamTokenizer", "JSONStreamWriter"]
@@ -1,5 +1,4 @@
 # _*_ coding: utf-8 _*_
-import importlib
 import logging
 import typing
 from collections import OrderedDict, deque
@@ -10,7 +9,14 @@ from lxml import etree  # type: ignore
 from lxml.etree import QName  # type: ignore
 from pydantic.v1.fields import SHAPE_LIST, SHAPE_SINGLETON
 
-from .common import get_fhir_type_name, is_primitive_type, normalize_fhir_type_class
+from ..lazy import resolve_lazy
+from .common import (
+    get_fhir_root_module,
+    get_fhir_type_name,
+    is_primitive_type,
+    normalize_fhir_type_class,
+)
+from .xsd import XSD_SCHEMA_POOL
 
 if typing.TYPE_CHECKING:
     from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
@@ -29,13 +35,6 @@ TupleStrKeyVal = typing.Tuple[str, StrBytes]
 ROOT_NS = "http://hl7.org/fhir"
 XHTML_NS = "http://www.w3.org/1999/xhtml"
 EMPTY_VALUE = None
-FHIR_ROOT_MODULES: typing.Dict[str, typing.Any] = {
-    "R5": None,
-    "R4": None,
-    "R4B": None,
-    "STU3": None,
-    "DSTU2": None,
-}
 LOG = logging.getLogger(__name__)
 
 
@@ -67,18 +66,6 @@ def get_fhir_model_class(field, check=True):
     return mod.get_fhir_model_class(get_fhir_type_name(field.type_))
 
 
-def get_fhir_root_module(fhir_release: str):
-    """ """
-    global FHIR_ROOT_MODULES
-    if FHIR_ROOT_MODULES[fhir_release] is None:
-        mod_name = "fhir.resources"
-        if fhir_release != "R5":
-            mod_name += f".{fhir_release}"
-        FHIR_ROOT_MODULES[fhir_release] = importlib.import_module(mod_name)
-
-    return FHIR_ROOT_MODULES[fhir_release]
-
-
 class SimpleNodeStorage:
     __slots__ = ("__storage__", "node")
     if typing.TYPE_CHECKING:
@@ -670,6 +657,7 @@ class Node:
         parent_child = None
         if get_fhir_type_name(field_type) == "Resource":
             # special case
+            value = resolve_lazy(value)
             parent_child = child
             child = Node.create(value.resource_type)
             parent_child.children.append(child)
@@ -854,8 +842,8 @@ class Node:
 
         if xmlparser is None:
             assert xsd_file and xsd_file.exists() and xsd_file.is_file()
-            schema = etree.XMLSchema(file=str(xsd_file))
-            xmlparser = etree.XMLParser(schema=schema)
+            # compiled schema is cached, parser is reused per thread
+            xmlparser = XSD_SCHEMA_POOL.get_parser(None, xsd_file)
 
         try:
             etree.fromstring(element_str, parser=xmlparser)
@@ -1017,6 +1005,570 @@ class Node:
         return self.to_string(pretty_print=False)
 
 
+_XML_FIELDS: typing.Dict[type, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] = {}
+
+
+def get_xml_fields(
+    model_cls: typing.Type["FHIRAbstractModel"],
+) -> typing.Tuple[typing.Tuple[typing.Any, ...], ...]:
+    """Returns (cached) tuple of (field, ext field name, is xhtml) in
+    ``elements_sequence`` order, ext field name is None for non primitive."""
+    try:
+        return _XML_FIELDS[model_cls]
+    except KeyError:
+        pass
+    alias_maps = model_cls.get_alias_mapping()
+    fields = []
+    for prop_name in model_cls.elements_sequence():
+        field = model_cls.__fields__[alias_maps[prop_name]]
+        ext_name = None
+        if is_primitive_type(field):
+            ext_name = f"{field.name}__ext"
+        is_xhtml = get_fhir_type_name(field.type_) == "xhtml"
+        fields.append((field, ext_name, is_xhtml))
+    result = _XML_FIELDS[model_cls] = tuple(fields)
+    return result
+
+
+def iter_fhir_obj_values(
+    model: "FHIRAbstractModel",
+) -> typing.Iterator[typing.Tuple["ModelField", typing.Any, typing.Any, typing.Any]]:
+    """Yields (field, value, ext value, ext field) of every element of the model."""
+    values = model.__dict__
+    model_fields = model.__class__.__fields__
+    for field, ext_name, _ in get_xml_fields(model.__class__):
+        value = values.get(field.name, None)
+        value_ext, value_ext_field = None, None
+        if ext_name is not None:
+            value_ext = values.get(ext_name, None)
+            if value_ext:
+                value_ext_field = model_fields[ext_name]
+
+        if value_ext is None and value is None:
+            continue
+        yield field, value, value_ext, value_ext_field
+
+
+def add_fhir_element_xml(
+    parent: etree._Element, field, value, ext=None, ext_field=None
+) -> None:
+    """Same as ``Node.add_fhir_element`` but lxml element is built directly,
+    without intermediate ``Node`` tree."""
+    if is_primitive_type(field):
+        if isinstance(value, list):
+            if ext and not isinstance(ext, list):
+                ext = [ext]
+
+            if ext is None:
+                ext = []
+
+            if len(value) < len(ext):
+                LOG.warning(f"Some {(len(ext) - len(value))} extension(s) are ignored.")
+
+            for idx, val in enumerate(value):
+                try:
+                    ext_ = ext[idx]
+                except IndexError:
+                    ext_ = None
+                if ext_ is None and val is None:
+                    continue
+                add_fhir_element_xml(
+                    parent, field, value=val, ext=ext_, ext_field=ext_field
+                )
+            return
+
+        if value is not None:
+            value = xml_represent(field.type_, value)
+        if value:
+            child = parent.makeelement(field.alias, value=value)
+        else:
+            child = parent.makeelement(field.alias)
+        if ext is not None:
+            exts = (value is not None or not isinstance(ext, list)) and [ext] or ext
+            for ext_ in exts:
+                if ext_ is None:
+                    continue
+                inject_comments_xml(parent, ext_.__dict__.get("fhir_comments", None))
+                add_fhir_element_xml(child, ext_field, ext_)
+        parent.append(child)
+        return
+
+    # Handle Multiple non primitive type values
+    if isinstance(value, list):
+        for value_ in value:
+            add_fhir_element_xml(parent, field, value_, ext=ext, ext_field=ext_field)
+        return
+
+    field_type = field.type_
+    # we see it's instance of 'FHIRAbstractModel'
+    if getattr(field_type, "__resource_type__", None) is None:
+        type_str = str(field_type)
+        if (
+            type_str.startswith(("typing.Union[", "typing.Optional["))
+            and "fhirtypes.FHIRPrimitiveExtensionType" in type_str
+        ):
+            for cls in field_type.__args__:
+                if cls.__name__ == "FHIRPrimitiveExtensionType":
+                    field_type = cls
+        else:
+            raise NotImplementedError
+
+    type_name = get_fhir_type_name(field_type)
+    if type_name == "FHIRPrimitiveExtension":
+        # this is an special primitive extension
+        field = value.__class__.__fields__["extension"]
+        value = value.__dict__.get(field.name, None)
+        if not value:
+            return
+        add_fhir_element_xml(parent, field, value, ext=ext, ext_field=ext_field)
+        return
+
+    child = parent.makeelement(field.alias)
+    if type_name == "Resource":
+        # special case
+        value = resolve_lazy(value)
+        parent_child = child
+        child = parent_child.makeelement(value.resource_type)
+        parent_child.append(child)
+    else:
+        parent_child = None
+
+    # working comments
+    inject_comments_xml(parent, value.__dict__.get("fhir_comments", None))
+    add_fhir_obj_elements_xml(
+        child, value, is_extension=field_type.fhir_type_name() == "Extension"
+    )
+    parent.append(child if parent_child is None else parent_child)
+
+
+def add_fhir_obj_elements_xml(
+    element: etree._Element, model: "FHIRAbstractModel", is_extension: bool = False
+) -> None:
+    """Adds every element of the model into (lxml) ``element``."""
+    values = model.__dict__
+    model_fields = model.__class__.__fields__
+    attrib = None
+    for field, ext_name, is_xhtml in get_xml_fields(model.__class__):
+        val = values.get(field.name)
+        if is_extension and field.alias in ("url", "id") and val:
+            if attrib is None:
+                attrib = OrderedDict()
+            attrib[field.alias] = val
+            continue
+        if is_xhtml and val:
+            # xxx: fhir-xhtml.xsd validation
+            xhtml_element = etree.fromstring(val)
+            if not (
+                xhtml_element.nsmap[None] == XHTML_NS
+                and str(etree.QName(XHTML_NS, field.alias))
+            ):
+                raise ValueError
+            element.append(xhtml_element)
+            continue
+
+        value_ext, value_ext_field = None, None
+        if ext_name is not None:
+            value_ext = values.get(ext_name, None)
+            if value_ext:
+                value_ext_field = model_fields[ext_name]
+
+        if value_ext is None and val is None:
+            continue
+
+        add_fhir_element_xml(
+            element, field, val, ext=value_ext, ext_field=value_ext_field
+        )
+
+    if attrib is not None:
+        for key, val in attrib.items():
+            element.set(key, val)
+
+
+def inject_comments_xml(
+    element: etree._Element, comments: typing.Union[str, typing.List[str], None]
+) -> None:
+    """ """
+    if comments:
+        if isinstance(comments, str):
+            comments = [comments]
+        for cm in comments:
+            element.append(etree.Comment(cm))
+
+
+def fhir_obj_to_xml(model: "FHIRAbstractModel") -> etree._Element:
+    """Builds lxml element tree of the model directly (without ``Node`` tree),
+    the result is the same as ``Node.from_fhir_obj(model).to_xml()``."""
+    root = etree.Element(model.resource_type, nsmap={None: ROOT_NS})
+    for field, value, value_ext, value_ext_field in iter_fhir_obj_values(model):
+        add_fhir_element_xml(
+            root, field, value, ext=value_ext, ext_field=value_ext_field
+        )
+    return root
+
+
+class XMLStreamWriter:
+    """Incremental writer of FHIR XML document into (binary) file object.
+    The document is serialized element by element (i.e. each ``Bundle.entry``),
+    only one top-level element is kept as lxml tree at a time. Output is the
+    same as ``xml_dumps``.
+
+    ``lxml.etree.xmlfile`` cannot reproduce ``pretty_print`` indentation of
+    nested elements, so each top-level element is serialized (by
+    ``etree.tostring``) under the root element, that is then written as it is.
+    """
+
+    def __init__(
+        self,
+        fp: typing.IO,
+        resource_type: str,
+        *,
+        pretty_print=False,
+        xml_declaration=True,
+        with_comments=True,
+        strip_text=False,
+    ):
+        """ """
+        self.fp = fp
+        self.root = etree.Element(resource_type, nsmap={None: ROOT_NS})
+        self.params = {
+            "encoding": "utf-8",
+            "method": "xml",
+            "pretty_print": pretty_print,
+            "with_comments": with_comments,
+            "strip_text": strip_text,
+        }
+        self.xml_declaration = xml_declaration
+        self.started = False
+        self.closed = False
+        self._start_tag, self._end_tag = self._get_root_tags()
+
+    def _get_root_tags(self) -> typing.Tuple[bytes, bytes]:
+        """ """
+        root = self.root
+        root.append(root.makeelement("x"))
+        result = etree.tostring(root, **self.params)
+        del root[:]
+        start, end = result.split(b"<x/>")
+        # indentation (pretty print) belongs to the child
+        return start.rstrip(b"\n "), end
+
+    def write(self, field: "ModelField", value, ext=None, ext_field=None) -> None:
+        """Writes element(s) of the root resource, in ``elements_sequence`` order."""
+        root = self.root
+        add_fhir_element_xml(root, field, value, ext=ext, ext_field=ext_field)
+        if len(root) == 0:
+            return
+        result = etree.tostring(root, **self.params)
+        del root[:]
+        start_tag, end_tag = self._start_tag, self._end_tag
+        if not result.startswith(start_tag) or not result.endswith(end_tag):
+            # i.e. comments are not written
+            return
+        self._start()
+        self.fp.write(result[len(start_tag) : len(result) - len(end_tag)])
+
+    def _start(self):
+        """ """
+        if self.started:
+            return
+        self.started = True
+        if self.xml_declaration:
+            self.fp.write(
+                etree.tostring(
+                    self.root.makeelement("x"),
+                    encoding="utf-8",
+                    xml_declaration=True,
+                )[: -len(b"<x/>")]
+            )
+        self.fp.write(self._start_tag)
+
+    def write_model(self, model: "FHIRAbstractModel") -> None:
+        """Writes every element of the model."""
+        for field, value, value_ext, value_ext_field in iter_fhir_obj_values(model):
+            self.write(field, value, value_ext, value_ext_field)
+
+    def close(self) -> None:
+        """ """
+        if self.closed:
+            return
+        self.closed = True
+        if not self.started:
+            # no element, self closed root element
+            result = etree.tostring(
+                self.root, xml_declaration=self.xml_declaration, **self.params
+            )
+            self.fp.write(result)
+            return
+        self.fp.write(self._end_tag)
+
+    def __enter__(self) -> "XMLStreamWriter":
+        """ """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ """
+        if exc_type is None:
+            self.close()
+
+
+class XMLBinding:
+    """Precomputed XML binding table of a FHIR model class, element name
+    (alias) -> (field name, is list, is primitive, is xhtml, model class).
+    Model class is resolved (and cached) on first use."""
+
+    __slots__ = (
+        "model_cls",
+        "fields",
+        "model_classes",
+        "is_resource",
+        "is_extension",
+        "primitive_ext_cls",
+        "ext_cls",
+        "narrative",
+    )
+
+    def __init__(self, model_cls: typing.Type["FHIRAbstractModel"]):
+        """ """
+        self.model_cls = model_cls
+        self.fields: typing.Dict[str, typing.Tuple[str, bool, bool, bool]] = {}
+        self.model_classes: typing.Dict[str, typing.Type["FHIRAbstractModel"]] = {}
+        # element name of resource narrative (``text``)
+        self.narrative: typing.Optional[str] = None
+        for alias, name in model_cls.get_alias_mapping().items():
+            field = model_cls.__fields__[name]
+            if field.shape == SHAPE_LIST:
+                is_list = True
+            elif field.shape == SHAPE_SINGLETON:
+                is_list = False
+            else:
+                is_list = None  # not supported
+            is_primitive = is_primitive_type(field)
+            is_xhtml = is_primitive and get_fhir_type_name(field.type_) == "xhtml"
+            self.fields[alias] = (name, is_list, is_primitive, is_xhtml)
+            if name == "text" and get_fhir_type_name(field.type_) == "Narrative":
+                self.narrative = alias
+        resource_type = model_cls.get_resource_type()
+        self.is_resource = resource_type == "Resource"
+        self.is_extension = resource_type == "Extension"
+        self.primitive_ext_cls = None
+        self.ext_cls = None
+
+    def get_model_class(self, name: str) -> typing.Type["FHIRAbstractModel"]:
+        """ """
+        try:
+            return self.model_classes[name]
+        except KeyError:
+            klass = self.model_classes[name] = get_fhir_model_class(
+                self.model_cls.__fields__[name], False
+            )
+            return klass
+
+    def get_primitive_ext_classes(
+        self,
+    ) -> typing.Tuple[
+        typing.Type["FHIRAbstractModel"], typing.Type["FHIRAbstractModel"]
+    ]:
+        """``FHIRPrimitiveExtension`` and its ``extension`` model class."""
+        if self.primitive_ext_cls is None:
+            fhir_release = self.model_cls.__fields__["id"].type_.__fhir_release__
+            primitive_ext_cls = get_fhir_root_module(fhir_release).get_fhir_model_class(
+                "FHIRPrimitiveExtension"
+            )
+            self.ext_cls = get_fhir_model_class(
+                primitive_ext_cls.__fields__["extension"], False
+            )
+            self.primitive_ext_cls = primitive_ext_cls
+        return self.primitive_ext_cls, self.ext_cls
+
+
+_XML_BINDINGS: typing.Dict[type, XMLBinding] = {}
+
+
+def get_xml_binding(model_cls: typing.Type["FHIRAbstractModel"]) -> XMLBinding:
+    """ """
+    try:
+        return _XML_BINDINGS[model_cls]
+    except KeyError:
+        binding = _XML_BINDINGS[model_cls] = XMLBinding(model_cls)
+        return binding
+
+
+def get_localname(tag: str) -> str:
+    """``{namespace}name`` -> ``name``"""
+    if tag[0] == "{":
+        return tag[tag.index("}") + 1 :]
+    return tag
+
+
+def join_comments(comments: typing.List[str]) -> typing.Union[str, typing.List[str]]:
+    """ """
+    if len(comments) == 1:
+        return comments[0]
+    return comments
+
+
+def is_xhtml_element(element: etree._Element) -> bool:
+    """ """
+    return element.nsmap.get(None, None) == XHTML_NS
+
+
+def element_to_fhir(
+    element: etree._Element,
+    klass: typing.Type["FHIRAbstractModel"],
+    comments: typing.Optional[typing.List[str]] = None,
+    *,
+    drop_narrative: bool = False,
+    drop_comments: bool = False,
+) -> "FHIRAbstractModel":
+    """Binds lxml element straight to the model (without intermediate ``Node``
+    tree), the result is the same as ``Node.from_element(element).to_fhir(klass)``.
+    ``comments``: comments right before the element.
+    ``drop_narrative``, ``drop_comments``: resource narrative (``text``) and
+    comments are skipped, not bound at all."""
+    binding = get_xml_binding(klass)
+    if binding.is_resource:
+        # the first child is the actual resource
+        child_comments: typing.List[str] = []
+        for child in element:
+            if isinstance(child, etree._Comment):
+                if not drop_comments:
+                    child_comments.append(child.text)
+                continue
+            f_release = klass.__fields__["id"].type_.__fhir_release__
+            klass_ = get_fhir_root_module(f_release).get_fhir_model_class(
+                get_localname(child.tag)
+            )
+            return element_to_fhir(
+                child,
+                klass_,
+                child_comments or None,
+                drop_narrative=drop_narrative,
+                drop_comments=drop_comments,
+            )
+
+    params: typing.Dict[str, typing.Any] = {"resource_type": klass.get_resource_type()}
+    if comments:
+        params["fhir_comments"] = join_comments(comments)
+
+    if binding.is_extension:
+        for name, val in element.attrib.items():
+            if name != "value":
+                params[name] = val
+
+    fields = binding.fields
+    narrative = binding.narrative if drop_narrative else None
+    primitive_ext_list_values: typing.Dict[str, typing.Dict[int, typing.Any]] = {}
+    child_comments = []
+    for child in element:
+        if isinstance(child, etree._Comment):
+            if not drop_comments:
+                child_comments.append(child.text)
+            continue
+        localname = get_localname(child.tag)
+        if localname == narrative:
+            child_comments = []
+            continue
+        xhtml = is_xhtml_element(child)
+        field_name, is_list, is_primitive, is_xhtml = fields[localname]
+        if is_list is None:
+            raise NotImplementedError
+
+        ext_children = None
+        if is_primitive:
+            if is_xhtml:
+                if xhtml:
+                    value = etree.tostring(child)
+                else:
+                    # namespaces in scope are not declared again
+                    exists_ns = [Namespace(*ns) for ns in element.nsmap.items()]
+                    value = Node.from_element(child, exists_ns=exists_ns).to_string(
+                        pretty_print=False, xml_declaration=False
+                    )
+            else:
+                value = child.get("value", None)
+            if not xhtml:
+                ext_children = [c for c in child if not isinstance(c, etree._Comment)]
+        else:
+            value = element_to_fhir(
+                child,
+                binding.get_model_class(field_name),
+                None if xhtml else child_comments,
+                drop_narrative=drop_narrative,
+                drop_comments=drop_comments,
+            )
+
+        if is_list:
+            if field_name not in params:
+                params[field_name] = list()
+            params[field_name].append(value)
+        else:
+            # xxx: handle None
+            params[field_name] = value
+
+        if ext_children is not None and (
+            len(ext_children) > 0 or len(child_comments) > 0
+        ):
+            primitive_ext_cls, ext_cls = binding.get_primitive_ext_classes()
+            primitive_ext_params: typing.Dict[str, typing.Any] = {}
+            if len(child_comments) > 0:
+                primitive_ext_params["fhir_comments"] = join_comments(child_comments)
+            if len(ext_children) > 0:
+                primitive_ext_params["extension"] = list(
+                    iter_extensions_to_fhir(child, ext_cls, drop_comments=drop_comments)
+                )
+            primitive_ext = primitive_ext_cls(**primitive_ext_params)
+            ext_field_name = f"{field_name}__ext"
+            if is_list:
+                # special case
+                if ext_field_name not in primitive_ext_list_values:
+                    primitive_ext_list_values[ext_field_name] = {}
+                primitive_ext_list_values[ext_field_name][
+                    len(params[field_name]) - 1
+                ] = primitive_ext
+            else:
+                params[ext_field_name] = primitive_ext
+
+        if is_list and (
+            len(params[field_name]) == 0 or all([v is None for v in params[field_name]])
+        ):
+            del params[field_name]
+
+        if not xhtml:
+            # reset
+            child_comments = []
+
+    # treatment for list type primitive ext
+    for p_ext_name in primitive_ext_list_values:
+        exts = []
+        for idx in range(len(params[p_ext_name[:-5]])):
+            try:
+                exts.append(primitive_ext_list_values[p_ext_name][idx])
+            except KeyError:
+                exts.append(None)
+        params[p_ext_name] = exts
+
+    return klass(**params)
+
+
+def iter_extensions_to_fhir(
+    element: etree._Element,
+    ext_cls: typing.Type["FHIRAbstractModel"],
+    *,
+    drop_comments: bool = False,
+) -> typing.Iterator["FHIRAbstractModel"]:
+    """Extensions of primitive element, with their comments."""
+    comments: typing.List[str] = []
+    for child in element:
+        if isinstance(child, etree._Comment):
+            if not drop_comments:
+                comments.append(child.text)
+            continue
+        if is_xhtml_element(child):
+            raise NotImplementedError
+        yield element_to_fhir(child, ext_cls, comments, drop_comments=drop_comments)
+        comments = []
+
+
 def xml_dumps(
     model: "FHIRAbstractModel",
     *,
@@ -1026,22 +1578,52 @@ def xml_dumps(
     strip_text=False,
 ):
     """ """
-    node = Node.from_fhir_obj(model)
-    return node.to_string(
+    params = {"encoding": "utf-8", "method": "xml", "pretty_print": pretty_print}
+    if xml_declaration:
+        params["xml_declaration"] = '<?xml version="1.0" encoding="UTF-8"?>'
+    params["with_comments"] = with_comments
+    params["strip_text"] = strip_text
+    return etree.tostring(fhir_obj_to_xml(model), **params)
+
+
+def xml_dump(
+    model: "FHIRAbstractModel",
+    fp: typing.IO,
+    *,
+    pretty_print=False,
+    xml_declaration=True,
+    with_comments=True,
+    strip_text=False,
+):
+    """Writes XML (the same as ``xml_dumps``) into binary file object,
+    top-level element by element."""
+    with XMLStreamWriter(
+        fp,
+        model.resource_type,
         pretty_print=pretty_print,
         xml_declaration=xml_declaration,
         with_comments=with_comments,
         strip_text=strip_text,
-    )
+    ) as writer:
+        writer.write_model(model)
 
 
 def xml_loads(
-    cls: typing.Type["FHIRAbstractModel"], b: bytes, xmlparser: etree.XMLParser = None
+    cls: typing.Type["FHIRAbstractModel"],
+    b: bytes,
+    xmlparser: etree.XMLParser = None,
+    *,
+    drop_narrative: bool = False,
+    drop_comments: bool = False,
 ) -> "FHIRAbstractModel":
-    """ """
+    """``drop_comments``: comments are not even kept in parsed tree (unless
+    ``xmlparser`` is provided)."""
+    if drop_comments and xmlparser is None:
+        xmlparser = etree.XMLParser(remove_comments=True)
     root = etree.fromstring(b, parser=xmlparser)
-    node = Node.from_element(root)
-    return node.to_fhir(cls)
+    return element_to_fhir(
+        root, cls, drop_narrative=drop_narrative, drop_comments=drop_comments
+    )
 
 
-__all__ = ["xml_dumps", "xml_loads"]
+__all__ = ["xml_dumps", "xml_dump", "xml_loads", "XMLStreamWriter"]
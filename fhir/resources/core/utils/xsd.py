@@ -0,0 +1,178 @@
+# _*_ coding: utf-8 _*_
+"""Pool of compiled XSD schemas for XML validation.
+
+Compiling the FHIR XSD set takes seconds, so every schema is compiled only once
+per ``(release, xsd file)`` and kept in the pool. ``lxml`` parsers are not
+thread-safe, so validating parsers are created per thread (and reused).
+
+XSD files are not shipped with ``fhir.resources``, the directory of the
+downloaded FHIR schemas (``fhir-all-xsd.zip``) is registered per release::
+
+    >>> from fhir.resources.core.utils.xsd import register_xsd_dir, validate_xml
+    >>> register_xsd_dir("R5", "/opt/fhir/R5/xsd")
+    >>> element = validate_xml(content, release="R5")
+"""
+import threading
+import typing
+from pathlib import Path
+
+from lxml import etree  # type: ignore
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+# contains every resource, so any resource document could be validated.
+DEFAULT_XSD_FILE = "fhir-single.xsd"
+
+SchemaKey = typing.Tuple[typing.Optional[str], Path]
+
+
+class XSDSchemaPool:
+    """Thread-safe cache of compiled ``etree.XMLSchema`` (keyed by release and
+    XSD file path) and of per thread validating ``etree.XMLParser``."""
+
+    def __init__(self):
+        """ """
+        self._xsd_dirs: typing.Dict[str, Path] = {}
+        self._schemas: typing.Dict[SchemaKey, etree.XMLSchema] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # incremented by ``clear``, outdated parsers of every thread are dropped
+        self._generation = 0
+
+    def register_xsd_dir(self, release: str, xsd_dir: typing.Union[str, Path]):
+        """Registers directory of FHIR XSD files for ``release``."""
+        xsd_dir = Path(xsd_dir)
+        if not xsd_dir.is_dir():
+            raise ValueError(f"XSD directory '{xsd_dir}' does not exist.")
+        with self._lock:
+            self._xsd_dirs[release] = xsd_dir.resolve()
+
+    def get_xsd_file(
+        self,
+        release: typing.Optional[str],
+        xsd_file: typing.Union[str, Path, None] = None,
+    ) -> Path:
+        """Absolute path of XSD file, relative ``xsd_file`` (or default
+        ``fhir-single.xsd``) is looked up in the registered release directory."""
+        if xsd_file is not None and Path(xsd_file).is_absolute():
+            return Path(xsd_file)
+        if release is None:
+            if xsd_file is None:
+                raise ValueError("Any of `release` or `xsd_file` is required")
+            return Path(xsd_file).resolve()
+        try:
+            xsd_dir = self._xsd_dirs[release]
+        except KeyError:
+            raise ValueError(
+                f"No XSD directory is registered for release '{release}', "
+                "see ``register_xsd_dir``."
+            )
+        return xsd_dir / (xsd_file or DEFAULT_XSD_FILE)
+
+    def get_schema(
+        self,
+        release: typing.Optional[str] = None,
+        xsd_file: typing.Union[str, Path, None] = None,
+    ) -> etree.XMLSchema:
+        """Compiled schema, it is compiled only the first time."""
+        key = (release, self.get_xsd_file(release, xsd_file))
+        schema = self._schemas.get(key)
+        if schema is None:
+            with self._lock:
+                schema = self._schemas.get(key)
+                if schema is None:
+                    if not key[1].is_file():
+                        raise ValueError(f"XSD file '{key[1]}' does not exist.")
+                    schema = etree.XMLSchema(file=str(key[1]))
+                    self._schemas[key] = schema
+        return schema
+
+    def get_parser(
+        self,
+        release: typing.Optional[str] = None,
+        xsd_file: typing.Union[str, Path, None] = None,
+    ) -> etree.XMLParser:
+        """Validating parser of the current thread."""
+        key = (release, self.get_xsd_file(release, xsd_file))
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.generation = self._generation
+            local.parsers = {}
+        parsers = local.parsers
+        parser = parsers.get(key)
+        if parser is None:
+            parser = etree.XMLParser(schema=self.get_schema(*key))
+            parsers[key] = parser
+        return parser
+
+    def validate(
+        self,
+        content: bytes,
+        release: typing.Optional[str] = "R5",
+        xsd_file: typing.Union[str, Path, None] = None,
+    ) -> etree._Element:
+        """Validates XML document, returns parsed root element (could be used
+        with ``element_to_fhir``, so document is not parsed twice).
+        ``ValueError`` is raised for invalid document."""
+        parser = self.get_parser(release, xsd_file)
+        try:
+            return etree.fromstring(content, parser=parser)
+        except (etree.XMLSchemaError, etree.XMLSyntaxError) as exc:
+            raise ValueError(str(exc))
+
+    def iter_validate(
+        self,
+        documents: typing.Iterable[bytes],
+        release: typing.Optional[str] = "R5",
+        xsd_file: typing.Union[str, Path, None] = None,
+    ) -> typing.Iterator[etree._Element]:
+        """Validates stream of XML documents with the same parser."""
+        parser = self.get_parser(release, xsd_file)
+        for content in documents:
+            try:
+                yield etree.fromstring(content, parser=parser)
+            except (etree.XMLSchemaError, etree.XMLSyntaxError) as exc:
+                raise ValueError(str(exc))
+
+    def clear(self):
+        """Drops compiled schemas and parsers of every thread."""
+        with self._lock:
+            self._schemas.clear()
+            self._generation += 1
+
+
+XSD_SCHEMA_POOL = XSDSchemaPool()
+
+
+def register_xsd_dir(release: str, xsd_dir: typing.Union[str, Path]):
+    """ """
+    XSD_SCHEMA_POOL.register_xsd_dir(release, xsd_dir)
+
+
+def validate_xml(
+    content: bytes,
+    release: typing.Optional[str] = "R5",
+    *,
+    xsd_file: typing.Union[str, Path, None] = None,
+) -> etree._Element:
+    """Validates XML document against cached (compiled once) release schema."""
+    return XSD_SCHEMA_POOL.validate(content, release, xsd_file)
+
+
+def iter_validate_xml(
+    documents: typing.Iterable[bytes],
+    release: typing.Optional[str] = "R5",
+    *,
+    xsd_file: typing.Union[str, Path, None] = None,
+) -> typing.Iterator[etree._Element]:
+    """ """
+    return XSD_SCHEMA_POOL.iter_validate(documents, release, xsd_file)
+
+
+__all__ = [
+    "XSDSchemaPool",
+    "XSD_SCHEMA_POOL",
+    "register_xsd_dir",
+    "validate_xml",
+    "iter_validate_xml",
+]
@@ -0,0 +1,191 @@
+# _*_ coding: utf-8 _*_
+"""Table driven validation engine for FHIR specific (class level) rules.
+
+Instead of rebuilding the same lookup tables inside a root validator on every
+instantiation, every model class gets a compiled ``ValidationPlan`` (the first
+time it is used) which holds all required primitive elements (with their
+``__ext`` twins) and all choice type (``one_of_many``) groups. The plan is then
+executed in a single pass over the input values.
+"""
+import typing
+
+from pydantic.v1.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.v1.errors import MissingError, NoneIsNotAllowedError
+
+if typing.TYPE_CHECKING:
+    from pydantic.v1.fields import ModelField
+
+    from .fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+_missing = object()
+_PLANS: typing.Dict[type, "ValidationPlan"] = {}
+
+
+class ValidationPlan:
+    """Precomputed validation table of a FHIR model class.
+
+    ``required_primitives``: sequence of (alias, ext alias, ext model field)
+    ``one_of_many``: sequence of (prefix, field names, required)
+    ``choice_index``: mapping of choice field name to position in ``one_of_many``
+    """
+
+    __slots__ = ("required_primitives", "one_of_many", "choice_index")
+
+    def __init__(
+        self,
+        required_primitives: typing.Tuple[
+            typing.Tuple[str, str, "ModelField"], ...
+        ] = (),
+        one_of_many: typing.Tuple[typing.Tuple[str, typing.List[str], bool], ...] = (),
+    ):
+        """ """
+        self.required_primitives = required_primitives
+        self.one_of_many = one_of_many
+        self.choice_index = {
+            name: index
+            for index, (_, names, _) in enumerate(one_of_many)
+            for name in names
+        }
+
+    @classmethod
+    def compile(cls, model_cls: typing.Type["FHIRAbstractModel"]) -> "ValidationPlan":
+        """Build the plan from field's metadata (``element_required``,
+        ``one_of_many`` and ``one_of_many_required``)."""
+        required_primitives = []
+        groups: typing.Dict[str, typing.List[str]] = {}
+        groups_required: typing.Dict[str, bool] = {}
+
+        for name, field in model_cls.__fields__.items():
+            extra = field.field_info.extra
+            # Primitive element only (non primitive required element is
+            # handled by pydantic itself), having extension twin.
+            if extra.get("element_required", False) is True:
+                ext_field = model_cls.__fields__.get(f"{name}__ext", None)
+                if ext_field is not None:
+                    required_primitives.append(
+                        (field.alias, ext_field.alias, ext_field)
+                    )
+
+            prefix = extra.get("one_of_many", None)
+            if prefix is not None:
+                if prefix not in groups:
+                    groups[prefix] = []
+                    groups_required[prefix] = extra.get("one_of_many_required") is True
+                groups[prefix].append(name)
+
+        return cls(
+            required_primitives=tuple(required_primitives),
+            one_of_many=tuple(
+                (prefix, names, groups_required[prefix])
+                for prefix, names in groups.items()
+            ),
+        )
+
+    def run(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        values: typing.Dict[str, typing.Any],
+    ) -> typing.Dict[str, typing.Any]:
+        """ """
+        if self.required_primitives:
+            self.validate_required_primitives(model_cls, values)
+
+        if self.one_of_many:
+            self.validate_one_of_many(values)
+
+        return values
+
+    def validate_required_primitives(
+        self,
+        model_cls: typing.Type["FHIRAbstractModel"],
+        values: typing.Dict[str, typing.Any],
+    ):
+        """https://www.hl7.org/fhir/extensibility.html#Special-Case
+        In some cases, implementers might find that they do not have appropriate data for
+        an element with minimum cardinality = 1. In this case, the element must be present,
+        but unless the resource or a profile on it has made the actual value of the primitive
+        data type mandatory, it is possible to provide an extension that explains why
+        the primitive value is not present.
+        """
+        errors: typing.List["ErrorWrapper"] = []
+        for alias, ext_alias, ext_field in self.required_primitives:
+            value = values.get(alias, _missing)
+            if value is not _missing and value is not None:
+                continue
+            ext_value = values.get(ext_alias, _missing)
+            missing_ext = True
+            if ext_value is not _missing and ext_value is not None:
+                if isinstance(ext_value, dict):
+                    missing_ext = len(ext_value.get("extension", [])) == 0
+                elif (
+                    getattr(ext_value.__class__, "get_resource_type", _fallback)()
+                    == "FHIRPrimitiveExtension"
+                ):
+                    if ext_value.extension and len(ext_value.extension) > 0:
+                        missing_ext = False
+                else:
+                    validate_pass = True
+                    for validator in ext_field.type_.__get_validators__():
+                        try:
+                            ext_value = validator(v=ext_value)
+                        except ValidationError as exc:
+                            errors.append(ErrorWrapper(exc, loc=ext_alias))
+                            validate_pass = False
+                    if not validate_pass:
+                        continue
+                    if ext_value.extension and len(ext_value.extension) > 0:
+                        missing_ext = False
+            if missing_ext:
+                if value is _missing:
+                    errors.append(ErrorWrapper(MissingError(), loc=alias))
+                else:
+                    errors.append(ErrorWrapper(NoneIsNotAllowedError(), loc=alias))
+        if len(errors) > 0:
+            raise ValidationError(errors, model_cls)  # type: ignore
+
+    def validate_one_of_many(self, values: typing.Dict[str, typing.Any]):
+        """https://www.hl7.org/fhir/formats.html#choice
+        A few elements have a choice of more than one data type for their content.
+        All such elements have a name that takes the form nnn[x].
+        Elements that have a choice of data type cannot repeat - they must have a
+        maximum cardinality of 1.
+        """
+        choice_index = self.choice_index
+        found = [0] * len(self.one_of_many)
+        for key, value in values.items():
+            index = choice_index.get(key, None)
+            if index is not None and value is not None:
+                found[index] += 1
+
+        for index, (_, fields, required) in enumerate(self.one_of_many):
+            if found[index] > 1:
+                raise ValueError(
+                    "Any of one field value is expected from "
+                    f"this list {fields}, but got multiple!"
+                )
+            if required is True and found[index] == 0:
+                raise ValueError(f"Expect any of field value from this list {fields}.")
+
+
+def _fallback():
+    return ""
+
+
+def get_validation_plan(
+    model_cls: typing.Type["FHIRAbstractModel"],
+) -> ValidationPlan:
+    """Returns compiled (cached) validation plan for the model class."""
+    try:
+        return _PLANS[model_cls]
+    except KeyError:
+        plan = _PLANS[model_cls] = ValidationPlan.compile(model_cls)
+        return plan
+
+
+def validate_fhir_element(
+    cls: typing.Type["FHIRAbstractModel"], values: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    """Pre root validator, runs the compiled validation plan of the class."""
+    return get_validation_plan(cls).run(cls, values)
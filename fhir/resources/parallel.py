@@ -0,0 +1,262 @@
+# _*_ coding: utf-8 _*_
+"""Parallel (multi process) parsing of large resource batches.
+
+Parsing is CPU bound pure python, so work is sharded across a process pool.
+Each worker imports the FHIR release (and optionally preloads model classes)
+only once. Workers don't send whole models back to the parent (pickling
+models is expensive), instead the ``reducer`` result is sent back, by default
+the compact JSON bytes of the validated model.
+"""
+import collections
+import os
+import pathlib
+import typing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from fhir.resources.core.fhirabstractmodel import json_loads
+from fhir.resources.core.utils.common import get_fhir_root_module
+from fhir.resources.core.utils.fileio import open_file
+
+from .bulk import DEFAULT_BUFFER_SIZE, FHIR_RELEASES, parse_ndjson_line
+
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+DEFAULT_CHUNK_SIZE = 256
+
+Reducer = typing.Callable[["FHIRAbstractModel"], typing.Any]
+ChunkResult = typing.List[typing.Tuple[int, bool, typing.Any]]
+
+# per worker process state, see ``_init_worker``
+_WORKER_STATE: typing.Dict[str, typing.Any] = {}
+
+
+def to_json_bytes(model: "FHIRAbstractModel") -> bytes:
+    """Default reducer, compact JSON bytes of validated model."""
+    return model.json(return_bytes=True)
+
+
+def parse_many(
+    items: typing.Iterable[typing.Union[bytes, str]],
+    release: str = "R5",
+    *,
+    workers: typing.Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    reducer: typing.Optional[Reducer] = None,
+    rehydrate: bool = False,
+    lenient: bool = False,
+    preload: typing.Sequence[str] = (),
+    mp_context=None,
+) -> typing.Iterator[typing.Any]:
+    """Parses JSON documents (one resource per item, dispatched by its
+    ``resourceType``) across a process pool.
+
+    :param workers: number of worker processes, default is number of CPUs.
+    :param chunk_size: number of items are sent to a worker at once.
+    :param ordered: results are yielded in input order, otherwise as soon as
+        chunks are completed (better throughput).
+    :param reducer: picklable (module level) function, which is called inside
+        the worker with the validated model, its result is sent back.
+        Default is ``to_json_bytes``.
+    :param rehydrate: reconstruct model (without validation) in the parent
+        from the JSON bytes, only with default reducer. DSTU2 models are
+        validated again.
+    :param lenient: instead of raising error, ``(index, error)`` tuple is yielded.
+    :param preload: model class names are imported once in each worker.
+    """
+    _check_params(release, chunk_size, reducer, rehydrate)
+    return _run(
+        enumerate(items),
+        release,
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=ordered,
+        reducer=reducer,
+        rehydrate=rehydrate,
+        lenient=lenient,
+        preload=preload,
+        mp_context=mp_context,
+    )
+
+
+def parse_ndjson(
+    source: typing.Union[str, pathlib.Path, typing.IO],
+    release: str = "R5",
+    *,
+    workers: typing.Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    reducer: typing.Optional[Reducer] = None,
+    rehydrate: bool = False,
+    lenient: bool = False,
+    preload: typing.Sequence[str] = (),
+    mp_context=None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> typing.Iterator[typing.Any]:
+    """NDJSON file variant of ``parse_many``, lines are read in the parent and
+    parsed in the workers. In lenient mode, ``(line number, error)`` tuple is
+    yielded for the invalid line."""
+    _check_params(release, chunk_size, reducer, rehydrate)
+
+    def iter_lines():
+        if isinstance(source, (str, pathlib.Path)):
+            fp = open_file(source, buffer_size)
+            close = True
+        else:
+            fp = source
+            close = False
+        try:
+            for line_no, line in enumerate(fp, start=1):
+                if line.strip():
+                    yield line_no, line
+        finally:
+            if close:
+                fp.close()
+
+    return _run(
+        iter_lines(),
+        release,
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=ordered,
+        reducer=reducer,
+        rehydrate=rehydrate,
+        lenient=lenient,
+        preload=preload,
+        mp_context=mp_context,
+    )
+
+
+def _check_params(
+    release: str, chunk_size: int, reducer: typing.Optional[Reducer], rehydrate: bool
+):
+    """ """
+    if release not in FHIR_RELEASES:
+        raise ValueError(
+            f"Unsupported FHIR release '{release}', "
+            f"should be one of {FHIR_RELEASES}"
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be more than 0.")
+    if rehydrate is True and reducer is not None:
+        raise ValueError("rehydrate is only possible with default reducer.")
+
+
+def _run(
+    numbered_items: typing.Iterator[typing.Tuple[int, typing.Union[bytes, str]]],
+    release: str,
+    *,
+    workers: typing.Optional[int],
+    chunk_size: int,
+    ordered: bool,
+    reducer: typing.Optional[Reducer],
+    rehydrate: bool,
+    lenient: bool,
+    preload: typing.Sequence[str],
+    mp_context,
+) -> typing.Iterator[typing.Any]:
+    """ """
+    get_fhir_model_class = get_fhir_root_module(release).get_fhir_model_class
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(release, reducer or to_json_bytes, tuple(preload)),
+    ) as executor:
+        # bounded number of chunks in flight, so memory is constant
+        max_pending = workers * 2
+        pending: typing.Deque["Future"] = collections.deque()
+
+        for chunk in _iter_chunks(numbered_items, chunk_size):
+            pending.append(executor.submit(_parse_chunk, chunk))
+            if len(pending) < max_pending:
+                continue
+            results = _pop_results(pending, ordered)
+            yield from _iter_results(results, lenient, rehydrate, get_fhir_model_class)
+
+        while pending:
+            results = _pop_results(pending, ordered)
+            yield from _iter_results(results, lenient, rehydrate, get_fhir_model_class)
+
+
+def _pop_results(pending: typing.Deque["Future"], ordered: bool) -> ChunkResult:
+    """Waits for the oldest chunk (ordered) or for any completed chunk."""
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = done.pop()
+    pending.remove(future)
+    return future.result()
+
+
+def _iter_chunks(
+    numbered_items: typing.Iterator[typing.Tuple[int, typing.Union[bytes, str]]],
+    chunk_size: int,
+) -> typing.Iterator[typing.List[typing.Tuple[int, typing.Union[bytes, str]]]]:
+    """ """
+    chunk = []
+    for item in numbered_items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_results(
+    results: ChunkResult,
+    lenient: bool,
+    rehydrate: bool,
+    get_fhir_model_class: typing.Callable,
+) -> typing.Iterator[typing.Any]:
+    """ """
+    for index, success, value in results:
+        if success is False:
+            if lenient is False:
+                raise value
+            yield index, value
+        elif rehydrate is True:
+            data = json_loads(value)
+            model_class = get_fhir_model_class(data["resourceType"])
+            # DSTU2 models have no trusted construction, validated again
+            construct = getattr(model_class, "construct_trusted", model_class.parse_obj)
+            yield construct(data)
+        else:
+            yield value
+
+
+def _init_worker(release: str, reducer: Reducer, preload: typing.Tuple[str, ...]):
+    """Process pool initializer, runs only once per worker."""
+    get_fhir_model_class = get_fhir_root_module(release).get_fhir_model_class
+    for model_name in preload:
+        get_fhir_model_class(model_name)
+    _WORKER_STATE["get_fhir_model_class"] = get_fhir_model_class
+    _WORKER_STATE["reducer"] = reducer
+
+
+def _parse_chunk(
+    chunk: typing.List[typing.Tuple[int, typing.Union[bytes, str]]]
+) -> ChunkResult:
+    """Runs inside the worker."""
+    get_fhir_model_class = _WORKER_STATE["get_fhir_model_class"]
+    reducer = _WORKER_STATE["reducer"]
+    results: ChunkResult = []
+    for index, item in chunk:
+        try:
+            value = reducer(parse_ndjson_line(item, get_fhir_model_class))
+        except Exception as exc:
+            results.append((index, False, exc))
+        else:
+            results.append((index, True, value))
+    return results
+
+
+__all__ = ["parse_many", "parse_ndjson", "to_json_bytes"]
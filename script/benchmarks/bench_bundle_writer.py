@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Streaming Bundle writer benchmark (peak allocation).
+#  Entries are produced one by one (i.e. from database cursor), compares
+#  collecting them into ``Bundle`` and calling ``Bundle.json()`` against
+#  ``BundleWriter``, which memory usage does not depend on number of entries.
+#
+#  Usage: python script/benchmarks/bench_bundle_writer.py [number of entries]
+import io
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.core.bundle import BundleWriter
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+
+STATIC_PATH = pathlib.Path(__file__).parents[2] / "tests" / "static"
+DATA = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+
+
+class Sink(io.RawIOBase):
+    """Discards written data (output itself is not measured)."""
+
+    def __init__(self):
+        """ """
+        self.size = 0
+
+    def writable(self):
+        """ """
+        return True
+
+    def write(self, data):
+        """ """
+        self.size += len(data)
+        return len(data)
+
+
+def iter_resources(size: int):
+    """ """
+    for i in range(size):
+        yield f"urn:uuid:{i}", Observation.parse_obj(DATA)
+
+
+def collect_then_json(size: int) -> int:
+    """ """
+    bundle = Bundle.parse_obj({"resourceType": "Bundle", "type": "searchset"})
+    bundle.entry = [
+        {"fullUrl": url, "resource": resource} for url, resource in iter_resources(size)
+    ]
+    bundle.total = size
+    return len(bundle.json(return_bytes=True))
+
+
+def bundle_writer(size: int) -> int:
+    """ """
+    fp = Sink()
+    with BundleWriter(fp, "searchset", release="R4B", buffer_size=64 * 1024) as writer:
+        for url, resource in iter_resources(size):
+            writer.write(resource, fullUrl=url)
+        writer.total = size
+    return fp.size
+
+
+def main():
+    """ """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"Bundle with {size} entries")
+    for func in (collect_then_json, bundle_writer):
+        tracemalloc.start()
+        started = time.perf_counter()
+        func(size)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{func.__name__:>18}: {elapsed * 1000:8.1f} ms, "
+            f"peak {peak / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Lab results Bundle (Observations with repeated codes, categories, performer
+#  and units), parse time and memory of the loaded Bundle, default against
+#  flyweight sharing (``parse_raw(..., shared=True)``) of repeated datatypes
+#  and shared + frozen.
+#
+#  Usage: python script/benchmarks/bench_flyweight.py [number of observations]
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.R4B.bundle import Bundle
+
+LOINC = "http://loinc.org"
+CODES = [(f"{2000 + index}-{index % 10}", f"Lab test {index}") for index in range(40)]
+
+
+def make_bundle(count: int) -> bytes:
+    """ """
+    entries = []
+    for index in range(count):
+        code, display = CODES[index % len(CODES)]
+        entries.append(
+            {
+                "resource": {
+                    "resourceType": "Observation",
+                    "id": f"obs-{index}",
+                    "status": "final",
+                    "category": [
+                        {
+                            "coding": [
+                                {
+                                    "system": "http://terminology.hl7.org/"
+                                    "CodeSystem/observation-category",
+                                    "code": "laboratory",
+                                    "display": "Laboratory",
+                                }
+                            ]
+                        }
+                    ],
+                    "code": {
+                        "coding": [{"system": LOINC, "code": code, "display": display}],
+                        "text": display,
+                    },
+                    "subject": {"reference": f"Patient/{index // 40}"},
+                    "performer": [
+                        {"reference": "Organization/lab", "display": "Central Lab"}
+                    ],
+                    "effectiveDateTime": "2020-01-01T10:00:00+01:00",
+                    "valueQuantity": {
+                        "value": index % 50,
+                        "unit": "mmol/L",
+                        "system": "http://unitsofmeasure.org",
+                        "code": "mmol/L",
+                    },
+                }
+            }
+        )
+    data = {"resourceType": "Bundle", "type": "collection", "entry": entries}
+    return json.dumps(data).encode()
+
+
+def measure(data: bytes, **options):
+    """Parse time (best of 3) and memory of the loaded Bundle."""
+    elapsed = float("inf")
+    for _ in range(3):
+        gc.collect()
+        start = time.perf_counter()
+        Bundle.parse_raw(data, **options)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    bundle = Bundle.parse_raw(data, **options)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del bundle
+    return elapsed, size
+
+
+def main(count: int):
+    """ """
+    data = make_bundle(count)
+    print(f"Bundle of {count} Observations")
+    elapsed, size = measure(data)
+    print(f"default:         {elapsed:.2f}s {size / 2 ** 20:.1f} MiB")
+    for label, options in (
+        ("shared:", {"shared": True}),
+        ("shared + frozen:", {"shared": True, "frozen": True}),
+    ):
+        shared_elapsed, shared_size = measure(data, **options)
+        print(
+            f"{label:<16} {shared_elapsed:.2f}s {shared_size / 2 ** 20:.1f} MiB "
+            f"({elapsed / shared_elapsed:.1f}x faster, "
+            f"{100 - shared_size * 100 / size:.0f}% less memory)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Memory of cached read-only Patient, Practitioner and Organization models,
+#  default models against frozen (``parse_obj(..., frozen=True)``) models,
+#  and set membership lookup of frozen models (hash is cached).
+#
+#  Usage: python script/benchmarks/bench_frozen.py [number of resources]
+import gc
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.R4B.organization import Organization
+from fhir.resources.R4B.patient import Patient
+from fhir.resources.R4B.practitioner import Practitioner
+
+SYSTEM = "http://hospital.example.org/identifiers"
+
+
+def make_items(count: int):
+    """ """
+    for index in range(count):
+        name = [{"use": "official", "family": f"Family{index}", "given": ["John"]}]
+        telecom = [{"system": "phone", "value": f"555-{index:06d}", "use": "work"}]
+        address = [{"city": "Amsterdam", "country": "NL", "postalCode": "1012"}]
+        identifier = [{"system": SYSTEM, "value": str(index)}]
+        kind = index % 3
+        if kind == 0:
+            yield Patient, {
+                "resourceType": "Patient",
+                "id": f"pat-{index}",
+                "active": True,
+                "identifier": identifier,
+                "name": name,
+                "telecom": telecom,
+                "gender": "male",
+                "birthDate": "1974-12-25",
+                "address": address,
+            }
+        elif kind == 1:
+            yield Practitioner, {
+                "resourceType": "Practitioner",
+                "id": f"pra-{index}",
+                "active": True,
+                "identifier": identifier,
+                "name": name,
+                "telecom": telecom,
+                "address": address,
+                "gender": "female",
+            }
+        else:
+            yield Organization, {
+                "resourceType": "Organization",
+                "id": f"org-{index}",
+                "active": True,
+                "identifier": identifier,
+                "name": f"Clinic {index}",
+                "telecom": telecom,
+                "address": address,
+            }
+
+
+def measure(items, frozen: bool):
+    """ """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = [klass.parse_obj(data, frozen=frozen) for klass, data in items]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main(count: int):
+    """ """
+    items = list(make_items(count))
+    print(f"{count} resources")
+    _, elapsed, dense = measure(items, False)
+    print(f"default: {elapsed:.2f}s {dense / 2 ** 20:.1f} MiB")
+    models, elapsed, size = measure(items, True)
+    print(
+        f"frozen:  {elapsed:.2f}s {size / 2 ** 20:.1f} MiB "
+        f"({100 - size * 100 / dense:.0f}% less)"
+    )
+
+    start = time.perf_counter()
+    cache = set(models)
+    elapsed = time.perf_counter() - start
+    print(f"set of frozen models (first hash): {elapsed:.3f}s")
+    start = time.perf_counter()
+    found = sum(1 for model in models if model in cache)
+    elapsed = time.perf_counter() - start
+    print(f"{found} lookups (cached hash): {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Cold start import time (``python -X importtime``) of every release package
+#  and of the first model (Patient), against the checked in baselines
+#  (``importtime_baseline.json``, measured before the lazy ``fhirtypes`` and
+#  ``fhirtypesvalidators`` names). Every import runs in a fresh interpreter,
+#  with warm bytecode cache (temporary ``PYTHONPYCACHEPREFIX``), best of rounds.
+#
+#  Usage: python script/benchmarks/bench_importtime.py [--write-baseline] [rounds]
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+ROOT_PATH = pathlib.Path(__file__).parents[2]
+BASELINE_FILE = pathlib.Path(__file__).parent / "importtime_baseline.json"
+
+TARGETS = {
+    "R5": "fhir.resources",
+    "R4B": "fhir.resources.R4B",
+    "STU3": "fhir.resources.STU3",
+    "DSTU2": "fhir.resources.DSTU2",
+    "R5 Patient": "fhir.resources.patient",
+    "R4B Patient": "fhir.resources.R4B.patient",
+    "STU3 Patient": "fhir.resources.STU3.patient",
+    "DSTU2 Patient": "fhir.resources.DSTU2.patient",
+}
+
+
+def import_times(module: str, env: dict) -> dict:
+    """Cumulative import time (microseconds) of the module and self import
+    time of ``fhirtypes`` and ``fhirtypesvalidators`` modules."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = {"total": 0, "fhirtypes": 0, "fhirtypesvalidators": 0}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[12:].split("|")
+        name = name.strip()
+        if name == module:
+            result["total"] = int(cumulative)
+        leaf = name.rsplit(".", 1)[-1]
+        if leaf in ("fhirtypes", "fhirtypesvalidators"):
+            result[leaf] += int(self_time)
+    return result
+
+
+def measure(rounds: int) -> dict:
+    """ """
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = cache_dir
+        env["PYTHONPATH"] = str(ROOT_PATH)
+        for label, module in TARGETS.items():
+            # bytecode is written by the first one
+            import_times(module, env)
+            samples = [import_times(module, env) for _ in range(rounds)]
+            results[label] = {
+                key: min(sample[key] for sample in samples) for key in samples[0]
+            }
+    return results
+
+
+def main(rounds: int, write_baseline: bool):
+    """ """
+    results = measure(rounds)
+    if write_baseline:
+        BASELINE_FILE.write_text(json.dumps(results, indent=2) + "\n")
+    baselines = {}
+    if BASELINE_FILE.exists():
+        baselines = json.loads(BASELINE_FILE.read_text())
+
+    print(
+        f"{'import':<16} {'total':>9} {'types':>8} {'validators':>10} "
+        f"{'baseline':>9} {'change':>7}"
+    )
+    for label, item in results.items():
+        line = (
+            f"{label:<16} {item['total'] / 1000:>7.1f}ms "
+            f"{item['fhirtypes'] / 1000:>6.1f}ms "
+            f"{item['fhirtypesvalidators'] / 1000:>8.1f}ms"
+        )
+        baseline = baselines.get(label, None)
+        if baseline is not None:
+            line += (
+                f" {baseline['total'] / 1000:>7.1f}ms "
+                f"{(item['total'] - baseline['total']) * 100 / baseline['total']:>+6.0f}%"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    write = "--write-baseline" in args
+    if write:
+        args.remove("--write-baseline")
+    main(int(args[0]) if args else 5, write)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  JSON serialization benchmark (time and peak allocation).
+#  Compares ``Model.json()`` against the previous way, where ``OrderedDict``
+#  tree is built by ``Model.dict()`` and then dumped with ``default`` encoder.
+#
+#  Usage: python script/benchmarks/bench_json.py [number of entries]
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.core.fhirabstractmodel import json_dumps
+from fhir.resources.R4B.bundle import Bundle
+
+STATIC_PATH = pathlib.Path(__file__).parents[2] / "tests" / "static"
+
+
+def make_bundle(size: int) -> Bundle:
+    """ """
+    resources = [
+        json.loads((STATIC_PATH / "Observation.json").read_bytes()),
+        json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes()),
+    ]
+    return Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"fullUrl": f"urn:uuid:{i}", "resource": resources[i % 2]}
+                for i in range(size)
+            ],
+        }
+    )
+
+
+def dict_then_dumps(bundle: Bundle) -> bytes:
+    """ """
+    return json_dumps(bundle.dict(), default=bundle.__json_encoder__, return_bytes=True)
+
+
+def direct(bundle: Bundle) -> bytes:
+    """ """
+    return bundle.json(return_bytes=True)
+
+
+def measure(func, bundle: Bundle, repeat: int = 5):
+    """Returns (best time, peak allocation in bytes)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(bundle)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(bundle)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    """ """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    bundle = make_bundle(size)
+    assert dict_then_dumps(bundle) == direct(bundle)
+    print(f"Bundle with {size} entries")
+    for func in (dict_then_dumps, direct):
+        best, peak = measure(func, bundle)
+        print(
+            f"{func.__name__:>16}: {best * 1000:8.1f} ms, peak {peak / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
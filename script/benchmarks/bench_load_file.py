@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  JSON file loading benchmark (time and max RSS), each one runs in separate
+#  process. Compares previous ``pydantic`` ``load_file`` (read, decode into
+#  ``str``, parse) and manual ``gzip`` decompression against
+#  ``fhir.resources.core.utils.load_file`` (memory-mapped or streaming
+#  decompression, no ``str`` copy).
+#
+#  Usage: python script/benchmarks/bench_load_file.py [number of entries]
+import gzip
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import orjson
+from bench_json import make_bundle
+from pydantic.v1.parse import load_file as default_load_file
+
+from fhir.resources.core.utils import load_file
+
+
+def previous(filename: str):
+    """ """
+    if filename.endswith(".gz"):
+        content = gzip.decompress(pathlib.Path(filename).read_bytes())
+        return orjson.loads(content.decode("utf8"))
+    return default_load_file(filename, json_loads=orjson.loads)
+
+
+def read(filename: str):
+    """ """
+    return load_file(filename, json_loads=orjson.loads, use_mmap=False)
+
+
+def mmap(filename: str):
+    """ """
+    return load_file(filename, json_loads=orjson.loads, use_mmap=True)
+
+
+def run(func_name: str, filename: str):
+    """ """
+    started = time.perf_counter()
+    count = len(globals()[func_name](filename)["entry"])
+    elapsed = time.perf_counter() - started
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"{pathlib.Path(filename).suffix:>5} {func_name:>8}: {count} entries, "
+        f"{elapsed * 1000:8.1f} ms, max RSS {max_rss / 1024:8.1f} MiB"
+    )
+
+
+def main():
+    """ """
+    if len(sys.argv) == 4 and sys.argv[1] == "--make":
+        content = make_bundle(int(sys.argv[2])).json(return_bytes=True)
+        pathlib.Path(sys.argv[3]).write_bytes(content)
+        pathlib.Path(sys.argv[3] + ".gz").write_bytes(gzip.compress(content))
+        return
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run(sys.argv[2], sys.argv[3])
+        return
+    size = sys.argv[1] if len(sys.argv) > 1 else "20000"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = str(pathlib.Path(tmp_dir) / "bundle.json")
+        # (max RSS of parent process is inherited)
+        for args in (
+            ("--make", size, filename),
+            ("--run", "previous", filename),
+            ("--run", "read", filename),
+            ("--run", "mmap", filename),
+            ("--run", "previous", filename + ".gz"),
+            ("--run", "read", filename + ".gz"),
+        ):
+            subprocess.run([sys.executable, __file__, *args], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Repeated payload (about 3 MB ValueSet expansion) through
+#  ``construct_fhir_element``, without cache, cache miss and cache hit
+#  (``fhir.resources.core.parsecache.ParseCache``), frozen and copy-on-write.
+#
+#  Usage: python script/benchmarks/bench_parse_cache.py [number of codes]
+import json
+import sys
+import time
+
+from fhir.resources.core.parsecache import ParseCache
+from fhir.resources.R4B import construct_fhir_element
+
+
+def make_value_set(count: int) -> bytes:
+    """ """
+    contains = [
+        {
+            "system": "http://snomed.info/sct",
+            "version": "http://snomed.info/sct/900000000000207008/version/20230131",
+            "code": str(100000000 + index),
+            "display": f"Clinical finding number {index} (finding)",
+        }
+        for index in range(count)
+    ]
+    data = {
+        "resourceType": "ValueSet",
+        "id": "clinical-findings",
+        "url": "http://example.org/fhir/ValueSet/clinical-findings",
+        "status": "active",
+        "expansion": {
+            "identifier": "urn:uuid:c757873d-ec9a-4326-a141-556f43239520",
+            "timestamp": "2023-12-14T10:00:00Z",
+            "total": count,
+            "contains": contains,
+        },
+    }
+    return json.dumps(data).encode()
+
+
+def timing(payload: bytes, cache, rounds: int = 3) -> float:
+    """Best of ``rounds``."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        construct_fhir_element("ValueSet", payload, cache=cache)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count: int):
+    """ """
+    payload = make_value_set(count)
+    print(f"ValueSet of {count} codes, {len(payload) / 2 ** 20:.1f} MB")
+    elapsed = timing(payload, None)
+    print(f"no cache:          {elapsed * 1000:>9.2f}ms")
+    for frozen in (True, False):
+        cache = ParseCache(frozen=frozen)
+        start = time.perf_counter()
+        construct_fhir_element("ValueSet", payload, cache=cache)
+        miss = time.perf_counter() - start
+        hit = timing(payload, cache, rounds=10)
+        label = "frozen" if frozen else "copy-on-write"
+        print(f"{label + ' miss:':<18} {miss * 1000:>9.2f}ms")
+        print(
+            f"{label + ' hit:':<18} {hit * 1000:>9.2f}ms ({elapsed / hit:.0f}x faster)"
+        )
+        print(f"  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
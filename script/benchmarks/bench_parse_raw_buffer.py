@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  JSON loading of bytes buffer, previous decode to ``str`` (pydantic
+#  ``load_str_bytes``) against bytes passed to ``orjson`` as they are.
+#
+#  Usage: python script/benchmarks/bench_parse_raw_buffer.py [entries]
+import sys
+import time
+
+import orjson
+from bench_json import make_bundle
+from pydantic.v1.parse import load_str_bytes as default_load_str_bytes
+
+from fhir.resources.core.utils import load_str_bytes
+
+
+def main():
+    """ """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    content = make_bundle(size).json(return_bytes=True)
+    # i.e. body sliced out of larger network read
+    packet = memoryview(b"HTTP/1.1 200 OK\r\n\r\n" + content)
+    body = packet[19:]
+    print(f"Bundle with {size} entries, {len(content) / 1024 / 1024:.1f} MiB")
+    for name, func in (
+        (
+            "decode to str",
+            lambda: default_load_str_bytes(bytes(body), json_loads=orjson.loads),
+        ),
+        ("bytes", lambda: load_str_bytes(content, json_loads=orjson.loads)),
+        ("memoryview", lambda: load_str_bytes(body, json_loads=orjson.loads)),
+    ):
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        print(f"{name:>14}: {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
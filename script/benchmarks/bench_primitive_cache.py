@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Bulk (NDJSON like) load of Observation resources with repeated codes,
+#  systems, references and timestamps, without and with the primitive values
+#  cache (``fhir.resources.core.primitives.enable_primitive_cache``).
+#  Reports parse time, memory of the loaded models and cache hit-rates.
+#
+#  Usage: python script/benchmarks/bench_primitive_cache.py [number of resources]
+import gc
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.core.primitives import (
+    disable_primitive_cache,
+    enable_primitive_cache,
+    primitive_cache_stats,
+)
+from fhir.resources.R4B.observation import Observation
+
+LOINC = "http://loinc.org"
+CODES = [f"{1000 + index}-{index % 10}" for index in range(300)]
+
+
+def make_items(count: int):
+    """ """
+    for index in range(count):
+        code = CODES[index % len(CODES)]
+        yield {
+            "resourceType": "Observation",
+            "id": f"obs-{index}",
+            "status": "final",
+            "category": [
+                {
+                    "coding": [
+                        {
+                            "system": "http://terminology.hl7.org/"
+                            "CodeSystem/observation-category",
+                            "code": "vital-signs",
+                        }
+                    ]
+                }
+            ],
+            "code": {"coding": [{"system": LOINC, "code": code}]},
+            "subject": {"reference": f"Patient/{index % 500}"},
+            "effectiveDateTime": f"2020-01-{index % 28 + 1:02d}T10:00:00+01:00",
+            "issued": f"2020-01-{index % 28 + 1:02d}T10:30:00.000Z",
+            "valueQuantity": {
+                "value": index % 200,
+                "unit": "mmHg",
+                "system": "http://unitsofmeasure.org",
+                "code": "mm[Hg]",
+            },
+        }
+
+
+def parse(items, cached: bool):
+    """ """
+    if cached:
+        enable_primitive_cache()
+    try:
+        return [Observation.parse_obj(data) for data in items]
+    finally:
+        disable_primitive_cache()
+
+
+def timing(items, cached: bool) -> float:
+    """ """
+    gc.collect()
+    start = time.perf_counter()
+    parse(items, cached)
+    return time.perf_counter() - start
+
+
+def memory(items, cached: bool) -> int:
+    """Memory of the models (cache included)."""
+    gc.collect()
+    tracemalloc.start()
+    if cached:
+        enable_primitive_cache()
+    models = [Observation.parse_obj(data) for data in items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main(count: int, rounds: int = 5):
+    """ """
+    items = list(make_items(count))
+    print(f"{count} resources, best of {rounds}")
+    timings = {False: [], True: []}
+    # interleaved, so both are affected by the machine load alike
+    for _ in range(rounds):
+        for cached in timings:
+            timings[cached].append(timing(items, cached))
+    elapsed, cached_elapsed = min(timings[False]), min(timings[True])
+
+    size = memory(items, False)
+    try:
+        cached_size = memory(items, True)
+        stats = primitive_cache_stats()
+    finally:
+        disable_primitive_cache()
+    print(f"no cache: {elapsed:.2f}s {size / 2 ** 20:.1f} MiB")
+    print(
+        f"cache:    {cached_elapsed:.2f}s {cached_size / 2 ** 20:.1f} MiB "
+        f"({elapsed / cached_elapsed:.2f}x, "
+        f"{(size - cached_size) / 2 ** 20:.1f} MiB less memory)"
+    )
+    for name, item in sorted(stats.items()):
+        print(
+            f"  {name:<10} hits {item['hits']:>8} misses {item['misses']:>8} "
+            f"hit-rate {item['hit_rate']:.1%} size {item['size']}"
+        )
+    print(f"  cache memory {stats['total']['memory'] / 2 ** 10:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
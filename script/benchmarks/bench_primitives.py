@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Primitive data types validation, fast path (``fhir.resources.core.primitives``)
+#  against the previous validators (kept here as reference).
+#  Every value (FHIR spec examples, edge cases and every string of
+#  ``tests/static`` examples) is validated as every type by both, the results
+#  (value and type) and errors must be the same, then typical values are timed.
+#
+#  Usage: python script/benchmarks/bench_primitives.py [number of rounds]
+import json
+import pathlib
+import re
+import sys
+import time
+
+from pydantic.v1 import AnyUrl, ValidationError, create_model
+from pydantic.v1.errors import DateError, DateTimeError, TimeError
+from pydantic.v1.types import ConstrainedDecimal, ConstrainedStr
+from pydantic.v1.validators import parse_date, parse_datetime, parse_time
+
+from fhir.resources import fhirtypes
+from fhir.resources.fhirtypes import FHIR_DATE_PARTS, FHIR_PRIMITIVES
+
+STATIC_PATH = pathlib.Path(__file__).parents[2] / "tests" / "static"
+
+
+def reference_str(klass):
+    """pydantic ``ConstrainedStr`` with the same constraints."""
+    return type(
+        "Reference" + klass.__name__,
+        (ConstrainedStr,),
+        {
+            "regex": klass.regex,
+            "min_length": klass.min_length,
+            "max_length": klass.max_length,
+        },
+    )
+
+
+class ReferenceDecimal(ConstrainedDecimal):
+    """ """
+
+
+class ReferenceUrl(fhirtypes.Url):
+    """ """
+
+    @classmethod
+    def validate(cls, value, field, config):
+        """ """
+        from email.utils import formataddr, parseaddr
+
+        from pydantic.v1.networks import validate_email
+
+        if value.startswith("mailto:"):
+            schema = value[0:7]
+            email = value[7:]
+            realname = parseaddr(email)[0]
+            name, email = validate_email(email)
+            if realname:
+                email = formataddr((name, email))
+            return schema + email
+        elif value.startswith("mllp:") or value.startswith("llp:"):
+            return value
+        elif value.startswith("urn:"):
+            return value
+        elif value in FHIR_PRIMITIVES:
+            return value
+
+        try:
+            return AnyUrl.validate(value, field, config)
+        except Exception:
+            if not value.startswith("/"):
+                matched = cls.path_regex.match("/" + value)
+            else:
+                matched = cls.path_regex.match(value)
+            if matched is not None:
+                if re.match(
+                    r"^[A-Za-z0-9\-.#]+$", matched.groupdict().get("resourceType", "")
+                ):
+                    return value
+            raise
+
+
+class ReferenceDate(fhirtypes.Date):
+    """ """
+
+    @classmethod
+    def validate(cls, value):
+        """ """
+        if not isinstance(value, str):
+            return parse_date(value)
+        match = FHIR_DATE_PARTS.match(value)
+        if not match:
+            if not cls.regex.match(value):
+                raise DateError()
+        elif not match.groupdict().get("day"):
+            if match.groupdict().get("month") and int(match.groupdict()["month"]) > 12:
+                raise DateError()
+            return value
+        return parse_date(value)
+
+
+class ReferenceDateTime(fhirtypes.DateTime):
+    """ """
+
+    @classmethod
+    def validate(cls, value):
+        """ """
+        import datetime
+
+        if isinstance(value, datetime.date):
+            return value
+        if not isinstance(value, str):
+            return parse_datetime(value)
+        match = FHIR_DATE_PARTS.match(value)
+        if match:
+            if (
+                match.groupdict().get("year")
+                and match.groupdict().get("month")
+                and match.groupdict().get("day")
+            ):
+                return parse_date(value)
+            elif match.groupdict().get("year") and match.groupdict().get("month"):
+                if int(match.groupdict()["month"]) > 12:
+                    raise DateError()
+            return value
+        if not cls.regex.match(value):
+            raise DateTimeError()
+        return parse_datetime(value)
+
+
+class ReferenceInstant(fhirtypes.Instant):
+    """ """
+
+    @classmethod
+    def validate(cls, value):
+        """ """
+        if isinstance(value, str):
+            if not cls.regex.match(value):
+                raise DateTimeError()
+        return parse_datetime(value)
+
+
+class ReferenceTime(fhirtypes.Time):
+    """ """
+
+    @classmethod
+    def validate(cls, value):
+        """ """
+        if isinstance(value, str):
+            if not cls.regex.match(value):
+                raise TimeError()
+        return parse_time(value)
+
+
+TYPES = {
+    "string": (fhirtypes.String, reference_str(fhirtypes.String)),
+    "code": (fhirtypes.Code, reference_str(fhirtypes.Code)),
+    "id": (fhirtypes.Id, reference_str(fhirtypes.Id)),
+    "uri": (fhirtypes.Uri, reference_str(fhirtypes.Uri)),
+    "oid": (fhirtypes.Oid, reference_str(fhirtypes.Oid)),
+    "markdown": (fhirtypes.Markdown, reference_str(fhirtypes.Markdown)),
+    "decimal": (fhirtypes.Decimal, ReferenceDecimal),
+    "url": (fhirtypes.Url, ReferenceUrl),
+    "date": (fhirtypes.Date, ReferenceDate),
+    "dateTime": (fhirtypes.DateTime, ReferenceDateTime),
+    "instant": (fhirtypes.Instant, ReferenceInstant),
+    "time": (fhirtypes.Time, ReferenceTime),
+}
+
+# FHIR datatypes page examples and edge cases
+EXAMPLES = [
+    "2018",
+    "1973-06",
+    "1905-08-23",
+    "2015-02-07T13:28:17-05:00",
+    "2017-01-01T00:00:00.000Z",
+    "2015-02-07T13:28:17.239+02:00",
+    "2017-01-01T00:00:00Z",
+    "2017-01-01T00:00:00.1Z",
+    "2017-01-01T00:00:00.1234567Z",
+    "2017-01-01T00:00:00+14:00",
+    "2017-01-01T00:00:00+14:30",
+    "2017-01-01T00:00:00+15:00",
+    "2017-01-01T00:00:00-00:00",
+    "2017-01-01T00:00:00+0500",
+    "2017-01-01T00:00:60Z",
+    "2017-01-01T24:00:00Z",
+    "2017-01-01T00:00:00",
+    "2017-01-01 00:00:00Z",
+    "2017-13-01T00:00:00Z",
+    "2017-02-30",
+    "2017-13",
+    "0000-01-01",
+    "2011-W01-2",
+    "2011-W01-2T00:05:23Z",
+    "20170101T000000Z",
+    "２０１７-01-01",
+    "2017-01-01\n",
+    "13:28:17",
+    "13:28:17.5",
+    "13:28:60",
+    "24:00:00",
+    "13:28",
+    "13:28:17+05:00",
+    "",
+    " ",
+    "\t",
+    "\x0b",
+    "\xa0x",
+    "a",
+    "a b",
+    "a  b",
+    " a",
+    "a ",
+    "a\tb",
+    "a\n",
+    "abc\n",
+    "ABC-12.3",
+    "x" * 64,
+    "x" * 65,
+    "urn:oid:1.2.3.4.5",
+    "urn:oid:1.02",
+    "urn:uuid:c757873d-ec9a-4326-a141-556f43239520",
+    "http://hl7.org/fhir/ValueSet/my-valueset|0.8",
+    "https://example.org/fhir?x=1#frag",
+    "http://",
+    "ftp://ftp.example.org/file",
+    "mailto:john@example.org",
+    "mllp://host:2575",
+    "Patient/123",
+    "/Patient/123",
+    "//Patient",
+    "Patient/123/_history/1",
+    "#contained",
+    "a:b/c",
+    " Patient/1",
+    "dateTime",
+    "-1.5",
+    "1.50",
+    "1e3",
+    "NaN",
+    "Infinity",
+    "0.0000001",
+    "1" * 40,
+]
+
+
+def harvest(value, found):
+    """Every string of example document."""
+    if isinstance(value, str):
+        found.add(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            harvest(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            harvest(item, found)
+
+
+def get_values():
+    """ """
+    values = set(EXAMPLES)
+    for filename in STATIC_PATH.glob("*.json"):
+        harvest(json.loads(filename.read_bytes()), values)
+    for filename in STATIC_PATH.glob("*.xml"):
+        values.update(re.findall(r'value="([^"]*)"', filename.read_text()))
+    return sorted(values) + [1, 1.5, None, b"2017-01-01"]
+
+
+def run(model, value):
+    """ """
+    try:
+        result = model(v=value).v
+        return "ok", result, result.__class__
+    except ValidationError as exc:
+        return "error", exc.errors(), None
+    except Exception as exc:
+        # i.e. ``mailto:`` requires optional ``email-validator``
+        return "exception", str(exc), exc.__class__
+
+
+def check_equivalence(values) -> int:
+    """ """
+    failures = 0
+    for name, (klass, reference) in TYPES.items():
+        fast_model = create_model(f"Fast{name}", v=(klass, None))
+        reference_model = create_model(f"Reference{name}", v=(reference, None))
+        for value in values:
+            fast = run(fast_model, value)
+            expected = run(reference_model, value)
+            if fast != expected:
+                failures += 1
+                print(f"MISMATCH {name} {value!r}: {fast} != {expected}")
+    return failures
+
+
+# (label, type name, value)
+TYPICAL = [
+    ("string", "string", "The patient is a 43 year old male " * 4),
+    ("code", "code", "final"),
+    ("id", "id", "example-123"),
+    ("uri", "uri", "http://loinc.org"),
+    ("oid", "oid", "urn:oid:1.2.3.4.5"),
+    ("markdown", "markdown", "Some **markdown** text\n" * 20),
+    ("decimal", "decimal", 120.5),
+    ("url", "url", "http://hl7.org/fhir/StructureDefinition/patient-birthPlace"),
+    ("url (relative)", "url", "Patient/123"),
+    ("date", "date", "1974-12-25"),
+    ("dateTime", "dateTime", "2015-02-07T13:28:17-05:00"),
+    ("instant", "instant", "2015-02-07T13:28:17.239+02:00"),
+    ("time", "time", "13:28:17"),
+]
+
+
+def main(rounds: int):
+    """ """
+    values = get_values()
+    failures = check_equivalence(values)
+    print(f"{len(values)} values x {len(TYPES)} types, {failures} mismatches")
+
+    print(f"{'type':<16} {'reference':>10} {'fast':>10}")
+    for label, name, value in TYPICAL:
+        timings = []
+        for type_ in reversed(TYPES[name]):
+            model = create_model(f"Bench{name}", v=(type_, None))
+            field = model.__fields__["v"]
+            start = time.perf_counter()
+            for _ in range(rounds):
+                field.validate(value, {}, loc="v", cls=model)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{label:<16} {timings[0] * 1e6 / rounds:>8.2f}us "
+            f"{timings[1] * 1e6 / rounds:>8.2f}us ({timings[0] / timings[1]:.1f}x)"
+        )
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000) and 1 or 0)
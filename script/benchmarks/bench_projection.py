@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Field projection benchmark, full ``parse_raw`` against
+#  ``parse_raw(..., elements=...)`` of typical analytics selection and
+#  ``parse_raw(..., drop_narrative=True, drop_comments=True)``.
+#
+#  Usage: python script/benchmarks/bench_projection.py [number of resources]
+import sys
+import time
+
+from fhir.resources.R4B.observation import Observation
+
+ELEMENTS = {"id", "meta", "subject", "code", "effective"}
+
+
+def make_observation(index: int) -> bytes:
+    """Observation with notes, components, reference ranges and narrative."""
+    return Observation.parse_obj(
+        {
+            "resourceType": "Observation",
+            "id": f"obs-{index}",
+            "status": "final",
+            "text": {
+                "status": "generated",
+                "div": '<div xmlns="http://www.w3.org/1999/xhtml">'
+                + "<p>Blood pressure</p>" * 20
+                + "</div>",
+            },
+            "code": {"coding": [{"system": "http://loinc.org", "code": "85354-9"}]},
+            "subject": {"reference": f"Patient/{index}"},
+            "effectiveDateTime": "2020-01-01T10:00:00+01:00",
+            "note": [{"text": f"Note {i}"} for i in range(5)],
+            "referenceRange": [
+                {"low": {"value": 60, "unit": "mmHg"}, "high": {"value": 90}}
+            ],
+            "component": [
+                {
+                    "code": {"coding": [{"system": "http://loinc.org", "code": code}]},
+                    "valueQuantity": {"value": 107 + i, "unit": "mmHg"},
+                    "interpretation": [{"text": "normal"}],
+                }
+                for i, code in enumerate(("8480-6", "8462-4", "8478-0"))
+            ],
+        }
+    ).json(return_bytes=True)
+
+
+def main():
+    """ """
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    contents = [make_observation(i) for i in range(count)]
+    for name, params in (
+        ("full", {}),
+        ("elements", {"elements": ELEMENTS}),
+        ("drop", {"drop_narrative": True, "drop_comments": True}),
+    ):
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for content in contents:
+                Observation.parse_raw(content, **params)
+            best = min(best, time.perf_counter() - started)
+        print(f"{name:>10}: {count} Observations, {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
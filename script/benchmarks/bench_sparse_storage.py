@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Memory of loaded Observations, default (dense) storage against
+#  ``sparse_storage``, where absent elements (i.e. the most of ``__ext``) are
+#  not kept in instance ``__dict__``.
+#
+#  Usage: python script/benchmarks/bench_sparse_storage.py [number of resources]
+import gc
+import sys
+import time
+import tracemalloc
+
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.R4B.observation import Observation
+
+
+def make_observation(index: int) -> dict:
+    """ """
+    return {
+        "resourceType": "Observation",
+        "id": f"obs-{index}",
+        "status": "final",
+        "category": [
+            {
+                "coding": [
+                    {
+                        "system": "http://terminology.hl7.org/CodeSystem/"
+                        "observation-category",
+                        "code": "vital-signs",
+                    }
+                ]
+            }
+        ],
+        "code": {"coding": [{"system": "http://loinc.org", "code": "8867-4"}]},
+        "subject": {"reference": f"Patient/{index}"},
+        "effectiveDateTime": "2020-01-01T10:00:00+01:00",
+        "valueQuantity": {
+            "value": 60 + index % 40,
+            "unit": "beats/minute",
+            "system": "http://unitsofmeasure.org",
+            "code": "/min",
+        },
+    }
+
+
+def measure(items, sparse: bool, construct: bool):
+    """ """
+    FHIRAbstractModel.__config__.sparse_storage = sparse
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    if construct:
+        result = [Observation.construct_trusted(data) for data in items]
+    else:
+        result = [Observation.parse_obj(data) for data in items]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    FHIRAbstractModel.__config__.sparse_storage = False
+    return elapsed, size
+
+
+def main(count: int):
+    """ """
+    items = [make_observation(i) for i in range(count)]
+    print(f"{count} Observations")
+    for construct in (False, True):
+        label = construct and "construct_trusted" or "parse_obj"
+        dense = measure(items, False, construct)
+        sparse = measure(items, True, construct)
+        print(
+            f"{label:<18} dense: {dense[0]:.2f}s {dense[1] / 2 ** 20:.1f} MiB, "
+            f"sparse: {sparse[0]:.2f}s {sparse[1] / 2 ** 20:.1f} MiB "
+            f"({100 - sparse[1] * 100 / dense[1]:.0f}% less)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
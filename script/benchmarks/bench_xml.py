@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  XML serialization benchmark (time and peak allocation).
+#  Compares previous ``Node`` tree way against direct lxml tree (``xml_dumps``)
+#  and streaming writer (``xml_dump``) into file object.
+#
+#  Usage: python script/benchmarks/bench_xml.py [number of entries]
+import io
+import sys
+import time
+import tracemalloc
+
+from bench_json import make_bundle
+
+from fhir.resources.core.utils.xml import Node, xml_dump, xml_dumps
+
+
+def node_tree(bundle) -> bytes:
+    """ """
+    return Node.from_fhir_obj(bundle).to_string()
+
+
+def direct(bundle) -> bytes:
+    """ """
+    return xml_dumps(bundle)
+
+
+def streaming(bundle) -> bytes:
+    """ """
+    fp = io.BytesIO()
+    xml_dump(bundle, fp)
+    return fp.getvalue()
+
+
+def main():
+    """ """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    bundle = make_bundle(size)
+    assert node_tree(bundle) == direct(bundle) == streaming(bundle)
+    print(f"Bundle with {size} entries")
+    for func in (node_tree, direct, streaming):
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            func(bundle)
+            best = min(best, time.perf_counter() - started)
+        tracemalloc.start()
+        func(bundle)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{func.__name__:>10}: {best * 1000:8.1f} ms, peak {peak / 1024:10.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
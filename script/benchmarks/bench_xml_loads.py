@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  XML parse benchmark, previous ``Node.from_element(...).to_fhir(...)`` way
+#  against direct binder (``element_to_fhir``, used by ``xml_loads``).
+#  Deeply nested ``Questionnaire.item`` and large ``Bundle`` are measured.
+#
+#  Usage: python script/benchmarks/bench_xml_loads.py [depth] [breadth]
+import sys
+import time
+
+from bench_json import make_bundle
+from lxml import etree
+
+from fhir.resources.core.utils.xml import Node, element_to_fhir
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.questionnaire import Questionnaire
+
+
+def make_items(depth: int, breadth: int, prefix: str = "q"):
+    """ """
+    items = []
+    for i in range(breadth):
+        link_id = f"{prefix}.{i}"
+        item = {"linkId": link_id, "text": f"Question {link_id}", "type": "group"}
+        if depth > 1:
+            item["item"] = make_items(depth - 1, breadth, link_id)
+        else:
+            item["type"] = "string"
+        items.append(item)
+    return items
+
+
+def node_tree(klass, content: bytes):
+    """ """
+    return Node.from_element(etree.fromstring(content)).to_fhir(klass)
+
+
+def binder(klass, content: bytes):
+    """ """
+    return element_to_fhir(etree.fromstring(content), klass)
+
+
+def main():
+    """ """
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    breadth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    questionnaire = Questionnaire.parse_obj(
+        {
+            "resourceType": "Questionnaire",
+            "status": "active",
+            "item": make_items(depth, breadth),
+        }
+    )
+    for name, klass, model in (
+        (
+            f"Questionnaire depth {depth} breadth {breadth}",
+            Questionnaire,
+            questionnaire,
+        ),
+        ("Bundle with 200 entries", Bundle, make_bundle(200)),
+    ):
+        content = model.xml(return_bytes=True)
+        assert node_tree(klass, content) == binder(klass, content)
+        print(name)
+        for func in (node_tree, binder):
+            best = float("inf")
+            for _ in range(3):
+                started = time.perf_counter()
+                func(klass, content)
+                best = min(best, time.perf_counter() - started)
+            print(f"{func.__name__:>10}: {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  Streaming XML Bundle reader benchmark (time and max RSS).
+#  Compares ``Bundle.parse_file`` (whole document) against
+#  ``Bundle.iter_xml_entries``, each one runs in separate process, as most of
+#  the memory is allocated by lxml (not visible to ``tracemalloc``).
+#
+#  Usage: python script/benchmarks/bench_xml_reader.py [number of entries]
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_json import make_bundle
+
+from fhir.resources.R4B.bundle import Bundle
+
+
+def parse_file(filename: str) -> int:
+    """ """
+    return len(Bundle.parse_file(filename).entry)
+
+
+def iter_xml_entries(filename: str) -> int:
+    """ """
+    return sum(1 for _ in Bundle.iter_xml_entries(filename))
+
+
+def run(func_name: str, filename: str):
+    """ """
+    started = time.perf_counter()
+    count = globals()[func_name](filename)
+    elapsed = time.perf_counter() - started
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        f"{func_name:>16}: {count} entries, {elapsed * 1000:8.1f} ms, "
+        f"max RSS {max_rss / 1024:8.1f} MiB"
+    )
+
+
+def main():
+    """ """
+    if len(sys.argv) == 4 and sys.argv[1] == "--make":
+        with open(sys.argv[3], "wb") as fp:
+            fp.write(
+                make_bundle(int(sys.argv[2])).xml(return_bytes=True, pretty_print=True)
+            )
+        return
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run(sys.argv[2], sys.argv[3])
+        return
+    size = sys.argv[1] if len(sys.argv) > 1 else "1000"
+    with tempfile.NamedTemporaryFile(suffix=".xml") as fp:
+        # (max RSS of parent process is inherited)
+        for args in (
+            ("--make", size),
+            ("--run", "parse_file"),
+            ("--run", "iter_xml_entries"),
+        ):
+            subprocess.run([sys.executable, __file__, *args, fp.name], check=True)
+
+
+if __name__ == "__main__":
+    main()
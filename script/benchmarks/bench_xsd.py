@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  XSD validation benchmark, schema compiled per document (previous
+#  ``Node.validate(..., xsd_file=...)``) against cached ``XSDSchemaPool``.
+#
+#  Usage: python script/benchmarks/bench_xsd.py [xsd directory] [documents]
+import sys
+import time
+from pathlib import Path
+
+from lxml import etree
+
+from fhir.resources.core.utils.xsd import XSDSchemaPool
+
+STATIC_PATH = Path(__file__).parents[2] / "tests" / "static"
+
+
+def main():
+    """ """
+    xsd_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else STATIC_PATH / "xsd" / "fhir"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    content = (STATIC_PATH / "Patient-with-ext.xml").read_bytes()
+    documents = [content] * count
+
+    for xsd_file in ("patient.xsd", "fhir-single.xsd"):
+        print(f"{count} documents, {xsd_file}")
+        started = time.perf_counter()
+        for document in documents:
+            schema = etree.XMLSchema(file=str(xsd_dir / xsd_file))
+            etree.fromstring(document, parser=etree.XMLParser(schema=schema))
+        print(f"  compile per document: {time.perf_counter() - started:8.3f} s")
+
+        pool = XSDSchemaPool()
+        pool.register_xsd_dir("R4", xsd_dir)
+        started = time.perf_counter()
+        for _ in pool.iter_validate(documents, "R4", xsd_file=xsd_file):
+            pass
+        print(f"  schema pool:          {time.perf_counter() - started:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# _*_ coding: utf-8 _*_
+import gzip
+import io
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.bulk import NDJSONWriter, iter_ndjson
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def make_ndjson(*lines) -> bytes:
+    """ """
+    return b"\n".join(lines) + b"\n"
+
+
+def get_resource_line(filename: str) -> bytes:
+    """ """
+    return json.dumps(json.loads((STATIC_PATH / filename).read_bytes())).encode()
+
+
+def test_iter_ndjson(tmp_path):
+    """ """
+    content = make_ndjson(
+        get_resource_line("Observation.json"),
+        get_resource_line("Patient-with-ext.json"),
+        b"",
+        get_resource_line("Observation.json"),
+    )
+    resources = list(iter_ndjson(io.BytesIO(content), release="R4B"))
+    assert [r.resource_type for r in resources] == [
+        "Observation",
+        "Patient",
+        "Observation",
+    ]
+    assert resources[0].__class__.__module__ == "fhir.resources.R4B.observation"
+
+    ndjson_file = tmp_path / "Observation.ndjson"
+    ndjson_file.write_bytes(content)
+    assert len(list(iter_ndjson(ndjson_file, release="R4B", buffer_size=64))) == 3
+    # text mode file object
+    with open(ndjson_file, "r", encoding="utf-8") as fp:
+        assert len(list(iter_ndjson(fp, release="R4B"))) == 3
+
+
+def test_iter_ndjson_lenient():
+    """ """
+    content = make_ndjson(
+        get_resource_line("Observation.json"),
+        b'{"resourceType": "Observation", "status": "wrong"',
+        b'{"resourceType": "Unknown"}',
+        b'{"resourceType": "Patient", "gender": "unknown-value", "active": 1.5}',
+    )
+    items = list(iter_ndjson(io.BytesIO(content), release="R4B", lenient=True))
+    assert items[0].resource_type == "Observation"
+    assert [item[0] for item in items[1:]] == [2, 3, 4]
+    assert isinstance(items[2][1], LookupError)
+    assert isinstance(items[3][1], ValidationError)
+
+    with pytest.raises(ValueError):
+        list(iter_ndjson(io.BytesIO(content), release="R4B"))
+
+    with pytest.raises(ValueError):
+        list(iter_ndjson(io.BytesIO(content), release="R4"))
+
+
+def test_ndjson_writer(tmp_path):
+    """ """
+    resources = list(
+        iter_ndjson(
+            io.BytesIO(
+                make_ndjson(
+                    get_resource_line("Observation.json"),
+                    get_resource_line("Patient-with-ext.json"),
+                )
+            ),
+            release="R4B",
+        )
+    )
+    ndjson_file = tmp_path / "resources.ndjson.gz"
+    with NDJSONWriter(ndjson_file, compress=True, buffer_size=64) as writer:
+        assert writer.write_many(resources) == 2
+        # raw dict is written as it is
+        writer.write(resources[0].dict())
+    assert writer.count == 3
+
+    with gzip.open(ndjson_file, "rb") as fp:
+        lines = fp.read().splitlines()
+    assert lines[0] == resources[0].json(return_bytes=True)
+    assert lines[1] == resources[1].json(return_bytes=True)
+    with gzip.open(ndjson_file, "rb") as fp:
+        assert list(iter_ndjson(fp, release="R4B")) == resources + resources[:1]
+
+    # text mode file object is not closed
+    fp = io.StringIO()
+    with NDJSONWriter(fp) as writer:
+        writer.write(resources[1])
+    assert fp.getvalue() == resources[1].json() + "\n"
+
+    with pytest.raises(ValueError):
+        NDJSONWriter(io.StringIO(), compress=True)
@@ -0,0 +1,271 @@
+# _*_ coding: utf-8 _*_
+import io
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core.bundle import BundleEntryReader, BundleWriter
+from fhir.resources.R4B.bundle import Bundle
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_bundle_data(**envelope) -> dict:
+    """ """
+    observation = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    data = {"resourceType": "Bundle", "type": "collection"}
+    data.update(envelope)
+    data["entry"] = [
+        {"fullUrl": "urn:uuid:1", "resource": observation},
+        {"fullUrl": "urn:uuid:2", "resource": patient},
+        {"fullUrl": "urn:uuid:3", "resource": observation},
+    ]
+    return data
+
+
+def test_iter_entries():
+    """ """
+    data = get_bundle_data(total=3, link=[{"relation": "self", "url": "http://x"}])
+    content = json.dumps(data, indent=2).encode()
+    reader = Bundle.iter_entries(io.BytesIO(content), chunk_size=16)
+    first = next(reader)
+    assert reader.bundle.total == 3
+    assert reader.bundle.entry is None
+    entries = [first] + list(reader)
+    assert [e.resource.resource_type for e in entries] == [
+        "Observation",
+        "Patient",
+        "Observation",
+    ]
+    assert [e.fullUrl for e in entries] == ["urn:uuid:1", "urn:uuid:2", "urn:uuid:3"]
+
+    expected = Bundle.parse_obj(data)
+    assert [e.dict() for e in entries] == [e.dict() for e in expected.entry]
+
+
+def test_iter_entries_path_and_text(tmp_path):
+    """ """
+    content = json.dumps(get_bundle_data(), ensure_ascii=False)
+    filename = tmp_path / "bundle.json"
+    filename.write_text(content, encoding="utf-8")
+    assert len(list(Bundle.iter_entries(filename))) == 3
+    assert len(list(Bundle.iter_entries(str(filename), chunk_size=7))) == 3
+    assert len(list(Bundle.iter_entries(io.StringIO(content), chunk_size=5))) == 3
+    assert len(list(Bundle.iter_entries(content.encode("utf-8")))) == 3
+
+
+def test_iter_entries_filter():
+    """ """
+    content = json.dumps(get_bundle_data()).encode()
+    entries = list(Bundle.iter_entries(content, entry_filter=["Patient"]))
+    assert [e.fullUrl for e in entries] == ["urn:uuid:2"]
+
+    entries = list(
+        Bundle.iter_entries(content, entry_filter=lambda rt: rt != "Patient")
+    )
+    assert [e.fullUrl for e in entries] == ["urn:uuid:1", "urn:uuid:3"]
+
+
+def test_iter_entries_filtered_entry_is_not_constructed():
+    """Filtered out entry is not validated at all."""
+    data = get_bundle_data()
+    data["entry"][1]["resource"]["unknownElement"] = True
+    content = json.dumps(data).encode()
+    entries = list(Bundle.iter_entries(content, entry_filter={"Observation"}))
+    assert len(entries) == 2
+
+    with pytest.raises(ValidationError):
+        list(Bundle.iter_entries(content))
+
+
+def test_iter_entries_envelope_validation():
+    """ """
+    data = get_bundle_data(total="not-a-number")
+    with pytest.raises(ValidationError):
+        next(Bundle.iter_entries(json.dumps(data).encode()))
+
+    # required ``type`` is missing
+    data = get_bundle_data()
+    del data["type"]
+    with pytest.raises(ValidationError):
+        list(Bundle.iter_entries(json.dumps(data).encode()))
+
+    data = get_bundle_data(resourceType="Patient")
+    with pytest.raises(ValueError) as exc_info:
+        next(Bundle.iter_entries(json.dumps(data).encode()))
+    assert "Expected resourceType is 'Bundle'" in str(exc_info.value)
+
+
+def test_iter_entries_envelope_after_entry():
+    """Envelope elements might come after ``entry``."""
+    data = get_bundle_data()
+    entries = data.pop("entry")
+    content = json.dumps({"entry": entries, **data, "total": 3}).encode()
+    reader = Bundle.iter_entries(content)
+    assert len(list(reader)) == 3
+
+    content = json.dumps({"entry": entries, **data, "total": "x"}).encode()
+    with pytest.raises(ValidationError):
+        list(Bundle.iter_entries(content))
+
+
+def test_iter_entries_envelope_validated_once(monkeypatch):
+    """Envelope is validated again only if elements came after ``entry``."""
+    calls = []
+    validate_envelope = BundleEntryReader.validate_envelope
+
+    def counting_validate_envelope(self, envelope):
+        calls.append(dict(envelope))
+        return validate_envelope(self, envelope)
+
+    monkeypatch.setattr(
+        BundleEntryReader, "validate_envelope", counting_validate_envelope
+    )
+    data = get_bundle_data(id="b1")
+    reader = Bundle.iter_entries(json.dumps(data).encode())
+    assert len(list(reader)) == 3
+    assert len(calls) == 1
+    assert reader.bundle.id == "b1"
+
+    calls.clear()
+    entries = data.pop("entry")
+    content = json.dumps({**data, "entry": entries, "total": 3}).encode()
+    reader = Bundle.iter_entries(content)
+    assert len(list(reader)) == 3
+    assert len(calls) == 2
+    assert reader.bundle.total == 3
+
+
+@pytest.mark.parametrize("release", ["R5", "STU3", "DSTU2"])
+def test_iter_entries_release(release):
+    """ """
+    from fhir.resources.core.utils.common import get_fhir_root_module
+
+    klass = get_fhir_root_module(release).get_fhir_model_class("Bundle")
+    data = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [
+            {"resource": {"resourceType": "Basic", "code": {"text": "x"}}},
+            {"resource": {"resourceType": "Patient", "id": "p1", "active": True}},
+        ],
+    }
+    entries = list(
+        klass.iter_entries(json.dumps(data).encode(), entry_filter=["Patient"])
+    )
+    assert len(entries) == 1
+    assert entries[0].resource.id == "p1"
+    assert entries[0].resource.__class__ is get_fhir_root_module(
+        release
+    ).get_fhir_model_class("Patient")
+
+
+def test_iter_entries_invalid_json():
+    """ """
+    content = json.dumps(get_bundle_data()).encode()
+    with pytest.raises(ValueError):
+        list(Bundle.iter_entries(content[:-20], chunk_size=16))
+    with pytest.raises(ValueError):
+        list(Bundle.iter_entries(b"[]"))
+
+
+def test_bundle_writer(tmp_path):
+    """Written document could be read back (by both reader and ``parse_file``)."""
+    data = get_bundle_data()
+    entries = Bundle.parse_obj(data).entry
+    filename = tmp_path / "searchset.json"
+    with BundleWriter(
+        filename, "searchset", release="R4B", id="b1", buffer_size=64
+    ) as writer:
+        # ``BundleEntry``, resource model (with entry elements), raw resource
+        writer.write(entries[0])
+        writer.write(
+            entries[1].resource, fullUrl="urn:uuid:2", search={"mode": "match"}
+        )
+        writer.write(data["entry"][2]["resource"], fullUrl="urn:uuid:3")
+        writer.total = 3
+        writer.link = [{"relation": "self", "url": "http://x"}]
+
+    bundle = Bundle.parse_file(filename)
+    assert bundle.id == "b1"
+    assert bundle.type == "searchset"
+    assert bundle.total == 3
+    assert bundle.link[0].url == "http://x"
+    assert [e.fullUrl for e in bundle.entry] == [
+        "urn:uuid:1",
+        "urn:uuid:2",
+        "urn:uuid:3",
+    ]
+    assert bundle.entry[1].search.mode == "match"
+    assert bundle.entry[1].resource == entries[1].resource
+    assert bundle.entry[2].resource == entries[2].resource
+
+    reader = Bundle.iter_entries(filename)
+    assert [e.dict() for e in reader] == [e.dict() for e in bundle.entry]
+    assert reader.bundle.total == 3
+
+
+def test_bundle_writer_no_entry_and_errors():
+    """ """
+    fp = io.StringIO()
+    with BundleWriter(fp, "collection", release="R4B"):
+        pass
+    # empty ``entry`` array is not written
+    assert json.loads(fp.getvalue()) == {"resourceType": "Bundle", "type": "collection"}
+
+    with pytest.raises(ValidationError):
+        BundleWriter(io.BytesIO(), "collection", release="R4B", timestamp="x")
+
+    fp = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        with BundleWriter(fp, "collection", release="R4B") as writer:
+            writer.write({"fullUrl": "urn:uuid:1"})
+            raise RuntimeError
+    # incomplete document is not completed
+    assert fp.getvalue() == b""
+
+    with pytest.raises(TypeError):
+        writer = BundleWriter(io.BytesIO(), "collection", release="R4B")
+        writer.write({"fullUrl": "urn:uuid:1"}, search={"mode": "match"})
+
+
+def test_iter_xml_entries(tmp_path):
+    """ """
+    data = get_bundle_data(total=3, link=[{"relation": "self", "url": "http://x"}])
+    data["entry"][0]["fhir_comments"] = ["first entry"]
+    expected = Bundle.parse_obj(data)
+    content = expected.xml(return_bytes=True, pretty_print=True)
+    filename = tmp_path / "bundle.xml"
+    filename.write_bytes(content)
+
+    for source in (content, io.BytesIO(content), filename, str(filename)):
+        reader = Bundle.iter_xml_entries(source)
+        entries = list(reader)
+        assert reader.bundle.total == 3
+        assert reader.bundle.entry is None
+        # the same as parsing whole document
+        assert [e.dict() for e in entries] == [
+            e.dict() for e in Bundle.parse_raw(content, content_type="text/xml").entry
+        ]
+    assert entries[0].fhir_comments == "first entry"
+    assert entries[1].resource.resource_type == "Patient"
+
+    entries = list(Bundle.iter_xml_entries(content, entry_filter=["Patient"]))
+    assert [e.fullUrl for e in entries] == ["urn:uuid:2"]
+
+
+def test_iter_xml_entries_errors():
+    """ """
+    content = Bundle.parse_obj(get_bundle_data()).xml(return_bytes=True)
+    with pytest.raises(ValueError) as exc_info:
+        next(Bundle.iter_xml_entries(content.replace(b"Bundle", b"Patient")))
+    assert "Expected resourceType is 'Bundle'" in str(exc_info.value)
+
+    # required ``type`` is missing
+    invalid = content.replace(b'<type value="collection"/>', b"")
+    with pytest.raises(ValidationError):
+        next(Bundle.iter_xml_entries(invalid))
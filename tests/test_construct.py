@@ -0,0 +1,92 @@
+# _*_ coding: utf-8 _*_
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core import utils
+from fhir.resources.R4B import construct_fhir_element
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_construct_trusted():
+    """ """
+    for klass, filename in (
+        (Observation, "Observation.json"),
+        (Patient, "Patient-with-ext.json"),
+    ):
+        data = json.loads((STATIC_PATH / filename).read_bytes())
+        validated = klass.parse_obj(data)
+        trusted = klass.construct_trusted(data)
+        assert trusted == validated
+        assert trusted.json() == validated.json()
+        assert trusted.__fields_set__ == validated.__fields_set__
+
+
+def test_construct_trusted_nested_types():
+    """ """
+    patient = Patient.construct_trusted(
+        json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    )
+    # polymorphic resource is dispatched by resourceType
+    assert [r.__class__.__name__ for r in patient.contained] == [
+        "Binary",
+        "Organization",
+    ]
+    # partial date is kept as string, same as validation does
+    assert patient.birthDate == "1974-12"
+    assert patient.name[0].__class__.__name__ == "HumanName"
+
+
+def test_construct_fhir_element_trusted():
+    """ """
+    obs = construct_fhir_element(
+        "Observation", STATIC_PATH / "Observation.json", trusted=True
+    )
+    obs2 = construct_fhir_element(
+        "Observation", (STATIC_PATH / "Observation.json").read_bytes(), trusted=True
+    )
+    assert obs == obs2
+    assert obs.json() == Observation.parse_file(STATIC_PATH / "Observation.json").json()
+
+    with pytest.raises(ValueError) as exc_info:
+        Observation.construct_trusted({"resourceType": "Patient"})
+    assert "expects resource type" in str(exc_info.value)
+
+
+def test_parse_raw_bytes_buffer(monkeypatch):
+    """``bytearray`` and ``memoryview`` (i.e. sliced out of network read) are
+    passed to ``orjson`` as they are."""
+    content = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    expected = Patient.parse_raw(content)
+    packet = b"HTTP/1.1 200 OK\r\n\r\n" + content + b"\r\n"
+    buffer = memoryview(packet)[19 : 19 + len(content)]
+    # non contiguous buffer
+    interleaved = memoryview(bytes(b for c in content for b in (c, 32)))[::2]
+    for data in (bytearray(content), buffer, interleaved):
+        assert Patient.parse_raw(data) == expected
+        assert construct_fhir_element("Patient", data) == expected
+        assert construct_fhir_element("Patient", data, trusted=True) == expected
+    data = content.decode("utf-8").encode("utf-16")
+    assert Patient.parse_raw(bytearray(data), encoding="utf-16") == expected
+    with pytest.raises(ValidationError):
+        Patient.parse_raw(memoryview(b"{invalid"))
+
+    received = []
+
+    def json_loads(value):
+        received.append(value)
+        return {}
+
+    monkeypatch.setattr(utils, "BYTES_JSON_LOADS", {json_loads})
+    utils.load_str_bytes(buffer, json_loads=json_loads)
+    assert received.pop() is buffer
+    # other loader receives decoded string, as before
+    monkeypatch.setattr(utils, "BYTES_JSON_LOADS", set())
+    utils.load_str_bytes(buffer, json_loads=json_loads)
+    assert received.pop() == content.decode("utf-8")
@@ -0,0 +1,62 @@
+# _*_ coding: utf-8 _*_
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.R4B import fhirtypesvalidators
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.organization import Organization
+from fhir.resources.R4B.patient import Patient
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+ORGANIZATION = {"resourceType": "Organization", "id": "o1", "name": "ACME"}
+
+
+def test_dispatch_table():
+    """ """
+    entry = fhirtypesvalidators.get_fhir_model_dispatch("Organization")
+    assert entry == (Organization, fhirtypesvalidators.organization_validator)
+    assert fhirtypesvalidators.DISPATCH_TABLE["Organization"] is entry
+
+    with pytest.raises(LookupError):
+        fhirtypesvalidators.get_fhir_model_dispatch("Foo")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ORGANIZATION,
+        json.dumps(ORGANIZATION),
+        json.dumps(ORGANIZATION).encode(),
+        Organization.parse_obj(ORGANIZATION),
+    ],
+)
+def test_polymorphic_resource(value):
+    """ """
+    patient = Patient.parse_obj({"resourceType": "Patient", "contained": [value]})
+    assert isinstance(patient.contained[0], Organization)
+    assert patient.contained[0].name == "ACME"
+
+    bundle = Bundle.parse_obj(
+        {"resourceType": "Bundle", "type": "collection", "entry": [{"resource": value}]}
+    )
+    assert isinstance(bundle.entry[0].resource, Organization)
+
+
+def test_polymorphic_resource_errors():
+    """ """
+    with pytest.raises(ValidationError):
+        Patient.parse_obj({"resourceType": "Patient", "contained": ["{invalid"]})
+
+    with pytest.raises(ValidationError) as exc_info:
+        Patient.parse_obj(
+            {"resourceType": "Patient", "contained": [dict(ORGANIZATION, foo=1)]}
+        )
+    assert "contained -> 0 -> foo" in str(exc_info.value)
+
+    with pytest.raises(LookupError):
+        Patient.parse_obj(
+            {"resourceType": "Patient", "contained": [{"resourceType": "Foo"}]}
+        )
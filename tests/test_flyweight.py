@@ -0,0 +1,106 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+import pickle
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core.flyweight import FlyweightPool, is_shared
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+OBSERVATION = {
+    "resourceType": "Observation",
+    "status": "final",
+    "code": {
+        "coding": [{"system": "http://loinc.org", "code": "8480-6"}],
+        "text": "Systolic blood pressure",
+    },
+    "subject": {"reference": "Patient/example"},
+    "valueQuantity": {
+        "value": 107,
+        "unit": "mmHg",
+        "system": "http://unitsofmeasure.org",
+        "code": "mm[Hg]",
+    },
+}
+
+
+def make_bundle(count: int) -> dict:
+    """ """
+    return {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [
+            {"resource": dict(OBSERVATION, id=f"obs-{index}")} for index in range(count)
+        ],
+    }
+
+
+def test_shared_datatypes():
+    """ """
+    data = make_bundle(3)
+    pool = FlyweightPool()
+    bundle = Bundle.parse_raw(json.dumps(data), shared=pool)
+    # Coding, CodeableConcept, Reference and Quantity
+    assert len(pool) == 4
+    assert pool.hits == 6
+    assert bundle == Bundle.parse_obj(data)
+
+    first, second, _ = (entry.resource for entry in bundle.entry)
+    assert first.code is not second.code
+    assert first.code.coding[0] is not second.code.coding[0]
+    assert first.code.coding[0].__dict__ is second.code.coding[0].__dict__
+    assert is_shared(first.valueQuantity) is True
+
+    # copy-on-write
+    first.code.coding[0].code = "8462-4"
+    first.valueQuantity.value = 110
+    del first.subject.reference
+    assert second.code.coding[0].code == "8480-6"
+    assert second.valueQuantity.value == 107
+    assert second.subject.reference == "Patient/example"
+    assert is_shared(first.code.coding[0]) is False
+    with pytest.raises(ValidationError):
+        second.valueQuantity.value = "x"
+    assert second.valueQuantity.value == 107
+
+    # copies are regular models
+    for obj in (
+        pickle.loads(pickle.dumps(second)),
+        copy.deepcopy(second),
+        second.copy(),
+    ):
+        assert obj == second
+        assert is_shared(obj.valueQuantity) is False
+
+
+def test_shared_frozen():
+    """ """
+    bundle = Bundle.parse_obj(make_bundle(3), shared=True, frozen=True)
+    first, second, _ = (entry.resource for entry in bundle.entry)
+    assert first.code is second.code
+    assert first.subject is second.subject
+    assert first.is_frozen() is True
+    assert bundle == Bundle.parse_obj(make_bundle(3))
+
+
+def test_shared_invalid():
+    """Invalid datatype is not shared, error is reported as usual."""
+    data = dict(OBSERVATION, valueQuantity={"value": "x", "unit": "mmHg"})
+    with pytest.raises(ValidationError) as exc_info:
+        Observation.parse_obj(data, shared=True)
+    assert exc_info.value.errors()[0]["loc"] == ("valueQuantity", "value")
+    # the value type is a part of the key
+    pool = FlyweightPool()
+    one = Observation.parse_obj(
+        dict(OBSERVATION, valueQuantity={"value": 1}), shared=pool
+    )
+    other = Observation.parse_obj(
+        dict(OBSERVATION, valueQuantity={"value": 1.0}), shared=pool
+    )
+    assert str(one.valueQuantity.value) == "1"
+    assert str(other.valueQuantity.value) == "1.0"
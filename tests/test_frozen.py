@@ -0,0 +1,102 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+import pickle
+
+import pytest
+
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def load(filename: str) -> dict:
+    """ """
+    return json.loads((STATIC_PATH / filename).read_bytes())
+
+
+def test_freeze():
+    """ """
+    data = load("Patient-with-ext.json")
+    patient = Patient.parse_obj(data)
+    frozen = Patient.parse_obj(data, frozen=True)
+    assert patient.is_frozen() is False
+    assert frozen.is_frozen() is True
+    assert frozen.name[0].is_frozen() is True
+    assert frozen.gender__ext.is_frozen() is True
+
+    # compact, but the same content
+    assert len(frozen.__dict__) < len(patient.__dict__)
+    assert frozen.birthDate__ext is None
+    assert frozen == patient
+    assert frozen.json() == patient.json()
+    assert frozen.xml() == patient.xml()
+
+    with pytest.raises(TypeError):
+        frozen.active = False
+    with pytest.raises(TypeError):
+        frozen.name[0].family = "Doe"
+    with pytest.raises(TypeError):
+        del frozen.gender
+    with pytest.raises(TypeError):
+        hash(patient)
+
+    # lists can't be changed in place
+    frozen_hash = hash(frozen)
+    with pytest.raises(TypeError):
+        frozen.name.append(frozen.name[0])
+    with pytest.raises(TypeError):
+        frozen.name[0] = frozen.name[0]
+    with pytest.raises(TypeError):
+        frozen.name[0].given.clear()
+    with pytest.raises(TypeError):
+        del frozen.identifier[0]
+    assert hash(frozen) == frozen_hash
+    assert frozen == patient and frozen in {frozen}
+    assert frozen.dict()["name"].__class__ is list
+
+    assert patient.freeze() is patient
+    assert patient.is_frozen() is True
+
+
+def test_frozen_hash():
+    """ """
+    data = load("Observation.json")
+    first = Observation.parse_obj(data, frozen=True)
+    second = Observation.parse_raw(json.dumps(data), frozen=True)
+    assert first is not second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert {first: "x"}[second] == "x"
+
+    data["status"] = "amended"
+    third = Observation.parse_obj(data, frozen=True)
+    assert third != first
+    assert len({first, second, third}) == 2
+
+    for obj in (
+        pickle.loads(pickle.dumps(first)),
+        copy.deepcopy(first),
+        copy.copy(first),
+    ):
+        assert obj.is_frozen() is True
+        assert obj == first
+        assert hash(obj) == hash(first)
+
+
+def test_freeze_lazy_resources():
+    """ """
+    data = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": load("Patient-with-ext.json")}],
+    }
+    bundle = Bundle.parse_raw(json.dumps(data), lazy=True, frozen=True)
+    resource = bundle.entry[0].__dict__["resource"]
+    assert resource.__class__ is Patient
+    assert resource.is_frozen() is True
+    assert bundle == Bundle.parse_obj(data)
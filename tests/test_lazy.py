@@ -0,0 +1,98 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+import pickle
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core.lazy import LazyResource
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_bundle_data() -> dict:
+    """ """
+    observation = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    return {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "total": 2,
+        "entry": [
+            {"fullUrl": "urn:uuid:1", "resource": observation},
+            {"fullUrl": "urn:uuid:2", "resource": patient},
+        ],
+    }
+
+
+def test_lazy_bundle():
+    """ """
+    data = get_bundle_data()
+    bundle = Bundle.parse_raw(json.dumps(data), lazy=True)
+    assert bundle.total == 2
+    assert [e.fullUrl for e in bundle.entry] == ["urn:uuid:1", "urn:uuid:2"]
+
+    lazy = bundle.entry[1].__dict__["resource"]
+    assert isinstance(lazy, LazyResource)
+    assert lazy.is_resolved() is False
+    # untouched resource is written back as it is
+    assert json.loads(bundle.json()) == data
+
+    # first attribute access validates and caches the model
+    assert bundle.entry[1].resource.resource_type == "Patient"
+    assert lazy.is_resolved() is True
+    assert isinstance(lazy.resolve(), Patient)
+    assert lazy.resolve() is lazy.resolve()
+
+    eager = Bundle.parse_raw(json.dumps(data))
+    assert bundle.entry[1].resource == eager.entry[1].resource
+    assert bundle.xml() == eager.xml()
+
+
+def test_lazy_bundle_modified_resource():
+    """ """
+    bundle = Bundle.parse_raw(json.dumps(get_bundle_data()), lazy=True)
+    bundle.entry[1].resource.active = False
+    assert json.loads(bundle.json())["entry"][1]["resource"]["active"] is False
+
+    with pytest.raises(ValidationError):
+        bundle.entry[1].resource.gender = ["invalid"]
+
+
+def test_lazy_bundle_deferred_error(tmp_path):
+    """Invalid resource is only reported, when it is accessed."""
+    data = get_bundle_data()
+    data["entry"][1]["resource"]["unknownElement"] = True
+    filename = tmp_path / "bundle.json"
+    filename.write_text(json.dumps(data))
+
+    bundle = Bundle.parse_file(filename, lazy=True)
+    assert bundle.entry[0].resource.resource_type == "Observation"
+    with pytest.raises(ValidationError):
+        bundle.entry[1].resource.id
+
+    with pytest.raises(ValidationError):
+        Bundle.parse_file(filename)
+
+    # envelope is always validated
+    data = get_bundle_data()
+    data["total"] = "x"
+    with pytest.raises(ValidationError):
+        Bundle.parse_raw(json.dumps(data), lazy=True)
+
+
+def test_lazy_bundle_copy_and_pickle():
+    """ """
+    bundle = Bundle.parse_raw(json.dumps(get_bundle_data()), lazy=True)
+    cloned = copy.deepcopy(bundle)
+    assert bundle.entry[0].__dict__["resource"].is_resolved() is False
+    assert cloned == bundle
+
+    bundle = Bundle.parse_raw(json.dumps(get_bundle_data()), lazy=True)
+    bundle.entry[0].resource.id
+    assert pickle.loads(pickle.dumps(bundle)) == bundle
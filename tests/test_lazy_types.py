@@ -0,0 +1,43 @@
+# _*_ coding: utf-8 _*_
+import pickle
+
+import pytest
+
+from fhir.resources import fhirtypes, fhirtypesvalidators
+from fhir.resources.R4B import fhirtypes as fhirtypes_r4b
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_lazy_fhir_types():
+    """``<Model>Type`` classes are created on first access."""
+    klass = fhirtypes.CodingType
+    assert klass is fhirtypes.CodingType
+    assert klass is fhirtypes.get_fhir_type_class("Coding")
+    assert klass.__resource_type__ == "Coding"
+    assert klass.__module__ == fhirtypes.__name__
+    assert issubclass(klass, fhirtypes.AbstractType)
+    assert pickle.loads(pickle.dumps(klass)) is klass
+    assert "CodingType" in fhirtypes.__all__
+    assert "PatientType" in dir(fhirtypes)
+    assert fhirtypes_r4b.CodingType is not klass
+
+    with pytest.raises(AttributeError):
+        fhirtypes.UnknownType
+    with pytest.raises(LookupError):
+        fhirtypes.get_fhir_type_class("Unknown")
+
+
+def test_lazy_fhir_validators():
+    """ """
+    validator = fhirtypesvalidators.coding_validator
+    assert validator is fhirtypesvalidators.coding_validator
+    assert validator.__name__ == "coding_validator"
+    assert "coding_validator" in dir(fhirtypesvalidators)
+
+    coding = validator({"system": "http://loinc.org", "code": "1234-5"})
+    assert coding.resource_type == "Coding"
+    assert next(fhirtypes.CodingType.__get_validators__()) is validator
+
+    with pytest.raises(AttributeError):
+        fhirtypesvalidators.unknown_validator
@@ -0,0 +1,89 @@
+# _*_ coding: utf-8 _*_
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.parallel import parse_many, parse_ndjson
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def get_resource_line(filename: str) -> bytes:
+    """ """
+    return json.dumps(json.loads((STATIC_PATH / filename).read_bytes())).encode()
+
+
+def get_resource_id(model):
+    """Reducer, runs inside the worker."""
+    return model.resource_type, model.id
+
+
+def test_parse_many():
+    """ """
+    observation = get_resource_line("Observation.json")
+    patient = get_resource_line("Patient-with-ext.json")
+    items = [observation, patient] * 5
+
+    results = list(parse_many(items, release="R4B", workers=2, chunk_size=3))
+    assert len(results) == 10
+    assert all(isinstance(r, bytes) for r in results)
+    assert json.loads(results[1])["resourceType"] == "Patient"
+
+    results = list(
+        parse_many(
+            items,
+            release="R4B",
+            workers=2,
+            chunk_size=2,
+            reducer=get_resource_id,
+            ordered=False,
+            preload=("Observation", "Patient"),
+        )
+    )
+    assert sorted(results) == sorted([get_resource_id_of(i) for i in items])
+
+    models = list(parse_many(items[:2], release="R4B", workers=1, rehydrate=True))
+    assert [m.resource_type for m in models] == ["Observation", "Patient"]
+
+    with pytest.raises(ValueError):
+        parse_many(items, release="R4B", reducer=get_resource_id, rehydrate=True)
+
+
+def test_parse_many_rehydrate_dstu2():
+    """DSTU2 models have no ``construct_trusted``."""
+    items = [b'{"resourceType": "Patient", "id": "p1", "gender": "male"}'] * 3
+    models = list(parse_many(items, release="DSTU2", workers=1, rehydrate=True))
+    assert [m.id for m in models] == ["p1", "p1", "p1"]
+    assert models[0].__class__.__module__.startswith("fhir.resources.DSTU2")
+    assert models[0].gender == "male"
+
+
+def get_resource_id_of(item: bytes):
+    """ """
+    data = json.loads(item)
+    return data["resourceType"], data.get("id")
+
+
+def test_parse_ndjson(tmp_path):
+    """ """
+    ndjson_file = tmp_path / "resources.ndjson"
+    ndjson_file.write_bytes(
+        b"\n".join(
+            [
+                get_resource_line("Observation.json"),
+                b"",
+                b'{"resourceType": "Patient", "birthDate": "wrong"}',
+                get_resource_line("Patient-with-ext.json"),
+            ]
+        )
+    )
+    results = list(parse_ndjson(ndjson_file, release="R4B", workers=2, lenient=True))
+    assert len(results) == 3
+    assert results[1][0] == 3
+    assert isinstance(results[1][1], ValidationError)
+
+    with pytest.raises(ValidationError):
+        list(parse_ndjson(ndjson_file, release="R4B", workers=1, chunk_size=1))
@@ -0,0 +1,109 @@
+# _*_ coding: utf-8 _*_
+import threading
+
+import pytest
+from pydantic.v1 import ValidationError
+
+import fhir.resources as fhir_resources
+from fhir.resources.core.parsecache import ParseCache
+from fhir.resources.R4B import construct_fhir_element
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_parse_cache():
+    """ """
+    payload = (STATIC_PATH / "Observation.json").read_bytes()
+    cache = ParseCache()
+    first = construct_fhir_element("Observation", payload, cache=cache)
+    second = construct_fhir_element("Observation", bytearray(payload), cache=cache)
+    third = Observation.parse_raw(
+        payload.decode(), content_type="application/json", cache=cache
+    )
+    assert first is second
+    assert third is first
+    assert first.is_frozen() is True
+    assert first == Observation.parse_raw(payload)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 2 / 3,
+        "size": 1,
+        "bytes": len(payload),
+    }
+    # release, type and options are a part of the key
+    Observation.parse_raw(payload, cache=cache)
+    fhir_resources.construct_fhir_element("Observation", payload, cache=cache)
+    assert len(cache) == 3
+
+    # invalid payload is never cached
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            Observation.parse_raw(b'{"resourceType": "Observation"}', cache=cache)
+    assert len(cache) == 3
+
+
+def test_parse_cache_copy_on_write():
+    """ """
+    payload = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    cache = ParseCache(frozen=False)
+    first = Patient.parse_raw(payload, cache=cache)
+    second = Patient.parse_raw(payload, cache=cache)
+    assert first is not second
+    assert first.is_frozen() is False
+    first.name[0].family = "Doe"
+    first.active = False
+    assert second.name[0].family != "Doe"
+    assert second == Patient.parse_raw(payload)
+    assert Patient.parse_raw(payload, cache=cache, frozen=True).is_frozen() is True
+
+
+def test_parse_cache_limits():
+    """ """
+    payloads = [
+        f'{{"resourceType": "Patient", "id": "p{index}"}}'.encode()
+        for index in range(10)
+    ]
+    cache = ParseCache(maxsize=4)
+    for payload in payloads:
+        Patient.parse_raw(payload, cache=cache)
+    assert cache.stats()["evictions"] == 6
+    assert len(cache) == 4
+
+    cache = ParseCache(max_bytes=len(payloads[0]) * 2)
+    for payload in payloads:
+        Patient.parse_raw(payload, cache=cache)
+    assert len(cache) == 2
+    assert cache.bytes <= cache.max_bytes
+    # larger than the limit, not cached, but frozen as cached ones
+    oversize = b" " * cache.max_bytes + payloads[0]
+    assert Patient.parse_raw(oversize, cache=cache).is_frozen() is True
+    assert len(cache) == 2
+    cache = ParseCache(max_bytes=len(payloads[0]) * 2, frozen=False)
+    assert Patient.parse_raw(oversize, cache=cache).is_frozen() is False
+    assert len(cache) == 0
+
+
+def test_parse_cache_threads():
+    """ """
+    payload = (STATIC_PATH / "Observation.json").read_bytes()
+    cache = ParseCache()
+    results = []
+
+    def worker():
+        for _ in range(20):
+            results.append(Observation.parse_raw(payload, cache=cache))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 1
+    assert all(model is results[-1] for model in results[-10:])
+    assert cache.hits + cache.misses == 80
@@ -0,0 +1,101 @@
+# _*_ coding: utf-8 _*_
+import datetime
+
+import pytest
+from pydantic.v1 import ValidationError, create_model
+
+from fhir.resources import fhirtypes
+from fhir.resources.core.primitives import (
+    PRIMITIVE_CACHE,
+    disable_primitive_cache,
+    enable_primitive_cache,
+    primitive_cache_stats,
+)
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.fixture
+def cache():
+    """ """
+    enable_primitive_cache()
+    try:
+        yield PRIMITIVE_CACHE
+    finally:
+        disable_primitive_cache()
+
+
+def validate(type_, value):
+    """ """
+    return create_model("Model", v=(type_, None))(v=value).v
+
+
+def test_disabled_by_default():
+    """ """
+    assert PRIMITIVE_CACHE.types == frozenset()
+    validate(fhirtypes.Code, "final")
+    assert primitive_cache_stats()["total"]["size"] == 0
+
+
+def test_cache_hits(cache):
+    """ """
+    value = "".join(["fi", "nal"])
+    first = validate(fhirtypes.Code, value)
+    second = validate(fhirtypes.Code, "final")
+    assert first is second
+    # interned
+    assert first is "final"  # noqa: F632
+
+    moment = validate(fhirtypes.Instant, "2017-01-01T00:00:00Z")
+    assert validate(fhirtypes.Instant, "2017-01-01T00:00:00Z") is moment
+    assert moment == datetime.datetime(2017, 1, 1, tzinfo=datetime.timezone.utc)
+    assert validate(fhirtypes.Url, "Patient/123") == "Patient/123"
+
+    stats = primitive_cache_stats()
+    assert stats["code"] == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1}
+    assert stats["instant"]["hits"] == 1
+    assert stats["url"]["misses"] == 1
+    assert stats["total"]["size"] == 3
+    assert stats["total"]["memory"] > 0
+    # not enabled for the type
+    validate(fhirtypes.String, "final")
+    assert "string" not in primitive_cache_stats()
+
+    # invalid values are never cached
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate(fhirtypes.Code, " final")
+    assert primitive_cache_stats()["code"]["misses"] == 3
+    assert primitive_cache_stats()["code"]["size"] == 1
+
+
+def test_cache_limits(cache):
+    """ """
+    enable_primitive_cache(["code"], maxsize=10)
+    for index in range(20):
+        validate(fhirtypes.Code, f"code-{index}")
+    assert primitive_cache_stats()["total"]["size"] == 10
+    # least recently used are evicted
+    validate(fhirtypes.Code, "code-19")
+    validate(fhirtypes.Code, "code-0")
+    assert primitive_cache_stats()["code"]["hits"] == 1
+
+    enable_primitive_cache(["code"], maxsize=1000, max_memory=2000)
+    assert 0 < cache.memory <= 2000
+    for index in range(100):
+        validate(fhirtypes.Code, f"code-{index}")
+    stats = primitive_cache_stats()["total"]
+    assert 0 < stats["size"] < 100
+    assert stats["memory"] <= 2000
+
+
+def test_configured_constraints(cache):
+    """Cache is invalidated by type constraints configuration."""
+    assert validate(fhirtypes.Id, "abcde") == "abcde"
+    try:
+        fhirtypes.Id.configure_constraints(max_length=4)
+        assert primitive_cache_stats()["total"]["size"] == 0
+        with pytest.raises(ValidationError):
+            validate(fhirtypes.Id, "abcde")
+    finally:
+        fhirtypes.Id.configure_constraints(max_length=64)
@@ -0,0 +1,101 @@
+# _*_ coding: utf-8 _*_
+import datetime
+import decimal
+
+import pytest
+from pydantic.v1 import ValidationError, create_model
+
+from fhir.resources import fhirtypes
+from fhir.resources.core.primitives import (
+    fast_date,
+    fast_datetime,
+    fast_time,
+    is_relative_url,
+)
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def validate(type_, value):
+    """ """
+    return create_model("Model", v=(type_, None))(v=value).v
+
+
+def test_fast_datetime():
+    """ """
+    utc = datetime.timezone.utc
+    assert fast_datetime("2017-01-01T00:00:00.1Z") == datetime.datetime(
+        2017, 1, 1, 0, 0, 0, 100000, tzinfo=utc
+    )
+    assert fast_datetime("2015-02-07T13:28:17-05:00").utcoffset() == (
+        datetime.timedelta(hours=-5)
+    )
+    assert fast_datetime("2015-02-07T13:28:17").tzinfo is None
+    # left for full validation
+    for value in (
+        "2017-01-01T00:00:00.1234567Z",
+        "2011-W01-2T00:05:23Z",
+        "2017-01-01T00:00:60Z",
+        "2017-01-01 00:00:00Z",
+        "2017-01-01T00:00:00+0500",
+    ):
+        assert fast_datetime(value) is None
+    assert fast_datetime("2017-01-01T00:00:00+14:00", require_timezone=True)
+    assert fast_datetime("2017-01-01T00:00:00+14:30", require_timezone=True) is None
+    assert fast_datetime("2017-01-01T00:00:00", require_timezone=True) is None
+
+    assert fast_date("1905-08-23") == datetime.date(1905, 8, 23)
+    assert fast_date("2011-W01-2") is None
+    assert fast_time("13:28:17.5") == datetime.time(13, 28, 17, 500000)
+    assert fast_time("13:28:17+05:00") is None
+
+
+def test_primitive_types():
+    """ """
+    assert validate(fhirtypes.DateTime, "2018") == "2018"
+    assert validate(fhirtypes.DateTime, "1905-08-23") == datetime.date(1905, 8, 23)
+    assert validate(fhirtypes.Instant, "2017-01-01T00:00:00Z").tzinfo is not None
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.Instant, "2017-01-01T00:00:00+15:00")
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.DateTime, "2017-13")
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.Time, "24:00:00")
+
+    assert validate(fhirtypes.Decimal, 1.5) == decimal.Decimal("1.5")
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.Decimal, "NaN")
+
+    assert validate(fhirtypes.Code, "a b") == "a b"
+    for value in ("a  b", " a", ""):
+        with pytest.raises(ValidationError):
+            validate(fhirtypes.Code, value)
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.String, "\x0bx")
+
+    assert is_relative_url("Patient/123")
+    assert is_relative_url("#contained")
+    assert not is_relative_url("http://example.org")
+    assert not is_relative_url("//Patient")
+    assert validate(fhirtypes.Url, "/Patient/123") == "/Patient/123"
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.Url, "http://")
+
+
+def test_configured_constraints():
+    """Run time configuration is respected by fast path."""
+    try:
+        fhirtypes.Id.configure_constraints(max_length=4)
+        with pytest.raises(ValidationError):
+            validate(fhirtypes.Id, "abcde")
+    finally:
+        fhirtypes.Id.configure_constraints(max_length=64)
+    assert validate(fhirtypes.Id, "abcde") == "abcde"
+
+    with pytest.raises(ValidationError):
+        validate(fhirtypes.String, "")
+    try:
+        fhirtypes.String.configure_empty_str(allow=True)
+        assert validate(fhirtypes.String, "") == ""
+    finally:
+        fhirtypes.String.configure_empty_str(allow=False)
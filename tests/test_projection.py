@@ -0,0 +1,154 @@
+# _*_ coding: utf-8 _*_
+import json
+
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core import projection
+from fhir.resources.core.projection import is_subsetted
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_parse_elements():
+    """ """
+    filename = STATIC_PATH / "Observation.json"
+    full = Observation.parse_file(filename)
+    obs = Observation.parse_file(
+        filename, elements={"subject", "effective", "Observation.code.coding"}
+    )
+    # selected, mandatory (``status``, ``code``) and ``id``, ``meta`` only
+    for name in ("id", "status", "subject", "effectiveDateTime"):
+        assert getattr(obs, name) == getattr(full, name)
+    assert obs.code.coding == full.code.coding
+    for name in ("category", "valueQuantity", "performer", "text"):
+        assert getattr(obs, name) is None and getattr(full, name) is not None
+    assert obs.code.text is None and full.code.text is not None
+    assert is_subsetted(obs) is True
+    assert is_subsetted(full) is False
+    assert obs.meta.tag[:-1] == full.meta.tag
+
+    # the same from raw content and data
+    content = filename.read_bytes()
+    assert (
+        Observation.parse_raw(content, elements="subject,effective,code.coding") == obs
+    )
+    data = json.loads(content)
+    assert (
+        Observation.parse_obj(data, elements=["subject", "effective", "code.coding"])
+        == obs
+    )
+    # input is not changed
+    assert data == json.loads(content)
+
+
+def test_parse_elements_skips_validation():
+    """Unselected elements are not validated at all."""
+    data = json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    data["gender"] = ["invalid"]
+    data["_gender"] = {"extension": "invalid"}
+    patient = Patient.parse_obj(data, elements={"name"})
+    assert patient.name[0].family == "Chalmers"
+    assert patient.gender is None
+
+    with pytest.raises(ValidationError):
+        Patient.parse_obj(data)
+    with pytest.raises(ValidationError):
+        Patient.parse_obj(data, elements={"gender"})
+    with pytest.raises(ValueError) as exc_info:
+        Patient.parse_obj(data, elements={"unknown"})
+    assert "has no element 'unknown'" in str(exc_info.value)
+
+
+def test_parse_elements_nested_resource():
+    """ """
+    observation = json.loads((STATIC_PATH / "Observation.json").read_bytes())
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    data = {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "total": 2,
+        "entry": [{"resource": observation}, {"resource": patient}],
+    }
+    bundle = Bundle.parse_obj(data, elements={"entry.resource.subject"})
+    assert bundle.total is None
+    assert bundle.entry[0].resource.subject.reference == "#newborn"
+    assert bundle.entry[0].resource.valueQuantity is None
+    assert is_subsetted(bundle.entry[0].resource) is True
+    # ``Patient`` has no ``subject``, mandatory elements only
+    assert bundle.entry[1].resource.name is None
+    assert is_subsetted(bundle.entry[1].resource) is True
+
+
+def has_comments(value) -> bool:
+    """ """
+    if isinstance(value, dict):
+        return "fhir_comments" in value or any(has_comments(v) for v in value.values())
+    if isinstance(value, list):
+        return any(has_comments(v) for v in value)
+    return False
+
+
+def test_drop_narrative_and_comments():
+    """ """
+    full = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    assert full.text is not None and full.contained[1].text is not None
+    assert has_comments(full.dict()) is True
+
+    for filename, params in (
+        ("Patient-with-ext.json", {}),
+        ("Patient-with-ext.xml", {}),
+        ("Patient-with-ext.json", {"lazy": True}),
+    ):
+        patient = Patient.parse_file(
+            STATIC_PATH / filename, drop_narrative=True, drop_comments=True, **params
+        )
+        assert patient.text is None
+        # nested resource
+        assert patient.contained[1].text is None
+        assert patient.contained[1].name == full.contained[1].name
+        assert has_comments(patient.dict()) is False
+        assert patient.name == full.name
+
+    content = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    patient = Patient.parse_raw(content, drop_comments=True)
+    assert patient.text == full.text
+    assert has_comments(patient.dict()) is False
+    patient = Patient.parse_raw(content, drop_narrative=True)
+    assert patient.text is None
+    assert patient.address[0].fhir_comments == full.address[0].fhir_comments
+
+    yaml_content = full.yaml(return_bytes=True)
+    patient = Patient.parse_raw(
+        yaml_content, content_type="text/yaml", drop_narrative=True
+    )
+    assert patient.text is None and patient.name == full.name
+
+
+class MyPatient(Patient):
+    """User defined subclass, outside of ``fhir.resources``."""
+
+
+def test_subsetted_tag_system():
+    """ """
+    from fhir.resources.patient import Patient as R5Patient
+    from fhir.resources.STU3.patient import Patient as STU3Patient
+
+    assert projection.get_fhir_release(R5Patient) == "R5"
+    assert projection.get_fhir_release(STU3Patient) == "STU3"
+    assert projection.get_fhir_release(MyPatient) == "R4B"
+
+    patient = MyPatient.parse_obj(
+        {"resourceType": "Patient", "id": "p1", "gender": "male"}, elements={"id"}
+    )
+    assert patient.gender is None
+    assert patient.meta.tag[0].system == projection.SUBSETTED_SYSTEMS["R4B"]
+    patient = STU3Patient.parse_obj(
+        {"resourceType": "Patient", "id": "p1"}, elements={"id"}
+    )
+    assert patient.meta.tag[0].system == projection.SUBSETTED_SYSTEMS["STU3"]
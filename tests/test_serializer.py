@@ -0,0 +1,104 @@
+# _*_ coding: utf-8 _*_
+import json
+import typing
+from collections import OrderedDict
+
+from fhir.resources.core.fhirabstractmodel import json_dumps
+from fhir.resources.core.serializer import get_serializer_plan
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_serializer_plan_compiled_once():
+    """ """
+    plan = get_serializer_plan(Patient)
+    assert plan is get_serializer_plan(Patient)
+    assert plan.native is True
+    assert plan.resource_type is True
+    names = [item[0] for item in plan.fields]
+    assert names[:3] == ["id", "meta", "implicitRules"]
+    birth_date = plan.fields[names.index("birthDate")]
+    assert birth_date == (
+        "birthDate",
+        "birthDate",
+        True,
+        "birthDate__ext",
+        "_birthDate",
+    )
+
+
+def test_serializer_plan_output():
+    """ """
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    data = patient.dict()
+    assert isinstance(data, OrderedDict)
+    assert list(data.keys())[0] == "resourceType"
+    assert data["_gender"] == {"fhir_comments": "This is comment for Gender"}
+    assert data["contact"][0]["name"]["_given"][0] is None
+    assert data["contact"][0]["name"]["_given"][1]["extension"][0]["valueCode"] == "MID"
+    assert (
+        OrderedDict(
+            patient._fhir_iter(by_alias=True, exclude_none=True, exclude_comments=False)
+        )
+        == data
+    )
+
+    data = patient.dict(by_alias=False, exclude_comments=True)
+    assert "gender__ext" not in data
+    assert "given__ext" in data["contact"][0]["name"]
+
+
+def test_serializer_overridden_iter():
+    """Subclass with own ``_fhir_iter`` is respected, also as nested value."""
+
+    class MyPatient(Patient):
+        def _fhir_iter(self, **kwargs) -> typing.Any:
+            yield from super()._fhir_iter(**kwargs)
+            yield "custom", True
+
+    patient = MyPatient.parse_obj({"resourceType": "Patient", "id": "p1"})
+    assert get_serializer_plan(MyPatient).native is False
+    assert patient.dict() == {"resourceType": "Patient", "id": "p1", "custom": True}
+    assert '"custom":true' in patient.json()
+
+
+def test_serializer_json_bytes():
+    """JSON bytes are written directly, output is the same as dumping dict tree."""
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": patient}, {"fullUrl": "urn:uuid:1"}, {}],
+        }
+    )
+    for params in (
+        {},
+        {"exclude_comments": True},
+        {"exclude_none": False},
+        {"by_alias": False},
+    ):
+        expected = json_dumps(
+            bundle.dict(**params), default=bundle.__json_encoder__, return_bytes=True
+        )
+        assert bundle.json(return_bytes=True, **params) == expected
+        assert bundle.json(**params) == expected.decode()
+
+    # resource without any element
+    assert Bundle.construct().json() == '{"resourceType":"Bundle"}'
+
+
+def test_serializer_empty_list_elements():
+    """Empty lists are omitted (``exclude_none``), the same as dict and indent."""
+    patient = Patient.parse_obj(
+        {"resourceType": "Patient", "id": "a", "name": [], "contact": []}
+    )
+    expected = {"resourceType": "Patient", "id": "a"}
+    assert patient.dict() == expected
+    assert json.loads(patient.json()) == expected
+    assert json.loads(patient.json(indent=2)) == expected
+    assert patient.json() == '{"resourceType":"Patient","id":"a"}'
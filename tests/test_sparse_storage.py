@@ -0,0 +1,88 @@
+# _*_ coding: utf-8 _*_
+import copy
+import json
+import pickle
+
+import pytest
+
+from fhir.resources.core.fhirabstractmodel import FHIRAbstractModel
+from fhir.resources.R4B.observation import Observation
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+@pytest.fixture
+def sparse_storage(monkeypatch):
+    """ """
+    monkeypatch.setattr(FHIRAbstractModel.__config__, "sparse_storage", True)
+
+
+def load(filename: str) -> dict:
+    """ """
+    return json.loads((STATIC_PATH / filename).read_bytes())
+
+
+def test_sparse_storage(sparse_storage):
+    """Absent elements are not stored, but attribute API remains the same."""
+    data = load("Patient-with-ext.json")
+    patient = Patient.parse_obj(data)
+    assert all(v is not None for v in patient.__dict__.values())
+    assert "deceasedDateTime" not in patient.__dict__
+    assert "gender__ext" in patient.__dict__
+    assert "birthDate__ext" not in patient.__dict__
+    assert patient.deceasedDateTime is None
+    assert patient.birthDate__ext is None
+    assert patient.resource_type == "Patient"
+    with pytest.raises(AttributeError):
+        patient.unknown_element
+
+    patient.active = False
+    assert patient.__dict__["active"] is False
+    patient.active = None
+    assert "active" not in patient.__dict__
+    assert patient.active is None
+
+    for klass, filename in (
+        (Observation, "Observation.json"),
+        (Patient, "Patient-with-ext.json"),
+    ):
+        data = load(filename)
+        sparse = klass.parse_obj(data)
+        trusted = klass.construct_trusted(data)
+        assert trusted.__dict__.keys() == sparse.__dict__.keys()
+        for obj in (
+            trusted,
+            copy.deepcopy(sparse),
+            pickle.loads(pickle.dumps(sparse)),
+        ):
+            assert obj == sparse
+            assert obj.json() == sparse.json()
+        content = sparse.xml(return_bytes=True)
+        assert (
+            klass.parse_raw(content, content_type="text/xml").xml(return_bytes=True)
+            == content
+        )
+
+
+def test_sparse_storage_same_output():
+    """ """
+    for klass, filename in (
+        (Observation, "Observation.json"),
+        (Patient, "Patient-with-ext.json"),
+    ):
+        data = load(filename)
+        dense = klass.parse_obj(data)
+        FHIRAbstractModel.__config__.sparse_storage = True
+        try:
+            sparse = klass.parse_obj(data)
+        finally:
+            FHIRAbstractModel.__config__.sparse_storage = False
+        assert len(sparse.__dict__) < len(dense.__dict__)
+        assert sparse == dense
+        assert sparse.json() == dense.json()
+        assert sparse.dict(exclude_none=False) == dense.dict(exclude_none=False)
+        assert sparse.xml() == dense.xml()
+        assert sparse.yaml() == dense.yaml()
@@ -0,0 +1,110 @@
+# _*_ coding: utf-8 _*_
+import bz2
+import gzip
+import json
+import lzma
+import os
+import threading
+
+import pytest
+
+from fhir.resources.bulk import iter_ndjson
+from fhir.resources.core.utils import fileio
+from fhir.resources.R4B.bundle import Bundle
+from fhir.resources.R4B.patient import Patient
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+COMPRESSORS = {"gz": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+@pytest.mark.parametrize("suffix", ["gz", "bz2", "xz"])
+def test_parse_file_compressed(tmp_path, suffix):
+    """ """
+    compress = COMPRESSORS[suffix]
+    expected = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    for name, content in (
+        ("Patient.json", (STATIC_PATH / "Patient-with-ext.json").read_bytes()),
+        ("Patient.xml", (STATIC_PATH / "Patient-with-ext.xml").read_bytes()),
+    ):
+        filename = tmp_path / f"{name}.{suffix}"
+        filename.write_bytes(compress(content))
+        patient = Patient.parse_file(filename)
+        if name.endswith(".xml"):
+            assert patient == Patient.parse_file(STATIC_PATH / "Patient-with-ext.xml")
+        else:
+            assert patient == expected
+
+    # recognized by magic bytes
+    filename = tmp_path / "Patient.data"
+    filename.write_bytes(compress(expected.json(return_bytes=True)))
+    assert fileio.get_compression(filename) == {"gz": "gzip"}.get(suffix, suffix)
+    assert Patient.parse_file(filename, content_type="application/json") == expected
+
+
+def test_parse_file_mmap(tmp_path):
+    """ """
+    filename = tmp_path / "Patient.json"
+    filename.write_bytes((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    expected = Patient.parse_file(filename, use_mmap=False)
+    assert Patient.parse_file(filename, use_mmap=True) == expected
+    lazy = Patient.parse_file(str(filename), use_mmap=True, lazy=True)
+    assert lazy.json() == expected.json()
+
+    with fileio.file_buffer(filename, use_mmap=True) as buffer:
+        assert isinstance(buffer, memoryview)
+        assert bytes(buffer) == filename.read_bytes()
+    with fileio.file_buffer(filename) as buffer:
+        # small file is just read
+        assert isinstance(buffer, bytes)
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    with fileio.file_buffer(empty, use_mmap=True) as buffer:
+        assert buffer == b""
+
+
+def test_streaming_readers_compressed(tmp_path):
+    """ """
+    patient = json.loads((STATIC_PATH / "Patient-with-ext.json").read_bytes())
+    filename = tmp_path / "Patient.ndjson.gz"
+    filename.write_bytes(gzip.compress((json.dumps(patient) + "\n").encode() * 3))
+    assert len(list(iter_ndjson(filename, release="R4B"))) == 3
+
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": patient}],
+        }
+    )
+    filename = tmp_path / "bundle.json.xz"
+    filename.write_bytes(lzma.compress(bundle.json(return_bytes=True)))
+    assert len(list(Bundle.iter_entries(filename))) == 1
+    filename = tmp_path / "bundle.xml.bz2"
+    filename.write_bytes(bz2.compress(bundle.xml(return_bytes=True)))
+    assert len(list(Bundle.iter_xml_entries(filename))) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipe is required")
+def test_parse_file_pipe(tmp_path):
+    """Pipe is never sniffed (it would consume the content)."""
+    content = (STATIC_PATH / "Patient-with-ext.json").read_bytes()
+    fifo = tmp_path / "Patient.data"
+    os.mkfifo(fifo)
+    results = []
+
+    def parse():
+        results.append(Patient.parse_file(fifo, content_type="application/json"))
+
+    reader = threading.Thread(target=parse, daemon=True)
+    reader.start()
+    with open(fifo, "wb") as fp:
+        fp.write(content)
+    reader.join(timeout=10)
+    if reader.is_alive():
+        # pipe was opened twice, unblock the reader
+        open(fifo, "wb").close()
+    assert results == [Patient.parse_raw(content)]
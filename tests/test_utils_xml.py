@@ -1,9 +1,15 @@
+import io
 import sys
+import threading
 from http import client
 
 import lxml.etree  # type: ignore
+import pytest
 
 from fhir.resources.core import utils
+from fhir.resources.core.bundle import XMLBundleWriter
+from fhir.resources.core.utils.xsd import XSDSchemaPool
+from fhir.resources.R4B.bundle import Bundle
 from fhir.resources.R4B.observation import Observation
 from fhir.resources.R4B.patient import Patient
 
@@ -108,3 +114,126 @@ def test_model_obj_xml_file():
     patient.contained[1].text = None
     patient3.contained[1].text = None
     assert patient3 == patient
+
+
+def test_xml_dump_same_as_node_tree():
+    """Direct (and streaming) XML writer output is the same as ``Node`` tree."""
+    observation = Observation.parse_file(STATIC_PATH / "Observation.json")
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    for model in (observation, patient):
+        for params in (
+            {},
+            {"pretty_print": True},
+            {"xml_declaration": False},
+        ):
+            expected = utils.xml.Node.from_fhir_obj(model).to_string(**params)
+            assert utils.xml_dumps(model, **params) == expected
+
+            fp = io.BytesIO()
+            utils.xml_dump(model, fp, **params)
+            assert fp.getvalue() == expected
+
+    # without any element
+    fp = io.BytesIO()
+    utils.xml_dump(Patient.construct(), fp)
+    assert fp.getvalue() == utils.xml_dumps(Patient.construct())
+
+
+def test_element_to_fhir_same_as_node_tree():
+    """Direct binder result is the same as ``Node`` tree ``to_fhir``."""
+    from fhir.resources.STU3.bundle import Bundle as STU3Bundle
+
+    for klass, filename in (
+        (Patient, "Patient-with-ext.xml"),
+        (STU3Bundle, "STU3-Bundle-Issue-144.xml"),
+    ):
+        element = lxml.etree.fromstring((STATIC_PATH / filename).read_bytes())
+        expected = utils.xml.Node.from_element(element).to_fhir(klass)
+        assert utils.xml.element_to_fhir(element, klass) == expected
+
+    # comments, primitive extensions and narrative round trip
+    patient = Patient.parse_file(STATIC_PATH / "Patient-with-ext.json")
+    for pretty_print in (False, True):
+        content = patient.xml(pretty_print=pretty_print, return_bytes=True)
+        result = Patient.parse_raw(content, content_type="text/xml")
+        expected = utils.xml.Node.from_element(lxml.etree.fromstring(content)).to_fhir(
+            Patient
+        )
+        assert result == expected
+        assert result.gender__ext == patient.gender__ext
+        assert result.address[0].fhir_comments == patient.address[0].fhir_comments
+
+
+def test_xml_bundle_writer():
+    """ """
+    resources = [
+        Observation.parse_file(STATIC_PATH / "Observation.json"),
+        Patient.parse_file(STATIC_PATH / "Patient-with-ext.json"),
+    ]
+    link = [{"relation": "self", "url": "http://x"}]
+    bundle = Bundle.parse_obj(
+        {
+            "resourceType": "Bundle",
+            "id": "b1",
+            "type": "searchset",
+            "total": 2,
+            "link": link,
+            "entry": [
+                {"fullUrl": "urn:uuid:1", "resource": resources[0]},
+                {"resource": resources[1], "search": {"mode": "match"}},
+            ],
+        }
+    )
+    for pretty_print in (False, True):
+        fp = io.BytesIO()
+        with XMLBundleWriter(
+            fp,
+            "searchset",
+            release="R4B",
+            pretty_print=pretty_print,
+            id="b1",
+            total=2,
+            link=link,
+        ) as writer:
+            writer.write(bundle.entry[0])
+            writer.write(resources[1], search={"mode": "match"})
+        assert fp.getvalue() == bundle.xml(return_bytes=True, pretty_print=pretty_print)
+
+
+def test_xsd_schema_pool():
+    """ """
+    pool = XSDSchemaPool()
+    content = (STATIC_PATH / "Patient-with-ext.xml").read_bytes()
+    with pytest.raises(ValueError) as exc_info:
+        pool.validate(content, "R4", xsd_file="patient.xsd")
+    assert "No XSD directory is registered" in str(exc_info.value)
+
+    pool.register_xsd_dir("R4", FHIR_XSD_DIR)
+    element = pool.validate(content, "R4", xsd_file="patient.xsd")
+    assert utils.xml.element_to_fhir(element, Patient) == Patient.parse_raw(
+        content, content_type="text/xml"
+    )
+    # compiled once, parser is reused by the same thread only
+    schema = pool.get_schema("R4", "patient.xsd")
+    assert pool.get_schema("R4", "patient.xsd") is schema
+    parser = pool.get_parser("R4", "patient.xsd")
+    assert pool.get_parser("R4", "patient.xsd") is parser
+    parsers = []
+    thread = threading.Thread(
+        target=lambda: parsers.append(pool.get_parser("R4", "patient.xsd"))
+    )
+    thread.start()
+    thread.join()
+    assert parsers[0] is not parser
+
+    invalid = content.replace(b"<gender ", b"<unknown ", 1)
+    with pytest.raises(ValueError):
+        pool.validate(invalid, "R4", xsd_file="patient.xsd")
+    elements = pool.iter_validate([content, invalid], "R4", xsd_file="patient.xsd")
+    next(elements)
+    with pytest.raises(ValueError):
+        next(elements)
+
+    pool.clear()
+    assert pool.get_schema("R4", "patient.xsd") is not schema
+    assert pool.get_parser("R4", "patient.xsd") is not parser
@@ -0,0 +1,54 @@
+# _*_ coding: utf-8 _*_
+import pytest
+from pydantic.v1 import ValidationError
+
+from fhir.resources.core.validators import get_validation_plan
+from fhir.resources.R4B.extension import Extension
+from fhir.resources.R4B.observation import Observation
+
+from .fixtures import STATIC_PATH
+
+__author__ = "Md Nazrul Islam<email2nazrul@gmail.com>"
+
+
+def test_validation_plan_compiled_once():
+    """ """
+    plan = get_validation_plan(Observation)
+    assert plan is get_validation_plan(Observation)
+    assert [item[0] for item in plan.required_primitives] == ["status"]
+    assert [item[0] for item in plan.one_of_many] == ["effective", "value"]
+    assert plan.choice_index["valueQuantity"] == 1
+    # required element without extension twin is not part of the plan.
+    assert get_validation_plan(Extension).required_primitives == ()
+
+
+def test_validation_plan_required_primitive():
+    """ """
+    data = {"code": {"text": "Glucose"}}
+    with pytest.raises(ValidationError) as exc_info:
+        Observation.parse_obj(data)
+    assert "status" in str(exc_info.value)
+
+    data["_status"] = {"extension": [{"url": "http://example.org", "valueCode": "x"}]}
+    obs = Observation.parse_obj(data)
+    assert obs.status is None
+
+    obs = Observation.parse_file(STATIC_PATH / "Observation.json")
+    with pytest.raises(ValidationError):
+        obs.status = None
+
+
+def test_validation_plan_one_of_many():
+    """ """
+    data = {
+        "status": "final",
+        "code": {"text": "Glucose"},
+        "valueString": "high",
+        "valueBoolean": True,
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        Observation.parse_obj(data)
+    assert "but got multiple" in str(exc_info.value)
+
+    data.pop("valueBoolean")
+    assert Observation.parse_obj(data).valueString == "high"